@@ -18,6 +18,7 @@ from gamestonk_terminal.helper_funcs import (
     EXPORT_BOTH_RAW_DATA_AND_FIGURES,
     EXPORT_ONLY_RAW_DATA_ALLOWED,
     check_positive,
+    check_positive_list,
 )
 from gamestonk_terminal.menu import session
 
@@ -201,10 +202,10 @@ Country: [cyan]{self.country}[/cyan]
         parser.add_argument(
             "-d",
             "--days",
-            type=check_positive,
-            help="Number of days back to look",
+            type=check_positive_list,
+            help="Number of days back to look, several comma separated to compare them",
             dest="days",
-            default=30,
+            default="30",
         )
         parser.add_argument(
             "-a",
@@ -226,8 +227,11 @@ Country: [cyan]{self.country}[/cyan]
         )
         if ns_parser:
             covid_view.display_country_slopes(
-                days_back=ns_parser.days,
+                days_back=ns_parser.days[0]
+                if len(ns_parser.days) == 1
+                else ns_parser.days,
                 limit=ns_parser.limit,
                 ascend=ns_parser.ascend,
                 threshold=ns_parser.threshold,
+                export=ns_parser.export,
             )
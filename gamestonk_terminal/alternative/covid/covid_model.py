@@ -1,9 +1,16 @@
 """Covid Model"""
 __docformat__ = "numpy"
 
-import warnings
-import pandas as pd
+import io
+import os
+import time
+from typing import Dict, List, Tuple, Union
+
 import numpy as np
+import pandas as pd
+import requests
+
+import gamestonk_terminal.config_terminal as cfg
 
 
 global_cases_time_series = (
@@ -15,6 +22,112 @@ global_deaths_time_series = (
     "covid_19_time_series/time_series_covid19_deaths_global.csv"
 )
 
+# The time series are updated once a day, so they are not checked more often
+CACHE_MAX_AGE = 60 * 60
+
+_TIME_SERIES: Dict[str, Tuple[float, pd.DataFrame]] = {}
+
+
+def _covid_folder() -> str:
+    return os.path.join(cfg.CACHE_DIR, "covid")
+
+
+def _download_time_series(url: str, path: str) -> bytes:
+    """Download a time series unless the cached one is still current
+
+    Parameters
+    ----------
+    url: str
+        Url of the csv file
+    path: str
+        Cached csv file, refreshed with a conditional request on its ETag
+
+    Returns
+    -------
+    bytes
+        Content of the csv file, empty if the cached one is still current
+    """
+    headers = {}
+    try:
+        with open(f"{path}.etag", encoding="utf8") as f:
+            etag = f.read().strip()
+        if etag and os.path.isfile(path):
+            headers["If-None-Match"] = etag
+    except OSError:
+        pass
+
+    response = requests.get(url, headers=headers, timeout=30)
+    if response.status_code == 304:
+        os.utime(path)
+        return b""
+    response.raise_for_status()
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(f"{path}.tmp", "wb") as f:
+            f.write(response.content)
+        os.replace(f"{path}.tmp", path)
+        with open(f"{path}.etag", "w", encoding="utf8") as f:
+            f.write(response.headers.get("ETag", ""))
+    except OSError:
+        pass
+    return response.content
+
+
+def get_time_series(url: str, refresh: bool = False) -> pd.DataFrame:
+    """Get a global time series, cached locally and refreshed when it changes
+
+    Parameters
+    ----------
+    url: str
+        Url of the csv file, global_cases_time_series or global_deaths_time_series
+    refresh: bool
+        Check for a new version even if the cached one is recent
+
+    Returns
+    -------
+    pd.DataFrame
+        Cumulative numbers, one row per country and one column per date
+    """
+    path = os.path.join(_covid_folder(), url.rsplit("/", 1)[-1])
+    try:
+        age = time.time() - os.path.getmtime(path)
+    except OSError:
+        age = None
+
+    content = b""
+    if refresh or age is None or age > CACHE_MAX_AGE:
+        try:
+            content = _download_time_series(url, path)
+        except requests.exceptions.RequestException:
+            # Stale numbers are better than none
+            if age is None:
+                raise
+
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        mtime = None
+    if (
+        not content
+        and mtime is not None
+        and _TIME_SERIES.get(path, (None,))[0] == mtime
+    ):
+        return _TIME_SERIES[path][1]
+
+    data = pd.read_csv(io.BytesIO(content) if content else path)
+    data = (
+        data.rename(columns={"Country/Region": "Country"})
+        .drop(columns=["Province/State", "Lat", "Long"])
+        .groupby("Country")
+        .agg("sum")
+        .astype(float)
+    )
+    data.columns = pd.to_datetime(data.columns)
+    if mtime is not None:
+        _TIME_SERIES[path] = (mtime, data)
+    return data
+
 
 def get_global_cases(country: str) -> pd.DataFrame:
     """Get historical cases for given country
@@ -29,15 +142,7 @@ def get_global_cases(country: str) -> pd.DataFrame:
     pd.DataFrame
         Dataframe of historical cases
     """
-    cases = pd.read_csv(global_cases_time_series)
-    cases = cases.rename(columns={"Country/Region": "Country"})
-    cases = (
-        cases.drop(columns=["Province/State", "Lat", "Long"])
-        .groupby("Country")
-        .agg("sum")
-        .T
-    )
-    cases.index = pd.to_datetime(cases.index)
+    cases = get_time_series(global_cases_time_series).T
     cases = pd.DataFrame(cases[country]).diff().dropna()
     if cases.shape[1] > 1:
         return pd.DataFrame(cases.sum(axis=1))
@@ -57,52 +162,75 @@ def get_global_deaths(country: str) -> pd.DataFrame:
     pd.DataFrame
         Dataframe of historical deaths
     """
-    deaths = pd.read_csv(global_deaths_time_series)
-    deaths = deaths.rename(columns={"Country/Region": "Country"})
-    deaths = (
-        deaths.drop(columns=["Province/State", "Lat", "Long"])
-        .groupby("Country")
-        .agg("sum")
-        .T
-    )
-    deaths.index = pd.to_datetime(deaths.index)
+    deaths = get_time_series(global_deaths_time_series).T
     deaths = pd.DataFrame(deaths[country]).diff().dropna()
     if deaths.shape[1] > 1:
         return pd.DataFrame(deaths.sum(axis=1))
     return deaths
 
 
-def get_case_slopes(days_back: int = 30, threshold: int = 10000) -> pd.DataFrame:
+def get_slopes(
+    data: pd.DataFrame, windows: List[int], threshold: float = 0
+) -> pd.DataFrame:
+    """Least squares slope of the last days of every row, for several windows
+
+    The slopes of all the rows and windows are a single matrix product with the
+    centered days of each window.
+
+    Parameters
+    ----------
+    data: pd.DataFrame
+        Cumulative numbers, one row per country and one column per date
+    windows: List[int]
+        Number of days of each window
+    threshold: float
+        Minimum increase over a window for its slope to be kept
+
+    Returns
+    -------
+    pd.DataFrame
+        Slopes per day, one column per window, NaN below the threshold
+    """
+    cumulative = data.to_numpy(dtype=np.float64)
+    n_dates = cumulative.shape[1]
+    if min(windows) < 2 or max(windows) > n_dates:
+        raise ValueError(f"Windows must be between 2 and {n_dates} days")
+
+    longest = max(windows)
+    weights = np.zeros((longest, len(windows)))
+    for i, window in enumerate(windows):
+        days = np.arange(window) - (window - 1) / 2
+        weights[-window:, i] = days / np.dot(days, days)
+    slopes = cumulative[:, -longest:] @ weights
+
+    # Numbers added over each window, from the day before it
+    before = np.array([n_dates - window - 1 for window in windows])
+    increases = cumulative[:, -1:] - np.where(
+        before >= 0, cumulative[:, np.maximum(before, 0)], 0
+    )
+    slopes[increases <= threshold] = np.nan
+    return pd.DataFrame(slopes, index=data.index, columns=windows)
+
+
+def get_case_slopes(
+    days_back: Union[int, List[int]] = 30, threshold: int = 10000
+) -> pd.DataFrame:
     """Load cases and find slope over period
 
     Parameters
     ----------
-    days_back: int
-        Number of historical days to consider
+    days_back: Union[int, List[int]]
+        Number of historical days to consider, or several of them
     threshold: int
         Threshold for total number of cases
     Returns
     -------
     pd.DataFrame
-        Dataframe containing slopes
+        Dataframe containing slopes, a Slope column or one per number of days
     """
-    # Ignore the pandas warning for setting a slace with a value
-    warnings.filterwarnings("ignore")
-    cases = pd.read_csv(global_cases_time_series)
-    cases = cases.rename(columns={"Country/Region": "Country"})
-    cases = (
-        (
-            cases.drop(columns=["Province/State", "Lat", "Long"])
-            .groupby("Country")
-            .agg("sum")
-        )
-        .diff()
-        .dropna()
-    )
-    hist = cases.iloc[:, -days_back:]
-    hist["Sum"] = hist.sum(axis=1)
-    hist = hist[hist.Sum > threshold].drop(columns="Sum")
-    hist["Slope"] = hist.apply(
-        lambda x: np.polyfit(np.arange(days_back), x, 1)[0], axis=1
+    windows = [days_back] if isinstance(days_back, int) else list(days_back)
+    slopes = get_slopes(get_time_series(global_cases_time_series), windows, threshold)
+    slopes.columns = (
+        ["Slope"] if isinstance(days_back, int) else [f"Slope {w}d" for w in windows]
     )
-    return pd.DataFrame(hist["Slope"])
+    return slopes.dropna(how="all")
@@ -2,6 +2,7 @@
 __docformat__ = "numpy"
 
 import os
+from typing import List, Union
 
 import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
@@ -161,7 +162,7 @@ def display_covid_stat(
 
 
 def display_country_slopes(
-    days_back: int = 30,
+    days_back: Union[int, List[int]] = 30,
     limit: int = 10,
     ascend: bool = False,
     threshold: int = 10000,
@@ -171,8 +172,9 @@ def display_country_slopes(
 
     Parameters
     ----------
-    days_back: int
-        Number of historical days to get slope for
+    days_back: Union[int, List[int]]
+        Number of historical days to get slope for, or several of them sorted on
+        the first one
     limit: int
         Number to show in table
     ascend: bool
@@ -182,9 +184,12 @@ def display_country_slopes(
     export : str
         Format to export data
     """
-    hist_slope = covid_model.get_case_slopes(days_back, threshold).sort_values(
-        by="Slope", ascending=ascend
-    )
+    try:
+        hist_slope = covid_model.get_case_slopes(days_back, threshold)
+    except ValueError as e:
+        t_console.print(f"{e}\n")
+        return
+    hist_slope = hist_slope.sort_values(by=hist_slope.columns[0], ascending=ascend)
     if gtff.USE_TABULATE_DF:
         t_console.print(
             rich_table_from_df(
@@ -198,9 +203,10 @@ def display_country_slopes(
         t_console.print(hist_slope.head(limit).to_string())
     t_console.print("")
 
+    days = days_back if isinstance(days_back, int) else "_".join(map(str, days_back))
     export_data(
         export,
         os.path.dirname(os.path.abspath(__file__)),
-        f"slopes_{days_back}day",
+        f"slopes_{days}day",
         hist_slope,
     )
@@ -1,11 +1,225 @@
 """Rolling Statistics"""
 __docformat__ = "numpy"
 
-from typing import Tuple
+from math import comb
+from typing import Iterable, List, Tuple, Union
 
+import numpy as np
 import pandas as pd
 import pandas_ta as ta
 
+ROLLING_STATISTICS = ["count", "mean", "std", "var", "skew", "kurt"]
+
+# Running sums restart every this many of the longest windows
+BLOCK_WINDOWS = 8
+
+
+def _power_sums(
+    values: np.ndarray, block: int, lag: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Running sums of the powers 0 to 4 of the values, restarted every block
+
+    Each block is shifted by its own mean, so that the sums stay small and the
+    central moments computed from them keep their precision. An empty block is
+    added before the values, and empty rows after them, for the windows
+    overlapping the edges.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Values, one row per date and one column per series
+    block : int
+        Number of rows of each block, at least the longest window
+    lag : int
+        Number of empty rows added after the values
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, np.ndarray]
+        Running sums within each block, up to and including each row (power,
+        block, row, column), sums of each whole block (power, block, column)
+        and mean of each block (block, column)
+    """
+    n_rows, n_cols = values.shape
+    n_blocks = 1 + -(-(n_rows + lag) // block)
+    padded = np.full((n_blocks * block, n_cols), np.nan)
+    padded[block : block + n_rows] = values
+    padded = padded.reshape(n_blocks, block, n_cols)
+
+    valid = ~np.isnan(padded)
+    counts = valid.sum(axis=1)
+    shifts = np.divide(
+        np.where(valid, padded, 0).sum(axis=1),
+        counts,
+        out=np.zeros(counts.shape),
+        where=counts > 0,
+    )
+    deviations = np.where(valid, padded - shifts[:, None, :], 0)
+
+    running = np.empty((5,) + padded.shape)
+    running[0] = valid
+    running[1] = deviations
+    for power in range(2, 5):
+        np.multiply(running[power - 1], deviations, out=running[power])
+    np.cumsum(running, axis=2, out=running)
+    return running, running[:, :, -1, :], shifts
+
+
+def _window_sums(
+    running: np.ndarray, totals: np.ndarray, shifts: np.ndarray, length: int
+) -> np.ndarray:
+    """Sums of the powers of the deviations of the windows ending at each row
+
+    Windows are at most one block long, so they span one block or the end of a
+    block and the beginning of the next one. The part in the previous block is
+    moved to the shift of the next one with the binomial expansion.
+
+    Returns
+    -------
+    np.ndarray
+        Sums of the powers 0 to 4 from the shift of the block of the last row
+        of each window (power, block, row, column)
+    """
+    sums = running.copy()
+    sums[:, :, length:] -= running[:, :, :-length]
+
+    # The windows ending in the first rows of a block start in the previous one
+    block = running.shape[2]
+    tail = totals[:, :-1, None] - running[:, :-1, block - length : block - 1]
+    delta = (shifts[:-1] - shifts[1:])[:, None, :]
+    delta_powers = [np.ones_like(delta), delta]
+    for _ in range(3):
+        delta_powers.append(delta_powers[-1] * delta)
+    for power in range(5):
+        sums[power, 1:, : length - 1] += sum(
+            comb(power, k) * delta_powers[power - k] * tail[k] for k in range(power + 1)
+        )
+    return sums
+
+
+def _moments(
+    sums: np.ndarray, shift: np.ndarray, statistics: Iterable[str]
+) -> List[np.ndarray]:
+    """Statistics of each window from the sums of the powers of its deviations
+
+    The arithmetic is done in place where possible, as the arrays are as large
+    as the data.
+    """
+    count = sums[0]
+    results = []
+    with np.errstate(divide="ignore", invalid="ignore"):
+        inverse = 1 / count
+        s1 = sums[1] * inverse
+        s2 = sums[2] * inverse
+        mean_2 = s1 * s1
+        m2 = s2 - mean_2
+        # Below the rounding error of the sums, the values are all the same
+        m2[m2 <= 16 * np.finfo(np.float64).eps * s2] = 0
+        flat = m2 <= 1e-14
+
+        for statistic in statistics:
+            if statistic == "count":
+                result = count.copy()
+            elif statistic == "mean":
+                result = s1 + shift
+                result[count < 1] = np.nan
+            elif statistic in ("std", "var"):
+                result = m2 * count
+                result /= count - 1
+                result[count < 2] = np.nan
+                if statistic == "std":
+                    np.sqrt(result, out=result)
+            elif statistic == "skew":
+                # Adjusted Fisher-Pearson coefficient, as pandas
+                result = sums[3] * inverse
+                result -= 3 * s1 * s2
+                result += 2 * mean_2 * s1
+                result /= m2 * np.sqrt(m2)
+                result *= np.sqrt(count * (count - 1)) / (count - 2)
+                result[(count < 3) | flat] = np.nan
+            elif statistic == "kurt":
+                # Unbiased excess kurtosis, as pandas
+                result = sums[4] * inverse
+                result -= 4 * s1 * (sums[3] * inverse)
+                result += 6 * mean_2 * s2
+                result -= 3 * mean_2 * mean_2
+                result /= m2 * m2
+                result *= count * count - 1
+                result -= 3 * (count - 1) ** 2
+                result /= (count - 2) * (count - 3)
+                result[(count < 4) | flat] = np.nan
+            else:
+                raise ValueError(
+                    f"{statistic} is not one of {', '.join(ROLLING_STATISTICS)}"
+                )
+            results.append(result)
+    return results
+
+
+def get_rolling_statistics(
+    df: Union[pd.DataFrame, pd.Series],
+    lengths: Union[int, Iterable[int]],
+    statistics: Iterable[str] = ("mean", "std"),
+    center: bool = False,
+    min_periods: int = None,
+) -> pd.DataFrame:
+    """Rolling statistics of every column, for several window lengths at once
+
+    The powers of the values are summed once, in float64, for all the
+    statistics and window lengths, and each window is read off the sums.
+
+    Parameters
+    ----------
+    df : Union[pd.DataFrame, pd.Series]
+        Data, one column per series, e.g. the prices of several tickers
+    lengths : Union[int, Iterable[int]]
+        Length of the windows
+    statistics : Iterable[str]
+        Statistics among count, mean, std, var, skew and kurt
+    center : bool
+        Label the windows at their center instead of their end
+    min_periods : int
+        Minimum number of values in a window, defaults to the window length
+
+    Returns
+    -------
+    pd.DataFrame
+        Statistics, with (statistic, length, column) columns
+    """
+    if isinstance(df, pd.Series):
+        df = df.to_frame()
+    lengths = [lengths] if isinstance(lengths, int) else list(lengths)
+    statistics = list(statistics)
+    if not lengths or min(lengths) < 1:
+        raise ValueError("Window lengths must be positive")
+
+    values = df.to_numpy(dtype=np.float64)
+    n_rows = len(values)
+    block = BLOCK_WINDOWS * max(lengths)
+    # A centered window is the window ending that many rows later
+    offsets = {length: (length - 1) // 2 if center else 0 for length in lengths}
+    running, totals, shifts = _power_sums(values, block, max(offsets.values()))
+    row_shifts = np.repeat(shifts, block, axis=0)
+
+    n_cols = values.shape[1]
+    # Filled in place, one (statistic, length) group of columns at a time
+    output = np.empty((n_rows, len(statistics), len(lengths), n_cols))
+    for i, length in enumerate(lengths):
+        rows = slice(block + offsets[length], block + offsets[length] + n_rows)
+        sums = _window_sums(running, totals, shifts, length)
+        sums = sums.reshape(5, -1, n_cols)[:, rows]
+        too_few = sums[0] < max(length if min_periods is None else min_periods, 1)
+        for j, result in enumerate(_moments(sums, row_shifts[rows], statistics)):
+            if statistics[j] != "count":
+                result[too_few] = np.nan
+            output[:, j, i] = result
+
+    return pd.DataFrame(
+        output.reshape(n_rows, -1),
+        index=df.index,
+        columns=pd.MultiIndex.from_product([statistics, lengths, df.columns]),
+    )
+
 
 def get_rolling_avg(df: pd.DataFrame, length: int) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """Return rolling mean and standard deviation
@@ -24,10 +238,10 @@ def get_rolling_avg(df: pd.DataFrame, length: int) -> Tuple[pd.DataFrame, pd.Dat
     pd.DataFrame :
         Dataframe of rolling standard deviation
     """
-    rolling_mean = df.rolling(length, center=True, min_periods=1).mean()
-    rolling_std = df.rolling(length, center=True, min_periods=1).std()
-
-    return pd.DataFrame(rolling_mean), pd.DataFrame(rolling_std)
+    df_stats = get_rolling_statistics(
+        df, length, ["mean", "std"], center=True, min_periods=1
+    )
+    return df_stats["mean"][length], df_stats["std"][length]
 
 
 def get_spread(df: pd.DataFrame, length: int) -> Tuple[pd.DataFrame, pd.DataFrame]:
@@ -45,16 +259,13 @@ def get_spread(df: pd.DataFrame, length: int) -> Tuple[pd.DataFrame, pd.DataFram
     df_var : pd.DataFrame
         Dataframe of rolling standard deviation
     """
-    df_sd = ta.stdev(
-        close=df,
-        length=length,
-    ).dropna()
-    df_var = ta.variance(
-        close=df,
-        length=length,
-    ).dropna()
+    df_stats = get_rolling_statistics(df, length, ["std", "var"])
+    df_sd = df_stats["std"][length].dropna()
+    df_var = df_stats["var"][length].dropna()
+    df_sd.columns = [f"STDEV_{length}"]
+    df_var.columns = [f"VAR_{length}"]
 
-    return pd.DataFrame(df_sd), pd.DataFrame(df_var)
+    return df_sd, df_var
 
 
 def get_quantile(
@@ -103,7 +314,8 @@ def get_skew(df: pd.DataFrame, length: int) -> pd.DataFrame:
     df_skew : pd.DataFrame
         Dataframe of rolling skew
     """
-    df_skew = ta.skew(close=df, length=length).dropna()
+    df_skew = get_rolling_statistics(df, length, ["skew"])["skew"][length].dropna()
+    df_skew.columns = [f"SKEW_{length}"]
     return df_skew
 
 
@@ -122,5 +334,6 @@ def get_kurtosis(df: pd.DataFrame, length: int) -> pd.DataFrame:
     df_kurt : pd.DataFrame
         Dataframe of rolling kurtosis
     """
-    df_kurt = ta.kurtosis(close=df, length=length).dropna()
+    df_kurt = get_rolling_statistics(df, length, ["kurt"])["kurt"][length].dropna()
+    df_kurt.columns = [f"KURT_{length}"]
     return df_kurt
@@ -0,0 +1,455 @@
+"""Multi-indicator Technical Analysis Engine"""
+__docformat__ = "numpy"
+
+import functools
+import sys
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+import pandas_ta as ta
+
+# Parameters of each indicator, in the order they are given in a spec string,
+# with the default used when a parameter is omitted
+INDICATORS: Dict[str, Dict[str, Any]] = {
+    "sma": {"length": 20},
+    "ema": {"length": 20},
+    "wma": {"length": 20},
+    "hma": {"length": 20},
+    "zlma": {"length": 20},
+    "vwap": {},
+    "cci": {"length": 14, "scalar": 0.015},
+    "macd": {"fast": 12, "slow": 26, "signal": 9},
+    "rsi": {"length": 14, "scalar": 100.0, "drift": 1},
+    "stoch": {"k": 14, "d": 3, "smooth_k": 3},
+    "fisher": {"length": 14},
+    "cg": {"length": 14},
+    "adx": {"length": 14, "scalar": 100, "drift": 1},
+    "aroon": {"length": 25, "scalar": 100},
+    "bbands": {"length": 15, "std": 2.0, "mamode": "sma"},
+    "donchian": {"upper_length": 20, "lower_length": 20},
+    "kc": {"length": 20, "scalar": 2.0, "mamode": "ema"},
+    "atr": {"length": 14},
+    "ad": {"use_open": False},
+    "adosc": {"fast": 3, "slow": 10, "use_open": False},
+    "obv": {},
+}
+
+# Indicators reading the Volume column, which not every data source provides
+VOLUME_INDICATORS = ("vwap", "ad", "adosc", "obv")
+
+ENGINE_CACHE_SIZE = 8
+_ENGINE_CACHE: "OrderedDict[Tuple, IndicatorEngine]" = OrderedDict()
+
+
+def parse_spec(spec: str) -> Tuple[str, Dict[str, Any]]:
+    """Parse an indicator spec string such as 'macd_12_26_9' or 'bbands_20_2'
+
+    Parameters
+    ----------
+    spec: str
+        Indicator name followed by its parameters, separated by underscores.
+        Omitted trailing parameters take their default value.
+
+    Returns
+    -------
+    Tuple[str, Dict[str, Any]]
+        Indicator name and its parameters
+    """
+    name, *values = spec.strip().lower().split("_")
+    if name not in INDICATORS:
+        raise ValueError(f"Unknown indicator: {name}")
+    defaults = INDICATORS[name]
+    if len(values) > len(defaults):
+        raise ValueError(f"Too many parameters for {name}: {spec}")
+
+    params = dict(defaults)
+    for key, value in zip(defaults.keys(), values):
+        default = defaults[key]
+        if isinstance(default, bool):
+            params[key] = value in ("1", "true", "open")
+        else:
+            params[key] = type(default)(value)
+    return name, params
+
+
+def _cached(func):
+    """Memoize an engine method on its name and arguments"""
+
+    @functools.wraps(func)
+    def inner(self, *args):
+        key = (func.__name__,) + args
+        if key not in self.cache:
+            self.cache[key] = func(self, *args)
+        return self.cache[key]
+
+    return inner
+
+
+def _ema(values: pd.Series, length: int) -> pd.Series:
+    """EMA seeded with the SMA of the first window, as pandas_ta computes it"""
+    if len(values) < length:
+        return pd.Series(np.nan, index=values.index)
+    values = values.copy()
+    seed = values.iloc[:length].mean()
+    values.iloc[: length - 1] = np.nan
+    values.iloc[length - 1] = seed
+    return values.ewm(span=length, adjust=False).mean()
+
+
+def _non_zero_range(high: pd.Series, low: pd.Series) -> pd.Series:
+    """Difference of two series, nudged by epsilon where it is zero"""
+    diff = high - low
+    if diff.eq(0).any():
+        diff += sys.float_info.epsilon
+    return diff
+
+
+class IndicatorEngine:
+    """Computes technical indicators on a loaded dataframe, sharing intermediates
+
+    Moving averages, true range, accumulation/distribution and the like are
+    computed once per (source, length) and reused by every indicator needing
+    them, so asking for many indicators costs little more than the most
+    expensive one.  Results follow pandas_ta naming and conventions.
+    """
+
+    def __init__(self, df_stock: pd.DataFrame, s_interval: str = "1440min"):
+        self.df_stock = df_stock
+        self.close_column = (
+            "Adj Close"
+            if s_interval == "1440min" and "Adj Close" in df_stock
+            else "Close"
+        )
+        self.cache: Dict[Tuple, Any] = {}
+
+    def source(self, name: str) -> pd.Series:
+        """Series by name: a price column or a derived series such as 'true_range'
+
+        Derived series taking arguments are named 'method:arg1:arg2',
+        e.g. 'macd_line:12:26'.
+        """
+        if name == "close":
+            return self.df_stock[self.close_column]
+        if name in ("open", "high", "low", "volume"):
+            return self.df_stock[name.title()]
+        method, *args = name.split(":")
+        return getattr(self, method)(*[int(arg) for arg in args])
+
+    @_cached
+    def sma(self, source: str, length: int) -> pd.Series:
+        return self.source(source).rolling(length, min_periods=length).mean()
+
+    @_cached
+    def ema(self, source: str, length: int) -> pd.Series:
+        return _ema(self.source(source), length)
+
+    @_cached
+    def rma(self, source: str, length: int) -> pd.Series:
+        return self.source(source).ewm(alpha=1 / length, min_periods=length).mean()
+
+    @_cached
+    def ma(self, mamode: str, source: str, length: int) -> pd.Series:
+        if mamode in ("sma", "ema", "rma"):
+            return getattr(self, mamode)(source, length)
+        return ta.ma(mamode, self.source(source), length=length)
+
+    @_cached
+    def stdev(self, source: str, length: int) -> pd.Series:
+        return self.source(source).rolling(length, min_periods=length).std(ddof=0)
+
+    @_cached
+    def rolling_min(self, source: str, length: int) -> pd.Series:
+        return self.source(source).rolling(length, min_periods=length).min()
+
+    @_cached
+    def rolling_max(self, source: str, length: int) -> pd.Series:
+        return self.source(source).rolling(length, min_periods=length).max()
+
+    @_cached
+    def true_range(self) -> pd.Series:
+        high, low = self.source("high"), self.source("low")
+        prev_close = self.source("close").shift(1)
+        tr = pd.concat(
+            [_non_zero_range(high, low), high - prev_close, prev_close - low],
+            axis=1,
+        )
+        tr = tr.abs().max(axis=1)
+        tr.iloc[:1] = np.nan
+        return tr
+
+    @_cached
+    def typical_price(self) -> pd.Series:
+        return (self.source("high") + self.source("low") + self.source("close")) / 3
+
+    @_cached
+    def ad_line(self) -> pd.Series:
+        high, low = self.source("high"), self.source("low")
+        ad = 2 * self.source("close") - (high + low)
+        return (ad * self.source("volume") / _non_zero_range(high, low)).cumsum()
+
+    @_cached
+    def ad_open_line(self) -> pd.Series:
+        high, low = self.source("high"), self.source("low")
+        ad = _non_zero_range(self.source("close"), self.source("open"))
+        return (ad * self.source("volume") / _non_zero_range(high, low)).cumsum()
+
+    @_cached
+    def price_change(self, drift: int) -> pd.Series:
+        return self.source("close").diff(drift)
+
+    @_cached
+    def gains(self, drift: int) -> pd.Series:
+        return self.price_change(drift).clip(lower=0)
+
+    @_cached
+    def losses(self, drift: int) -> pd.Series:
+        return self.price_change(drift).clip(upper=0)
+
+    @_cached
+    def macd_line(self, fast: int, slow: int) -> pd.Series:
+        return self.ema("close", fast) - self.ema("close", slow)
+
+    @_cached
+    def macd_signal(self, fast: int, slow: int, signal: int) -> pd.Series:
+        line = self.macd_line(fast, slow)
+        start = line.first_valid_index()
+        if start is None:
+            return line.copy()
+        return _ema(line.loc[start:], signal).reindex(line.index)
+
+    def compute(self, name: str, **params) -> pd.DataFrame:
+        """Compute one indicator, reusing every intermediate already computed
+
+        Parameters
+        ----------
+        name: str
+            Indicator name, one of INDICATORS
+        params:
+            Indicator parameters, defaults are taken from INDICATORS
+
+        Returns
+        -------
+        pd.DataFrame
+            Indicator columns, named as pandas_ta names them
+        """
+        full_params = dict(INDICATORS[name])
+        full_params.update(params)
+        key = ("compute", name) + tuple(sorted(full_params.items()))
+        if key not in self.cache:
+            df_ta = getattr(self, f"_{name}")(**full_params)
+            if isinstance(df_ta, pd.Series):
+                df_ta = df_ta.to_frame()
+            self.cache[key] = df_ta
+        return self.cache[key]
+
+    def _sma(self, length: int) -> pd.Series:
+        return self.sma("close", length).rename(f"SMA_{length}")
+
+    def _ema(self, length: int) -> pd.Series:
+        return self.ema("close", length).rename(f"EMA_{length}")
+
+    def _wma(self, length: int) -> pd.Series:
+        return ta.wma(self.source("close"), length=length)
+
+    def _hma(self, length: int) -> pd.Series:
+        return ta.hma(self.source("close"), length=length)
+
+    def _zlma(self, length: int) -> pd.Series:
+        return ta.zlma(self.source("close"), length=length)
+
+    def _vwap(self) -> pd.Series:
+        day = self.df_stock.index.to_period("D")
+        volume = self.source("volume")
+        price_volume = self.typical_price() * volume
+        vwap = price_volume.groupby(day).cumsum() / volume.groupby(day).cumsum()
+        return vwap.rename("VWAP_D")
+
+    def _cci(self, length: int, scalar: float) -> pd.Series:
+        typical_price = self.typical_price()
+        windows = np.lib.stride_tricks.sliding_window_view(typical_price.values, length)
+        mad = np.full(len(typical_price), np.nan)
+        if len(windows):
+            mad[length - 1 :] = np.abs(
+                windows - windows.mean(axis=1, keepdims=True)
+            ).mean(axis=1)
+        cci = (typical_price - self.sma("typical_price", length)) / (scalar * mad)
+        return cci.rename(f"CCI_{length}_{scalar}")
+
+    def _macd(self, fast: int, slow: int, signal: int) -> pd.DataFrame:
+        if slow < fast:
+            fast, slow = slow, fast
+        line = self.macd_line(fast, slow)
+        signal_line = self.macd_signal(fast, slow, signal)
+        props = f"_{fast}_{slow}_{signal}"
+        return pd.DataFrame(
+            {
+                f"MACD{props}": line,
+                f"MACDh{props}": line - signal_line,
+                f"MACDs{props}": signal_line,
+            }
+        )
+
+    def _rsi(self, length: int, scalar: float, drift: int) -> pd.Series:
+        gains = self.rma(f"gains:{drift}", length)
+        losses = self.rma(f"losses:{drift}", length)
+        return (scalar * gains / (gains + losses.abs())).rename(f"RSI_{length}")
+
+    def _stoch(self, k: int, d: int, smooth_k: int) -> pd.DataFrame:
+        lowest_low = self.rolling_min("low", k)
+        highest_high = self.rolling_max("high", k)
+        stoch = 100 * (self.source("close") - lowest_low)
+        stoch /= _non_zero_range(highest_high, lowest_low)
+        stoch_k = stoch.rolling(smooth_k, min_periods=smooth_k).mean()
+        stoch_d = stoch_k.rolling(d, min_periods=d).mean()
+        props = f"_{k}_{d}_{smooth_k}"
+        return pd.DataFrame({f"STOCHk{props}": stoch_k, f"STOCHd{props}": stoch_d})
+
+    def _fisher(self, length: int) -> pd.DataFrame:
+        return ta.fisher(
+            high=self.source("high"), low=self.source("low"), length=length
+        )
+
+    def _cg(self, length: int) -> pd.Series:
+        return ta.cg(close=self.source("close"), length=length)
+
+    def _adx(self, length: int, scalar: int, drift: int) -> pd.DataFrame:
+        return ta.adx(
+            high=self.source("high"),
+            low=self.source("low"),
+            close=self.source("close"),
+            length=length,
+            scalar=scalar,
+            drift=drift,
+        )
+
+    def _aroon(self, length: int, scalar: int) -> pd.DataFrame:
+        return ta.aroon(
+            high=self.source("high"),
+            low=self.source("low"),
+            length=length,
+            scalar=scalar,
+        )
+
+    def _bbands(self, length: int, std: float, mamode: str) -> pd.DataFrame:
+        close = self.source("close")
+        mid = self.ma(mamode, "close", length)
+        deviations = std * self.stdev("close", length)
+        lower = mid - deviations
+        upper = mid + deviations
+        band_range = _non_zero_range(upper, lower)
+        props = f"_{length}_{std}"
+        return pd.DataFrame(
+            {
+                f"BBL{props}": lower,
+                f"BBM{props}": mid,
+                f"BBU{props}": upper,
+                f"BBB{props}": 100 * band_range / mid,
+                f"BBP{props}": _non_zero_range(close, lower) / band_range,
+            }
+        )
+
+    def _donchian(self, upper_length: int, lower_length: int) -> pd.DataFrame:
+        lower = self.rolling_min("low", lower_length)
+        upper = self.rolling_max("high", upper_length)
+        props = f"_{lower_length}_{upper_length}"
+        return pd.DataFrame(
+            {
+                f"DCL{props}": lower,
+                f"DCM{props}": 0.5 * (lower + upper),
+                f"DCU{props}": upper,
+            }
+        )
+
+    def _kc(self, length: int, scalar: float, mamode: str) -> pd.DataFrame:
+        basis = self.ma(mamode, "close", length)
+        band = self.ma(mamode, "true_range", length)
+        props = f"{mamode.lower()[0] if mamode else ''}_{length}_{scalar}"
+        return pd.DataFrame(
+            {
+                f"KCL{props}": basis - scalar * band,
+                f"KCB{props}": basis,
+                f"KCU{props}": basis + scalar * band,
+            }
+        )
+
+    def _atr(self, length: int) -> pd.Series:
+        return self.rma("true_range", length).rename(f"ATRr_{length}")
+
+    def _ad(self, use_open: bool) -> pd.Series:
+        if use_open:
+            return self.ad_open_line().rename("ADo")
+        return self.ad_line().rename("AD")
+
+    def _adosc(self, fast: int, slow: int, use_open: bool) -> pd.Series:
+        line = "ad_open_line" if use_open else "ad_line"
+        return (self.ema(line, fast) - self.ema(line, slow)).rename(
+            f"ADOSC_{fast}_{slow}"
+        )
+
+    def _obv(self) -> pd.Series:
+        sign = np.sign(self.price_change(1))
+        sign.iloc[0] = 1
+        return (sign * self.source("volume")).cumsum().rename("OBV")
+
+
+def get_engine(df_stock: pd.DataFrame, s_interval: str = "1440min") -> IndicatorEngine:
+    """Indicator engine for a loaded dataframe, reused while the data is unchanged
+
+    Parameters
+    ----------
+    df_stock: pd.DataFrame
+        Dataframe of prices
+    s_interval: str
+        Stock time interval
+
+    Returns
+    -------
+    IndicatorEngine
+        Engine memoizing every indicator computed on df_stock
+    """
+    key = (
+        id(df_stock),
+        df_stock.shape,
+        df_stock.index[0] if len(df_stock) else None,
+        df_stock.index[-1] if len(df_stock) else None,
+        s_interval,
+    )
+    engine = _ENGINE_CACHE.get(key)
+    if engine is None or engine.df_stock is not df_stock:
+        engine = IndicatorEngine(df_stock, s_interval)
+        _ENGINE_CACHE[key] = engine
+        while len(_ENGINE_CACHE) > ENGINE_CACHE_SIZE:
+            _ENGINE_CACHE.popitem(last=False)
+    else:
+        _ENGINE_CACHE.move_to_end(key)
+    return engine
+
+
+def get_indicators(
+    df_stock: pd.DataFrame, s_interval: str, specs: List[str]
+) -> pd.DataFrame:
+    """Compute several technical indicators in one pass over the loaded data
+
+    Parameters
+    ----------
+    df_stock: pd.DataFrame
+        Dataframe of prices
+    s_interval: str
+        Stock time interval
+    specs: List[str]
+        Indicator specs, e.g. ['ema_20', 'rsi_14', 'macd_12_26_9', 'bbands_20_2']
+
+    Returns
+    -------
+    pd.DataFrame
+        One wide dataframe with the columns of every indicator
+    """
+    engine = get_engine(df_stock, s_interval)
+    frames = []
+    for spec in specs:
+        name, params = parse_spec(spec)
+        frames.append(engine.compute(name, **params))
+    df_ta = pd.concat(frames, axis=1)
+    return df_ta.loc[:, ~df_ta.columns.duplicated()]
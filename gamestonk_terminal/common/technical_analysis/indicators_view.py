@@ -0,0 +1,71 @@
+"""Multi-indicator Technical Analysis View"""
+__docformat__ = "numpy"
+
+import os
+from typing import List
+
+import pandas as pd
+from tabulate import tabulate
+
+from gamestonk_terminal import feature_flags as gtff
+from gamestonk_terminal.common.technical_analysis import indicators_model
+from gamestonk_terminal.helper_funcs import export_data
+
+
+def display_indicators(
+    s_ticker: str,
+    s_interval: str,
+    df_stock: pd.DataFrame,
+    indicators: List[str],
+    num: int = 5,
+    export: str = "",
+):
+    """Display the latest values of several technical indicators at once
+
+    Parameters
+    ----------
+    s_ticker : str
+        Stock ticker
+    s_interval : str
+        Interval of stock data
+    df_stock : pd.DataFrame
+        Dataframe of prices
+    indicators : List[str]
+        Indicator specs, e.g. ['ema_20', 'rsi_14', 'macd_12_26_9']
+    num : int
+        Number of last bars to show
+    export : str
+        Format to export data
+    """
+    try:
+        df_ta = indicators_model.get_indicators(df_stock, s_interval, indicators)
+    except ValueError as e:
+        print(e, "\n")
+        return
+
+    df_show = df_ta.tail(num).T
+    if s_interval == "1440min":
+        df_show.columns = [col.strftime("%Y-%m-%d") for col in df_show.columns]
+    else:
+        df_show.columns = [col.strftime("%Y-%m-%d %H:%M") for col in df_show.columns]
+
+    print(f"\n{s_ticker.upper()} technical indicators")
+    if gtff.USE_TABULATE_DF:
+        print(
+            tabulate(
+                df_show,
+                headers=df_show.columns,
+                tablefmt="fancy_grid",
+                floatfmt=".2f",
+            ),
+            "\n",
+        )
+    else:
+        print(df_show.to_string(), "\n")
+
+    export_data(
+        export,
+        os.path.dirname(os.path.abspath(__file__)).replace("common", "stocks"),
+        "multi",
+        df_ta,
+    )
@@ -0,0 +1,434 @@
+"""Streaming Technical Analysis Model"""
+__docformat__ = "numpy"
+
+import copy
+import math
+import sys
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from gamestonk_terminal.common.technical_analysis import indicators_model
+
+NAN = float("nan")
+
+
+class _RunningEMA:
+    """EMA seeded with the SMA of the first window, updated in O(1)"""
+
+    def __init__(self, length: int):
+        self.length = length
+        self.alpha = 2 / (length + 1)
+        self.count = 0
+        self.valid = 0
+        self.total = 0.0
+        self.value = NAN
+
+    def update(self, x: float) -> float:
+        self.count += 1
+        if self.count <= self.length:
+            if not math.isnan(x):
+                self.valid += 1
+                self.total += x
+            if self.count == self.length and self.valid:
+                self.value = self.total / self.valid
+            return self.value
+        if not math.isnan(x):
+            self.value = self.alpha * x + (1 - self.alpha) * self.value
+        return self.value
+
+
+class _RunningRMA:
+    """Wilder's moving average (adjusted ewm with alpha = 1 / length) in O(1)"""
+
+    def __init__(self, length: int):
+        self.length = length
+        self.decay = 1 - 1 / length
+        self.count = 0
+        self.numerator = 0.0
+        self.denominator = 0.0
+
+    def update(self, x: float) -> float:
+        if math.isnan(x):
+            return self.value
+        self.count += 1
+        self.numerator = x + self.decay * self.numerator
+        self.denominator = 1 + self.decay * self.denominator
+        return self.value
+
+    @property
+    def value(self) -> float:
+        if self.count < self.length:
+            return NAN
+        return self.numerator / self.denominator
+
+
+class _RunningWindow:
+    """Mean and population standard deviation of the last length values in O(1)
+
+    Sums are taken around a shift that is refreshed, together with the sums
+    themselves, every length updates to keep round-off from accumulating.
+    """
+
+    def __init__(self, length: int):
+        self.length = length
+        self.values: deque = deque(maxlen=length)
+        self.shift = 0.0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.updates = 0
+
+    def update(self, x: float):
+        if len(self.values) == self.length:
+            old = self.values[0] - self.shift
+            self.total -= old
+            self.total_sq -= old * old
+        self.values.append(x)
+        self.updates += 1
+        if self.updates % self.length == 0:
+            self.shift = self.values[0]
+            self.total = sum(v - self.shift for v in self.values)
+            self.total_sq = sum((v - self.shift) ** 2 for v in self.values)
+        else:
+            new = x - self.shift
+            self.total += new
+            self.total_sq += new * new
+
+    @property
+    def ready(self) -> bool:
+        return len(self.values) == self.length
+
+    @property
+    def mean(self) -> float:
+        if not self.ready:
+            return NAN
+        return self.shift + self.total / self.length
+
+    @property
+    def std(self) -> float:
+        if not self.ready:
+            return NAN
+        mean = self.total / self.length
+        return math.sqrt(max(self.total_sq / self.length - mean * mean, 0.0))
+
+
+def _non_zero(diff: float) -> float:
+    return diff if diff != 0 else sys.float_info.epsilon
+
+
+class StreamingSMA:
+    """Simple moving average of the close"""
+
+    def __init__(self, length: int = 20):
+        self.columns = [f"SMA_{length}"]
+        self.window = _RunningWindow(length)
+
+    def update(self, bar: Dict[str, Any]) -> Dict[str, float]:
+        self.window.update(bar["close"])
+        return {self.columns[0]: self.window.mean}
+
+
+class StreamingEMA:
+    """Exponential moving average of the close"""
+
+    def __init__(self, length: int = 20):
+        self.columns = [f"EMA_{length}"]
+        self.ema = _RunningEMA(length)
+
+    def update(self, bar: Dict[str, Any]) -> Dict[str, float]:
+        return {self.columns[0]: self.ema.update(bar["close"])}
+
+
+class StreamingRSI:
+    """Relative strength index"""
+
+    def __init__(self, length: int = 14, scalar: float = 100.0, drift: int = 1):
+        self.columns = [f"RSI_{length}"]
+        self.scalar = scalar
+        self.closes: deque = deque(maxlen=drift + 1)
+        self.gains = _RunningRMA(length)
+        self.losses = _RunningRMA(length)
+
+    def update(self, bar: Dict[str, Any]) -> Dict[str, float]:
+        self.closes.append(bar["close"])
+        if len(self.closes) == self.closes.maxlen:
+            change = self.closes[-1] - self.closes[0]
+            self.gains.update(max(change, 0.0))
+            self.losses.update(min(change, 0.0))
+        gains, losses = self.gains.value, self.losses.value
+        return {self.columns[0]: self.scalar * gains / (gains + abs(losses))}
+
+
+class StreamingMACD:
+    """Moving average convergence divergence"""
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        if slow < fast:
+            fast, slow = slow, fast
+        props = f"_{fast}_{slow}_{signal}"
+        self.columns = [f"MACD{props}", f"MACDh{props}", f"MACDs{props}"]
+        self.fast = _RunningEMA(fast)
+        self.slow = _RunningEMA(slow)
+        self.signal = _RunningEMA(signal)
+
+    def update(self, bar: Dict[str, Any]) -> Dict[str, float]:
+        line = self.fast.update(bar["close"]) - self.slow.update(bar["close"])
+        # The signal line only starts once the MACD line is defined
+        signal = self.signal.update(line) if not math.isnan(line) else NAN
+        return dict(zip(self.columns, [line, line - signal, signal]))
+
+
+class StreamingBBands:
+    """Bollinger bands around a simple moving average"""
+
+    def __init__(self, length: int = 15, std: float = 2.0, mamode: str = "sma"):
+        if mamode != "sma":
+            raise ValueError("Streaming bbands only support mamode sma")
+        props = f"_{length}_{std}"
+        self.columns = [
+            f"BBL{props}",
+            f"BBM{props}",
+            f"BBU{props}",
+            f"BBB{props}",
+            f"BBP{props}",
+        ]
+        self.std = std
+        self.window = _RunningWindow(length)
+
+    def update(self, bar: Dict[str, Any]) -> Dict[str, float]:
+        self.window.update(bar["close"])
+        mid = self.window.mean
+        lower = mid - self.std * self.window.std
+        upper = mid + self.std * self.window.std
+        band = _non_zero(upper - lower)
+        return dict(
+            zip(
+                self.columns,
+                [
+                    lower,
+                    mid,
+                    upper,
+                    100 * band / mid,
+                    _non_zero(bar["close"] - lower) / band,
+                ],
+            )
+        )
+
+
+class _TrueRange:
+    def __init__(self):
+        self.prev_close = NAN
+
+    def update(self, bar: Dict[str, Any]) -> float:
+        if math.isnan(self.prev_close):
+            tr = NAN
+        else:
+            tr = max(
+                abs(_non_zero(bar["high"] - bar["low"])),
+                abs(bar["high"] - self.prev_close),
+                abs(self.prev_close - bar["low"]),
+            )
+        self.prev_close = bar["close"]
+        return tr
+
+
+class StreamingATR:
+    """Average true range"""
+
+    def __init__(self, length: int = 14):
+        self.columns = [f"ATRr_{length}"]
+        self.true_range = _TrueRange()
+        self.rma = _RunningRMA(length)
+
+    def update(self, bar: Dict[str, Any]) -> Dict[str, float]:
+        return {self.columns[0]: self.rma.update(self.true_range.update(bar))}
+
+
+class StreamingKC:
+    """Keltner channels from the EMA of the close and of the true range"""
+
+    def __init__(self, length: int = 20, scalar: float = 2.0, mamode: str = "ema"):
+        if mamode != "ema":
+            raise ValueError("Streaming kc only support mamode ema")
+        props = f"e_{length}_{scalar}"
+        self.columns = [f"KCL{props}", f"KCB{props}", f"KCU{props}"]
+        self.scalar = scalar
+        self.true_range = _TrueRange()
+        self.basis = _RunningEMA(length)
+        self.band = _RunningEMA(length)
+
+    def update(self, bar: Dict[str, Any]) -> Dict[str, float]:
+        basis = self.basis.update(bar["close"])
+        band = self.band.update(self.true_range.update(bar))
+        return dict(
+            zip(
+                self.columns,
+                [basis - self.scalar * band, basis, basis + self.scalar * band],
+            )
+        )
+
+
+class StreamingOBV:
+    """On balance volume"""
+
+    def __init__(self):
+        self.columns = ["OBV"]
+        self.prev_close = NAN
+        self.value = 0.0
+
+    def update(self, bar: Dict[str, Any]) -> Dict[str, float]:
+        if math.isnan(self.prev_close):
+            sign = 1.0
+        else:
+            change = bar["close"] - self.prev_close
+            sign = 0.0 if change == 0 else math.copysign(1.0, change)
+        self.value += sign * bar["volume"]
+        self.prev_close = bar["close"]
+        return {"OBV": self.value}
+
+
+class StreamingAD:
+    """Accumulation/distribution line"""
+
+    def __init__(self, use_open: bool = False):
+        self.use_open = use_open
+        self.columns = ["ADo" if use_open else "AD"]
+        self.value = 0.0
+
+    def update(self, bar: Dict[str, Any]) -> Dict[str, float]:
+        if self.use_open:
+            ad = _non_zero(bar["close"] - bar["open"])
+        else:
+            ad = 2 * bar["close"] - (bar["high"] + bar["low"])
+        self.value += ad * bar["volume"] / _non_zero(bar["high"] - bar["low"])
+        return {self.columns[0]: self.value}
+
+
+class StreamingVWAP:
+    """Volume weighted average price, anchored to each trading day"""
+
+    def __init__(self):
+        self.columns = ["VWAP_D"]
+        self.day = None
+        self.price_volume = 0.0
+        self.volume = 0.0
+
+    def update(self, bar: Dict[str, Any]) -> Dict[str, float]:
+        day = bar["date"].date() if bar.get("date") is not None else None
+        if day != self.day:
+            self.day = day
+            self.price_volume = 0.0
+            self.volume = 0.0
+        typical_price = (bar["high"] + bar["low"] + bar["close"]) / 3
+        self.price_volume += typical_price * bar["volume"]
+        self.volume += bar["volume"]
+        vwap = self.price_volume / self.volume if self.volume else NAN
+        return {"VWAP_D": vwap}
+
+
+STREAMING_INDICATORS = {
+    "sma": StreamingSMA,
+    "ema": StreamingEMA,
+    "rsi": StreamingRSI,
+    "macd": StreamingMACD,
+    "bbands": StreamingBBands,
+    "atr": StreamingATR,
+    "kc": StreamingKC,
+    "obv": StreamingOBV,
+    "ad": StreamingAD,
+    "vwap": StreamingVWAP,
+}
+
+
+class StreamingIndicators:
+    """Set of indicators updated bar by bar, in constant time per bar
+
+    Meant to be fed from a polling loop on intraday data: every refresh only
+    processes the bars that were not seen yet, however long the history is,
+    plus the last bar seen, which may still have been forming. Values match the
+    ones computed on the whole dataframe by indicators_model.get_indicators.
+    """
+
+    def __init__(self, specs: List[str], s_interval: str = "1min"):
+        self.close_column = "Adj Close" if s_interval == "1440min" else "Close"
+        self.indicators = []
+        for spec in specs:
+            name, params = indicators_model.parse_spec(spec)
+            if name not in STREAMING_INDICATORS:
+                raise ValueError(f"No streaming version of {name}")
+            self.indicators.append(STREAMING_INDICATORS[name](**params))
+        self.last_date = None
+        self.values: Dict[str, float] = {}
+        # State before the last bar fed by update_frame, to feed it again
+        self._checkpoint: Optional[Tuple[list, Dict[str, float], Any]] = None
+
+    @property
+    def columns(self) -> List[str]:
+        return [col for indicator in self.indicators for col in indicator.columns]
+
+    def update(self, bar: Dict[str, Any]) -> Dict[str, float]:
+        """Feed one new bar
+
+        Parameters
+        ----------
+        bar: Dict[str, Any]
+            Bar with open, high, low, close, volume and date keys
+
+        Returns
+        -------
+        Dict[str, float]
+            Latest value of every indicator column
+        """
+        self._checkpoint = None
+        return self._feed(bar)
+
+    def _feed(self, bar: Dict[str, Any]) -> Dict[str, float]:
+        for indicator in self.indicators:
+            self.values.update(indicator.update(bar))
+        self.last_date = bar.get("date")
+        return dict(self.values)
+
+    def update_frame(self, df_stock: pd.DataFrame) -> pd.DataFrame:
+        """Feed the bars of a refreshed dataframe that have not been seen yet
+
+        The last bar fed by the previous refresh is fed again from the state
+        before it, as it may have changed since.
+
+        Parameters
+        ----------
+        df_stock: pd.DataFrame
+            Dataframe of prices, as loaded by stocks_helper.load
+
+        Returns
+        -------
+        pd.DataFrame
+            Indicator values for the last bar fed before and the new bars
+        """
+        if self._checkpoint is not None and self.last_date in df_stock.index:
+            self.indicators, self.values, self.last_date = self._checkpoint
+        if self.last_date is not None:
+            df_stock = df_stock[df_stock.index > self.last_date]
+
+        rows = []
+        columns = {
+            "open": df_stock["Open"].values if "Open" in df_stock else None,
+            "high": df_stock["High"].values,
+            "low": df_stock["Low"].values,
+            "close": df_stock[self.close_column].values,
+            "volume": df_stock["Volume"].values,
+        }
+        for i, date in enumerate(df_stock.index):
+            bar = {
+                key: float(values[i])
+                for key, values in columns.items()
+                if values is not None
+            }
+            bar["date"] = date
+            if i == len(df_stock) - 1:
+                self._checkpoint = copy.deepcopy(
+                    (self.indicators, self.values, self.last_date)
+                )
+            rows.append(self._feed(bar))
+
+        return pd.DataFrame(rows, index=df_stock.index, columns=self.columns)
@@ -12,6 +12,11 @@ DEBUG_MODE = False
 # By default the jupyter notebook will be run on port 8888
 PAPERMILL_NOTEBOOK_REPORT_PORT = "8888"
 
+# Directory where downloaded and precomputed data is cached between sessions
+CACHE_DIR = os.getenv("GT_CACHE_DIR") or os.path.join(
+    os.path.expanduser("~"), ".gamestonk_terminal", "cache"
+)
+
 # Logging settings
 
 # 0 - INFO
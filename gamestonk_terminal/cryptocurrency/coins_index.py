@@ -0,0 +1,289 @@
+"""Cross-source coin index with fuzzy search"""
+__docformat__ = "numpy"
+
+import difflib
+import heapq
+import json
+import os
+from collections import Counter
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+import gamestonk_terminal.config_terminal as cfg
+
+# Bump whenever the layout of the files written by build_index changes
+INDEX_VERSION = 2
+
+INDEX_COLUMNS = ["CoinGecko", "CoinPaprika", "Binance", "Coinbase", "Symbol", "Name"]
+
+# find keys mapped to the index column searched for them
+SEARCH_KEYS = {"id": "CoinGecko", "symbol": "Symbol", "name": "Name"}
+
+DATA_FILES = [
+    "coingecko_coins.json",
+    "coinpaprika_coins.json",
+    "binance_gecko_map.json",
+    "coinbase_gecko_map.json",
+]
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+_INDEX: Dict[str, np.ndarray] = {}
+_COINS_DF: Optional[pd.DataFrame] = None
+
+
+def _read_json(file_name: str):
+    with open(os.path.join(DATA_DIR, file_name), encoding="utf8") as f:
+        return json.load(f)
+
+
+def build_all_coins_df() -> pd.DataFrame:
+    """Merge the coins of all sources: CoinGecko, CoinPaprika, Binance and Coinbase
+
+        CoinGecko - > name < - CoinPaprika
+        CoinGecko - > id <- Binance
+        CoinGecko - > id <- Coinbase
+
+    Returns
+    -------
+    pd.DataFrame
+        CoinGecko - id for coin in CoinGecko API: uniswap
+        CoinPaprika - id for coin in CoinPaprika API: uni-uniswap
+        Binance - symbol (baseAsset) for coin in Binance API: UNI
+        Coinbase - symbol for coin in Coinbase Pro API e.g UNI
+        Symbol - CoinGecko symbol: uni
+        Name - CoinGecko name: Uniswap
+    """
+    gecko_coins_df = pd.DataFrame(_read_json("coingecko_coins.json"))
+
+    paprika_coins_df = pd.DataFrame(_read_json("coinpaprika_coins.json"))
+    paprika_coins_df = paprika_coins_df[paprika_coins_df["is_active"]]
+    paprika_coins_df = paprika_coins_df[["id", "name"]].rename(
+        columns={"id": "CoinPaprika"}
+    )
+
+    binance_coins_df = pd.Series(_read_json("binance_gecko_map.json")).reset_index()
+    binance_coins_df.columns = ["Binance", "CoinGecko"]
+    coinbase_coins_df = pd.Series(_read_json("coinbase_gecko_map.json")).reset_index()
+    coinbase_coins_df.columns = ["Coinbase", "CoinGecko"]
+
+    df_merged = pd.merge(gecko_coins_df, paprika_coins_df, on="name", how="left")
+    df_merged.rename(
+        columns={"id": "CoinGecko", "symbol": "Symbol", "name": "Name"},
+        inplace=True,
+    )
+    df_merged = pd.merge(df_merged, binance_coins_df, on="CoinGecko", how="left")
+    df_merged = pd.merge(df_merged, coinbase_coins_df, on="CoinGecko", how="left")
+
+    return df_merged[INDEX_COLUMNS]
+
+
+def _encode(values: np.ndarray) -> np.ndarray:
+    return np.char.encode(values.astype(str), "utf-8")
+
+
+def _decode(values: np.ndarray) -> List[str]:
+    return [value.decode("utf-8") for value in values.tolist()]
+
+
+def _build_char_index(vocabulary: np.ndarray) -> Dict[str, np.ndarray]:
+    """Inverted index from character to the positions of the words holding it,
+    with the number of times they hold it"""
+    word_counts = [Counter(word) for word in vocabulary]
+    sizes = np.array([len(counts) for counts in word_counts], dtype=np.int32)
+    all_chars = np.array(
+        [ord(char) for counts in word_counts for char in counts], dtype=np.int32
+    )
+    all_counts = np.array(
+        [count for counts in word_counts for count in counts.values()], dtype=np.int32
+    )
+    all_words = np.repeat(np.arange(len(vocabulary), dtype=np.int32), sizes)
+
+    order = np.argsort(all_chars, kind="stable")
+    chars, starts = np.unique(all_chars[order], return_index=True)
+    offsets = np.append(starts, len(order)).astype(np.int64)
+
+    return {
+        "chars": chars,
+        "offsets": offsets,
+        "postings": all_words[order],
+        "counts": all_counts[order],
+        "lengths": np.array([len(word) for word in vocabulary], dtype=np.int32),
+    }
+
+
+def _fingerprint() -> str:
+    stats = [os.stat(os.path.join(DATA_DIR, file_name)) for file_name in DATA_FILES]
+    return ";".join(
+        [str(INDEX_VERSION)] + [f"{st.st_size}:{st.st_mtime_ns}" for st in stats]
+    )
+
+
+def _index_dir() -> str:
+    return os.path.join(cfg.CACHE_DIR, "coins_index")
+
+
+def build_index() -> Dict[str, np.ndarray]:
+    """Build the coin index: one array per column plus a character index per search key
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        Arrays of the index, by name
+    """
+    df = build_all_coins_df().fillna("")
+    arrays = {col: _encode(df[col].values) for col in INDEX_COLUMNS}
+    for col in SEARCH_KEYS.values():
+        vocabulary = np.unique(df[col].values[df[col].values != ""].astype(str))
+        arrays[f"{col}_words"] = _encode(vocabulary)
+        for name, values in _build_char_index(vocabulary).items():
+            arrays[f"{col}_{name}"] = values
+    return arrays
+
+
+def _write_index(arrays: Dict[str, np.ndarray], fingerprint: str):
+    index_dir = _index_dir()
+    os.makedirs(index_dir, exist_ok=True)
+    for name, values in arrays.items():
+        np.save(os.path.join(index_dir, f"{name}.npy"), values)
+    # The metadata goes last, so a partially written index is never picked up
+    with open(os.path.join(index_dir, "meta.json"), "w", encoding="utf8") as f:
+        json.dump({"fingerprint": fingerprint, "arrays": sorted(arrays)}, f)
+
+
+def _read_index(fingerprint: str) -> Optional[Dict[str, np.ndarray]]:
+    index_dir = _index_dir()
+    try:
+        with open(os.path.join(index_dir, "meta.json"), encoding="utf8") as f:
+            meta = json.load(f)
+        if meta["fingerprint"] != fingerprint:
+            return None
+        return {
+            name: np.load(os.path.join(index_dir, f"{name}.npy"), mmap_mode="r")
+            for name in meta["arrays"]
+        }
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def load_index() -> Dict[str, np.ndarray]:
+    """Load the coin index, memory mapped from the cache directory
+
+    The index is rebuilt when the bundled coin lists change and kept in memory
+    when the cache directory is not writable.
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        Arrays of the index, by name
+    """
+    global _COINS_DF  # pylint: disable=global-statement
+
+    if _INDEX:
+        return _INDEX
+
+    fingerprint = _fingerprint()
+    arrays = _read_index(fingerprint)
+    if arrays is None:
+        arrays = build_index()
+        try:
+            _write_index(arrays, fingerprint)
+        except OSError:
+            pass
+    _INDEX.update(arrays)
+    _COINS_DF = None
+    return _INDEX
+
+
+def clear_cache():
+    """Drop the index loaded in memory"""
+    global _COINS_DF  # pylint: disable=global-statement
+
+    _INDEX.clear()
+    _COINS_DF = None
+
+
+def get_all_coins_df() -> pd.DataFrame:
+    """Coins of all sources, read from the coin index
+
+    Returns
+    -------
+    pd.DataFrame
+        Same columns as build_all_coins_df, missing values are NaN
+    """
+    global _COINS_DF  # pylint: disable=global-statement
+
+    index = load_index()
+    if _COINS_DF is None:
+        _COINS_DF = pd.DataFrame(
+            {col: _decode(index[col]) for col in INDEX_COLUMNS}
+        ).replace("", np.nan)
+    return _COINS_DF.copy()
+
+
+def get_close_matches(
+    word: str, column: str, n: int = 3, cutoff: float = 0.6
+) -> List[str]:
+    """Values of an index column most similar to a word, as difflib.get_close_matches
+
+    The characters the word shares with every value, looked up in the character
+    index, bound the ratio of each value from above, like
+    difflib.SequenceMatcher.quick_ratio. Values are then scored from the highest
+    bound down, until no remaining one can enter the best n.
+
+    Parameters
+    ----------
+    word: str
+        Search query
+    column: str
+        Index column to search: CoinGecko, Symbol or Name
+    n: int
+        Maximum number of matches
+    cutoff: float
+        float between <0, 1>. Only return matches with a ratio above cutoff
+
+    Returns
+    -------
+    List[str]
+        Best matches, most similar first
+    """
+    if n <= 0:
+        raise ValueError(f"n must be > 0: {n}")
+
+    index = load_index()
+    chars = index[f"{column}_chars"]
+    offsets = index[f"{column}_offsets"]
+    postings = index[f"{column}_postings"]
+    counts = index[f"{column}_counts"]
+    lengths = index[f"{column}_lengths"]
+
+    shared = np.zeros(len(lengths), dtype=np.int64)
+    for char, count in Counter(word).items():
+        pos = np.searchsorted(chars, ord(char))
+        if pos < len(chars) and chars[pos] == ord(char):
+            start, end = offsets[pos], offsets[pos + 1]
+            shared[postings[start:end]] += np.minimum(counts[start:end], count)
+    bounds = 2.0 * shared / (len(word) + lengths)
+
+    candidates = np.flatnonzero(bounds >= cutoff)
+    candidates = candidates[np.argsort(-bounds[candidates], kind="stable")]
+
+    words = index[f"{column}_words"]
+    matcher = difflib.SequenceMatcher()
+    matcher.set_seq2(word)
+    best: List = []
+    for i in candidates.tolist():
+        # Ties are broken like difflib.get_close_matches, so equal bounds are scored
+        if len(best) == n and bounds[i] < best[0][0]:
+            break
+        candidate = words[i].decode("utf-8")
+        matcher.set_seq1(candidate)
+        ratio = matcher.ratio()
+        if ratio >= cutoff:
+            heapq.heappush(best, (ratio, candidate))
+            if len(best) > n:
+                heapq.heappop(best)
+
+    return [candidate for _, candidate in sorted(best, reverse=True)]
@@ -33,6 +33,7 @@ from gamestonk_terminal.cryptocurrency.due_diligence.binance_model import (
 )
 
 from gamestonk_terminal.cryptocurrency.due_diligence import coinbase_model
+from gamestonk_terminal.cryptocurrency import coins_index
 import gamestonk_terminal.config_terminal as cfg
 from gamestonk_terminal.feature_flags import USE_ION as ion
 from gamestonk_terminal import feature_flags as gtff
@@ -140,8 +141,8 @@ def load_coinbase_map():
 
 
 def prepare_all_coins_df() -> pd.DataFrame:
-    """Helper method which loads coins from all sources: CoinGecko, CoinPaprika, Binance
-    and merge those coins on keys:
+    """Helper method which loads coins from all sources: CoinGecko, CoinPaprika, Binance,
+    Coinbase merged on keys:
 
         CoinGecko - > name < - CoinPaprika
         CoinGecko - > id <- Binance
@@ -156,44 +157,11 @@ def prepare_all_coins_df() -> pd.DataFrame:
         Symbol: uni
     """
 
-    gecko_coins_df = load_coins_list("coingecko_coins.json")
+    # The merged map is built once per version of the bundled coin lists and read
+    # back from the coin index, see coins_index.load_index
+    coins_df = coins_index.get_all_coins_df()
 
-    paprika_coins_df = load_coins_list("coinpaprika_coins.json")
-    paprika_coins_df = paprika_coins_df[paprika_coins_df["is_active"]]
-    paprika_coins_df = paprika_coins_df[["rank", "id", "name", "symbol", "type"]]
-
-    # TODO: Think about scheduled job, that once a day will update data
-
-    binance_coins_df = load_binance_map().rename(columns={"symbol": "Binance"})
-    coinbase_coins_df = load_coinbase_map().rename(columns={"symbol": "Coinbase"})
-    gecko_paprika_coins_df = pd.merge(
-        gecko_coins_df, paprika_coins_df, on="name", how="left"
-    )
-    df_merged = pd.merge(
-        left=gecko_paprika_coins_df,
-        right=binance_coins_df,
-        left_on="id_x",
-        right_on="id",
-        how="left",
-    )
-    df_merged.rename(
-        columns={
-            "id_x": "CoinGecko",
-            "symbol_x": "Symbol",
-            "id_y": "CoinPaprika",
-        },
-        inplace=True,
-    )
-
-    df_merged = pd.merge(
-        left=df_merged,
-        right=coinbase_coins_df,
-        left_on="CoinGecko",
-        right_on="id",
-        how="left",
-    )
-
-    return df_merged[["CoinGecko", "CoinPaprika", "Binance", "Coinbase", "Symbol"]]
+    return coins_df[["CoinGecko", "CoinPaprika", "Binance", "Coinbase", "Symbol"]]
 
 
 def _create_closest_match_df(
@@ -423,8 +391,6 @@ def load(
 
 FIND_KEYS = ["id", "symbol", "name"]
 
-# TODO: Find better algorithm then difflib.get_close_matches to find most similar coins
-
 
 def find(source: str, coin: str, key: str, top: int, export: str) -> None:
     """Find similar coin by coin name,symbol or id.
@@ -453,14 +419,16 @@ def find(source: str, coin: str, key: str, top: int, export: str) -> None:
     """
 
     if source == "cg":
-        coins_df = get_coin_list()
-        coins_list = coins_df[key].to_list()
+        coins_df = (
+            coins_index.get_all_coins_df()[["CoinGecko", "Symbol", "Name"]]
+            .drop_duplicates()
+            .rename(columns={"CoinGecko": "id", "Symbol": "symbol", "Name": "name"})
+        )
         if key in ["symbol", "id"]:
             coin = coin.lower()
-        sim = difflib.get_close_matches(coin, coins_list, top)
-        df = pd.Series(sim).to_frame().reset_index()
+        sim = coins_index.get_close_matches(coin, coins_index.SEARCH_KEYS[key], top)
+        df = pd.Series(sim, dtype=object).to_frame().reset_index()
         df.columns = ["index", key]
-        coins_df.drop("index", axis=1, inplace=True)
         df = df.merge(coins_df, on=key)
 
     elif source == "cp":
@@ -584,9 +552,8 @@ def display_all_coins(
 
     elif not source or source not in sources:
         df = prepare_all_coins_df()
-        cg_coins_list = df["CoinGecko"].to_list()
-        sim = difflib.get_close_matches(coin.lower(), cg_coins_list, limit, cutoff)
-        df_matched = pd.Series(sim).to_frame().reset_index()
+        sim = coins_index.get_close_matches(coin.lower(), "CoinGecko", limit, cutoff)
+        df_matched = pd.Series(sim, dtype=object).to_frame().reset_index()
         df_matched.columns = ["index", "CoinGecko"]
         df = df.merge(df_matched, on="CoinGecko")
         df.drop("index", axis=1, inplace=True)
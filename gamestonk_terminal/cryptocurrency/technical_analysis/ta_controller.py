@@ -15,6 +15,7 @@ from gamestonk_terminal.cryptocurrency.cryptocurrency_helpers import load
 from gamestonk_terminal import feature_flags as gtff
 from gamestonk_terminal.helper_funcs import (
     EXPORT_BOTH_RAW_DATA_AND_FIGURES,
+    EXPORT_ONLY_RAW_DATA_ALLOWED,
     parse_known_args_and_warn,
     check_positive_list,
     check_positive,
@@ -24,6 +25,8 @@ from gamestonk_terminal.helper_funcs import (
 from gamestonk_terminal.menu import session
 from gamestonk_terminal.common.technical_analysis import (
     custom_indicators_view,
+    indicators_model,
+    indicators_view,
     momentum_view,
     overlap_view,
     trend_indicators_view,
@@ -54,6 +57,7 @@ class TechnicalAnalysisController(BaseController):
         "ad",
         "obv",
         "fib",
+        "multi",
     ]
 
     def __init__(
@@ -118,6 +122,7 @@ Volume:
     obv         on balance volume{not_dim}
 Custom:
     fib         fibonacci retracement
+    multi       several indicators computed at once
 """
         print(help_str)
 
@@ -1049,3 +1054,62 @@ Custom:
                 end_date=ns_parser.end,
                 export=ns_parser.export,
             )
+
+    def call_multi(self, other_args: List[str]):
+        """Process multi command"""
+        parser = argparse.ArgumentParser(
+            add_help=False,
+            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+            prog="multi",
+            description="""
+                Computes several technical indicators at once, sharing intermediate
+                moving averages and ranges between them. Indicators are given as
+                name_param1_param2, e.g. ema_20,rsi_14,macd_12_26_9,bbands_20_2.
+                Omitted parameters take their default values.
+            """,
+        )
+        parser.add_argument(
+            "-i",
+            "--indicators",
+            dest="indicators",
+            type=lambda s: [str(item).lower() for item in s.split(",")],
+            default=["ema_20", "sma_50", "rsi_14", "macd_12_26_9", "bbands_20_2"],
+            help="Indicators separated by comma",
+        )
+        parser.add_argument(
+            "-n",
+            "--num",
+            dest="num",
+            type=check_positive,
+            default=5,
+            help="Number of last bars to show",
+        )
+        if other_args and "-" not in other_args[0][0]:
+            other_args.insert(0, "-i")
+
+        ns_parser = parse_known_args_and_warn(
+            parser, other_args, EXPORT_ONLY_RAW_DATA_ALLOWED
+        )
+        if ns_parser:
+            indicators = ns_parser.indicators
+            if "Volume" not in self.stock:
+                no_volume = [
+                    spec
+                    for spec in indicators
+                    if spec.strip().split("_")[0] in indicators_model.VOLUME_INDICATORS
+                ]
+                if no_volume:
+                    print(
+                        f"No volume data for {self.ticker}, skipping: "
+                        f"{', '.join(no_volume)}\n"
+                    )
+                    indicators = [spec for spec in indicators if spec not in no_volume]
+            if indicators:
+                indicators_view.display_indicators(
+                    s_ticker=self.ticker,
+                    s_interval=self.interval,
+                    df_stock=self.stock,
+                    indicators=indicators,
+                    num=ns_parser.num,
+                    export=ns_parser.export,
+                )
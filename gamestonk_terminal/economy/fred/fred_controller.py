@@ -120,8 +120,8 @@ Current Series IDs:
         ns_parser = parse_known_args_and_warn(parser, other_args)
         if ns_parser:
             # Loop through entries.  If it exists, save title in dictionary
-            for s_id in ns_parser.series_id.split(","):
-                exists, information = fred_model.check_series_id(s_id)
+            checks = fred_model.check_series_ids(ns_parser.series_id.split(","))
+            for s_id, (exists, information) in checks.items():
                 if exists:
                     self.current_series[s_id] = {
                         "title": information["seriess"][0]["title"],
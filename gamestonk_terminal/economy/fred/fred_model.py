@@ -1,6 +1,10 @@
 """ Fred Model """
 __docformat__ = "numpy"
 
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple, Dict
 import requests
 import fred
@@ -10,6 +14,15 @@ from fredapi import Fred
 from gamestonk_terminal import config_terminal as cfg
 from gamestonk_terminal.helper_funcs import get_user_agent
 
+# Series checked or downloaded at the same time
+MAX_WORKERS = 8
+# Stored observations are not checked for new ones more often than this, in seconds
+SERIES_MAX_AGE = 60 * 60
+
+
+def _series_folder() -> str:
+    return os.path.join(cfg.CACHE_DIR, "fred")
+
 
 def check_series_id(series_id: str) -> Tuple[bool, Dict]:
     """Checks if series ID exists in fred
@@ -35,6 +48,27 @@ def check_series_id(series_id: str) -> Tuple[bool, Dict]:
     return r.status_code == 200, r.json()
 
 
+def check_series_ids(series_ids: List[str]) -> Dict[str, Tuple[bool, Dict]]:
+    """Checks if several series IDs exist in fred, all at once
+
+    Parameters
+    ----------
+    series_ids: List[str]
+        Series IDs to check
+
+    Returns
+    -------
+    Dict[str, Tuple[bool, Dict]]
+        Whether each series ID exists, with its series information
+    """
+    series_ids = list(dict.fromkeys(series_ids))
+    if not series_ids:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(series_ids))) as executor:
+        results = list(executor.map(check_series_id, series_ids))
+    return dict(zip(series_ids, results))
+
+
 def get_series_notes(series_term: str) -> pd.DataFrame:
     """Get Series notes. [Source: FRED]
     Parameters
@@ -88,8 +122,41 @@ def get_series_ids(series_term: str, num: int) -> Tuple[List[str], List[str]]:
     return df_series["id"].values, df_series["title"].values
 
 
+def _load_series(series_id: str) -> Tuple[Dict, pd.Series]:
+    """Stored observations of a series, with when they were first requested from
+    and last updated"""
+    path = os.path.join(_series_folder(), series_id)
+    try:
+        with open(f"{path}.json", encoding="utf8") as f:
+            meta = json.load(f)
+        data = pd.read_csv(f"{path}.csv", index_col=0, parse_dates=True).iloc[:, 0]
+    except (OSError, ValueError, IndexError):
+        return {}, pd.Series(dtype=float)
+    data = data[~data.index.duplicated(keep="last")].rename(None)
+    data.index.name = None
+    return meta, data
+
+
+def _store_series(series_id: str, meta: Dict, data: pd.Series, append: bool):
+    path = os.path.join(_series_folder(), series_id)
+    try:
+        os.makedirs(_series_folder(), exist_ok=True)
+        data.rename("value").to_csv(
+            f"{path}.csv", mode="a" if append else "w", header=not append
+        )
+        with open(f"{path}.json.tmp", "w", encoding="utf8") as f:
+            json.dump(meta, f)
+        os.replace(f"{path}.json.tmp", f"{path}.json")
+    except OSError:
+        pass
+
+
 def get_series_data(series_id: str, start: str) -> pd.DataFrame:
     """Get Series data. [Source: FRED]
+
+    Observations are stored locally. Once SERIES_MAX_AGE has passed, only the
+    ones since the last stored observation are pulled again.
+
     Parameters
     ----------
     series_id : str
@@ -101,5 +168,60 @@ def get_series_data(series_id: str, start: str) -> pd.DataFrame:
     pd.DataFrame
         Series data
     """
+    start_date = pd.Timestamp(start)
+    meta, data = _load_series(series_id)
     fredapi_client = Fred(cfg.API_FRED_KEY)
-    return fredapi_client.get_series(series_id, start)
+
+    if data.empty or pd.Timestamp(meta["start"]) > start_date:
+        data = fredapi_client.get_series(series_id, start_date)
+        meta = {"start": start_date.strftime("%Y-%m-%d"), "updated": time.time()}
+        _store_series(series_id, meta, data, append=False)
+        return data
+
+    if time.time() - meta["updated"] > SERIES_MAX_AGE:
+        try:
+            # The last stored observation is pulled again in case it was revised
+            new_data = fredapi_client.get_series(series_id, data.index[-1])
+        except (ValueError, OSError):
+            # Stored observations are better than none
+            new_data = None
+        if new_data is not None:
+            meta["updated"] = time.time()
+            last_date, last_value = data.index[-1], data.iloc[-1]
+            revised = last_date in new_data.index and not (
+                new_data[last_date] == last_value
+                or (pd.isna(new_data[last_date]) and pd.isna(last_value))
+            )
+            data = pd.concat([data, new_data])
+            data = data[~data.index.duplicated(keep="last")]
+            # A revised observation rewrites the stored ones, new ones are appended
+            if revised:
+                _store_series(series_id, meta, data, append=False)
+            else:
+                _store_series(
+                    series_id, meta, new_data[new_data.index > last_date], append=True
+                )
+
+    return data[data.index >= start_date]
+
+
+def get_aggregated_series_data(series_ids: List[str], start: str) -> pd.DataFrame:
+    """Get the data of several series at once. [Source: FRED]
+
+    Parameters
+    ----------
+    series_ids : List[str]
+        Series IDs to get data from
+    start : str
+        Start date to get data from, format yyyy-mm-dd
+    Returns
+    ----------
+    pd.DataFrame
+        Series data, one column per series ID
+    """
+    series_ids = list(dict.fromkeys(series_ids))
+    if not series_ids:
+        return pd.DataFrame()
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(series_ids))) as executor:
+        data = list(executor.map(lambda s_id: get_series_data(s_id, start), series_ids))
+    return pd.DataFrame(dict(zip(series_ids, data)))
@@ -5,7 +5,6 @@ import os
 import textwrap
 from typing import Dict
 import matplotlib.pyplot as plt
-import pandas as pd
 import numpy as np
 from pandas.plotting import register_matplotlib_converters
 from rich.console import Console
@@ -98,19 +97,7 @@ def display_fred_series(
         Number of raw data rows to show
     """
     series_ids = list(d_series.keys())
-    data = pd.DataFrame()
-
-    for s_id in series_ids:
-        data = pd.concat(
-            [
-                data,
-                pd.DataFrame(
-                    fred_model.get_series_data(s_id, start_date), columns=[s_id]
-                ),
-            ],
-            axis=1,
-        )
-    data = data.dropna()
+    data = fred_model.get_aggregated_series_data(series_ids, start_date).dropna()
     # Try to get everything onto the same 0-10 scale.
     # To do so, think in scientific notation.  Divide the data by whatever the E would be
     fig, ax = plt.subplots(figsize=plot_autoscale(), dpi=PLOT_DPI)
@@ -315,6 +315,15 @@ Major holdings: {', '.join(self.etf_holdings)}
             help="Number of holdings to get",
             default=10,
         )
+        parser.add_argument(
+            "-e",
+            "--etfs",
+            type=str,
+            dest="etfs",
+            help="Other ETFs to aggregate the holdings of with the loaded one, "
+            "as an equal weighted basket, comma separated",
+            default="",
+        )
         if other_args and "-" not in other_args[0][0]:
             other_args.insert(0, "-l")
 
@@ -322,11 +331,24 @@ Major holdings: {', '.join(self.etf_holdings)}
             parser, other_args, export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED
         )
         if ns_parser:
-            stockanalysis_view.view_holdings(
-                symbol=self.etf_name,
-                num_to_show=ns_parser.limit,
-                export=ns_parser.export,
-            )
+            etf_list = [self.etf_name] if self.etf_name else []
+            for etf in ns_parser.etfs.upper().split(","):
+                if etf and etf not in etf_list:
+                    etf_list.append(etf)
+            if len(etf_list) > 1:
+                stockanalysis_view.view_look_through_holdings(
+                    symbols=etf_list,
+                    num_to_show=ns_parser.limit,
+                    export=ns_parser.export,
+                )
+            elif etf_list:
+                stockanalysis_view.view_holdings(
+                    symbol=etf_list[0],
+                    num_to_show=ns_parser.limit,
+                    export=ns_parser.export,
+                )
+            else:
+                print("Please load an ETF or select ETFs with -e\n")
 
     def call_news(self, other_args: List[str]):
         """Process news command"""
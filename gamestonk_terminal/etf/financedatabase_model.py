@@ -4,6 +4,17 @@ __docformat__ = "numpy"
 from typing import Dict, List
 import financedatabase as fd
 
+from gamestonk_terminal.etf import universe_model
+
+
+def _search_etfs(query: str, field: str) -> Dict:
+    """ETFs whose field contains the query, ignoring case, from a local snapshot"""
+    data = universe_model.get_snapshot("financedatabase", fd.select_etfs)
+    symbols = list(data)
+    texts = [data[symbol].get(field) for symbol in symbols]
+    matches = universe_model.search("financedatabase", field, texts, query)
+    return {symbols[i]: data[symbols[i]] for i in matches}
+
 
 def get_etfs_by_name(name: str) -> Dict:
     """Return a selection of ETFs based on name filtered by total assets. [Source: Finance Database]
@@ -18,10 +29,7 @@ def get_etfs_by_name(name: str) -> Dict:
     data : pd.DataFrame
         Dataframe with ETFs that match a certain name
     """
-    data = fd.select_etfs()
-    data = fd.search_products(data, query=name, search="long_name")
-
-    return data
+    return _search_etfs(name, "long_name")
 
 
 def get_etfs_by_description(description: str) -> Dict:
@@ -37,10 +45,7 @@ def get_etfs_by_description(description: str) -> Dict:
     data : pd.DataFrame
         Dataframe with ETFs that match a certain description
     """
-    data = fd.select_etfs()
-    data = fd.search_products(data, query=description, search="summary")
-
-    return data
+    return _search_etfs(description, "summary")
 
 
 def get_etfs_by_category(category: str) -> Dict:
@@ -3,9 +3,64 @@ __docformat__ = "numpy"
 
 import configparser
 import os
+from typing import Dict, Tuple
 
+import numpy as np
 import pandas as pd
 
+from gamestonk_terminal.etf import universe_model
+
+
+def load_preset(preset: str) -> Dict[str, Tuple[float, float]]:
+    """Bounds set by a preset
+
+    Parameters
+    ----------
+    preset: str
+        Screener to use from presets
+
+    Returns
+    ----------
+    Dict[str, Tuple[float, float]]
+        Exclusive lower and upper bounds of each column with at least one of them
+    """
+    cf = configparser.ConfigParser()
+    path = os.path.join(os.path.abspath(os.path.dirname(__file__)), "presets/")
+    cf.read(path + preset)
+
+    bounds = {}
+    for col in cf.sections():
+        low, high = cf[col]["Min"], cf[col]["Max"]
+        if low != "None" or high != "None":
+            bounds[col] = (
+                -np.inf if low == "None" else float(low),
+                np.inf if high == "None" else float(high),
+            )
+    return bounds
+
+
+def screen(df: pd.DataFrame, bounds: Dict[str, Tuple[float, float]]) -> pd.DataFrame:
+    """Rows strictly within all the bounds, in a single vectorized mask
+
+    Parameters
+    ----------
+    df: pd.DataFrame
+        ETF overviews
+    bounds: Dict[str, Tuple[float, float]]
+        Exclusive lower and upper bounds of some columns
+
+    Returns
+    ----------
+    pd.DataFrame
+        Screened dataframe
+    """
+    if not bounds:
+        return df
+    values = df[list(bounds)].to_numpy(dtype=np.float64)
+    low, high = np.array(list(bounds.values())).T
+    # Missing values are never within the bounds
+    return df[((values > low) & (values < high)).all(axis=1)]
+
 
 def etf_screener(preset: str):
     """
@@ -22,25 +77,4 @@ def etf_screener(preset: str):
     df : pd.DataFrame
         Screened dataframe
     """
-
-    # pylint: disable=no-member
-
-    df = pd.read_csv(
-        "https://raw.githubusercontent.com/jmaslek/etf_scraper/main/etf_overviews.csv",
-        index_col=0,
-    )
-
-    cf = configparser.ConfigParser()
-    path = os.path.join(os.path.abspath(os.path.dirname(__file__)), "presets/")
-    cf.read(path + preset)
-    cols = cf.sections()
-
-    for col in cols:
-        if cf[col]["Min"] != "None":
-            query = f"{col} > {cf[col]['Min']} "
-            df = df.query(query)
-        if cf[col]["Max"] != "None":
-            query = f"{col} < {cf[col]['Max']} "
-            df = df.query(query)
-
-    return df
+    return screen(universe_model.get_overviews(), load_preset(preset))
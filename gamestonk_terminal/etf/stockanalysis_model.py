@@ -1,17 +1,38 @@
 """Stockanalysis.com/etf Model"""
 __docformat__ = "numpy"
 
-from typing import List, Tuple
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Dict, List, Optional, Tuple
 
+import lxml.html
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup as bs
+
+import gamestonk_terminal.config_terminal as cfg
+from gamestonk_terminal.etf import universe_model
 from gamestonk_terminal.helper_funcs import get_user_agent
 
+# ETF pages downloaded at the same time
+MAX_WORKERS = 12
+
+
+def _download_names_symbols() -> Tuple[List[str], List[str]]:
+    r = requests.get(
+        "https://stockanalysis.com/etf/", headers={"User-Agent": get_user_agent()}
+    )
+    r.raise_for_status()
+    soup2 = bs(r.text, "html.parser")
+    script = soup2.find("script", {"id": "__NEXT_DATA__"})
+    etfs = pd.DataFrame(json.loads(script.text)["props"]["pageProps"]["stocks"])
+    return etfs.s.to_list(), etfs.n.to_list()
+
 
 def get_all_names_symbols() -> Tuple[List[str], List[str]]:
-    """Gets all etf names and symbols
+    """Gets all etf names and symbols, from a local snapshot refreshed daily
 
     Returns
     -------
@@ -20,15 +41,87 @@ def get_all_names_symbols() -> Tuple[List[str], List[str]]:
     etf_names: List[str]
         List of all available etf names
     """
+    return universe_model.get_snapshot("stockanalysis", _download_names_symbols)
+
+
+def _pages_folder() -> str:
+    return os.path.join(cfg.CACHE_DIR, "etf", "stockanalysis")
+
+
+def parse_tables(html: str) -> List[List[List[str]]]:
+    """Parse the tables of a page
+
+    Parameters
+    ----------
+    html: str
+        Page to parse
+
+    Returns
+    -------
+    List[List[List[str]]]
+        Tables, as the texts of the cells of their rows with cells
+    """
+    tree = lxml.html.fromstring(html)
+    tables = []
+    for table in tree.iter("table"):
+        rows = [
+            [td.text_content() for td in tr.xpath("./td")] for tr in table.iter("tr")
+        ]
+        tables.append([row for row in rows if row])
+    return tables
+
+
+def get_etf_tables(symbol: str, page: str = "") -> List[List[List[str]]]:
+    """Get the tables of an ETF page, from the cache if parsed today
+
+    Parameters
+    ----------
+    symbol: str
+        ETF symbol
+    page: str
+        Page of the ETF, e.g. holdings, the overview by default
+
+    Returns
+    -------
+    List[List[List[str]]]
+        Tables, see parse_tables. Empty if the page is not found
+    """
+    prefix = f"{symbol.upper()}_{page or 'overview'}_"
+    cache_file = os.path.join(_pages_folder(), f"{prefix}{date.today()}.json")
+    try:
+        with open(cache_file, encoding="utf8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    link = f"https://stockanalysis.com/etf/{symbol}"
     r = requests.get(
-        "https://stockanalysis.com/etf/", headers={"User-Agent": get_user_agent()}
+        f"{link}/{page}/" if page else link, headers={"User-Agent": get_user_agent()}
     )
-    soup2 = bs(r.text, "html.parser")
-    script = soup2.find("script", {"id": "__NEXT_DATA__"})
-    etfs = pd.DataFrame(json.loads(script.text)["props"]["pageProps"]["stocks"])
-    etf_symbols = etfs.s.to_list()
-    etf_names = etfs.n.to_list()
-    return etf_symbols, etf_names
+    if r.status_code != 200:
+        return []
+    tables = parse_tables(r.text)
+    # A page without tables is a layout change or an error page, fetched again
+    if not any(tables):
+        return tables
+
+    try:
+        os.makedirs(_pages_folder(), exist_ok=True)
+        with open(f"{cache_file}.tmp", "w", encoding="utf8") as f:
+            json.dump(tables, f)
+        os.replace(f"{cache_file}.tmp", cache_file)
+        # Only the latest copy of the page is kept
+        for file_name in os.listdir(_pages_folder()):
+            path = os.path.join(_pages_folder(), file_name)
+            if (
+                file_name.startswith(prefix)
+                and file_name.endswith(".json")
+                and path != cache_file
+            ):
+                os.remove(path)
+    except OSError:
+        pass
+    return tables
 
 
 def get_etf_overview(etf_symbol: str) -> pd.DataFrame:
@@ -44,17 +137,8 @@ def get_etf_overview(etf_symbol: str) -> pd.DataFrame:
     df : pd.DataFrame
         Dataframe of stock overview data
     """
-    r = requests.get(
-        f"https://stockanalysis.com/etf/{etf_symbol}",
-        headers={"User-Agent": get_user_agent()},
-    )
-    soup = bs(r.text, "html.parser")  # %%
-    tables = soup.findAll("table")
-    texts = []
-    for tab in tables[:2]:
-        entries = tab.findAll("td")
-        for ent in entries:
-            texts.append(ent.get_text())
+    tables = get_etf_tables(etf_symbol)
+    texts = [cell for table in tables[:2] for row in table for cell in row]
 
     var_cols = [0, 2, 4, 6, 8, 10, 12, 18, 20, 22, 26, 28, 30, 32]
     vals = [idx + 1 for idx in var_cols]
@@ -77,27 +161,90 @@ def get_etf_holdings(symbol: str) -> pd.DataFrame:
     df: pd.DataFrame
         Dataframe of holdings
     """
+    tables = get_etf_tables(symbol, "holdings")
+    if not tables:
+        return pd.DataFrame()
+    rows = [row for row in tables[0] if len(row) >= 5]
+    df = pd.DataFrame(index=[row[1] for row in rows])
+    df["% Of Etf"] = [row[3] for row in rows]
+    df["Shares"] = [row[4] for row in rows]
+    return df
+
+
+def _map_symbols(function, symbols: List[str]) -> Dict[str, pd.DataFrame]:
+    """Call a function for all the symbols at the same time, skipping the failures"""
+    if not symbols:
+        return {}
+
+    def call(symbol: str) -> Optional[pd.DataFrame]:
+        try:
+            return function(symbol)
+        except (IndexError, ValueError, requests.exceptions.RequestException):
+            return None
+
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(symbols))) as executor:
+        results = list(executor.map(call, symbols))
+
+    return {s: df for s, df in zip(symbols, results) if df is not None}
+
+
+def get_etfs_holdings(symbols: List[str]) -> Dict[str, pd.DataFrame]:
+    """Get the holdings of several ETFs at once
+
+    Parameters
+    ----------
+    symbols: List[str]
+        Symbols to get holdings for
+
+    Returns
+    -------
+    Dict[str, pd.DataFrame]
+        Holdings by symbol, see get_etf_holdings. Those that could not be
+        downloaded or parsed are left out
+    """
+    return _map_symbols(get_etf_holdings, symbols)
+
 
-    link = f"https://stockanalysis.com/etf/{symbol}/holdings/"
-    r = requests.get(link, headers={"User-Agent": get_user_agent()})
-    if r.status_code == 200:
-        soup = bs(r.text, "html.parser")
-        soup = soup.find("table")
-        tds = soup.findAll("td")
-        tickers = []
-        for i in tds[1::5]:
-            tickers.append(i.text)
-        percents = []
-        for i in tds[3::5]:
-            percents.append(i.text)
-        shares = []
-        for i in tds[4::5]:
-            shares.append(i.text)
-        df = pd.DataFrame(index=tickers)
-        df["% Of Etf"] = percents
-        df["Shares"] = shares
-        return df
-    return pd.DataFrame()
+def get_look_through_holdings(symbols: List[str]) -> pd.DataFrame:
+    """Get the holdings of an equal weighted basket of ETFs
+
+    Parameters
+    ----------
+    symbols: List[str]
+        Symbols of the ETFs in the basket
+
+    Returns
+    -------
+    df: pd.DataFrame
+        Weight of each holding in the basket, in %, and ETFs holding it, by
+        decreasing weight. ETFs whose holdings are not found are left out
+    """
+    holdings = {
+        symbol: df for symbol, df in get_etfs_holdings(symbols).items() if not df.empty
+    }
+    if not holdings:
+        return pd.DataFrame()
+
+    weights = pd.concat(
+        [
+            pd.to_numeric(
+                df["% Of Etf"].str.rstrip("%").str.replace(",", ""), errors="coerce"
+            )
+            .fillna(0)
+            .groupby(level=0)
+            .sum()
+            .rename(symbol.upper())
+            for symbol, df in holdings.items()
+        ],
+        axis=1,
+    )
+
+    df = pd.DataFrame(index=weights.index)
+    df["Weight"] = weights.sum(axis=1) / len(holdings)
+    df["Etfs"] = [
+        ", ".join(weights.columns[held]) for held in weights.notna().to_numpy()
+    ]
+    return df.sort_values("Weight", ascending=False, kind="stable")
 
 
 def compare_etfs(symbols: List[str]) -> pd.DataFrame:
@@ -113,12 +260,10 @@ def compare_etfs(symbols: List[str]) -> pd.DataFrame:
     df_compare : pd.DataFrame
         Dataframe of etf comparisons
     """
-
-    df_compare = pd.DataFrame()
-    for symbol in symbols:
-        df_compare = pd.concat([df_compare, get_etf_overview(symbol)], axis=1)
-
-    return df_compare
+    overviews = _map_symbols(get_etf_overview, symbols)
+    if not overviews:
+        return pd.DataFrame()
+    return pd.concat(overviews.values(), axis=1)
 
 
 def get_etfs_by_name(name_to_search: str) -> pd.DataFrame:
@@ -135,16 +280,10 @@ def get_etfs_by_name(name_to_search: str) -> pd.DataFrame:
         Dataframe with symbols and names
     """
     all_symbols, all_names = get_all_names_symbols()
-
-    filtered_symbols = list()
-    filtered_names = list()
-    for symbol, name in zip(all_symbols, all_names):
-        if name_to_search.lower() in name.lower():
-            filtered_symbols.append(symbol)
-            filtered_names.append(name)
+    matches = universe_model.search("stockanalysis", "name", all_names, name_to_search)
 
     df = pd.DataFrame(
-        list(zip(filtered_symbols, filtered_names)), columns=["Symbol", "Name"]
+        [(all_symbols[i], all_names[i]) for i in matches], columns=["Symbol", "Name"]
     )
 
     return df
@@ -61,6 +61,36 @@ def view_holdings(symbol: str, num_to_show: int, export: str):
     export_data(export, os.path.dirname(os.path.abspath(__file__)), "holdings", data)
 
 
+def view_look_through_holdings(symbols: List[str], num_to_show: int, export: str):
+    """Show the holdings of an equal weighted basket of ETFs
+
+    Parameters
+    ----------
+    symbols: List[str]
+        ETF symbols in the basket
+    num_to_show: int
+        Number of holdings to show
+    export: str
+        Format to export data
+    """
+
+    data = stockanalysis_model.get_look_through_holdings(symbols)
+    if data.empty:
+        print("No holdings found for given ETFs\n")
+        return
+    data_show = data.head(num_to_show).copy()
+    data_show["Weight"] = data_show["Weight"].map("{:.2f}%".format)
+    if gtff.USE_TABULATE_DF:
+        print(
+            tabulate(data_show, headers=data_show.columns, tablefmt="fancy_grid"),
+            "\n",
+        )
+    else:
+        print(data_show.to_string(), "\n")
+
+    export_data(export, os.path.dirname(os.path.abspath(__file__)), "holdings", data)
+
+
 def view_comparisons(symbols: List[str], export: str):
     """Show ETF comparisons
 
@@ -76,7 +106,7 @@ def view_comparisons(symbols: List[str], export: str):
     for etf in symbols:
         if etf not in etf_list:
             print(f"{etf} not a known symbol.\n")
-            etf_list.remove(etf)
+    symbols = [etf for etf in symbols if etf in etf_list]
 
     data = stockanalysis_model.compare_etfs(symbols)
     if data.empty:
@@ -0,0 +1,237 @@
+"""Local snapshots of the ETF universe, with indexed name and description search"""
+__docformat__ = "numpy"
+
+import io
+import os
+import pickle
+import re
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import requests
+
+import gamestonk_terminal.config_terminal as cfg
+
+OVERVIEWS_URL = (
+    "https://raw.githubusercontent.com/jmaslek/etf_scraper/main/etf_overviews.csv"
+)
+
+# The overviews are scraped hourly through the market day
+OVERVIEWS_MAX_AGE = 60 * 60
+# Lists of ETFs change slowly
+LIST_MAX_AGE = 24 * 60 * 60
+
+_SNAPSHOTS: Dict[str, Tuple[float, Any]] = {}
+_INDEXES: Dict[Tuple[str, str], Tuple[float, Dict[str, np.ndarray]]] = {}
+
+
+def _universe_folder() -> str:
+    return os.path.join(cfg.CACHE_DIR, "etf")
+
+
+def _load(name: str) -> Optional[Tuple[float, Any]]:
+    """Snapshot from memory, or from disk when the file is newer"""
+    path = os.path.join(_universe_folder(), f"{name}.pkl")
+    try:
+        mtime = os.path.getmtime(path)
+        if name not in _SNAPSHOTS or _SNAPSHOTS[name][0] != mtime:
+            with open(path, "rb") as f:
+                _SNAPSHOTS[name] = (mtime, pickle.load(f))
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+    return _SNAPSHOTS.get(name)
+
+
+def _store(name: str, value: Any):
+    path = os.path.join(_universe_folder(), f"{name}.pkl")
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(f"{path}.tmp", "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(f"{path}.tmp", path)
+        _SNAPSHOTS[name] = (os.path.getmtime(path), value)
+    except OSError:
+        _SNAPSHOTS[name] = (time.time(), value)
+
+
+def get_snapshot(
+    name: str, fetch: Callable[[], Any], max_age: float = LIST_MAX_AGE
+) -> Any:
+    """Snapshot kept in memory and on disk, downloaded again once older than max_age
+
+    Parameters
+    ----------
+    name: str
+        Name of the snapshot, also the name of its cache file
+    fetch: Callable[[], Any]
+        Function downloading the snapshot
+    max_age: float
+        Maximum age of the snapshot, in seconds
+
+    Returns
+    -------
+    Any
+        Snapshot, the stale one if it cannot be downloaded again
+    """
+    cached = _load(name)
+    if cached is not None and time.time() - cached[0] <= max_age:
+        return cached[1]
+    try:
+        value = fetch()
+    except Exception:
+        if cached is not None:
+            return cached[1]
+        raise
+    _store(name, value)
+    return value
+
+
+def _download_overviews() -> Optional[pd.DataFrame]:
+    """Download the overviews unless the ones on disk are still current
+
+    Returns
+    -------
+    Optional[pd.DataFrame]
+        Overviews, None if the cached ones are still current
+    """
+    etag_file = os.path.join(_universe_folder(), "overviews.etag")
+    headers = {}
+    try:
+        with open(etag_file, encoding="utf8") as f:
+            etag = f.read().strip()
+        if etag and _load("overviews") is not None:
+            headers["If-None-Match"] = etag
+    except OSError:
+        pass
+
+    response = requests.get(OVERVIEWS_URL, headers=headers, timeout=30)
+    if response.status_code == 304:
+        return None
+    response.raise_for_status()
+
+    df = pd.read_csv(io.BytesIO(response.content), index_col=0)
+    try:
+        os.makedirs(_universe_folder(), exist_ok=True)
+        with open(etag_file, "w", encoding="utf8") as f:
+            f.write(response.headers.get("ETag", ""))
+    except OSError:
+        pass
+    return df
+
+
+def get_overviews(refresh: bool = False) -> pd.DataFrame:
+    """Overviews of all the ETFs scraped by https://github.com/jmaslek/etf_scraper
+
+    The snapshot is kept on disk and only downloaded again when it changed.
+
+    Parameters
+    ----------
+    refresh: bool
+        Check for new overviews even if the snapshot is recent
+
+    Returns
+    -------
+    pd.DataFrame
+        Overviews, one row per ETF
+    """
+    cached = _load("overviews")
+    if (
+        not refresh
+        and cached is not None
+        and time.time() - cached[0] <= OVERVIEWS_MAX_AGE
+    ):
+        return cached[1]
+
+    try:
+        df = _download_overviews()
+    except requests.exceptions.RequestException:
+        # Stale overviews are better than none
+        if cached is None:
+            raise
+        return cached[1]
+    if df is None:
+        # Still current, so the snapshot is as good as new
+        path = os.path.join(_universe_folder(), "overviews.pkl")
+        try:
+            os.utime(path)
+            _SNAPSHOTS["overviews"] = (os.path.getmtime(path), cached[1])  # type: ignore
+        except OSError:
+            pass
+        return cached[1]  # type: ignore
+    _store("overviews", df)
+    return df
+
+
+def _tokens(text: str) -> List[str]:
+    return re.findall(r"[a-z0-9]+", text.lower())
+
+
+def build_token_index(texts: List[Optional[str]]) -> Dict[str, np.ndarray]:
+    """Inverted index of the words of some texts
+
+    Parameters
+    ----------
+    texts: List[Optional[str]]
+        Texts to index, None for the missing ones
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        Positions of the texts containing each lower case word
+    """
+    positions: Dict[str, List[int]] = {}
+    for i, text in enumerate(texts):
+        if isinstance(text, str):
+            for token in set(_tokens(text)):
+                positions.setdefault(token, []).append(i)
+    return {token: np.array(rows) for token, rows in positions.items()}
+
+
+def search(name: str, field: str, texts: List[Optional[str]], query: str) -> List[int]:
+    """Positions of the texts of a snapshot containing a query, ignoring case
+
+    The index of the words of the texts is built once per version of the
+    snapshot. It narrows the texts down to those with every word of the
+    query, and only those are then checked.
+
+    Parameters
+    ----------
+    name: str
+        Name of the snapshot the texts come from
+    field: str
+        Field of the snapshot the texts come from
+    texts: List[Optional[str]]
+        Texts to search, None for the missing ones
+    query: str
+        Text to find
+
+    Returns
+    -------
+    List[int]
+        Positions of the texts containing the query
+    """
+    version = _SNAPSHOTS[name][0] if name in _SNAPSHOTS else time.time()
+    key = (name, field)
+    if key not in _INDEXES or _INDEXES[key][0] != version:
+        _INDEXES[key] = (version, build_token_index(texts))
+    index = _INDEXES[key][1]
+
+    candidates = None
+    # A word of the query is inside a word of every text containing the query
+    for word in set(_tokens(query)):
+        rows = [rows for token, rows in index.items() if word in token]
+        matches = np.unique(np.concatenate(rows)) if rows else np.array([], int)
+        candidates = (
+            matches if candidates is None else np.intersect1d(candidates, matches)
+        )
+    if candidates is None:
+        candidates = np.arange(len(texts))
+
+    query = query.lower()
+    return [
+        i
+        for i in candidates.tolist()
+        if isinstance(texts[i], str) and query in texts[i].lower()  # type: ignore
+    ]
@@ -20,11 +20,11 @@ from colorama import Fore, Style
 from pandas._config.config import get_option
 from pandas.plotting import register_matplotlib_converters
 import pandas.io.formats.format
-import requests
 from screeninfo import get_monitors
 
 from gamestonk_terminal import feature_flags as gtff
 from gamestonk_terminal import config_plot as cfgPlot
+from gamestonk_terminal import reference_data
 
 
 register_matplotlib_converters()
@@ -429,6 +429,30 @@ def divide_chunks(data, n):
         yield data[i : i + n]
 
 
+def load_tickers_file(path: str) -> List[str]:
+    """Read tickers from a text or csv file
+
+    Parameters
+    ----------
+    path: str
+        Text file with tickers separated by new lines, commas or spaces, or csv
+        file with the tickers in the first column
+
+    Returns
+    -------
+    List[str]
+        Tickers, upper case
+    """
+    with open(path, encoding="utf8") as f:
+        if path.endswith(".csv"):
+            cells = [line.split(",")[0] for line in f]
+            if cells and cells[0].strip().lower() in ("ticker", "symbol"):
+                cells = cells[1:]
+        else:
+            cells = re.split(r"[,\s]+", f.read())
+    return [cell.strip().upper() for cell in cells if cell.strip()]
+
+
 def get_next_stock_market_days(last_stock_day, n_next_days) -> list:
     """Gets the next stock market day. Checks against weekends and holidays"""
     n_days = 0
@@ -911,22 +935,14 @@ def export_data(
 
 def get_rf() -> float:
     """
-    Uses the fiscaldata.gov API to get most recent T-Bill rate
+    Uses the fiscaldata.gov API to get most recent T-Bill rate, cached for a day
 
     Returns
     -------
     rate : float
         The current US T-Bill rate
     """
-    try:
-        base = "https://api.fiscaldata.treasury.gov/services/api/fiscal_service"
-        end = "/v2/accounting/od/avg_interest_rates"
-        filters = "?filter=security_desc:eq:Treasury Bills&sort=-record_date"
-        response = requests.get(base + end + filters)
-        latest = response.json()["data"][0]
-        return round(float(latest["avg_interest_rate_amt"]) / 100, 8)
-    except Exception:
-        return 0.02
+    return reference_data.get_rf()
 
 
 class LineAnnotateDrawer:
@@ -2,17 +2,21 @@
 __docformat__ = "numpy"
 
 # pylint: disable=R1732
+import argparse
 import os
 from typing import List
 import webbrowser
 from datetime import datetime
 from ast import literal_eval
 from prompt_toolkit.completion import NestedCompleter
+from tabulate import tabulate
 from gamestonk_terminal.decorators import try_except
 import papermill as pm
 
 from gamestonk_terminal.parent_classes import BaseController
 from gamestonk_terminal import feature_flags as gtff
+from gamestonk_terminal.helper_funcs import check_positive, parse_known_args_and_warn
+from gamestonk_terminal.jupyter.reports import reports_model
 from gamestonk_terminal.menu import session
 
 
@@ -73,6 +77,7 @@ class ReportController(BaseController):
             + f"{(max_len_name-len(report_to_run))*' '} "
             + f"{args if args != '<>' else ''}\n"
         )
+    CHOICES_COMMANDS = ["batch"]
     CHOICES_MENUS = report_names + ids_reports
 
     def __init__(self, queue: List[str] = None):
@@ -88,7 +93,9 @@ class ReportController(BaseController):
         help_text = f"""
 
 Select one of the following reports:
-{self.reports_opts}"""
+{self.reports_opts}
+   batch    run several reports for several tickers at once
+"""
         print(help_text)
 
     @try_except
@@ -137,7 +144,7 @@ Select one of the following reports:
             elif known_args.cmd == "r":
                 known_args.cmd = "reset"
 
-            if known_args.cmd in ["quit", "help", "reset", "home", "exit"]:
+            if known_args.cmd in ["quit", "help", "reset", "home", "exit", "batch"]:
                 getattr(
                     self,
                     "call_" + known_args.cmd,
@@ -213,3 +220,100 @@ Select one of the following reports:
             )
 
         return self.queue
+
+    def call_batch(self, other_args: List[str]):
+        """Process batch command"""
+        parser = argparse.ArgumentParser(
+            add_help=False,
+            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+            prog="batch",
+            description="""Run several reports, for several tickers, concurrently in
+            separate kernels and export them as HTML. Reports already run today with
+            the same arguments are exported from the cache instead of running again.""",
+        )
+        parser.add_argument(
+            "-r",
+            "--reports",
+            dest="reports",
+            type=lambda s: [str(item) for item in s.split(",")],
+            default=[],
+            help="Reports to run, by name or number, separated by comma",
+        )
+        parser.add_argument(
+            "-t",
+            "--tickers",
+            dest="tickers",
+            type=lambda s: [str(item).upper() for item in s.split(",")],
+            default=[],
+            help="Tickers to run the reports for, separated by comma",
+        )
+        parser.add_argument(
+            "-w",
+            "--workers",
+            dest="workers",
+            type=check_positive,
+            default=4,
+            help="Number of reports run at the same time",
+        )
+        parser.add_argument(
+            "--no-cache",
+            action="store_false",
+            default=True,
+            dest="use_cache",
+            help="Run the reports even if they already ran today",
+        )
+        if other_args and "-" not in other_args[0][0]:
+            other_args.insert(0, "-r")
+        ns_parser = parse_known_args_and_warn(parser, other_args)
+        if ns_parser:
+            jobs = []
+            for report in ns_parser.reports:
+                report_to_run = self.d_id_to_report_name.get(report, report)
+                if report_to_run not in self.d_params:
+                    print(f"Report {report} not found.\n")
+                    return
+                params = self.d_params[report_to_run]
+                if not params:
+                    jobs.append((report_to_run, {}))
+                elif len(params) == 1:
+                    if not ns_parser.tickers:
+                        print(f"Report {report_to_run} requires tickers (-t).\n")
+                        return
+                    jobs += [
+                        (report_to_run, {params[0]: ticker})
+                        for ticker in ns_parser.tickers
+                    ]
+                else:
+                    print(
+                        f"Report {report_to_run} takes more than one argument, "
+                        "run it on its own.\n"
+                    )
+                    return
+
+            if not jobs:
+                print("No reports selected. Use -r to select reports.\n")
+                return
+
+            print(f"Running {len(jobs)} reports with {ns_parser.workers} workers..")
+            results = reports_model.execute_reports(
+                jobs, ns_parser.workers, ns_parser.use_cache
+            )
+
+            rows = [
+                [
+                    report_to_run,
+                    " ".join(params.values()),
+                    "cache" if from_cache else ("failed" if error else "run"),
+                    path or error,
+                ]
+                for (report_to_run, params), (path, from_cache, error) in zip(
+                    jobs, results
+                )
+            ]
+            headers = ["Report", "Arguments", "Status", "Output"]
+            if gtff.USE_TABULATE_DF:
+                print(tabulate(rows, headers=headers, tablefmt="fancy_grid"), "\n")
+            else:
+                for row in rows:
+                    print(" ".join(row))
+                print("")
@@ -0,0 +1,226 @@
+"""Reports Model Module."""
+__docformat__ = "numpy"
+
+import hashlib
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+
+import nbformat
+import papermill as pm
+from nbconvert import HTMLExporter
+
+import gamestonk_terminal.config_terminal as cfg
+
+REPORTS_FOLDER = os.path.dirname(os.path.abspath(__file__))
+STORED_FOLDER = os.path.join(REPORTS_FOLDER, "stored")
+
+# Cells exporting the notebook themselves, replaced by a direct HTML export
+EXPORT_CELL_PREFIX = "!jupyter nbconvert"
+
+
+def _cache_folder() -> str:
+    return os.path.join(cfg.CACHE_DIR, "reports")
+
+
+def load_report_template(report_name: str) -> nbformat.NotebookNode:
+    """Load a report notebook without the cells that convert it to HTML
+
+    Parameters
+    ----------
+    report_name: str
+        Name of the notebook in the reports folder, without extension
+
+    Returns
+    -------
+    nbformat.NotebookNode
+        Report template
+    """
+    notebook = nbformat.read(
+        os.path.join(REPORTS_FOLDER, report_name + ".ipynb"), as_version=4
+    )
+    notebook.cells = [
+        cell
+        for cell in notebook.cells
+        if not (
+            cell.cell_type == "code"
+            and cell.source.lstrip().startswith(EXPORT_CELL_PREFIX)
+        )
+    ]
+    return notebook
+
+
+def get_report_key(
+    report_name: str,
+    notebook: nbformat.NotebookNode,
+    params: Dict[str, str],
+    day: date,
+) -> str:
+    """Key of an executed report, changing with its parameters, day and code
+
+    Parameters
+    ----------
+    report_name: str
+        Name of the report
+    notebook: nbformat.NotebookNode
+        Report template
+    params: Dict[str, str]
+        Parameters of the report
+    day: date
+        Day the report is run
+
+    Returns
+    -------
+    str
+        Hex digest identifying the executed report
+    """
+    content = json.dumps(
+        {
+            "report": report_name,
+            "params": params,
+            "day": day.isoformat(),
+            "cells": [
+                cell.source for cell in notebook.cells if cell.cell_type == "code"
+            ],
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+
+def get_report_output_name(
+    report_name: str, args: List[str], when: Optional[datetime] = None
+) -> str:
+    """Output name of a report: <date time>_<report name>_<args>
+
+    Parameters
+    ----------
+    report_name: str
+        Name of the report
+    args: List[str]
+        Values of the report parameters
+    when: Optional[datetime]
+        Time the report is run, now by default
+
+    Returns
+    -------
+    str
+        File name, without extension
+    """
+    when = when or datetime.now()
+    args_to_output = f"_{'_'.join(args)}" if "_".join(args) else ""
+    return f"{when.strftime('%Y%m%d_%H%M%S')}_{report_name}{args_to_output}"
+
+
+def execute_report(
+    report_name: str, params: Dict[str, str], use_cache: bool = True
+) -> Tuple[str, bool]:
+    """Execute a report in its own kernel and export it as HTML
+
+    A report already executed today with the same parameters and code is
+    not executed again, its cached outputs are exported instead.
+
+    Parameters
+    ----------
+    report_name: str
+        Name of the report
+    params: Dict[str, str]
+        Parameters of the report
+    use_cache: bool
+        Reuse a report executed today with the same parameters
+
+    Returns
+    -------
+    Tuple[str, bool]
+        Path of the HTML report and whether it was read from the cache
+    """
+    now = datetime.now()
+    template = load_report_template(report_name)
+    key = get_report_key(report_name, template, params, now.date())
+    cached_notebook = os.path.join(_cache_folder(), key + ".ipynb")
+
+    notebook_output = os.path.join(
+        STORED_FOLDER, get_report_output_name(report_name, list(params.values()), now)
+    )
+    os.makedirs(STORED_FOLDER, exist_ok=True)
+
+    from_cache = use_cache and os.path.isfile(cached_notebook)
+    if from_cache:
+        notebook = nbformat.read(cached_notebook, as_version=4)
+        nbformat.write(notebook, notebook_output + ".ipynb")
+    else:
+        # papermill only reads templates from a path
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".ipynb", encoding="utf-8", delete=False
+        ) as f:
+            nbformat.write(template, f)
+        try:
+            notebook = pm.execute_notebook(
+                f.name,
+                notebook_output + ".ipynb",
+                parameters={**params, "report_name": notebook_output},
+                progress_bar=False,
+            )
+        finally:
+            os.remove(f.name)
+        os.makedirs(_cache_folder(), exist_ok=True)
+        nbformat.write(notebook, cached_notebook)
+
+    html, _ = HTMLExporter(exclude_input=True).from_notebook_node(notebook)
+    with open(notebook_output + ".html", "w", encoding="utf-8") as f:
+        f.write(html)
+
+    return notebook_output + ".html", from_cache
+
+
+def _execute_report_job(
+    job: Tuple[str, Dict[str, str]], use_cache: bool
+) -> Tuple[str, bool, str]:
+    report_name, params = job
+    try:
+        path, from_cache = execute_report(report_name, params, use_cache)
+        return path, from_cache, ""
+    except Exception as e:  # pylint: disable=broad-except
+        return "", False, str(e).strip().split("\n")[-1]
+
+
+def clear_old_reports_cache():
+    """Remove the reports cached on previous days"""
+    folder = _cache_folder()
+    if not os.path.isdir(folder):
+        return
+    today = date.today()
+    for file_name in os.listdir(folder):
+        path = os.path.join(folder, file_name)
+        if date.fromtimestamp(os.path.getmtime(path)) < today:
+            os.remove(path)
+
+
+def execute_reports(
+    jobs: List[Tuple[str, Dict[str, str]]], workers: int = 4, use_cache: bool = True
+) -> List[Tuple[str, bool, str]]:
+    """Execute several reports concurrently, each one in a separate kernel
+
+    Parameters
+    ----------
+    jobs: List[Tuple[str, Dict[str, str]]]
+        Report names with their parameters
+    workers: int
+        Number of reports executed at the same time
+    use_cache: bool
+        Reuse the reports executed today with the same parameters
+
+    Returns
+    -------
+    List[Tuple[str, bool, str]]
+        For each job: path of the HTML report, whether it was read from the
+        cache and the error message if it failed
+    """
+    clear_old_reports_cache()
+    if not jobs:
+        return []
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+        return list(executor.map(_execute_report_job, jobs, [use_cache] * len(jobs)))
@@ -8,8 +8,6 @@ from typing import List
 
 import numpy as np
 import pandas as pd
-import statsmodels.api as sm
-from statsmodels.regression.rolling import RollingOLS
 
 from gamestonk_terminal.portfolio import (
     portfolio_view,
@@ -107,6 +105,9 @@ def add_values(
 ) -> pd.DataFrame:
     """Creates a new df with performance results
 
+    The transactions are applied in date order to arrays of daily changes,
+    keeping the running quantity and cost basis of each ticker.
+
     Parameters
     ----------
     log : pd.DataFrame
@@ -121,79 +122,79 @@ def add_values(
     log : pd.DataFrame
         A dataframe with daily holdings
     """
-    for index, _ in log.iterrows():
-        # Add stocks to dataframe
-        values = changes[changes["Date"] == index]
-        if len(values.index) > 0:
-            for _, sub_row in values.iterrows():
-                ticker = sub_row["Name"]
-                quantity = sub_row["Quantity"]
-                price = sub_row["Price"]
-                fees = sub_row["Fees"]
-                if math.isnan(fees):
-                    fees = 0
-                sign = -1 if sub_row["Side"].lower() == "sell" else 1
-                pos1 = log.cumsum().at[index, ("Quantity", ticker)] > 0
-                pos2 = (quantity * sign) > 0
-
-                if sub_row["Side"].lower() == "interest":
-                    log.at[index, ("Cost Basis", ticker)] = (
-                        log.at[index, ("Cost Basis", ticker)] + quantity * price
-                    )
-                    log.at[index, ("Cash", "Cash")] = log.at[
-                        index, ("Cash", "Cash")
-                    ] - (quantity * price)
-
-                elif (
-                    pos1 == pos2
-                    or log.cumsum().at[index, ("Quantity", ticker)] == 0
-                    or (quantity * sign) == 0
-                ):
-                    log.at[index, ("Quantity", ticker)] = (
-                        log.at[index, ("Quantity", ticker)] + quantity * sign
-                    )
-                    log.at[index, ("Cost Basis", ticker)] = (
-                        log.at[index, ("Cost Basis", ticker)]
-                        + fees
-                        + quantity * sign * price
-                    )
-                    log.at[index, ("Cash", "Cash")] = log.at[
-                        index, ("Cash", "Cash")
-                    ] - (fees + quantity * sign * price)
-                else:
-                    rev = (
-                        log.at[index, ("Profit", ticker)] + quantity * sign * price * -1
-                    )
-                    wa_cost = (
-                        quantity / log.cumsum().at[index, ("Quantity", ticker)]
-                    ) * log.cumsum().at[index, ("Cost Basis", ticker)]
-                    log.at[index, ("Profit", ticker)] = rev - wa_cost - fees
-                    log.at[index, ("Cash", "Cash")] = (
-                        log.at[index, ("Cash", "Cash")] + rev - fees
-                    )
-                    log.at[index, ("Quantity", ticker)] = (
-                        log.at[index, ("Quantity", ticker)] + quantity * sign
-                    )
-                    log.at[index, ("Cost Basis", ticker)] = (
-                        log.at[index, ("Cost Basis", ticker)] - wa_cost
-                    )
-        cash_vals = cashes[cashes["Date"] == index]
-        if len(cash_vals.index) > 0:
-            for _, sub_row in cash_vals.iterrows():
-                amount = sub_row["Price"]
-                quantity = sub_row["Quantity"]
-                if sub_row["Side"] == "deposit":
-                    d = 1
-                elif sub_row["Side"] == "withdrawal":
-                    d = -1
-                else:
-                    raise ValueError("Cash type must be deposit or withdrawal")
-                log.at[index, ("Cash", "Cash")] = (
-                    log.at[index, ("Cash", "Cash")] + d * amount * quantity
-                )
-                log.at[index, ("Cash", "User")] = (
-                    log.at[index, ("Cash", "User")] + d * amount * quantity
-                )
+    uniques = [ticker for field, ticker in log.columns if field == "Quantity"]
+    column = {ticker: i for i, ticker in enumerate(uniques)}
+    quantity, cost_basis, profit = (
+        log[[(name, ticker) for ticker in uniques]].to_numpy(
+            dtype=np.float64, copy=True
+        )
+        for name in ("Quantity", "Cost Basis", "Profit")
+    )
+    cash = log[("Cash", "Cash")].to_numpy(dtype=np.float64, copy=True)
+    user = log[("Cash", "User")].to_numpy(dtype=np.float64, copy=True)
+    # Holdings up to the day being processed, as the cumulative sums of the log
+    held = np.zeros(len(uniques))
+    held_cost = np.zeros(len(uniques))
+
+    rows = log.index.get_indexer(pd.DatetimeIndex(changes["Date"]))
+    for row, (_, sub_row) in sorted(
+        zip(rows, changes.iterrows()), key=lambda item: item[0]
+    ):
+        if row < 0:
+            continue
+        i = column[sub_row["Name"]]
+        quantity_change = sub_row["Quantity"]
+        price = sub_row["Price"]
+        fees = sub_row["Fees"]
+        if math.isnan(fees):
+            fees = 0
+        sign = -1 if sub_row["Side"].lower() == "sell" else 1
+        pos1 = held[i] > 0
+        pos2 = (quantity_change * sign) > 0
+
+        if sub_row["Side"].lower() == "interest":
+            cost_basis[row, i] += quantity_change * price
+            held_cost[i] += quantity_change * price
+            cash[row] -= quantity_change * price
+
+        elif pos1 == pos2 or held[i] == 0 or (quantity_change * sign) == 0:
+            quantity[row, i] += quantity_change * sign
+            held[i] += quantity_change * sign
+            cost = fees + quantity_change * sign * price
+            cost_basis[row, i] += cost
+            held_cost[i] += cost
+            cash[row] -= cost
+        else:
+            rev = profit[row, i] + quantity_change * sign * price * -1
+            wa_cost = (quantity_change / held[i]) * held_cost[i]
+            profit[row, i] = rev - wa_cost - fees
+            cash[row] += rev - fees
+            quantity[row, i] += quantity_change * sign
+            held[i] += quantity_change * sign
+            cost_basis[row, i] -= wa_cost
+            held_cost[i] -= wa_cost
+
+    rows = log.index.get_indexer(pd.DatetimeIndex(cashes["Date"]))
+    for row, (_, sub_row) in zip(rows, cashes.iterrows()):
+        if row < 0:
+            continue
+        if sub_row["Side"] == "deposit":
+            d = 1
+        elif sub_row["Side"] == "withdrawal":
+            d = -1
+        else:
+            raise ValueError("Cash type must be deposit or withdrawal")
+        cash[row] += d * sub_row["Price"] * sub_row["Quantity"]
+        user[row] += d * sub_row["Price"] * sub_row["Quantity"]
+
+    for name, values in (
+        ("Quantity", quantity),
+        ("Cost Basis", cost_basis),
+        ("Profit", profit),
+    ):
+        log[[(name, ticker) for ticker in uniques]] = values
+    log[("Cash", "Cash")] = cash
+    log[("Cash", "User")] = user
     return log
 
 
@@ -229,27 +230,39 @@ def merge_dataframes(
     comb = pd.merge(comb, divs, how="left", left_index=True, right_index=True)
     comb = comb.fillna(0)
 
-    for uni in uniques:
-        comb[("Quantity", uni)] = comb[("Quantity", uni)].cumsum()
-        comb[("Cost Basis", uni)] = comb[("Cost Basis", uni)].cumsum()
-        comb[("Cash", "Cash")] = comb[("Cash", "Cash")] + (
-            comb[("Quantity", uni)] * comb[("Dividend", uni)]
-        )
-        comb[("Holding", uni)] = (
-            np.where(
-                comb[("Quantity", uni)] > 0,
-                comb[("Close", uni)],
-                (2 * comb[("Close", uni)][0] - comb[("Close", uni)]),
-            )
-            * comb[("Quantity", uni)]
-        )
-        comb[("Profit", uni)] = comb[("Profit", uni)].cumsum()
-    comb[("Cash", "Cash")] = comb[("Cash", "Cash")].cumsum()
+    # Dates by tickers arrays of every field, cumulated all at once
+    quantity, cost_basis, profit = (
+        comb[[(name, uni) for uni in uniques]].to_numpy(dtype=np.float64).cumsum(axis=0)
+        for name in ("Quantity", "Cost Basis", "Profit")
+    )
+    close, dividend = (
+        comb[[(name, uni) for uni in uniques]].to_numpy(dtype=np.float64)
+        for name in ("Close", "Dividend")
+    )
+    holding = np.where(quantity > 0, close, 2 * close[:1] - close) * quantity
+
+    comb[[("Quantity", uni) for uni in uniques]] = quantity
+    comb[[("Cost Basis", uni) for uni in uniques]] = cost_basis
+    comb[[("Profit", uni) for uni in uniques]] = profit
+    comb[("Cash", "Cash")] = (
+        comb[("Cash", "Cash")].to_numpy() + (quantity * dividend).sum(axis=1)
+    ).cumsum()
+    comb = pd.concat(
+        [
+            comb,
+            pd.DataFrame(
+                holding,
+                index=comb.index,
+                columns=pd.MultiIndex.from_product([["Holding"], uniques]),
+            ),
+        ],
+        axis=1,
+    )
     if len(changes["Date"]) > 0:
-        comb["holdings"] = comb.sum(level=0, axis=1)["Holding"]
-        comb["profits"] = comb.sum(level=0, axis=1)["Profit"]
+        comb["holdings"] = holding.sum(axis=1)
+        comb["profits"] = profit.sum(axis=1)
         comb["total_prof"] = comb["holdings"] + comb["profits"]
-        comb["total_cost"] = comb.sum(level=0, axis=1)["Cost Basis"]
+        comb["total_cost"] = cost_basis.sum(axis=1)
     return comb
 
 
@@ -284,14 +297,13 @@ def convert_df(portfolio: pd.DataFrame) -> pd.DataFrame:
     divs = divs.fillna(0)
     mini = min(cashes["Date"].to_list() + changes["Date"].to_list())
     days = pd.date_range(mini, date.today() - timedelta(days=1), freq="d")
-    zeros = [0 for _ in uniques]
-    data = [zeros + zeros + zeros + [0] for _ in days]
     vals = ["Quantity", "Cost Basis", "Profit"]
-    arrays = [[x for _ in uniques for x in vals] + ["Cash"], uniques * 3 + ["Cash"]]
-    tuples = list(zip(*arrays))
+    tuples = list(pd.MultiIndex.from_product([vals, uniques])) + [
+        ("Cash", "Cash"),
+        ("Cash", "User"),
+    ]
     headers = pd.MultiIndex.from_tuples(tuples, names=["first", "second"])
-    log = pd.DataFrame(data, columns=headers, index=days)
-    log[("Cash", "User")] = 0
+    log = pd.DataFrame(0.0, columns=headers, index=days)
     log = add_values(log, changes, cashes)
     comb = merge_dataframes(log, hist, changes, divs, uniques)
 
@@ -337,6 +349,68 @@ def get_return(df: pd.DataFrame, df_m: pd.DataFrame, n: int) -> pd.DataFrame:
     return comb, variance
 
 
+def get_rolling_regression(
+    assets: pd.DataFrame, factors: pd.DataFrame, window: int = 252
+) -> pd.DataFrame:
+    """Rolling least squares of every asset on the factors, all fitted at once
+
+    The sums of squares and cross products of each window are differences of
+    cumulative sums, so every window of every asset costs the same whatever its
+    length. Missing observations are left out of their windows.
+
+    Parameters
+    ----------
+    assets : pd.DataFrame
+        Dependent series, one column per asset
+    factors : pd.DataFrame
+        Independent series, one column per factor, on the same index
+    window : int
+        Number of observations in each regression
+
+    Returns
+    ----------
+    params : pd.DataFrame
+        Coefficients, with a (parameter, asset) column for the constant ("const")
+        and each factor, NaN until the first full window
+    """
+    y = assets.to_numpy(dtype=np.float64)
+    x = factors.to_numpy(dtype=np.float64)
+    n_params = x.shape[1] + 1
+    valid = ~np.isnan(y) & ~np.isnan(x).any(axis=1)[:, None]
+    # Centering does not change the slopes and keeps the cumulative sums precise
+    y_mean = np.nanmean(np.where(valid, y, np.nan), axis=0)
+    x_mean = np.nanmean(x, axis=0)
+    z = np.nan_to_num(np.column_stack([np.ones(len(x)), x - x_mean]))
+    weights = valid.astype(np.float64)
+    y_centered = np.where(valid, y - y_mean, 0)
+
+    # Sums over the windows, by date, asset and parameter
+    zz = np.cumsum(
+        weights[:, :, None, None] * (z[:, :, None] * z[:, None, :])[:, None], axis=0
+    )
+    zy = np.cumsum((weights * y_centered)[:, :, None] * z[:, None, :], axis=0)
+    zz[window:] = zz[window:] - zz[:-window]
+    zy[window:] = zy[window:] - zy[:-window]
+
+    # Windows without enough observations or variation are left empty
+    det = np.linalg.det(zz)
+    scale = np.prod(np.diagonal(zz, axis1=2, axis2=3), axis=2)
+    solvable = (zz[:, :, 0, 0] >= n_params) & (det > 1e-10 * scale)
+    solvable[: window - 1] = False
+    zz[~solvable] = np.eye(n_params)
+    coefs = np.linalg.solve(zz, zy[..., None])[..., 0]
+    coefs[~solvable] = np.nan
+    coefs[:, :, 0] += y_mean - coefs[:, :, 1:] @ x_mean
+
+    names = ["const"] + factors.columns.tolist()
+    columns = pd.MultiIndex.from_product([names, assets.columns])
+    return pd.DataFrame(
+        coefs.transpose(0, 2, 1).reshape(len(x), -1),
+        index=assets.index,
+        columns=columns,
+    )
+
+
 def get_rolling_beta(
     df: pd.DataFrame, hist: pd.DataFrame, mark: pd.DataFrame, n: pd.DataFrame
 ) -> pd.DataFrame:
@@ -360,26 +434,27 @@ def get_rolling_beta(
     """
     df = df["Holding"]
     uniques = df.columns.tolist()
-    res = df.div(df.sum(axis=1), axis=0)
-    res = res.fillna(0)
+    weights = df.div(df.sum(axis=1), axis=0)
+    weights = weights.fillna(0)
     comb = pd.merge(
         hist["Close"], mark["Market"], how="outer", left_index=True, right_index=True
     )
     comb = comb.fillna(method="ffill")
-    for col in hist["Close"].columns:
-        exog = sm.add_constant(comb["Close"])
-        rols = RollingOLS(comb[col], exog, window=252)
-        rres = rols.fit()
-        res[f"beta_{col}"] = rres.params["Close"]
-    final = res.fillna(method="ffill")
-    for uni in uniques:
-        final[f"prod_{uni}"] = final[uni] * final[f"beta_{uni}"]
-    dropped = final[[f"beta_{x}" for x in uniques]].copy()
-    final = final.drop(columns=[f"beta_{x}" for x in uniques] + uniques)
+    betas = get_rolling_regression(
+        comb[hist["Close"].columns], comb[["Close"]], window=252
+    )["Close"]
+    betas = betas.reindex(weights.index).fillna(method="ffill")
+
+    final = (weights[uniques] * betas[uniques]).add_prefix("prod_")
     final["total"] = final.sum(axis=1)
     final = final[final.index >= datetime.now() - timedelta(days=n + 1)]
-    comb = pd.merge(final, dropped, how="left", left_index=True, right_index=True)
-    return comb
+    return pd.merge(
+        final,
+        betas[uniques].add_prefix("beta_"),
+        how="left",
+        left_index=True,
+        right_index=True,
+    )
 
 
 def get_main_text(df: pd.DataFrame) -> str:
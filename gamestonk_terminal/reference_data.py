@@ -0,0 +1,99 @@
+"""Reference data shared by the menus, cached in memory and on disk"""
+__docformat__ = "numpy"
+
+import os
+import pickle
+import time
+from typing import Any, Callable, Dict, Tuple
+
+import requests
+
+import gamestonk_terminal.config_terminal as cfg
+
+# Maximum age, in seconds, of the risk-free rate
+RF_MAX_AGE = 24 * 60 * 60
+
+RF_URL = (
+    "https://api.fiscaldata.treasury.gov/services/api/fiscal_service"
+    "/v2/accounting/od/avg_interest_rates"
+    "?filter=security_desc:eq:Treasury Bills&sort=-record_date"
+)
+
+# Used when the rate cannot be downloaded and was never cached
+DEFAULT_RF = 0.02
+
+_CACHE: Dict[str, Tuple[float, Any]] = {}
+
+
+def _reference_folder() -> str:
+    return os.path.join(cfg.CACHE_DIR, "reference")
+
+
+def cached(name: str, max_age: float, fetch: Callable[[], Any]) -> Any:
+    """Value cached in memory and on disk, fetched again once older than max_age
+
+    Parameters
+    ----------
+    name: str
+        Name of the value, also the name of its cache file
+    max_age: float
+        Maximum age of the cached value, in seconds
+    fetch: Callable[[], Any]
+        Function downloading the value
+
+    Returns
+    -------
+    Any
+        Value, the stale cached one if it cannot be downloaded again
+    """
+    now = time.time()
+    if name in _CACHE and now - _CACHE[name][0] <= max_age:
+        return _CACHE[name][1]
+
+    path = os.path.join(_reference_folder(), f"{name}.pkl")
+    try:
+        mtime = os.path.getmtime(path)
+        if name not in _CACHE or _CACHE[name][0] < mtime:
+            with open(path, "rb") as f:
+                _CACHE[name] = (mtime, pickle.load(f))
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+    if name in _CACHE and now - _CACHE[name][0] <= max_age:
+        return _CACHE[name][1]
+
+    try:
+        value = fetch()
+    except Exception:
+        if name in _CACHE:
+            return _CACHE[name][1]
+        raise
+
+    _CACHE[name] = (now, value)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(f"{path}.tmp", "wb") as f:
+            pickle.dump(value, f)
+        os.replace(f"{path}.tmp", path)
+    except OSError:
+        pass
+    return value
+
+
+def _download_rf() -> float:
+    response = requests.get(RF_URL, timeout=10)
+    latest = response.json()["data"][0]
+    return round(float(latest["avg_interest_rate_amt"]) / 100, 8)
+
+
+def get_rf() -> float:
+    """Most recent average T-Bill rate, from the fiscaldata.gov API
+
+    Returns
+    -------
+    rate : float
+        The current US T-Bill rate
+    """
+    try:
+        return cached("rf", RF_MAX_AGE, _download_rf)
+    except Exception:
+        return DEFAULT_RF
@@ -2,6 +2,7 @@
 __docformat__ = "numpy"
 
 import argparse
+from datetime import datetime, timedelta
 from typing import List
 
 import matplotlib as mpl
@@ -24,7 +25,7 @@ from gamestonk_terminal.menu import session
 # Save current matplotlib backend
 default_backend = mpl.get_backend()
 # pylint: disable=wrong-import-position
-from gamestonk_terminal.stocks.backtesting import bt_view  # noqa: E402
+from gamestonk_terminal.stocks.backtesting import bt_model, bt_view  # noqa: E402
 
 # Restore backend matplotlib used
 mpl.use(default_backend)
@@ -33,7 +34,7 @@ mpl.use(default_backend)
 class BacktestingController(BaseController):
     """Backtesting Controller class"""
 
-    CHOICES_COMMANDS = ["ema", "ema_cross", "rsi", "whatif"]
+    CHOICES_COMMANDS = ["ema", "ema_cross", "rsi", "whatif", "basket"]
 
     def __init__(self, ticker: str, stock: pd.DataFrame, queue: List[str] = None):
         """Constructor"""
@@ -56,6 +57,8 @@ Ticker: {self.ticker.upper()}
     ema         buy when price exceeds EMA(l)
     ema_cross   buy when EMA(short) > EMA(long)
     rsi         buy when RSI < low and sell when RSI > high
+
+    basket      apply a strategy across a basket of tickers
         """
         print(help_text)
 
@@ -279,3 +282,137 @@ Ticker: {self.ticker.upper()}
                 shortable=ns_parser.shortable,
                 export=ns_parser.export,
             )
+
+    def call_basket(self, other_args: List[str]):
+        """Call basket strategy"""
+        parser = argparse.ArgumentParser(
+            add_help=False,
+            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+            prog="basket",
+            description="""Apply a strategy across a basket of tickers at once, on an
+            aligned price panel, with periodic rebalancing.""",
+        )
+        parser.add_argument(
+            "-t",
+            "--tickers",
+            dest="tickers",
+            type=lambda s: [str(item).upper() for item in s.split(",")],
+            default=[self.ticker.upper()] if self.ticker else [],
+            help="Tickers in the basket separated by comma",
+        )
+        parser.add_argument(
+            "-s",
+            "--strategy",
+            dest="strategy",
+            choices=bt_model.PORTFOLIO_STRATEGIES,
+            default="hold",
+            help="Strategy applied to every ticker",
+        )
+        parser.add_argument(
+            "-r",
+            "--rebalance",
+            dest="rebalance",
+            choices=list(bt_model.REBALANCE_FREQUENCIES.keys()),
+            default="monthly",
+            help="Rebalancing frequency",
+        )
+        parser.add_argument(
+            "--start",
+            dest="start",
+            type=valid_date,
+            default=(
+                self.stock.index[0]
+                if not self.stock.empty
+                else datetime.now() - timedelta(days=5 * 365)
+            ),
+            help="Start date of the backtest",
+        )
+        parser.add_argument(
+            "--ema",
+            default=20,
+            dest="ema_length",
+            type=check_positive,
+            help="EMA period to consider for the ema strategy",
+        )
+        parser.add_argument(
+            "--short",
+            default=20,
+            dest="short",
+            type=check_positive,
+            help="Short EMA period for the ema_cross strategy",
+        )
+        parser.add_argument(
+            "--long",
+            default=50,
+            dest="long",
+            type=check_positive,
+            help="Long EMA period for the ema_cross strategy",
+        )
+        parser.add_argument(
+            "--periods",
+            dest="periods",
+            help="Number of periods for RSI calculation",
+            type=check_positive,
+            default=14,
+        )
+        parser.add_argument(
+            "--high",
+            default=70,
+            dest="high",
+            type=check_positive,
+            help="High (upper) RSI Level",
+        )
+        parser.add_argument(
+            "--low",
+            default=30,
+            dest="low",
+            type=check_positive,
+            help="Low RSI Level",
+        )
+        parser.add_argument(
+            "--spy",
+            action="store_true",
+            default=False,
+            help="Flag to add spy hold comparison",
+            dest="spy",
+        )
+        parser.add_argument(
+            "--no_bench",
+            action="store_true",
+            default=False,
+            help="Flag to not show equal weight buy and hold comparison",
+            dest="no_bench",
+        )
+        parser.add_argument(
+            "--no_short",
+            action="store_false",
+            default=True,
+            dest="shortable",
+            help="Flag that disables the short sell",
+        )
+        if other_args and "-" not in other_args[0][0]:
+            other_args.insert(0, "-t")
+        ns_parser = parse_known_args_and_warn(
+            parser, other_args, export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED
+        )
+        if ns_parser:
+            if not ns_parser.tickers:
+                print("No tickers selected. Use -t to add tickers to the basket.\n")
+                return
+
+            bt_view.display_portfolio_backtest(
+                tickers=ns_parser.tickers,
+                start_date=ns_parser.start,
+                strategy=ns_parser.strategy,
+                rebalance=ns_parser.rebalance,
+                ema_length=ns_parser.ema_length,
+                short_length=ns_parser.short,
+                long_length=ns_parser.long,
+                periods=ns_parser.periods,
+                low_rsi=ns_parser.low,
+                high_rsi=ns_parser.high,
+                shortable=ns_parser.shortable,
+                spy_bt=ns_parser.spy,
+                no_bench=ns_parser.no_bench,
+                export=ns_parser.export,
+            )
@@ -1,11 +1,23 @@
 """Backtesting Model"""
 __docformat__ = "numpy"
 
+from typing import List
+
 import bt
+import numpy as np
 import pandas as pd
 import pandas_ta as ta
 import yfinance as yf
 
+REBALANCE_FREQUENCIES = {
+    "daily": "D",
+    "weekly": "W",
+    "monthly": "M",
+    "quarterly": "Q",
+    "yearly": "Y",
+}
+PORTFOLIO_STRATEGIES = ["hold", "ema", "ema_cross", "rsi"]
+
 
 def get_data(ticker: str, start_date: str) -> pd.DataFrame:
     """Function to replace bt.get,  Gets Adjusted close of ticker using yfinance
@@ -248,3 +260,316 @@ def rsi_strategy(
 
     res = bt.run(*backtests)
     return res
+
+
+def get_portfolio_data(tickers: List[str], start_date) -> pd.DataFrame:
+    """Gets an aligned panel of adjusted close prices for a basket of tickers
+
+    Parameters
+    ----------
+    tickers: List[str]
+        Tickers to get data for
+    start_date: str
+        Start date
+
+    Returns
+    -------
+    prices: pd.DataFrame
+        Forward filled dataframe of Adj Close with columns = tickers
+    """
+    prices = yf.download(tickers, start=start_date, progress=False, threads=True)
+    if prices.empty:
+        return pd.DataFrame()
+    prices = prices["Adj Close"]
+    if isinstance(prices, pd.Series):
+        prices = prices.to_frame()
+    if len(tickers) == 1:
+        prices.columns = tickers
+    prices.columns = [col.lower() for col in prices.columns]
+    return prices.ffill().dropna(how="all")
+
+
+def get_portfolio_signals(
+    prices: pd.DataFrame,
+    strategy: str = "hold",
+    ema_length: int = 20,
+    short_length: int = 20,
+    long_length: int = 50,
+    periods: int = 14,
+    low_rsi: int = 30,
+    high_rsi: int = 70,
+    shortable: bool = True,
+) -> pd.DataFrame:
+    """Computes the target position of every ticker of a price panel at once
+
+    Parameters
+    ----------
+    prices : pd.DataFrame
+        Aligned price panel with one column per ticker
+    strategy : str
+        One of PORTFOLIO_STRATEGIES
+    ema_length : int
+        Length of ema window for the ema strategy
+    short_length : int
+        Length of short ema window for the ema_cross strategy
+    long_length : int
+        Length of long ema window for the ema_cross strategy
+    periods : int
+        Number of periods for RSI calculation
+    low_rsi : int
+        Low RSI value to buy
+    high_rsi : int
+        High RSI value to sell
+    shortable : bool
+        Boolean to allow for selling of the stock
+
+    Returns
+    -------
+    pd.DataFrame
+        Target position per date and ticker, 1 for long, -1 for short and 0 for flat
+    """
+    if strategy == "hold":
+        signals = pd.DataFrame(1.0, index=prices.index, columns=prices.columns)
+    elif strategy == "ema":
+        ema = prices.ewm(span=ema_length, adjust=False, min_periods=ema_length).mean()
+        signals = (prices >= ema).astype(float)
+    elif strategy == "ema_cross":
+        short_ema = prices.ewm(
+            span=short_length, adjust=False, min_periods=short_length
+        ).mean()
+        long_ema = prices.ewm(
+            span=long_length, adjust=False, min_periods=long_length
+        ).mean()
+        signals = pd.DataFrame(
+            np.where(short_ema > long_ema, 1.0, -1.0 * shortable),
+            index=prices.index,
+            columns=prices.columns,
+        )
+        signals[long_ema.isnull()] = 0.0
+    elif strategy == "rsi":
+        delta = prices.diff()
+        # Wilder's smoothing, as used by pandas_ta
+        gain = (
+            delta.clip(lower=0)
+            .ewm(alpha=1 / periods, adjust=False, min_periods=periods)
+            .mean()
+        )
+        loss = (
+            (-delta.clip(upper=0))
+            .ewm(alpha=1 / periods, adjust=False, min_periods=periods)
+            .mean()
+        )
+        rsi = 100 * gain / (gain + loss)
+        signals = pd.DataFrame(
+            np.select(
+                [rsi.values > high_rsi, rsi.values < low_rsi],
+                [-1.0 * shortable, 1.0],
+                0.0,
+            ),
+            index=prices.index,
+            columns=prices.columns,
+        )
+    else:
+        raise ValueError(f"Unknown strategy: {strategy}")
+
+    signals[prices.isnull()] = 0.0
+    return signals
+
+
+def get_portfolio_weights(signals: pd.DataFrame, strategy: str) -> pd.DataFrame:
+    """Converts target positions into portfolio weights
+
+    The ema strategy weighs the selected tickers equally, as bt.algos.WeighEqually
+    does, while the other strategies allocate 1/N of the capital to each ticker.
+
+    Parameters
+    ----------
+    signals : pd.DataFrame
+        Target position per date and ticker
+    strategy : str
+        One of PORTFOLIO_STRATEGIES
+
+    Returns
+    -------
+    pd.DataFrame
+        Portfolio weights per date and ticker
+    """
+    if strategy in ("hold", "ema"):
+        n_assets = (signals != 0).sum(axis=1)
+    else:
+        n_assets = signals.notnull().sum(axis=1)
+    return signals.div(n_assets.where(n_assets > 0), axis=0).fillna(0.0)
+
+
+def portfolio_backtest(
+    prices: pd.DataFrame,
+    weights: pd.DataFrame,
+    rebalance: str = "daily",
+    initial_value: float = 100.0,
+) -> pd.Series:
+    """Vectorized backtest of a weighted portfolio with periodic rebalancing
+
+    The portfolio is rebalanced to the target weights on the close of the first
+    date of every period, then positions drift with prices until the next
+    rebalancing date.  Capital not allocated (or raised
+    from short sales) is kept as cash.
+
+    Parameters
+    ----------
+    prices : pd.DataFrame
+        Aligned price panel with one column per ticker
+    weights : pd.DataFrame
+        Target weights per date and ticker
+    rebalance : str
+        One of REBALANCE_FREQUENCIES
+    initial_value : float
+        Starting value of the portfolio
+
+    Returns
+    -------
+    pd.Series
+        Portfolio equity curve
+    """
+    returns = prices.pct_change().fillna(0.0)
+
+    if rebalance == "daily":
+        period = np.arange(len(prices.index))
+    else:
+        freq = REBALANCE_FREQUENCIES[rebalance]
+        keys = prices.index.to_period(freq)
+        period = np.concatenate([[0], np.cumsum(keys[1:] != keys[:-1])])
+
+    # Rebalancing happens on the close of the first date of each period, so the
+    # returns of a row are earned with the weights of the previous row's period
+    held_period = np.concatenate([[-1], period[:-1]])
+    held = weights.groupby(period).transform("first").shift(1).fillna(0.0).values
+
+    growth = (1 + returns).groupby(held_period).cumprod().values
+    period_factor = 1 + ((growth - 1) * held).sum(axis=1)
+    previous_factors = (
+        pd.Series(period_factor)
+        .groupby(held_period)
+        .last()
+        .cumprod()
+        .shift(1)
+        .fillna(1.0)
+        .values
+    )
+    equity = pd.Series(
+        period_factor * previous_factors[held_period + 1], index=prices.index
+    )
+    return initial_value * equity
+
+
+def get_portfolio_stats(equity: pd.DataFrame) -> pd.DataFrame:
+    """Summary statistics for a set of equity curves
+
+    Parameters
+    ----------
+    equity : pd.DataFrame
+        Equity curves, one per column
+
+    Returns
+    -------
+    pd.DataFrame
+        Total return, CAGR, volatility, sharpe and max drawdown for each curve
+    """
+    returns = equity.pct_change().dropna()
+    years = max((equity.index[-1] - equity.index[0]).days / 365.25, 1 / 365.25)
+    total_return = equity.iloc[-1] / equity.iloc[0] - 1
+    volatility = returns.std() * np.sqrt(252)
+    stats = pd.DataFrame(
+        {
+            "Total Return": total_return,
+            "CAGR": (1 + total_return) ** (1 / years) - 1,
+            "Volatility": volatility,
+            "Sharpe": returns.mean() * 252 / volatility,
+            "Max Drawdown": (equity / equity.cummax() - 1).min(),
+        }
+    )
+    return stats.T
+
+
+# pylint:disable=too-many-arguments
+def portfolio_strategy(
+    tickers: List[str],
+    start_date,
+    strategy: str = "hold",
+    rebalance: str = "monthly",
+    ema_length: int = 20,
+    short_length: int = 20,
+    long_length: int = 50,
+    periods: int = 14,
+    low_rsi: int = 30,
+    high_rsi: int = 70,
+    shortable: bool = True,
+    spy_bt: bool = True,
+    no_bench: bool = False,
+) -> pd.DataFrame:
+    """Perform backtest of a strategy applied across a basket of tickers
+
+    Parameters
+    ----------
+    tickers : List[str]
+        Tickers in the basket
+    start_date : str
+        Backtest start date.  Can be either string or datetime
+    strategy : str
+        One of PORTFOLIO_STRATEGIES
+    rebalance : str
+        One of REBALANCE_FREQUENCIES
+    ema_length : int
+        Length of ema window for the ema strategy
+    short_length : int
+        Length of short ema window for the ema_cross strategy
+    long_length : int
+        Length of long ema window for the ema_cross strategy
+    periods : int
+        Number of periods for RSI calculation
+    low_rsi : int
+        Low RSI value to buy
+    high_rsi : int
+        High RSI value to sell
+    shortable : bool
+        Boolean to allow for selling of the stocks
+    spy_bt : bool
+        Boolean to add spy comparison
+    no_bench : bool
+        Boolean to not show equal weight buy and hold comparison
+
+    Returns
+    -------
+    pd.DataFrame
+        Equity curves of the strategy and its benchmarks
+    """
+    prices = get_portfolio_data(tickers, start_date)
+    if prices.empty:
+        return pd.DataFrame()
+
+    signals = get_portfolio_signals(
+        prices,
+        strategy,
+        ema_length,
+        short_length,
+        long_length,
+        periods,
+        low_rsi,
+        high_rsi,
+        shortable,
+    )
+    weights = get_portfolio_weights(signals, strategy)
+    equity = pd.DataFrame(
+        {strategy.upper(): portfolio_backtest(prices, weights, rebalance)}
+    )
+    if not no_bench and strategy != "hold":
+        hold_weights = get_portfolio_weights(
+            get_portfolio_signals(prices, "hold"), "hold"
+        )
+        equity["Equal Weight Hold"] = portfolio_backtest(
+            prices, hold_weights, rebalance
+        )
+    if spy_bt:
+        spy = get_data("SPY", prices.index[0]).reindex(prices.index).ffill()
+        equity["SPY Hold"] = 100 * spy["SPY"] / spy["SPY"].iloc[0]
+
+    return equity
@@ -4,11 +4,13 @@ __docformat__ = "numpy"
 import os
 
 from datetime import datetime
+from typing import List
 import yfinance as yf
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from pandas.plotting import register_matplotlib_converters
+from tabulate import tabulate
 
 from gamestonk_terminal import feature_flags as gtff
 from gamestonk_terminal.config_plot import PLOT_DPI
@@ -227,3 +229,100 @@ def display_rsi_strategy(
     export_data(
         export, os.path.dirname(os.path.abspath(__file__)), "rsi_corss", res.stats
     )
+
+
+# pylint:disable=too-many-arguments
+def display_portfolio_backtest(
+    tickers: List[str],
+    start_date,
+    strategy: str = "hold",
+    rebalance: str = "monthly",
+    ema_length: int = 20,
+    short_length: int = 20,
+    long_length: int = 50,
+    periods: int = 14,
+    low_rsi: int = 30,
+    high_rsi: int = 70,
+    shortable: bool = True,
+    spy_bt: bool = True,
+    no_bench: bool = False,
+    export: str = "",
+):
+    """Strategy applied across a basket of tickers with periodic rebalancing
+
+    Parameters
+    ----------
+    tickers : List[str]
+        Tickers in the basket
+    start_date : str
+        Backtest start date
+    strategy : str
+        One of hold, ema, ema_cross and rsi
+    rebalance : str
+        Rebalancing frequency
+    ema_length : int
+        Length of ema window for the ema strategy
+    short_length : int
+        Length of short ema window for the ema_cross strategy
+    long_length : int
+        Length of long ema window for the ema_cross strategy
+    periods : int
+        Number of periods for RSI calculation
+    low_rsi : int
+        Low RSI value to buy
+    high_rsi : int
+        High RSI value to sell
+    shortable : bool
+        Boolean to allow for selling of the stocks
+    spy_bt : bool
+        Boolean to add spy comparison
+    no_bench : bool
+        Boolean to not show equal weight buy and hold comparison
+    export : str
+        Format to export backtest results
+    """
+    equity = bt_model.portfolio_strategy(
+        tickers,
+        start_date,
+        strategy,
+        rebalance,
+        ema_length,
+        short_length,
+        long_length,
+        periods,
+        low_rsi,
+        high_rsi,
+        shortable,
+        spy_bt,
+        no_bench,
+    )
+    if equity.empty:
+        print("No data found for the selected tickers.\n")
+        return
+
+    fig, ax = plt.subplots(figsize=plot_autoscale(), dpi=PLOT_DPI)
+    equity.plot(
+        title=f"{strategy.upper()} across {len(tickers)} tickers, {rebalance} rebalance",
+        ax=ax,
+    )
+    ax.grid(b=True, which="major", color="#666666", linestyle="-")
+    ax.set_xlim([equity.index[0], equity.index[-1]])
+    fig.tight_layout()
+    if gtff.USE_ION:
+        plt.ion()
+    plt.show()
+
+    stats = bt_model.get_portfolio_stats(equity)
+    if gtff.USE_TABULATE_DF:
+        print(
+            tabulate(
+                stats,
+                headers=stats.columns,
+                tablefmt="fancy_grid",
+                floatfmt=".4f",
+            ),
+            "\n",
+        )
+    else:
+        print(stats.to_string(), "\n")
+    export_data(export, os.path.dirname(os.path.abspath(__file__)), "portfolio", stats)
@@ -14,6 +14,8 @@ from gamestonk_terminal import feature_flags as gtff
 from gamestonk_terminal.helper_funcs import (
     check_non_negative,
     check_positive,
+    check_proportion_range,
+    load_tickers_file,
     parse_known_args_and_warn,
     valid_date,
     EXPORT_ONLY_RAW_DATA_ALLOWED,
@@ -21,6 +23,7 @@ from gamestonk_terminal.helper_funcs import (
 from gamestonk_terminal.menu import session
 from gamestonk_terminal.portfolio.portfolio_optimization import po_controller
 from gamestonk_terminal.stocks.comparison_analysis import (
+    correlation_view,
     finbrain_view,
     finnhub_model,
     finviz_compare_model,
@@ -48,6 +51,7 @@ class ComparisonAnalysisController(BaseController):
         "rmv",
         "historical",
         "hcorr",
+        "tcorr",
         "volume",
         "income",
         "balance",
@@ -105,6 +109,7 @@ Similar Companies: {', '.join(self.similar) if self.similar else ''}
 Yahoo Finance:
     historical    historical price data comparison
     hcorr         historical price correlation
+    tcorr         most correlated pairs of tickers
     volume        historical volume data comparison
 Market Watch:
     income        income financials comparison
@@ -170,7 +175,9 @@ Finviz:
             add_help=False,
             formatter_class=argparse.ArgumentDefaultsHelpFormatter,
             prog="tsne",
-            description="""Get similar companies to compare with using sklearn TSNE.""",
+            description="""Get similar companies to compare with: the SP500 stocks whose
+                daily returns over the last year are the closest, from an index built once a day.
+                sklearn TSNE is only run to plot them.""",
         )
         parser.add_argument(
             "-r",
@@ -448,13 +455,37 @@ Finviz:
             default=[],
             help="similar companies to compare with.",
         )
+        parser.add_argument(
+            "-f",
+            "--file",
+            dest="file",
+            type=str,
+            default=None,
+            help="Text or csv file with the companies to compare with.",
+        )
         if other_args and "-" not in other_args[0][0]:
             other_args.insert(0, "-s")
         ns_parser = parse_known_args_and_warn(parser, other_args)
         if ns_parser:
-            self.similar = list(set(ns_parser.l_similar))
+            l_similar = ns_parser.l_similar
+            if ns_parser.file:
+                try:
+                    l_similar = l_similar + load_tickers_file(ns_parser.file)
+                except OSError as e:
+                    print(f"Unable to read {ns_parser.file}: {e}\n")
+                    return
+            self.similar = list(dict.fromkeys(l_similar))
             self.user = "Custom"
-            print(f"[{self.user}] Similar Companies: {', '.join(self.similar)}", "\n")
+            if len(self.similar) > 20:
+                print(
+                    f"[{self.user}] Similar Companies: {', '.join(self.similar[:20])}"
+                    f" and {len(self.similar) - 20} others",
+                    "\n",
+                )
+            else:
+                print(
+                    f"[{self.user}] Similar Companies: {', '.join(self.similar)}", "\n"
+                )
 
     def call_historical(self, other_args: List[str]):
         """Process historical command"""
@@ -551,6 +582,109 @@ Finviz:
             else:
                 print("Please make sure there are similar tickers selected. \n")
 
+    def call_tcorr(self, other_args: List[str]):
+        """Process top correlation command"""
+        parser = argparse.ArgumentParser(
+            add_help=False,
+            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+            prog="tcorr",
+            description="""Most correlated pairs of similar companies, from the correlation
+            matrix of their daily returns. Meant to scale to thousands of tickers, e.g. an
+            index loaded with 'set -f'. With a ticker, the companies most correlated to it.
+            """,
+        )
+        parser.add_argument(
+            "-t",
+            "--type",
+            action="store",
+            dest="type_candle",
+            type=str,
+            choices=["o", "h", "l", "c", "a"],
+            default="a",  # in case it's adjusted close
+            help="Candle data to use: o-open, h-high, l-low, c-close, a-adjusted close.",
+        )
+        parser.add_argument(
+            "-s",
+            "--start",
+            type=valid_date,
+            default=(datetime.now() - timedelta(days=366)).strftime("%Y-%m-%d"),
+            dest="start",
+            help="The starting date (format YYYY-MM-DD) of the stock",
+        )
+        parser.add_argument(
+            "-l",
+            "--limit",
+            default=10,
+            dest="limit",
+            type=check_positive,
+            help="Number of pairs or companies to show.",
+        )
+        parser.add_argument(
+            "--least",
+            action="store_true",
+            default=False,
+            dest="least",
+            help="Show the least correlated instead.",
+        )
+        parser.add_argument(
+            "--ticker",
+            dest="ticker",
+            type=lambda s: s.upper(),
+            default=None,
+            help="Show the companies most correlated to this ticker.",
+        )
+        parser.add_argument(
+            "--shrinkage",
+            dest="shrinkage",
+            type=check_proportion_range,
+            default=0,
+            help="Shrinkage intensity of the covariance matrix towards a scaled identity.",
+        )
+        parser.add_argument(
+            "--lw",
+            action="store_true",
+            default=False,
+            dest="ledoit_wolf",
+            help="Use the Ledoit and Wolf shrinkage intensity.",
+        )
+        parser.add_argument(
+            "-w",
+            "--window",
+            dest="window",
+            type=check_positive,
+            default=None,
+            help="Plot the rolling correlation to the ticker over windows of this many days.",
+        )
+        parser.add_argument(
+            "-n",
+            "--workers",
+            dest="workers",
+            type=check_positive,
+            default=8,
+            help="Number of tickers downloaded at the same time.",
+        )
+        ns_parser = parse_known_args_and_warn(
+            parser, other_args, EXPORT_ONLY_RAW_DATA_ALLOWED
+        )
+        if ns_parser:
+            if self.similar and len(self.similar) > 1:
+                correlation_view.display_top_correlations(
+                    similar_tickers=self.similar,
+                    start=ns_parser.start.strftime("%Y-%m-%d"),
+                    candle_type=ns_parser.type_candle,
+                    num=ns_parser.limit,
+                    least=ns_parser.least,
+                    ticker=ns_parser.ticker,
+                    shrinkage=None if ns_parser.ledoit_wolf else ns_parser.shrinkage,
+                    window=ns_parser.window,
+                    workers=ns_parser.workers,
+                    export=ns_parser.export,
+                )
+            else:
+                print(
+                    "Please make sure there are more than 1 similar tickers selected. \n"
+                )
+
     def call_income(self, other_args: List[str]):
         """Process income command"""
         parser = argparse.ArgumentParser(
@@ -0,0 +1,340 @@
+"""Correlation model, comparing thousands of tickers on an aligned panel of returns"""
+__docformat__ = "numpy"
+
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+d_candle_types = {
+    "o": "Open",
+    "h": "High",
+    "l": "Low",
+    "c": "Close",
+    "a": "Adj Close",
+    "v": "Volume",
+}
+
+# Tickers requested to yfinance per download, each one threaded
+CHUNK_SIZE = 500
+
+
+def get_panel(
+    tickers: List[str],
+    start: str = (datetime.now() - timedelta(days=366)).strftime("%Y-%m-%d"),
+    candle_type: str = "a",
+    workers: int = 8,
+) -> pd.DataFrame:
+    """Download the prices of many tickers into a single aligned panel
+
+    Parameters
+    ----------
+    tickers : List[str]
+        Tickers to download
+    start : str, optional
+        Start date of comparison. Defaults to 1 year previously
+    candle_type : str, optional
+        Candle variable to compare, by default "a" for Adjusted Close
+    workers : int, optional
+        Number of tickers downloaded at the same time
+
+    Returns
+    -------
+    pd.DataFrame
+        Prices (float32), one column per ticker found and one row per date
+    """
+    column = d_candle_types[candle_type]
+    frames = []
+    # yfinance gathers the results of a download in a module level dict, so the
+    # chunks are downloaded one after another and the tickers of each in parallel
+    for i in range(0, len(tickers), CHUNK_SIZE):
+        chunk = tickers[i : i + CHUNK_SIZE]
+        df_chunk = yf.download(
+            chunk,
+            start=start,
+            progress=False,
+            threads=max(1, min(workers, len(chunk))),
+        )
+        if df_chunk.empty:
+            continue
+        if len(chunk) == 1:
+            frames.append(df_chunk[[column]].set_axis(chunk, axis=1))
+        else:
+            frames.append(df_chunk[column])
+
+    if not frames:
+        return pd.DataFrame(columns=tickers, dtype=np.float32)
+
+    df_panel = pd.concat(frames, axis=1).sort_index()
+    df_panel = df_panel.loc[:, ~df_panel.columns.duplicated()]
+    return df_panel.dropna(axis=1, how="all").astype(np.float32)
+
+
+def get_returns(df_panel: pd.DataFrame, min_ratio: float = 0.9) -> pd.DataFrame:
+    """Daily returns of the tickers with enough history
+
+    Parameters
+    ----------
+    df_panel : pd.DataFrame
+        Prices, from get_panel
+    min_ratio : float, optional
+        Ratio of the dates a ticker needs returns on to be kept
+
+    Returns
+    -------
+    pd.DataFrame
+        Daily returns (float32). The few missing ones are set to the mean return
+        of the ticker, so that they do not weigh on its covariances
+    """
+    df_returns = df_panel.pct_change(fill_method=None).iloc[1:]
+    df_returns = df_returns.replace([np.inf, -np.inf], np.nan)
+    df_returns = df_returns.loc[:, df_returns.notna().mean() >= min_ratio]
+    df_returns = df_returns.fillna(df_returns.mean())
+    # Constant prices have no correlation to anything
+    df_returns = df_returns.loc[:, df_returns.std() > 0]
+    return df_returns.astype(np.float32)
+
+
+def _ledoit_wolf_shrinkage(centered: np.ndarray, sample_cov: np.ndarray) -> float:
+    """Ledoit and Wolf (2004) intensity of the shrinkage towards a scaled identity
+
+    Parameters
+    ----------
+    centered : np.ndarray
+        Centered returns, one row per date
+    sample_cov : np.ndarray
+        Maximum likelihood covariance of the returns, centered.T @ centered / n
+
+    Returns
+    -------
+    float
+        Shrinkage intensity, between 0 and 1
+    """
+    n_dates = centered.shape[0]
+    mu = np.trace(sample_cov, dtype=np.float64) / sample_cov.shape[0]
+    cov_norm = np.square(sample_cov, dtype=np.float64).sum()
+    # Sum over the dates of |x_t|^4, the variance of the outer products x_t x_t'
+    row_norms = np.square(centered, dtype=np.float64).sum(axis=1)
+    beta = (np.square(row_norms).sum() / n_dates - cov_norm) / n_dates
+    delta = cov_norm - 2 * mu * np.trace(sample_cov, dtype=np.float64)
+    delta += sample_cov.shape[0] * mu ** 2
+    if delta <= 0:
+        return 0.0
+    return float(min(max(beta, 0), delta) / delta)
+
+
+def covariance_matrix(
+    returns: np.ndarray, shrinkage: Optional[float] = 0
+) -> Tuple[np.ndarray, float]:
+    """Covariance matrix of the returns, optionally shrunk towards a scaled identity
+
+    Parameters
+    ----------
+    returns : np.ndarray
+        Returns, one row per date and one column per ticker
+    shrinkage : Optional[float], optional
+        Shrinkage intensity between 0 and 1, None to use the Ledoit and Wolf one
+
+    Returns
+    -------
+    Tuple[np.ndarray, float]
+        Covariance matrix (float32) and shrinkage intensity used
+    """
+    returns = np.asarray(returns, dtype=np.float32)
+    n_dates = returns.shape[0]
+    if n_dates < 2:
+        raise ValueError("At least 2 dates of returns are needed")
+
+    centered = returns - returns.mean(axis=0, dtype=np.float64).astype(np.float32)
+    # A single BLAS matrix product for every pair of tickers
+    cov = centered.T @ centered
+    if shrinkage is None:
+        shrinkage = _ledoit_wolf_shrinkage(centered, cov / n_dates)
+    cov /= n_dates - 1
+
+    if shrinkage:
+        mu = np.trace(cov, dtype=np.float64) / cov.shape[0]
+        cov *= 1 - shrinkage
+        cov[np.diag_indices_from(cov)] += shrinkage * mu
+    return cov, float(shrinkage)
+
+
+def correlation_matrix(
+    returns: np.ndarray, shrinkage: Optional[float] = 0
+) -> Tuple[np.ndarray, float]:
+    """Correlation matrix of the returns
+
+    Parameters
+    ----------
+    returns : np.ndarray
+        Returns, one row per date and one column per ticker
+    shrinkage : Optional[float], optional
+        Shrinkage intensity of the covariance matrix between 0 and 1, None to use
+        the Ledoit and Wolf one
+
+    Returns
+    -------
+    Tuple[np.ndarray, float]
+        Correlation matrix (float32) and shrinkage intensity used
+    """
+    corr, shrinkage = covariance_matrix(returns, shrinkage)
+    std = np.sqrt(np.diag(corr))
+    corr /= std[:, None]
+    corr /= std[None, :]
+    np.clip(corr, -1, 1, out=corr)
+    return corr, shrinkage
+
+
+def top_correlated_pairs(
+    corr: np.ndarray,
+    tickers: List[str],
+    num_pairs: int = 10,
+    least: bool = False,
+    block_size: int = 512,
+) -> pd.DataFrame:
+    """Most (or least) correlated pairs of tickers, without listing every pair
+
+    Parameters
+    ----------
+    corr : np.ndarray
+        Correlation matrix
+    tickers : List[str]
+        Tickers of the rows and columns of the matrix
+    num_pairs : int, optional
+        Number of pairs returned
+    least : bool, optional
+        Return the least correlated pairs instead
+    block_size : int, optional
+        Number of rows of the matrix scanned at once
+
+    Returns
+    -------
+    pd.DataFrame
+        Ticker 1, Ticker 2 and Correlation of the pairs, best first
+    """
+    n_tickers = corr.shape[0]
+    sign = -1 if least else 1
+    rows: List[np.ndarray] = []
+    cols: List[np.ndarray] = []
+    scores: List[np.ndarray] = []
+    for start in range(0, n_tickers - 1, block_size):
+        block = sign * corr[start : start + block_size].astype(np.float32)
+        # Only the pairs above the diagonal
+        row_index = np.arange(start, start + block.shape[0])[:, None]
+        block[np.arange(n_tickers)[None, :] <= row_index] = -np.inf
+        block[np.isnan(block)] = -np.inf
+
+        flat = block.ravel()
+        n_best = min(num_pairs, flat.size)
+        best = np.argpartition(flat, flat.size - n_best)[flat.size - n_best :]
+        best = best[np.isfinite(flat[best])]
+        rows.append(start + best // n_tickers)
+        cols.append(best % n_tickers)
+        scores.append(flat[best])
+
+    if not scores or not sum(len(score) for score in scores):
+        return pd.DataFrame(columns=["Ticker 1", "Ticker 2", "Correlation"])
+
+    all_rows = np.concatenate(rows)
+    all_cols = np.concatenate(cols)
+    all_scores = np.concatenate(scores)
+    order = np.lexsort((all_cols, all_rows, -all_scores))[:num_pairs]
+    names = np.asarray(tickers)
+    return pd.DataFrame(
+        {
+            "Ticker 1": names[all_rows[order]],
+            "Ticker 2": names[all_cols[order]],
+            "Correlation": corr[all_rows[order], all_cols[order]],
+        }
+    )
+
+
+def top_correlated(
+    corr: np.ndarray,
+    tickers: List[str],
+    ticker: str,
+    num_tickers: int = 10,
+    least: bool = False,
+) -> pd.DataFrame:
+    """Tickers most (or least) correlated to a ticker
+
+    Parameters
+    ----------
+    corr : np.ndarray
+        Correlation matrix
+    tickers : List[str]
+        Tickers of the rows and columns of the matrix
+    ticker : str
+        Ticker to compare the others to
+    num_tickers : int, optional
+        Number of tickers returned
+    least : bool, optional
+        Return the least correlated tickers instead
+
+    Returns
+    -------
+    pd.DataFrame
+        Ticker and Correlation, best first
+    """
+    names = np.asarray(tickers)
+    position = np.flatnonzero(names == ticker)
+    if not len(position):
+        raise ValueError(f"{ticker} is not in the compared tickers")
+
+    scores = (-1 if least else 1) * corr[position[0]].astype(np.float64)
+    scores[position[0]] = -np.inf
+    scores[np.isnan(scores)] = -np.inf
+    num_tickers = min(num_tickers, int(np.isfinite(scores).sum()))
+    if num_tickers <= 0:
+        return pd.DataFrame(columns=["Ticker", "Correlation"])
+
+    best = np.argpartition(scores, scores.size - num_tickers)[-num_tickers:]
+    best = best[np.argsort(-scores[best], kind="stable")]
+    return pd.DataFrame({"Ticker": names[best], "Correlation": corr[position[0], best]})
+
+
+def rolling_correlation(
+    df_returns: pd.DataFrame, ticker: str, others: List[str], window: int = 60
+) -> pd.DataFrame:
+    """Rolling correlation of a ticker to others, updated incrementally
+
+    Parameters
+    ----------
+    df_returns : pd.DataFrame
+        Returns, from get_returns
+    ticker : str
+        Ticker to compare the others to
+    others : List[str]
+        Tickers compared
+    window : int, optional
+        Number of dates of each window
+
+    Returns
+    -------
+    pd.DataFrame
+        Correlations, one column per other ticker, from the first full window
+    """
+    if window < 2 or window > len(df_returns):
+        raise ValueError(f"The window must be between 2 and {len(df_returns)} dates")
+
+    x = df_returns[ticker].to_numpy(dtype=np.float64)[:, None]
+    y = df_returns[others].to_numpy(dtype=np.float64)
+
+    def window_sums(values: np.ndarray) -> np.ndarray:
+        # Each window is the previous one plus a new date minus the oldest one
+        sums = np.cumsum(values, axis=0)
+        sums[window:] = sums[window:] - sums[:-window]
+        return sums[window - 1 :]
+
+    sum_x, sum_y = window_sums(x), window_sums(y)
+    cov = window * window_sums(x * y) - sum_x * sum_y
+    var_x = window * window_sums(x * x) - sum_x ** 2
+    var_y = window * window_sums(y * y) - sum_y ** 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = cov / np.sqrt(np.clip(var_x * var_y, 0, None))
+
+    return pd.DataFrame(
+        np.clip(corr, -1, 1), index=df_returns.index[window - 1 :], columns=others
+    )
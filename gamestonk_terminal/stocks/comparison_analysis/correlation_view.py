@@ -0,0 +1,119 @@
+""" Comparison Analysis Correlation View """
+__docformat__ = "numpy"
+
+import os
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+import matplotlib.pyplot as plt
+from tabulate import tabulate
+
+from gamestonk_terminal import feature_flags as gtff
+from gamestonk_terminal.config_plot import PLOT_DPI
+from gamestonk_terminal.helper_funcs import export_data, plot_autoscale
+from gamestonk_terminal.stocks.comparison_analysis import correlation_model
+
+
+def display_top_correlations(
+    similar_tickers: List[str],
+    start: str = (datetime.now() - timedelta(days=366)).strftime("%Y-%m-%d"),
+    candle_type: str = "a",
+    num: int = 10,
+    least: bool = False,
+    ticker: Optional[str] = None,
+    shrinkage: Optional[float] = 0,
+    window: Optional[int] = None,
+    workers: int = 8,
+    export: str = "",
+):
+    """Display the most correlated pairs of tickers, or tickers to a ticker. [Source: Yahoo Finance]
+
+    Parameters
+    ----------
+    similar_tickers : List[str]
+        Tickers compared
+    start : str, optional
+        Start date of comparison, by default 1 year ago
+    candle_type : str, optional
+        OHLCA column to use, by default "a" for Adjusted Close
+    num : int, optional
+        Number of pairs or tickers shown
+    least : bool, optional
+        Show the least correlated instead
+    ticker : Optional[str], optional
+        Show the tickers correlated to this one instead of pairs
+    shrinkage : Optional[float], optional
+        Shrinkage intensity of the covariance matrix, None for Ledoit and Wolf
+    window : Optional[int], optional
+        Plot the rolling correlation to the ticker over windows of this many days
+    workers : int, optional
+        Number of tickers downloaded at the same time
+    export : str, optional
+        Format to export the correlations, by default ""
+    """
+    df_panel = correlation_model.get_panel(similar_tickers, start, candle_type, workers)
+    df_returns = correlation_model.get_returns(df_panel)
+    dropped = [t for t in similar_tickers if t not in df_returns.columns]
+    if dropped:
+        print(
+            f"Not enough prices for {len(dropped)} tickers: {', '.join(dropped[:20])}"
+        )
+        if len(dropped) > 20:
+            print("...")
+    if df_returns.shape[1] < 2:
+        print("Not enough tickers to compare.\n")
+        return
+
+    tickers = list(df_returns.columns)
+    if ticker and ticker not in tickers:
+        print(f"{ticker} is not among the compared tickers.\n")
+        return
+
+    corr, shrinkage = correlation_model.correlation_matrix(
+        df_returns.to_numpy(), shrinkage
+    )
+    if ticker:
+        df_corr = correlation_model.top_correlated(corr, tickers, ticker, num, least)
+    else:
+        df_corr = correlation_model.top_correlated_pairs(corr, tickers, num, least)
+
+    print(
+        f"{'Least' if least else 'Most'} correlated daily returns of {len(tickers)} "
+        f"tickers over {len(df_returns)} days, shrinkage {shrinkage:.2f}"
+    )
+    if gtff.USE_TABULATE_DF:
+        print(
+            tabulate(
+                df_corr,
+                headers=df_corr.columns,
+                showindex=False,
+                floatfmt=".4f",
+                tablefmt="fancy_grid",
+            ),
+        )
+    else:
+        print(df_corr.to_string(index=False))
+    print("")
+
+    export_data(export, os.path.dirname(os.path.abspath(__file__)), "tcorr", df_corr)
+
+    if ticker and window:
+        if window < 2 or window > len(df_returns):
+            print(f"The rolling window must be between 2 and {len(df_returns)} days.\n")
+            return
+        df_rolling = correlation_model.rolling_correlation(
+            df_returns, ticker, df_corr["Ticker"].tolist(), window
+        )
+        fig, ax = plt.subplots(figsize=plot_autoscale(), dpi=PLOT_DPI)
+        df_rolling.plot(ax=ax)
+        ax.set_title(f"{window} days rolling correlation to {ticker}")
+        ax.set_xlabel("Time")
+        ax.set_ylabel("Correlation")
+        ax.grid(b=True, which="major", color="#666666", linestyle="-")
+        ax.set_xlim([df_rolling.index[0], df_rolling.index[-1]])
+        plt.gcf().autofmt_xdate()
+        fig.tight_layout()
+        if gtff.USE_ION:
+            plt.ion()
+        plt.show()
+        print("")
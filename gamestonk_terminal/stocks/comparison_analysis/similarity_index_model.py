@@ -0,0 +1,248 @@
+"""Similarity index of the S&P 500 stocks, from the embeddings of their daily returns"""
+__docformat__ = "numpy"
+
+import os
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+import gamestonk_terminal.config_terminal as cfg
+
+# Bump whenever the layout of the file written by save_similarity_index changes
+INDEX_VERSION = 1
+
+# Dimension of the embeddings, the principal components of the returns
+N_COMPONENTS = 32
+
+SP500_PRICES_URL = (
+    "https://raw.githubusercontent.com/jmaslek/daily_sp_500/main/SP500_prices_1yr.csv"
+)
+
+_INDEX: Dict[str, Tuple[float, Dict[str, np.ndarray]]] = {}
+
+
+def _index_file() -> str:
+    return os.path.join(cfg.CACHE_DIR, "similarity", "sp500.npz")
+
+
+def get_1y_sp500() -> pd.DataFrame:
+    """
+    Gets the last year of Adj Close prices for all current SP 500 stocks.
+    They are scraped daily using yfinance at https://github.com/jmaslek/daily_sp_500
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame containing last 1 year of closes for all SP500 stocks.
+    """
+    return pd.read_csv(SP500_PRICES_URL, index_col=0)
+
+
+def _normalized_returns(close_vals: pd.DataFrame) -> np.ndarray:
+    """Daily returns of each column, scaled to unit norm, one row per column"""
+    close_vals = close_vals.fillna(method="bfill")
+    rets = close_vals.pct_change().iloc[1:].fillna(0).to_numpy(dtype=np.float64).T
+    norms = np.linalg.norm(rets, axis=1, keepdims=True)
+    return np.divide(rets, norms, out=np.zeros_like(rets), where=norms > 0)
+
+
+def build_similarity_index(
+    close_vals: pd.DataFrame, n_components: int = N_COMPONENTS
+) -> Dict[str, np.ndarray]:
+    """Embed the returns of stocks with their principal components
+
+    Parameters
+    ----------
+    close_vals: pd.DataFrame
+        Prices, one column per ticker and one row per day
+    n_components: int
+        Dimension of the embeddings
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        tickers, dates of the prices, mean and components used to embed the
+        returns of other stocks and embeddings of the stocks (float32)
+    """
+    close_vals = close_vals.dropna(how="all")
+    vectors = _normalized_returns(close_vals)
+    mean = vectors.mean(axis=0)
+    _, _, components = np.linalg.svd(vectors - mean, full_matrices=False)
+    components = components[:n_components]
+
+    return {
+        "version": np.array(INDEX_VERSION),
+        "built": np.array(date.today().isoformat()),
+        "tickers": np.array(close_vals.columns, dtype=str),
+        "dates": np.array(close_vals.index, dtype=str),
+        "mean": mean.astype(np.float32),
+        "components": components.astype(np.float32),
+        "embeddings": ((vectors - mean) @ components.T).astype(np.float32),
+    }
+
+
+def save_similarity_index(index: Dict[str, np.ndarray]):
+    """Save the similarity index in the cache directory
+
+    Parameters
+    ----------
+    index: Dict[str, np.ndarray]
+        Similarity index, from build_similarity_index
+    """
+    index_file = _index_file()
+    os.makedirs(os.path.dirname(index_file), exist_ok=True)
+    # Written aside and renamed, so a partially written index is never picked up
+    with open(f"{index_file}.tmp", "wb") as f:
+        np.savez(f, **index)
+    os.replace(f"{index_file}.tmp", index_file)
+
+
+def load_similarity_index(refresh: bool = False) -> Dict[str, np.ndarray]:
+    """Load the similarity index of the S&P 500, built once a day
+
+    Parameters
+    ----------
+    refresh: bool
+        Build the index again even if it was built today
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        Similarity index, see build_similarity_index
+    """
+    index_file = _index_file()
+    if not refresh:
+        try:
+            mtime = os.path.getmtime(index_file)
+            if index_file in _INDEX and _INDEX[index_file][0] == mtime:
+                index = _INDEX[index_file][1]
+            else:
+                with np.load(index_file) as npz:
+                    index = {name: npz[name] for name in npz.files}
+                _INDEX[index_file] = (mtime, index)
+            if (
+                int(index["version"]) == INDEX_VERSION
+                and str(index["built"]) == date.today().isoformat()
+            ):
+                return index
+        except (OSError, ValueError, KeyError):
+            pass
+
+    index = build_similarity_index(get_1y_sp500())
+    try:
+        save_similarity_index(index)
+    except OSError:
+        pass
+    return index
+
+
+def embed_prices(index: Dict[str, np.ndarray], close: pd.Series) -> np.ndarray:
+    """Embed the returns of a stock outside of the index
+
+    Parameters
+    ----------
+    index: Dict[str, np.ndarray]
+        Similarity index
+    close: pd.Series
+        Prices of the stock, by date
+
+    Returns
+    -------
+    np.ndarray
+        Embedding of the returns over the dates of the index
+    """
+    close = close.copy()
+    close.index = pd.to_datetime(close.index).strftime("%Y-%m-%d")
+    close = close[~close.index.duplicated()].reindex(index["dates"])
+    vector = _normalized_returns(close.to_frame())[0]
+    return ((vector - index["mean"]) @ index["components"].T).astype(np.float32)
+
+
+def get_ticker_embedding(
+    index: Dict[str, np.ndarray], ticker: str
+) -> Tuple[np.ndarray, bool]:
+    """Embedding of a ticker, downloading its prices if it is not in the index
+
+    Parameters
+    ----------
+    index: Dict[str, np.ndarray]
+        Similarity index
+    ticker: str
+        Ticker to embed
+
+    Returns
+    -------
+    Tuple[np.ndarray, bool]
+        Embedding and whether the ticker is in the index
+    """
+    position = np.flatnonzero(index["tickers"] == ticker)
+    if len(position):
+        return index["embeddings"][position[0]], True
+
+    df_ticker = yf.download(ticker, start=str(index["dates"][0]), progress=False)
+    if df_ticker.empty:
+        raise ValueError(f"No prices found for {ticker}")
+    return embed_prices(index, df_ticker["Adj Close"]), False
+
+
+def query_similarity_index(
+    index: Dict[str, np.ndarray],
+    embedding: np.ndarray,
+    num_tickers: int = 10,
+    exclude: Optional[str] = None,
+) -> List[str]:
+    """Nearest stocks of the index to an embedding
+
+    Parameters
+    ----------
+    index: Dict[str, np.ndarray]
+        Similarity index
+    embedding: np.ndarray
+        Embedding searched for
+    num_tickers: int
+        Number of tickers returned
+    exclude: Optional[str]
+        Ticker left out of the results, usually the one searched for
+
+    Returns
+    -------
+    List[str]
+        Tickers, nearest first
+    """
+    embeddings = index["embeddings"]
+    # |e - q|^2 without the constant |q|^2, a single matrix-vector product
+    distances = np.einsum("ij,ij->i", embeddings, embeddings) - 2 * (
+        embeddings @ embedding
+    )
+    if exclude is not None:
+        distances[index["tickers"] == exclude] = np.inf
+
+    num_tickers = min(num_tickers, int(np.isfinite(distances).sum()))
+    if num_tickers <= 0:
+        return []
+    nearest = np.argpartition(distances, num_tickers - 1)[:num_tickers]
+    nearest = nearest[np.argsort(distances[nearest], kind="stable")]
+    return index["tickers"][nearest].tolist()
+
+
+def get_similar_tickers(ticker: str, num_tickers: int = 10) -> List[str]:
+    """Stocks of the S&P 500 whose daily returns over the last year are the closest
+
+    Parameters
+    ----------
+    ticker: str
+        Ticker to get similar companies to
+    num_tickers: int
+        Number of tickers returned
+
+    Returns
+    -------
+    List[str]
+        Similar tickers, closest first
+    """
+    index = load_similarity_index()
+    embedding, _ = get_ticker_embedding(index, ticker)
+    return query_similarity_index(index, embedding, num_tickers, exclude=ticker)
@@ -5,14 +5,15 @@ from datetime import datetime, timedelta
 from typing import List
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import yfinance as yf
 from sklearn.manifold import TSNE
-from sklearn.preprocessing import normalize
 
 from gamestonk_terminal.config_plot import PLOT_DPI
 from gamestonk_terminal.helper_funcs import plot_autoscale
 from gamestonk_terminal import feature_flags as gtff
+from gamestonk_terminal.stocks.comparison_analysis import similarity_index_model
 
 d_candle_types = {
     "o": "Open",
@@ -52,22 +53,6 @@ def get_historical(
     ][similar_tickers]
 
 
-def get_1y_sp500() -> pd.DataFrame:
-    """
-    Gets the last year of Adj Close prices for all current SP 500 stocks.
-    They are scraped daily using yfinance at https://github.com/jmaslek/daily_sp_500
-
-    Returns
-    -------
-    pd.DataFrame
-        DataFrame containing last 1 year of closes for all SP500 stocks.
-    """
-    return pd.read_csv(
-        "https://raw.githubusercontent.com/jmaslek/daily_sp_500/main/SP500_prices_1yr.csv",
-        index_col=0,
-    )
-
-
 # pylint:disable=E1137,E1101
 
 
@@ -75,8 +60,9 @@ def get_sp500_comps_tsne(
     ticker: str, lr: int = 200, no_plot: bool = False, num_tickers: int = 10
 ) -> List[str]:
     """
-    Runs TSNE on SP500 tickers (along with ticker if not in SP500).
-    TSNE is a method of visualing higher dimensional data
+    Gets the SP500 tickers (along with ticker if not in SP500) whose daily returns over
+    the last year are the closest to the ticker ones, from a similarity index built daily.
+    TSNE is only run to plot the stocks, it is a method of visualing higher dimensional data
     https://scikit-learn.org/stable/modules/generated/sklearn.manifold.TSNE.html
     Note that the TSNE numbers are meaningless and will be arbitrary if run again.
 
@@ -94,28 +80,28 @@ def get_sp500_comps_tsne(
     Returns
     -------
     List[str]
-        List of the 10 closest stocks due to TSNE
+        List of the 10 closest stocks
     """
-    # Adding the type makes pylint stop yelling
-    close_vals: pd.DataFrame = get_1y_sp500()
-    if ticker not in close_vals.columns:
-        df_ticker = yf.download(ticker, start=close_vals.index[0], progress=False)[
-            "Adj Close"
-        ].to_frame()
-        df_ticker.columns = [ticker]
-        close_vals = close_vals.join(df_ticker, how="inner")
-
-    close_vals = close_vals.dropna(how="all").fillna(method="bfill")
-    rets = close_vals.pct_change()[1:].T
-
-    model = TSNE(learning_rate=lr)
-    tsne_features = model.fit_transform(normalize(rets))
-    xs = tsne_features[:, 0]
-    ys = tsne_features[:, 1]
+    index = similarity_index_model.load_similarity_index()
+    embedding, in_index = similarity_index_model.get_ticker_embedding(index, ticker)
+    similar = similarity_index_model.query_similarity_index(
+        index, embedding, num_tickers, exclude=ticker
+    )
+
     if not no_plot:
+        companies = index["tickers"].tolist()
+        embeddings = index["embeddings"]
+        if not in_index:
+            companies.append(ticker)
+            embeddings = np.vstack([embeddings, embedding])
+
+        model = TSNE(learning_rate=lr)
+        tsne_features = model.fit_transform(embeddings)
+        xs = tsne_features[:, 0]
+        ys = tsne_features[:, 1]
         fig, ax = plt.subplots(figsize=plot_autoscale(), dpi=PLOT_DPI)
         ax.scatter(xs, ys, alpha=0.5)
-        for x, y, company in zip(xs, ys, rets.index):
+        for x, y, company in zip(xs, ys, companies):
             if company != ticker:
                 ax.annotate(company, (x, y), fontsize=9, alpha=0.75)
             else:
@@ -125,8 +111,5 @@ def get_sp500_comps_tsne(
         if gtff.USE_ION:
             plt.ion()
         plt.show()
-    data = pd.DataFrame({"X": xs, "Y": ys}, index=rets.index)
-    x0, y0 = data.loc[ticker]
-    data["dist"] = (data.X - x0) ** 2 + (data.Y - y0) ** 2
-    data = data.sort_values(by="dist")
-    return data.iloc[1 : num_tickers + 1].index.to_list()
+
+    return similar
@@ -0,0 +1,424 @@
+"""Batch DCF model, computing the valuation of the dcf workbook numerically"""
+__docformat__ = "numpy"
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+from gamestonk_terminal.helper_funcs import get_rf
+from gamestonk_terminal.stocks.fundamental_analysis import dcf_model
+
+PROJECTION_YEARS = 10
+MARKET_RATE = 0.08
+MIN_DISCOUNT_RATE = 0.005
+MAX_LONG_TERM_GROWTH = 0.04
+
+# Items projected from a linear fit on another one, as in CreateExcelFA.add_estimates,
+# by regressor. Those with True are floored at 0
+LINEAR_ITEMS: Dict[str, List[Tuple[str, bool]]] = {
+    "Revenue": [
+        ("Cost of Revenue", False),
+        ("Selling, General & Admin", True),
+        ("Research & Development", True),
+        ("Other Operating Expenses", False),
+        ("Preferred Dividends", False),
+        ("Interest Expense / Income", False),
+        ("Other Expense / Income", False),
+        ("Cash & Equivalents", True),
+        ("Short-Term Investments", True),
+        ("Receivables", True),
+        ("Inventory", True),
+        ("Other Current Assets", False),
+        ("Property, Plant & Equipment", True),
+        ("Long-Term Investments", True),
+        ("Goodwill and Intangibles", True),
+        ("Other Long-Term Assets", False),
+        ("Accounts Payable", False),
+        ("Deferred Revenue", False),
+        ("Current Debt", False),
+        ("Other Current Liabilities", False),
+    ],
+    "Operating Income": [("Income Tax", False)],
+}
+
+SUMMARY_COLUMNS = [
+    "Ticker",
+    "Price",
+    "Value",
+    "Upside",
+    "Model",
+    "Discount Rate",
+    "Long Term Growth",
+    "Revenue Growth",
+]
+
+
+def get_statement_items(
+    pages: Dict[str, dict]
+) -> Tuple[np.ndarray, Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+    """Get the items of the statements of a company, oldest year first
+
+    Parameters
+    ----------
+    pages: Dict[str, dict]
+        Statements by BS, IS and CF, from dcf_model.get_statement_pages
+
+    Returns
+    -------
+    Tuple[np.ndarray, Dict[str, np.ndarray], Dict[str, np.ndarray]]
+        Years, values of the items and values used by the linear fits, which
+        are read with dcf_model.string_float as in the workbook. Only GAAP
+        items are kept, those missing from the statements are 0
+    """
+    # The workbook takes the years from the balance sheet
+    years = pages["BS"]["years"][1:]
+    n_years = len(years)
+    values: Dict[str, np.ndarray] = {}
+    fit_values: Dict[str, np.ndarray] = {}
+    for statement, items in [("BS", dcf_model.gaap_bs), ("IS", dcf_model.gaap_is)]:
+        for row in pages[statement]["rows"]:
+            if row[0] not in items or row[0] in values:
+                continue
+            cells = row[1 : n_years + 1]
+            if len(cells) < n_years:
+                raise ValueError("Dataframe does not have key information.")
+            values[row[0]] = np.array(
+                [0 if x == "-" else float(x.replace(",", "")) for x in cells[::-1]]
+            )
+            fit_values[row[0]] = np.array(
+                [dcf_model.string_float(x) for x in cells[::-1]]
+            )
+
+    for item in ["Revenue", "Cash & Equivalents"]:
+        if item not in values:
+            raise ValueError("Dataframe does not have key information.")
+    for item in dcf_model.gaap_is + dcf_model.gaap_bs:
+        values.setdefault(item, np.zeros(n_years))
+        fit_values.setdefault(item, np.zeros(n_years))
+
+    return (
+        np.array([dcf_model.string_float(x) for x in years[::-1]]),
+        values,
+        fit_values,
+    )
+
+
+def linear_fit(x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Least squares lines of several series on the same regressor
+
+    Parameters
+    ----------
+    x: np.ndarray
+        Regressor, one value per year
+    y: np.ndarray
+        Series fitted, one row per year and one column per series
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Slopes and intercepts, one per series
+    """
+    x_centered = x - x.mean()
+    y_mean = y.mean(axis=0)
+    variance = x_centered @ x_centered
+    if variance == 0:
+        slopes = np.zeros(y.shape[1])
+    else:
+        slopes = x_centered @ (y - y_mean) / variance
+    return slopes, y_mean - slopes * x.mean()
+
+
+def project_financials(
+    years: np.ndarray,
+    fit_values: Dict[str, np.ndarray],
+    n_years: int = PROJECTION_YEARS,
+) -> Dict[str, np.ndarray]:
+    """Project the items needed by the free cash flows, all years at once
+
+    Parameters
+    ----------
+    years: np.ndarray
+        Years of the statements, oldest first
+    fit_values: Dict[str, np.ndarray]
+        Values used by the linear fits, from get_statement_items
+    n_years: int
+        Years projected
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        Projected items, one value per year
+    """
+    offsets = years - years.min()
+    slope, intercept = linear_fit(offsets, fit_values["Revenue"][:, None])
+    projected = {
+        "Revenue": (offsets.max() + np.arange(1, n_years + 1)) * slope[0] + intercept[0]
+    }
+
+    def project(regressor: str):
+        items = LINEAR_ITEMS[regressor]
+        slopes, intercepts = linear_fit(
+            fit_values[regressor],
+            np.column_stack([fit_values[item] for item, _ in items]),
+        )
+        y = projected[regressor][:, None] * slopes + intercepts
+        no_neg = np.array([floored for _, floored in items])
+        y = np.where(no_neg & (y < 0), 0, y)
+        for i, (item, _) in enumerate(items):
+            projected[item] = y[:, i]
+
+    project("Revenue")
+    projected["Operating Income"] = (
+        projected["Revenue"]
+        - projected["Cost of Revenue"]
+        - projected["Selling, General & Admin"]
+        - projected["Research & Development"]
+        - projected["Other Operating Expenses"]
+    )
+    project("Operating Income")
+    projected["Net Income"] = (
+        projected["Operating Income"]
+        - projected["Interest Expense / Income"]
+        - projected["Other Expense / Income"]
+        - projected["Income Tax"]
+    )
+    projected["Total Current Assets"] = (
+        projected["Cash & Equivalents"]
+        + projected["Short-Term Investments"]
+        + projected["Receivables"]
+        + projected["Inventory"]
+        + projected["Other Current Assets"]
+    )
+    projected["Total Long-Term Assets"] = (
+        projected["Property, Plant & Equipment"]
+        + projected["Long-Term Investments"]
+        + projected["Goodwill and Intangibles"]
+        + projected["Other Long-Term Assets"]
+    )
+    projected["Total Current Liabilities"] = (
+        projected["Accounts Payable"]
+        + projected["Deferred Revenue"]
+        + projected["Current Debt"]
+        + projected["Other Current Liabilities"]
+    )
+    return projected
+
+
+def get_free_cash_flows(
+    values: Dict[str, np.ndarray], projected: Dict[str, np.ndarray]
+) -> np.ndarray:
+    """Free cash flows of the projected years
+
+    Parameters
+    ----------
+    values: Dict[str, np.ndarray]
+        Values of the statements, from get_statement_items
+    projected: Dict[str, np.ndarray]
+        Projected items, from project_financials
+
+    Returns
+    -------
+    np.ndarray
+        Net income minus the changes in net working capital and long-term
+        assets, minus preferred dividends
+    """
+
+    def change(item: str) -> np.ndarray:
+        return np.diff(projected[item], prepend=values[item][-1])
+
+    return (
+        projected["Net Income"]
+        - (change("Total Current Assets") - change("Total Current Liabilities"))
+        - change("Total Long-Term Assets")
+        - projected["Preferred Dividends"]
+    )
+
+
+def get_firm_value(
+    values: Dict[str, np.ndarray],
+    free_cash_flows: np.ndarray,
+    discount_rate: float,
+    growth: float,
+) -> float:
+    """Value of the equity of a company
+
+    Parameters
+    ----------
+    values: Dict[str, np.ndarray]
+        Values of the statements, from get_statement_items
+    free_cash_flows: np.ndarray
+        Free cash flows of the projected years
+    discount_rate: float
+        Rate the cash flows are discounted at
+    growth: float
+        Growth of the cash flows after the projected years
+
+    Returns
+    -------
+    float
+        Present value of the cash flows and of the terminal value, plus cash,
+        minus long-term liabilities. At least the book value
+    """
+    terminal = free_cash_flows[-1] * (1 + growth) / (discount_rate - growth)
+    flows = np.append(free_cash_flows, terminal)
+    npv = flows @ (1 + discount_rate) ** -np.arange(1, len(flows) + 1)
+    return max(
+        npv
+        + values["Cash & Cash Equivalents"][-1]
+        - values["Total Long-Term Liabilities"][-1],
+        values["Total Assets"][-1] - values["Total Liabilities"][-1],
+    )
+
+
+def get_discount_rate(
+    ticker: str,
+    beta: Optional[float],
+    risk_free_rate: float,
+    df_fama: Optional[pd.DataFrame] = None,
+) -> Tuple[str, float]:
+    """Discount rate of a company, from Fama and French or CAPM
+
+    Parameters
+    ----------
+    ticker: str
+        The ticker of the company
+    beta: Optional[float]
+        Beta of the company, 1 if unknown
+    risk_free_rate: float
+        Risk free rate
+    df_fama: Optional[pd.DataFrame]
+        Fama French data. CAPM is used if not given or if the regression fails
+
+    Returns
+    -------
+    Tuple[str, float]
+        Model used and discount rate
+    """
+    if df_fama is not None:
+        try:
+            rate = float(dcf_model.get_fama_coe(ticker, df_fama))
+            if np.isfinite(rate):
+                return "Fama French", max(rate, MIN_DISCOUNT_RATE)
+        except (ValueError, KeyError):
+            pass
+
+    beta = 1 if beta is None else beta
+    rate = (MARKET_RATE - risk_free_rate) * beta + risk_free_rate
+    return "CAPM", max(rate, MIN_DISCOUNT_RATE)
+
+
+def value_company(
+    pages: Dict[str, dict],
+    info: dict,
+    discount_rate: float,
+) -> Dict[str, float]:
+    """Value a company with the model of the dcf workbook
+
+    Parameters
+    ----------
+    pages: Dict[str, dict]
+        Statements by BS, IS and CF, from dcf_model.get_statement_pages
+    info: dict
+        Yahoo Finance info, with sharesOutstanding and regularMarketPrice
+    discount_rate: float
+        Rate the cash flows are discounted at
+
+    Returns
+    -------
+    Dict[str, float]
+        Implied share price, growth assumptions and upside
+    """
+    rounding = pages["BS"]["rounding"]
+    if not rounding:
+        raise ValueError("Stock Analysis did not specify a proper rounding amount")
+
+    years, values, fit_values = get_statement_items(pages)
+    projected = project_financials(years, fit_values)
+    growth = min(MAX_LONG_TERM_GROWTH, discount_rate * 0.9)
+    firm_value = get_firm_value(
+        values, get_free_cash_flows(values, projected), discount_rate, growth
+    )
+    share_value = firm_value * rounding / info["sharesOutstanding"]
+    price = float(info["regularMarketPrice"])
+
+    last_revenue = values["Revenue"][-1]
+    revenue_growth = np.nan
+    if last_revenue > 0 and projected["Revenue"][-1] > 0:
+        revenue_growth = (projected["Revenue"][-1] / last_revenue) ** (
+            1 / len(projected["Revenue"])
+        ) - 1
+
+    return {
+        "Price": price,
+        "Value": share_value,
+        "Upside": share_value / price - 1 if price else np.nan,
+        "Discount Rate": discount_rate,
+        "Long Term Growth": growth,
+        "Revenue Growth": revenue_growth,
+    }
+
+
+def _value_ticker(
+    ticker: str, risk_free_rate: float, df_fama: Optional[pd.DataFrame]
+) -> Tuple[str, Optional[Dict[str, float]], str]:
+    try:
+        pages = {
+            statement: page
+            for (_, statement), page in dcf_model.get_statement_pages([ticker]).items()
+        }
+        if len(pages) < 3:
+            raise ValueError("The ticker given is not in the stock analysis website.")
+        info = yf.Ticker(ticker).info
+        model, rate = get_discount_rate(
+            ticker, info.get("beta"), risk_free_rate, df_fama
+        )
+        result = value_company(pages, info, rate)
+        result["Model"] = model
+        return ticker, result, ""
+    except Exception as e:  # pylint: disable=broad-except
+        return ticker, None, str(e) or type(e).__name__
+
+
+def get_batch_dcf(
+    tickers: List[str], workers: int = 4, capm: bool = False
+) -> Tuple[pd.DataFrame, Dict[str, str]]:
+    """Value several companies with the model of the dcf workbook
+
+    The risk free rate and the Fama French factors are downloaded once, the
+    companies are then valued in parallel worker processes.
+
+    Parameters
+    ----------
+    tickers: List[str]
+        Tickers of the companies
+    workers: int
+        Number of worker processes, the companies are valued in this process if 1
+    capm: bool
+        Discount with CAPM instead of Fama and French
+
+    Returns
+    -------
+    Tuple[pd.DataFrame, Dict[str, str]]
+        Valuations with SUMMARY_COLUMNS, in the order of the tickers, and the
+        error of each ticker that could not be valued
+    """
+    if not tickers:
+        return pd.DataFrame(columns=SUMMARY_COLUMNS), {}
+
+    risk_free_rate = get_rf()
+    df_fama = None if capm else dcf_model.get_fama_raw()
+    args = (tickers, [risk_free_rate] * len(tickers), [df_fama] * len(tickers))
+    if workers <= 1:
+        results = list(map(_value_ticker, *args))
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tickers))) as executor:
+            results = list(executor.map(_value_ticker, *args))
+
+    df_summary = pd.DataFrame(
+        [{"Ticker": ticker, **result} for ticker, result, _ in results if result],
+        columns=SUMMARY_COLUMNS,
+    )
+    return df_summary, {ticker: error for ticker, _, error in results if error}
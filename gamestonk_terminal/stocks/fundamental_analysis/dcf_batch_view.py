@@ -0,0 +1,79 @@
+""" Batch DCF view """
+__docformat__ = "numpy"
+
+import os
+from typing import List
+
+from tabulate import tabulate
+
+from gamestonk_terminal import feature_flags as gtff
+from gamestonk_terminal.helper_funcs import export_data
+from gamestonk_terminal.stocks.fundamental_analysis import dcf_batch_model, dcf_view
+
+
+def display_batch_dcf(
+    tickers: List[str],
+    excel: List[str] = None,
+    workers: int = 4,
+    capm: bool = False,
+    audit: bool = False,
+    export: str = "",
+):
+    """Value several companies with the dcf model and show a summary
+
+    Parameters
+    ----------
+    tickers: List[str]
+        Tickers of the companies
+    excel: List[str]
+        Tickers to also write the dcf workbook for
+    workers: int
+        Number of worker processes
+    capm: bool
+        Discount with CAPM instead of Fama and French
+    audit: bool
+        Add the audit to the workbooks
+    export: str
+        Export dataframe data to csv,json,xlsx file
+    """
+    df_summary, d_errors = dcf_batch_model.get_batch_dcf(tickers, workers, capm)
+
+    if df_summary.empty:
+        print("No company could be valued.\n")
+    else:
+        df_print = df_summary.copy()
+        for col in ["Upside", "Discount Rate", "Long Term Growth", "Revenue Growth"]:
+            df_print[col] = df_print[col].apply(lambda x: f"{x:.2%}")
+
+        if gtff.USE_TABULATE_DF:
+            print(
+                tabulate(
+                    df_print,
+                    headers=df_print.columns,
+                    showindex=False,
+                    floatfmt=".2f",
+                    tablefmt="fancy_grid",
+                ),
+            )
+        else:
+            print(df_print.to_string(index=False))
+        print("")
+
+    if d_errors:
+        print("Companies that could not be valued:")
+        for ticker, error in d_errors.items():
+            print(f"   {ticker}: {error}")
+        print("")
+
+    export_data(
+        export,
+        os.path.dirname(os.path.abspath(__file__)),
+        "dcf",
+        df_summary,
+    )
+
+    for ticker in excel or []:
+        try:
+            dcf_view.CreateExcelFA(ticker, audit).create_workbook()
+        except ValueError as e:
+            print(f"Unable to create the workbook of {ticker}: {e}\n")
@@ -1,8 +1,12 @@
 """ DCF Model """
 __docformat__ = "numpy"
 
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from urllib.request import urlopen
-from typing import List, Union
+from typing import Dict, List, Optional, Tuple, Union
 from zipfile import ZipFile
 from io import BytesIO
 
@@ -10,9 +14,12 @@ from sklearn.linear_model import LinearRegression
 from openpyxl.styles import Border, Side, Font, PatternFill, Alignment
 from openpyxl import worksheet
 import financedatabase as fd
+import lxml.html
+import requests
 import yfinance as yf
 import pandas as pd
 
+import gamestonk_terminal.config_terminal as cfg
 from gamestonk_terminal.helper_funcs import get_user_agent
 
 opts = Union[int, str, float]
@@ -171,20 +178,23 @@ def get_historical_5(ticker: str) -> pd.DataFrame:
     return df
 
 
-def get_fama_coe(ticker: str) -> float:
+def get_fama_coe(ticker: str, df_f: Optional[pd.DataFrame] = None) -> float:
     """Use Fama and French to get the cost of equity for a company
 
     Parameters
     ----------
     ticker : str
         The ticker to be analyzed
+    df_f : Optional[pd.DataFrame]
+        Fama French data, downloaded if not given
 
     Returns
     -------
     coef : float
         The stock's Fama French coefficient
     """
-    df_f = get_fama_raw()
+    if df_f is None:
+        df_f = get_fama_raw()
     df_h = get_historical_5(ticker)
     df = df_h.join(df_f)
     df = df.dropna()
@@ -232,6 +242,161 @@ def others_in_sector(ticker: str, sector: str, industry: str) -> List[str]:
     return sister_ticks
 
 
+STATEMENT_PAGES = {
+    "IS": "",
+    "BS": "balance-sheet/",
+    "CF": "cash-flow-statement/",
+}
+
+# Statement pages downloaded at the same time
+MAX_WORKERS = 12
+
+
+def _statements_folder() -> str:
+    return os.path.join(cfg.CACHE_DIR, "dcf")
+
+
+def get_fiscal_period(date: Optional[datetime] = None) -> str:
+    """Period a statement page is cached for
+
+    Stock Analysis shows yearly statements, which only change once new
+    filings are out, so a page parsed this quarter is not downloaded again.
+
+    Parameters
+    ----------
+    date: Optional[datetime]
+        Date in the period, today by default
+
+    Returns
+    -------
+    str
+        Period, e.g. 2021Q4
+    """
+    date = date or datetime.now()
+    return f"{date.year}Q{(date.month - 1) // 3 + 1}"
+
+
+def parse_statement_page(html: str) -> Dict[str, Union[int, list]]:
+    """Parse a Stock Analysis financial statement page
+
+    Parameters
+    ----------
+    html: str
+        Page of the statement
+
+    Returns
+    -------
+    Dict[str, Union[int, list]]
+        Column headers (years), rows of cells (the item name first) and
+        rounding of the numbers, 0 if the page does not specify it
+    """
+    if "404 - Page Not Found" in html:
+        raise ValueError("The ticker given is not in the stock analysis website.")
+
+    tree = lxml.html.fromstring(html)
+    tables = tree.xpath(
+        "//table[contains(concat(' ', normalize-space(@class)), "
+        "' FinancialTable_table_financial__')]"
+    )
+    if not tables or not tables[0].xpath("./thead"):
+        raise ValueError("Incorrect website format")
+    table = tables[0]
+
+    rounding = 0
+    phrases = tree.xpath("//div[@class='text-sm pb-1 text-gray-600']")
+    if phrases:
+        phrase = phrases[0].text_content()
+        if "thousand" in phrase:
+            rounding = 1_000
+        elif "millions" in phrase:
+            rounding = 1_000_000
+        elif "billions" in phrase:
+            rounding = 1_000_000_000
+
+    return {
+        "years": [x.text_content().strip() for x in table.xpath("./thead//th")],
+        "rows": [
+            [x.text_content().strip() for x in row.xpath("./td")]
+            for row in table.xpath("./tbody/tr")
+        ],
+        "rounding": rounding,
+    }
+
+
+def get_statement_page(ticker: str, statement: str) -> Dict[str, Union[int, list]]:
+    """Get a financial statement of a company, from the cache if parsed this quarter
+
+    Parameters
+    ----------
+    ticker: str
+        The ticker of the company
+    statement: str
+        IS (income statement), BS (balance sheet) or CF (cash flows)
+
+    Returns
+    -------
+    Dict[str, Union[int, list]]
+        Statement, see parse_statement_page
+    """
+    cache_file = os.path.join(
+        _statements_folder(), f"{ticker}_{statement}_{get_fiscal_period()}.json"
+    )
+    try:
+        with open(cache_file, encoding="utf8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    r = requests.get(
+        f"https://stockanalysis.com/stocks/{ticker}/financials/"
+        f"{STATEMENT_PAGES[statement]}",
+        headers=headers,
+    )
+    page = parse_statement_page(r.text)
+
+    try:
+        os.makedirs(_statements_folder(), exist_ok=True)
+        with open(cache_file, "w", encoding="utf8") as f:
+            json.dump(page, f)
+    except OSError:
+        pass
+    return page
+
+
+def get_statement_pages(
+    tickers: List[str], statements: Tuple[str, ...] = ("BS", "IS", "CF")
+) -> Dict[Tuple[str, str], Dict[str, Union[int, list]]]:
+    """Get the financial statements of several companies concurrently
+
+    Parameters
+    ----------
+    tickers: List[str]
+        The tickers of the companies
+    statements: Tuple[str, ...]
+        Statements to get for each company
+
+    Returns
+    -------
+    Dict[Tuple[str, str], Dict[str, Union[int, list]]]
+        Statements by ticker and statement. Those that could not be
+        downloaded or parsed are left out
+    """
+    keys = [(ticker, statement) for ticker in tickers for statement in statements]
+    if not keys:
+        return {}
+
+    def get_page(key: Tuple[str, str]) -> Optional[Dict[str, Union[int, list]]]:
+        try:
+            return get_statement_page(*key)
+        except (ValueError, requests.exceptions.RequestException):
+            return None
+
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(keys))) as executor:
+        pages = list(executor.map(get_page, keys))
+
+    return {key: page for key, page in zip(keys, pages) if page is not None}
+
+
 letters = [
     "A",
     "B",
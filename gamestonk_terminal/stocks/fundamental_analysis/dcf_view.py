@@ -1,7 +1,7 @@
 """ DCF View """
 __docformat__ = "numpy"
 
-from typing import List, Union
+from typing import Dict, List, Union
 from datetime import datetime
 from pathlib import Path
 import random
@@ -11,12 +11,9 @@ from openpyxl.styles.numbers import FORMAT_PERCENTAGE_00
 from openpyxl import Workbook, worksheet
 from openpyxl.styles import Font
 from sklearn.linear_model import LinearRegression
-from bs4 import BeautifulSoup
-import regex as re
 import yfinance as yf
 import pandas as pd
 import numpy as np
-import requests
 
 from gamestonk_terminal.stocks.fundamental_analysis import dcf_model
 from gamestonk_terminal.helper_funcs import get_rf
@@ -48,6 +45,14 @@ class CreateExcelFA:
         self.len_pred: int = 10
         self.years: List[str] = []
         self.rounding: int = 0
+        pages = dcf_model.get_statement_pages([ticker])
+        self.pages: Dict[str, dict] = {
+            statement: pages[(ticker, statement)]
+            for statement in ["BS", "IS", "CF"]
+            if (ticker, statement) in pages
+        }
+        if len(self.pages) < 3:
+            raise ValueError("The ticker given is not in the stock analysis website.")
         self.df_bs: pd.DataFrame = self.get_data("BS", self.bs_start, False)
         self.df_is: pd.DataFrame = self.get_data("IS", self.is_start, True)
         self.df_cf: pd.DataFrame = self.get_data("CF", self.cf_start, False)
@@ -95,90 +100,18 @@ class CreateExcelFA:
             )
 
     def get_data(self, statement: str, row: int, header: bool) -> pd.DataFrame:
-        URL = f"https://stockanalysis.com/stocks/{self.ticker}/financials/"
         if statement == "BS":
-            URL += "balance-sheet/"
             title = "Balance Sheet"
-            ignores = dcf_model.non_gaap_bs
         if statement == "CF":
-            URL += "cash-flow-statement/"
             title = "Cash Flows"
-            ignores = dcf_model.non_gaap_cf
         if statement == "IS":
             title = "Income Statement"
-            ignores = dcf_model.non_gaap_is
 
-        r = requests.get(URL, headers=dcf_model.headers)
-
-        if "404 - Page Not Found" in r.text:
-            raise ValueError("The ticker given is not in the stock analysis website.")
-        soup = BeautifulSoup(r.content, "html.parser")
-
-        table = soup.find(
-            "table", attrs={"class": re.compile("^FinancialTable_table_financial__.*")}
-        )
-        head = table.find("thead")
-        columns = head.find_all("th")
-
-        if self.years == []:
-            self.years = [x.get_text().strip() for x in columns]
-            self.len_data = len(self.years) - 1
-
-        if self.rounding == 0:
-            phrase = soup.find(
-                "div", attrs={"class": "text-sm pb-1 text-gray-600"}
-            ).get_text()
-            if "thousand" in phrase:
-                self.rounding = 1_000
-            elif "millions" in phrase:
-                self.rounding = 1_000_000
-            elif "billions" in phrase:
-                self.rounding = 1_000_000_000
-            else:
-                raise ValueError(
-                    "Stock Analysis did not specify a proper rounding amount"
-                )
-
-        body = table.find("tbody")
-        rows = body.find_all("tr")
-
-        all_data = [
-            [
-                x.get_text().strip() if x.get_text().strip() != "-" else "0"
-                for x in y.find_all("td")
-            ]
-            for y in rows
-        ]
-
-        df = pd.DataFrame(data=all_data)
-        df = df.set_index(0)
-        n = df.shape[1] - self.len_data
-        if n > 0:
-            df = df.iloc[:, :-n]
-        df.columns = self.years[1:]
-
-        for ignore in ignores:
-            if ignore in df.index:
-                df = df.drop([ignore])
-        df = df[df.columns[::-1]]
+        df = self.get_statement_df(statement, self.pages[statement], True)
 
         self.ws1[f"A{row}"] = title
         self.ws1[f"A{row}"].font = dcf_model.bold_font
 
-        if statement == "IS":
-            vals = ["Revenue", dcf_model.gaap_is]
-        elif statement == "BS":
-            vals = ["Cash & Equivalents", dcf_model.gaap_bs]
-        elif statement == "CF":
-            vals = ["Net Income", dcf_model.gaap_cf]
-
-        if vals[0] in df.index:
-            blank_list = ["0" for _ in df.loc[vals[0]].to_list()]
-        else:
-            raise ValueError("Dataframe does not have key information.")
-        for i, _ in enumerate(vals[1][1:]):
-            df = dcf_model.insert_row(vals[1][i + 1], vals[1][i], df, blank_list)
-
         rowI = row + 1
         names = df.index.values.tolist()
 
@@ -1265,71 +1198,51 @@ class CreateExcelFA:
         # TODO: Once mcap is added to this, we can add as an additional filters for more comparative results
         sisters = self.sisters
         random.shuffle(sisters)
-        i = 0
         new_list = []
-        while i < 3 and sisters:
-            try:
-                vals = [
-                    sisters[0],
-                    [self.get_sister_data(x, sisters[0]) for x in ["BS", "IS", "CF"]],
-                ]
-                new_list.append(vals)
-                i += 1
-                sisters.pop(0)
-            except ValueError:
-                sisters.pop(0)
+        while len(new_list) < 3 and sisters:
+            # The statements of the sisters needed are downloaded at once, the
+            # next ones are only tried if some could not be used
+            candidates = sisters[: 3 - len(new_list)]
+            del sisters[: len(candidates)]
+            pages = dcf_model.get_statement_pages(candidates)
+            for sister in candidates:
+                try:
+                    vals = [
+                        sister,
+                        [
+                            self.get_statement_df(x, pages[(sister, x)], False)
+                            for x in ["BS", "IS", "CF"]
+                        ],
+                    ]
+                    new_list.append(vals)
+                except (KeyError, ValueError):
+                    print(f"Unable to use sister ticker {sister} for ratio analysis")
         self.sister_data = new_list
 
-    def get_sister_data(self, statement: str, ticker: str) -> pd.DataFrame:
-        URL = f"https://stockanalysis.com/stocks/{ticker}/financials/"
+    def get_statement_df(
+        self, statement: str, page: dict, fill_blanks: bool
+    ) -> pd.DataFrame:
         if statement == "BS":
-            URL += "balance-sheet/"
             ignores = dcf_model.non_gaap_bs
         if statement == "CF":
-            URL += "cash-flow-statement/"
             ignores = dcf_model.non_gaap_cf
         if statement == "IS":
             ignores = dcf_model.non_gaap_is
 
-        r = requests.get(URL, headers=dcf_model.headers)
-
-        if "404 - Page Not Found" in r.text:
-            # TODO: add better handling
-            print("Unable to find requested sister ticker for ration analysis")
-            raise ValueError("The ticker given is not in the stock analysis website.")
-        soup = BeautifulSoup(r.content, "html.parser")
-
-        table = soup.find(
-            "table", attrs={"class": re.compile("^FinancialTable_table_financial__.*")}
-        )
-        head = table.find("thead")
-        if head is None:
-            raise ValueError("Incorrect website format")
-        columns = head.find_all("th")
-
         if self.years == []:
-            self.years = [x.get_text().strip() for x in columns]
+            self.years = page["years"]
             self.len_data = len(self.years) - 1
 
         if self.rounding == 0:
-            phrase = soup.find(
-                "div", attrs={"class": "text-sm pb-1 text-gray-600"}
-            ).get_text()
-            if "thousand" in phrase:
-                self.rounding = 1_000
-            elif "millions" in phrase:
-                self.rounding = 1_000_000
-            elif "billions" in phrase:
-                self.rounding = 1_000_000_000
-            else:
+            self.rounding = page["rounding"]
+            if self.rounding == 0:
                 raise ValueError(
                     "Stock Analysis did not specify a proper rounding amount"
                 )
 
-        body = table.find("tbody")
-        rows = body.find_all("tr")
-
-        all_data = [[x.get_text().strip() for x in y.find_all("td")] for y in rows]
+        all_data = [
+            ["0" if fill_blanks and x == "-" else x for x in y] for y in page["rows"]
+        ]
 
         df = pd.DataFrame(data=all_data)
         df = df.set_index(0)
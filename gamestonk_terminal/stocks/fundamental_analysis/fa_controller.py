@@ -18,6 +18,7 @@ from gamestonk_terminal.stocks.fundamental_analysis import (
     yahoo_finance_view,
     av_view,
     business_insider_view,
+    dcf_batch_view,
     dcf_view,
     market_watch_view,
 )
@@ -27,6 +28,7 @@ from gamestonk_terminal.helper_funcs import (
     parse_known_args_and_warn,
     check_positive,
     valid_date,
+    load_tickers_file,
 )
 from gamestonk_terminal.stocks import stocks_helper
 from gamestonk_terminal.menu import session
@@ -725,7 +727,8 @@ Other Sources:
             description="""
                 Generates a discounted cash flow statement. The statement uses machine
                 learning to predict the future financial statement, and then predicts the future
-                value of the stock based on the predicted financials.""",
+                value of the stock based on the predicted financials. Several tickers are
+                valued at once with the same model in parallel, showing a summary.""",
         )
         parser.add_argument(
             "-a",
@@ -735,13 +738,76 @@ Other Sources:
             default=False,
             help="Confirms that the numbers provided are accurate.",
         )
+        parser.add_argument(
+            "-t",
+            "--tickers",
+            type=lambda s: [x.strip().upper() for x in s.split(",") if x.strip()],
+            dest="tickers",
+            default=[],
+            help="""Tickers to value at once, separated by commas. Only a summary
+            is shown, the workbooks are written for the --excel tickers.""",
+        )
+        parser.add_argument(
+            "-f",
+            "--file",
+            type=str,
+            dest="file",
+            default="",
+            help="Text or csv file with the tickers to value at once.",
+        )
+        parser.add_argument(
+            "-x",
+            "--excel",
+            type=lambda s: [x.strip().upper() for x in s.split(",") if x.strip()],
+            dest="excel",
+            default=[],
+            help="Tickers to write the workbook for when valuing several tickers.",
+        )
+        parser.add_argument(
+            "-w",
+            "--workers",
+            type=check_positive,
+            dest="workers",
+            default=4,
+            help="Number of worker processes when valuing several tickers.",
+        )
+        parser.add_argument(
+            "-c",
+            "--capm",
+            action="store_true",
+            dest="capm",
+            default=False,
+            help="Discount with CAPM instead of Fama and French when valuing several tickers.",
+        )
         ns_parser = parse_known_args_and_warn(
             parser, other_args, EXPORT_ONLY_RAW_DATA_ALLOWED
         )
 
         if ns_parser:
-            dcf = dcf_view.CreateExcelFA(self.ticker, ns_parser.audit)
-            dcf.create_workbook()
+            tickers = ns_parser.tickers
+            if ns_parser.file:
+                try:
+                    tickers += load_tickers_file(ns_parser.file)
+                except OSError as e:
+                    print(f"Unable to read {ns_parser.file}: {e}\n")
+                    return
+            if tickers:
+                dcf_batch_view.display_batch_dcf(
+                    tickers=list(dict.fromkeys(tickers)),
+                    excel=ns_parser.excel,
+                    workers=ns_parser.workers,
+                    capm=ns_parser.capm,
+                    audit=ns_parser.audit,
+                    export=ns_parser.export,
+                )
+            elif ns_parser.excel:
+                print(
+                    "The --excel tickers are only used when valuing several "
+                    "tickers with --tickers or --file\n"
+                )
+            else:
+                dcf = dcf_view.CreateExcelFA(self.ticker, ns_parser.audit)
+                dcf.create_workbook()
 
     def call_warnings(self, other_args: List[str]):
         """Process warnings command."""
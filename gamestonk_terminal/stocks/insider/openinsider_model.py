@@ -1,13 +1,36 @@
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Tuple
 import os
 import configparser
 import requests
-from bs4 import BeautifulSoup
+import lxml.html
 import pandas as pd
 
 presets_path = os.path.join(os.path.abspath(os.path.dirname(__file__)), "presets/")
 
+d_open_insider = {
+    "lcb": "latest-cluster-buys",
+    "lpsb": "latest-penny-stock-buys",
+    "lit": "latest-insider-trading",
+    "lip": "insider-purchases",
+    "blip": "latest-insider-purchases-25k",
+    "blop": "latest-officer-purchases-25k",
+    "blcp": "latest-ceo-cfo-purchases-25k",
+    "lis": "insider-sales",
+    "blis": "latest-insider-sales-100k",
+    "blos": "latest-officer-sales-100k",
+    "blcs": "latest-ceo-cfo-sales-100k",
+    "topt": "top-officer-purchases-of-the-day",
+    "toppw": "top-officer-purchases-of-the-week",
+    "toppm": "top-officer-purchases-of-the-month",
+    "tipt": "top-insider-purchases-of-the-day",
+    "tippw": "top-insider-purchases-of-the-week",
+    "tippm": "top-insider-purchases-of-the-month",
+    "tist": "top-insider-sales-of-the-day",
+    "tispw": "top-insider-sales-of-the-week",
+    "tispm": "top-insider-sales-of-the-month",
+}
+
 
 # pylint: disable=too-many-branches,line-too-long,C0302
 # flake8: noqa
@@ -1225,6 +1248,43 @@ def get_open_insider_link(preset_loaded: str) -> str:
     return link
 
 
+def parse_open_insider_table(html: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Extract the results table of an open insider page
+
+    Parameters
+    ----------
+    html: str
+        open insider page
+
+    Returns
+    ----------
+    Tuple[pd.DataFrame, pd.DataFrame]
+        Text of each cell and first link of each cell ("" if none), with the
+        table headers as columns. Empty if the page holds no results table
+    """
+    tables = lxml.html.fromstring(html).xpath(
+        "//table[contains(concat(' ', normalize-space(@class), ' '), ' tinytable ')]"
+    )
+    if not tables:
+        return pd.DataFrame(), pd.DataFrame()
+
+    headers = [
+        th.text_content().replace("\xa0", " ").strip()
+        for th in tables[0].xpath("./thead/tr/th")
+    ]
+    l_cells = []
+    l_links = []
+    for row in tables[0].xpath("./tbody/tr"):
+        tds = row.xpath("./td")
+        l_cells.append([td.text_content().strip() for td in tds])
+        l_links.append([(td.xpath(".//a/@href") or [""])[0] for td in tds])
+
+    return (
+        pd.DataFrame(l_cells, columns=headers),
+        pd.DataFrame(l_links, columns=headers),
+    )
+
+
 def get_open_insider_data(url: str, has_company_name: bool) -> pd.DataFrame:
     """Get open insider link
 
@@ -1240,108 +1300,64 @@ def get_open_insider_data(url: str, has_company_name: bool) -> pd.DataFrame:
     data : pd.DataFrame
         open insider filtered data
     """
-    text_soup_open_insider = BeautifulSoup(requests.get(url).text, "lxml")
+    df_cells, df_links = parse_open_insider_table(requests.get(url).text)
 
-    if len(text_soup_open_insider.find_all("tbody")) == 0:
+    if df_cells.empty:
         print("No insider trading found.")
         return pd.DataFrame()
 
-    l_filing_link = []
-    l_ticker_link = []
-    l_insider_link = []
-
-    idx = 0
-    for val in text_soup_open_insider.find_all("tbody")[1].find_all("a"):
-        if idx == 0:
-            l_filing_link.append(val["href"])
-            idx += 1
-        elif idx == 1:
-            l_ticker_link.append("http://openinsider.com" + val["href"])
-            idx += 1
-        elif idx == 2 and has_company_name:
-            idx += 1
-        else:
-            l_insider_link.append("http://openinsider.com" + val["href"])
-            idx = 0
-
-    l_X = []
-    l_filing_date = []
-    l_trading_date = []
-    l_ticker = []
-    l_company = []
-    l_insider = []
-    l_title = []
-    l_trade_type = []
-    l_price = []
-    l_quantity = []
-    l_owned = []
-    l_delta_own = []
-    l_value = []
-
-    idx = 0
-    for val in text_soup_open_insider.find_all("tbody")[1].find_all("td"):
-        if idx == 0:
-            l_X.append(val.text)
-            idx += 1
-        elif idx == 1:
-            l_filing_date.append(val.text)
-            idx += 1
-        elif idx == 2:
-            l_trading_date.append(val.text)
-            idx += 1
-        elif idx == 3:
-            l_ticker.append(val.text.strip())
-            idx += 1
-        elif idx == 4 and has_company_name:
-            l_company.append(val.text)
-            idx += 1
-        elif idx == (5 - int(not has_company_name)):
-            l_insider.append(val.text)
-            idx += 1
-        elif idx == (6 - int(not has_company_name)):
-            l_title.append(val.text)
-            idx += 1
-        elif idx == (7 - int(not has_company_name)):
-            l_trade_type.append(val.text)
-            idx += 1
-        elif idx == (8 - int(not has_company_name)):
-            l_price.append(val.text)
-            idx += 1
-        elif idx == (9 - int(not has_company_name)):
-            l_quantity.append(val.text)
-            idx += 1
-        elif idx == (10 - int(not has_company_name)):
-            l_owned.append(val.text)
-            idx += 1
-        elif idx == (11 - int(not has_company_name)):
-            l_delta_own.append(val.text)
-            idx += 1
-        elif idx == (12 - int(not has_company_name)):
-            l_value.append(val.text)
-            idx += 1
-        elif idx < (16 - int(not has_company_name)):
-            idx += 1
-        else:
-            idx = 0
-
-    d_open_insider = {
-        "X": l_X,
-        "Filing Date": l_filing_date,
-        "Trading Date": l_trading_date,
-        "Ticker": l_ticker,
-        "Insider": l_insider,
-        "Title": l_title,
-        "Trade Type": l_trade_type,
-        "Price": l_price,
-        "Quantity": l_quantity,
-        "Owned": l_owned,
-        "Delta Own": l_delta_own,
-        "Value": l_value,
-        "Filing Link": l_filing_link,
-        "Ticker Link": l_ticker_link,
-        "Insider Link": l_insider_link,
-    }
+    df_open_insider = df_cells[
+        [
+            "X",
+            "Filing Date",
+            "Trade Date",
+            "Ticker",
+            "Insider Name",
+            "Title",
+            "Trade Type",
+            "Price",
+            "Qty",
+            "Owned",
+            "ΔOwn",
+            "Value",
+        ]
+    ].rename(
+        columns={
+            "Trade Date": "Trading Date",
+            "Insider Name": "Insider",
+            "Qty": "Quantity",
+            "ΔOwn": "Delta Own",
+        }
+    )
+    df_open_insider["Filing Link"] = df_links["Filing Date"]
+    df_open_insider["Ticker Link"] = "http://openinsider.com" + df_links["Ticker"]
+    df_open_insider["Insider Link"] = (
+        "http://openinsider.com" + df_links["Insider Name"]
+    )
     if has_company_name:
-        d_open_insider["Company"] = l_company
+        df_open_insider["Company"] = df_cells["Company Name"]
+
+    return df_open_insider
+
+
+def get_open_insider_page(type_insider: str) -> pd.DataFrame:
+    """Get the trades of one of the open insider latest and top pages
+
+    Parameters
+    ----------
+    type_insider: str
+        Page, one of d_open_insider
+
+    Returns
+    ----------
+    pd.DataFrame
+        Trades shown on the page, without the performance columns
+    """
+    df_cells, _ = parse_open_insider_table(
+        requests.get(f"http://openinsider.com/{d_open_insider[type_insider]}").text
+    )
+    if df_cells.empty:
+        return df_cells
 
-    return pd.DataFrame(d_open_insider)
+    df_cells = df_cells.rename(columns={"ΔOwn": "Diff Own"})
+    return df_cells.loc[:, :"Value"]
@@ -0,0 +1,292 @@
+"""Local store of the latest insider trades, answering the open insider screens"""
+__docformat__ = "numpy"
+
+import json
+import os
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import requests
+
+import gamestonk_terminal.config_terminal as cfg
+from gamestonk_terminal.stocks.insider.openinsider_model import (
+    get_open_insider_page,
+    parse_open_insider_table,
+)
+
+# Trades older than this, counted from the latest filing, are dropped
+STORE_DAYS = 30
+
+# The store is not updated again before this
+STORE_MAX_AGE = timedelta(minutes=15)
+
+# Filing date ranges supported by the open insider screener
+FILING_DAYS = [1, 3, 7, 14, 30]
+
+RESULTS_PER_PAGE = 1000
+MAX_PAGES = 20
+
+SCREENER_URL = (
+    "http://openinsider.com/screener?s=&o=&pl=&ph=&ll=&lh=&fd={days}&fdr=&td=0&tdr="
+    "&fdlyl=&fdlyh=&daysago=&xp=1&xs=1&vl=&vh=&ocl=&och=&sic1=-1&sicl=100&sich=9999"
+    "&grp=0&nfl=&nfh=&nil=&nih=&nol=&noh=&v2l=&v2h=&oc2l=&oc2h=&sortcol=0"
+    "&cnt={count}&page={page}"
+)
+
+COLUMNS = [
+    "X",
+    "Filing Date",
+    "Trade Date",
+    "Ticker",
+    "Company Name",
+    "Insider Name",
+    "Title",
+    "Trade Type",
+    "Price",
+    "Qty",
+    "Owned",
+    "Diff Own",
+    "Value",
+    "Filing Link",
+]
+
+# Columns identifying a trade, the notes in X change when a filing is amended
+KEY_COLUMNS = [col for col in COLUMNS if col != "X"]
+
+OFFICER_TITLES = r"\b(?:COB|CEO|Pres|COO|CFO|GC|VP|EVP|SVP)\b"
+CEO_CFO_TITLES = r"\b(?:CEO|CFO)\b"
+
+# Open insider screens answered by the store: trade type, minimum absolute
+# value, insider titles, filing days counted from the latest filing, and
+# whether trades are sorted by value instead of filing date
+d_store_screens: Dict[str, dict] = {
+    "lip": dict(trade_type="P"),
+    "blip": dict(trade_type="P", min_value=25_000),
+    "blop": dict(trade_type="P", min_value=25_000, titles=OFFICER_TITLES),
+    "blcp": dict(trade_type="P", min_value=25_000, titles=CEO_CFO_TITLES),
+    "lis": dict(trade_type="S"),
+    "blis": dict(trade_type="S", min_value=100_000),
+    "blos": dict(trade_type="S", min_value=100_000, titles=OFFICER_TITLES),
+    "blcs": dict(trade_type="S", min_value=100_000, titles=CEO_CFO_TITLES),
+    "topt": dict(trade_type="P", titles=OFFICER_TITLES, days=1, top=True),
+    "toppw": dict(trade_type="P", titles=OFFICER_TITLES, days=7, top=True),
+    "toppm": dict(trade_type="P", titles=OFFICER_TITLES, days=30, top=True),
+    "tipt": dict(trade_type="P", days=1, top=True),
+    "tippw": dict(trade_type="P", days=7, top=True),
+    "tippm": dict(trade_type="P", days=30, top=True),
+    "tist": dict(trade_type="S", days=1, top=True),
+    "tispw": dict(trade_type="S", days=7, top=True),
+    "tispm": dict(trade_type="S", days=30, top=True),
+}
+
+_STORE: Dict[str, Tuple[float, pd.DataFrame, dict]] = {}
+
+
+def _store_folder() -> str:
+    return os.path.join(cfg.CACHE_DIR, "insider")
+
+
+def load_insider_store() -> Tuple[pd.DataFrame, Optional[datetime]]:
+    """Load the insider trades stored locally
+
+    Returns
+    ----------
+    Tuple[pd.DataFrame, Optional[datetime]]
+        Trades, latest filing first, and time of the last update. Empty and
+        None if there is no store yet
+    """
+    folder = _store_folder()
+    meta_file = os.path.join(folder, "meta.json")
+    try:
+        mtime = os.path.getmtime(meta_file)
+        if folder in _STORE and _STORE[folder][0] == mtime:
+            _, df_store, meta = _STORE[folder]
+        else:
+            with open(meta_file, encoding="utf8") as f:
+                meta = json.load(f)
+            df_store = pd.read_pickle(os.path.join(folder, "trades.pkl"))
+            _STORE[folder] = (mtime, df_store, meta)
+    except (OSError, ValueError):
+        return pd.DataFrame(columns=COLUMNS), None
+
+    return df_store, datetime.fromisoformat(meta["updated"])
+
+
+def _save_insider_store(df_store: pd.DataFrame, updated: datetime):
+    folder = _store_folder()
+    os.makedirs(folder, exist_ok=True)
+    df_store.to_pickle(os.path.join(folder, "trades.pkl"))
+    # The metadata goes last, so a partially written store is never picked up
+    with open(os.path.join(folder, "meta.json"), "w", encoding="utf8") as f:
+        json.dump({"updated": updated.isoformat()}, f)
+
+
+def get_latest_trades(days: int, since: str = "") -> pd.DataFrame:
+    """Get the purchases and sales filed in the last days, latest first
+
+    Parameters
+    ----------
+    days: int
+        Filing days, one of FILING_DAYS
+    since: str
+        Stop paging once this filing date is reached
+
+    Returns
+    ----------
+    pd.DataFrame
+        Trades with the store columns
+    """
+    l_pages = []
+    for page in range(1, MAX_PAGES + 1):
+        df_cells, df_links = parse_open_insider_table(
+            requests.get(
+                SCREENER_URL.format(days=days, count=RESULTS_PER_PAGE, page=page)
+            ).text
+        )
+        if df_cells.empty:
+            break
+
+        df_page = df_cells.rename(columns={"ΔOwn": "Diff Own"})
+        df_page["Filing Link"] = df_links["Filing Date"]
+        l_pages.append(df_page[COLUMNS])
+
+        if len(df_page) < RESULTS_PER_PAGE or df_page["Filing Date"].min() <= since:
+            break
+
+    if not l_pages:
+        return pd.DataFrame(columns=COLUMNS)
+    return pd.concat(l_pages, ignore_index=True)
+
+
+def update_insider_store(max_age: timedelta = STORE_MAX_AGE) -> pd.DataFrame:
+    """Add the trades filed since the last update to the local store
+
+    Only filings newer than the latest one stored are downloaded, the
+    pages of the open insider screener being sorted by filing date.
+
+    Parameters
+    ----------
+    max_age: timedelta
+        Use the store as is if it was updated more recently than this
+
+    Returns
+    ----------
+    pd.DataFrame
+        Trades of the last STORE_DAYS, latest filing first
+    """
+    df_store, updated = load_insider_store()
+    now = datetime.now()
+    if updated is not None and now - updated < max_age:
+        return df_store
+
+    since = df_store["Filing Date"].max() if not df_store.empty else ""
+    days = FILING_DAYS[-1]
+    if since:
+        elapsed = (now - datetime.fromisoformat(since)).days + 1
+        days = next((d for d in FILING_DAYS if d >= elapsed), FILING_DAYS[-1])
+
+    try:
+        df_new = get_latest_trades(days, since)
+    except requests.exceptions.RequestException:
+        return df_store
+
+    df_store = (
+        pd.concat([df_new, df_store], ignore_index=True)
+        .drop_duplicates(subset=KEY_COLUMNS, keep="first")
+        .sort_values(by="Filing Date", ascending=False, kind="mergesort")
+        .reset_index(drop=True)
+    )
+    if not df_store.empty:
+        oldest = datetime.fromisoformat(df_store["Filing Date"].iloc[0]) - timedelta(
+            days=STORE_DAYS
+        )
+        df_store = df_store[df_store["Filing Date"] >= oldest.isoformat(sep=" ")]
+
+    try:
+        _save_insider_store(df_store, now)
+    except OSError:
+        pass
+    return df_store
+
+
+def _to_number(values: pd.Series) -> pd.Series:
+    """$1,044.54, +$25,336,000, -390,639 to floats"""
+    return pd.to_numeric(
+        values.str.replace(r"[$,+]", "", regex=True), errors="coerce"
+    ).astype(float)
+
+
+def query_insider_store(
+    df_store: pd.DataFrame,
+    trade_type: str = "",
+    min_value: float = 0,
+    titles: str = "",
+    days: int = 0,
+    top: bool = False,
+) -> pd.DataFrame:
+    """Select trades of the store
+
+    Parameters
+    ----------
+    df_store: pd.DataFrame
+        Trades, from update_insider_store
+    trade_type: str
+        Trade type code: P for purchases, S for sales
+    min_value: float
+        Minimum absolute value traded
+    titles: str
+        Regular expression the insider title must match
+    days: int
+        Filing days to keep, counted from the latest filing. All if 0
+    top: bool
+        Sort by absolute value traded instead of filing date
+
+    Returns
+    ----------
+    pd.DataFrame
+        Selected trades
+    """
+    selected = np.ones(len(df_store), dtype=bool)
+    if trade_type:
+        selected &= df_store["Trade Type"].str.startswith(trade_type).to_numpy()
+    if titles:
+        selected &= df_store["Title"].str.contains(titles, regex=True).to_numpy()
+    values = _to_number(df_store["Value"]).abs()
+    if min_value:
+        selected &= (values >= min_value).to_numpy()
+    if days and not df_store.empty:
+        first_day = pd.Timestamp(df_store["Filing Date"].max()).normalize() - (
+            pd.Timedelta(days=days - 1)
+        )
+        selected &= (df_store["Filing Date"] >= str(first_day)).to_numpy()
+
+    df_selected = df_store[selected]
+    if top:
+        order = np.argsort(-values[selected].to_numpy(), kind="stable")
+        df_selected = df_selected.iloc[order]
+    return df_selected.drop(columns=["Filing Link"]).reset_index(drop=True)
+
+
+def get_insider_data(type_insider: str) -> pd.DataFrame:
+    """Get the trades of an open insider screen
+
+    The screens of d_store_screens are answered from the local store, the
+    other ones (e.g. cluster and penny stock buys) are read from open insider.
+
+    Parameters
+    ----------
+    type_insider: str
+        Screen, one of openinsider_model.d_open_insider
+
+    Returns
+    ----------
+    pd.DataFrame
+        Trades of the screen
+    """
+    if type_insider in d_store_screens:
+        df_store = update_insider_store()
+        if not df_store.empty:
+            return query_insider_store(df_store, **d_store_screens[type_insider])
+    return get_open_insider_page(type_insider)
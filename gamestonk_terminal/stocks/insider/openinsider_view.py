@@ -1,8 +1,6 @@
 import os
 import textwrap
 import itertools
-from bs4 import BeautifulSoup
-import requests
 import numpy as np
 import pandas as pd
 from tabulate import tabulate
@@ -15,31 +13,11 @@ from gamestonk_terminal.stocks.insider.openinsider_model import (
     get_open_insider_link,
     get_open_insider_data,
 )
+from gamestonk_terminal.stocks.insider.openinsider_store_model import (
+    get_insider_data,
+)
 from gamestonk_terminal import feature_flags as gtff
 
-d_open_insider = {
-    "lcb": "latest-cluster-buys",
-    "lpsb": "latest-penny-stock-buys",
-    "lit": "latest-insider-trading",
-    "lip": "insider-purchases",
-    "blip": "latest-insider-purchases-25k",
-    "blop": "latest-officer-purchases-25k",
-    "blcp": "latest-ceo-cfo-purchases-25k",
-    "lis": "insider-sales",
-    "blis": "latest-insider-sales-100k",
-    "blos": "latest-officer-sales-100k",
-    "blcs": "latest-ceo-cfo-sales-100k",
-    "topt": "top-officer-purchases-of-the-day",
-    "toppw": "top-officer-purchases-of-the-week",
-    "toppm": "top-officer-purchases-of-the-month",
-    "tipt": "top-insider-purchases-of-the-day",
-    "tippw": "top-insider-purchases-of-the-week",
-    "tippm": "top-insider-purchases-of-the-month",
-    "tist": "top-insider-sales-of-the-day",
-    "tispw": "top-insider-sales-of-the-week",
-    "tispm": "top-insider-sales-of-the-month",
-}
-
 d_notes = {
     "A": "A: Amended filing",
     "D": "D: Derivative transaction in filing (usually option exercise)",
@@ -134,39 +112,13 @@ def print_insider_data(type_insider: str, limit: int = 10, export: str = ""):
     export: str
         Export data format
     """
-    response = requests.get(f"http://openinsider.com/{d_open_insider[type_insider]}")
-    soup = BeautifulSoup(response.text, "html.parser")
-    table = soup.find("table", {"class": "tinytable"})
+    df = get_insider_data(type_insider)
 
-    if not table:
+    if df.empty:
         print("No insider information found", "\n")
         return
 
-    table_rows = table.find_all("tr")
-
-    res = []
-    for tr in table_rows:
-        td = tr.find_all("td")
-        row = [tr.text.strip() for tr in td if tr.text.strip()]
-        res.append(row)
-
-    df = pd.DataFrame(res).dropna().head(n=limit)
-
-    df.columns = [
-        "X",
-        "Filing Date",
-        "Trade Date",
-        "Ticker",
-        "Company Name",
-        "Industry" if type_insider == "lcb" else "Insider Name",
-        "Title",
-        "Trade Type",
-        "Price",
-        "Qty",
-        "Owned",
-        "Diff Own",
-        "Value",
-    ]
+    df = df.head(n=limit)
 
     df["Filing Date"] = df["Filing Date"].apply(
         lambda x: "\n".join(textwrap.wrap(x, width=10)) if isinstance(x, str) else x
@@ -174,10 +126,11 @@ def print_insider_data(type_insider: str, limit: int = 10, export: str = ""):
     df["Company Name"] = df["Company Name"].apply(
         lambda x: "\n".join(textwrap.wrap(x, width=20)) if isinstance(x, str) else x
     )
-    df["Title"] = df["Title"].apply(
-        lambda x: "\n".join(textwrap.wrap(x, width=10)) if isinstance(x, str) else x
-    )
-    if type_insider == "lcb":
+    if "Title" in df:
+        df["Title"] = df["Title"].apply(
+            lambda x: "\n".join(textwrap.wrap(x, width=10)) if isinstance(x, str) else x
+        )
+    if "Industry" in df:
         df["Industry"] = df["Industry"].apply(
             lambda x: "\n".join(textwrap.wrap(x, width=20)) if isinstance(x, str) else x
         )
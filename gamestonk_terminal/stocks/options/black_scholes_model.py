@@ -0,0 +1,319 @@
+"""Black-Scholes-Merton prices, greeks and implied volatilities of whole chains"""
+__docformat__ = "numpy"
+
+from datetime import date, datetime
+from typing import Dict, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy.stats import norm
+
+from gamestonk_terminal.stocks.options import chain_cache_model, reference_data_model
+
+# Bounds of the implied volatilities searched for
+MIN_VOL = 1e-4
+MAX_VOL = 5.0
+
+
+def _d1_d2(
+    spot: np.ndarray,
+    strike: np.ndarray,
+    years: np.ndarray,
+    rate: float,
+    vol: np.ndarray,
+    div_yield: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    vol_sqrt_t = vol * np.sqrt(years)
+    d1 = (
+        np.log(spot / strike) + (rate - div_yield + vol ** 2 / 2) * years
+    ) / vol_sqrt_t
+    return d1, d1 - vol_sqrt_t
+
+
+def option_price(
+    spot: np.ndarray,
+    strike: np.ndarray,
+    years: np.ndarray,
+    rate: float,
+    vol: np.ndarray,
+    put: np.ndarray,
+    div_yield: float = 0,
+) -> np.ndarray:
+    """Black-Scholes-Merton price of European options, broadcast over the arrays
+
+    Parameters
+    ----------
+    spot : np.ndarray
+        Price of the underlying asset
+    strike : np.ndarray
+        Strike prices
+    years : np.ndarray
+        Time to expiration, in years
+    rate : float
+        Continuously compounded risk-free rate
+    vol : np.ndarray
+        Annualized volatilities
+    put : np.ndarray
+        Whether the options are puts
+    div_yield : float
+        Continuous dividend yield of the underlying asset
+
+    Returns
+    -------
+    np.ndarray
+        Prices of the options
+    """
+    d1, d2 = _d1_d2(spot, strike, years, rate, vol, div_yield)
+    forward = spot * np.exp(-div_yield * years)
+    discounted = strike * np.exp(-rate * years)
+    call = forward * norm.cdf(d1) - discounted * norm.cdf(d2)
+    return np.where(put, call - forward + discounted, call)
+
+
+def greeks(
+    spot: np.ndarray,
+    strike: np.ndarray,
+    years: np.ndarray,
+    rate: float,
+    vol: np.ndarray,
+    put: np.ndarray,
+    div_yield: float = 0,
+) -> Dict[str, np.ndarray]:
+    """Black-Scholes-Merton greeks of European options, broadcast over the arrays
+
+    Parameters
+    ----------
+    spot : np.ndarray
+        Price of the underlying asset
+    strike : np.ndarray
+        Strike prices
+    years : np.ndarray
+        Time to expiration, in years
+    rate : float
+        Continuously compounded risk-free rate
+    vol : np.ndarray
+        Annualized volatilities
+    put : np.ndarray
+        Whether the options are puts
+    div_yield : float
+        Continuous dividend yield of the underlying asset
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        delta, gamma, theta (per day), vega and rho (per point of volatility and
+        of rate)
+    """
+    d1, d2 = _d1_d2(spot, strike, years, rate, vol, div_yield)
+    sqrt_t = np.sqrt(years)
+    forward = spot * np.exp(-div_yield * years)
+    discounted = strike * np.exp(-rate * years)
+    density = norm.pdf(d1)
+    # Puts use N(x) - 1 = -N(-x)
+    n_d1 = norm.cdf(d1) - put
+    n_d2 = norm.cdf(d2) - put
+
+    theta = (
+        -forward * density * vol / (2 * sqrt_t)
+        - rate * discounted * n_d2
+        + div_yield * forward * n_d1
+    )
+    return {
+        "delta": np.exp(-div_yield * years) * n_d1,
+        "gamma": np.exp(-div_yield * years) * density / (spot * vol * sqrt_t),
+        "theta": theta / 365,
+        "vega": forward * density * sqrt_t / 100,
+        "rho": discounted * years * n_d2 / 100,
+    }
+
+
+def implied_volatility(
+    price: np.ndarray,
+    spot: np.ndarray,
+    strike: np.ndarray,
+    years: np.ndarray,
+    rate: float,
+    put: np.ndarray,
+    div_yield: float = 0,
+    tol: float = 1e-6,
+    max_iter: int = 100,
+) -> np.ndarray:
+    """Implied volatilities of many options at once
+
+    Newton steps on all the options together, falling back to bisection when a
+    step leaves the bracket of the solution.
+
+    Parameters
+    ----------
+    price : np.ndarray
+        Prices of the options
+    spot : np.ndarray
+        Price of the underlying asset
+    strike : np.ndarray
+        Strike prices
+    years : np.ndarray
+        Time to expiration, in years
+    rate : float
+        Continuously compounded risk-free rate
+    put : np.ndarray
+        Whether the options are puts
+    div_yield : float
+        Continuous dividend yield of the underlying asset
+    tol : float
+        Tolerance on the price
+    max_iter : int
+        Maximum number of iterations
+
+    Returns
+    -------
+    np.ndarray
+        Implied volatilities, NaN for the prices outside of the no-arbitrage bounds
+    """
+    price, spot, strike, years, put = (
+        np.array(array, dtype=np.float64)
+        for array in np.broadcast_arrays(price, spot, strike, years, put)
+    )
+    forward = spot * np.exp(-div_yield * years)
+    discounted = strike * np.exp(-rate * years)
+    lower = np.maximum(np.where(put, discounted - forward, forward - discounted), 0)
+    upper = np.where(put, discounted, forward)
+    solved = np.isfinite(price) & (years > 0) & (price > lower) & (price < upper)
+
+    result = np.full(price.shape, np.nan)
+    target = price[solved]
+    args = (spot[solved], strike[solved], years[solved], rate)
+    is_put = put[solved]
+    low = np.full(target.shape, MIN_VOL)
+    high = np.full(target.shape, MAX_VOL)
+    # Brenner and Subrahmanyam approximation for options at the money
+    vol = np.clip(
+        np.sqrt(2 * np.pi / args[2]) * target / args[0], MIN_VOL * 10, MAX_VOL / 2
+    )
+    diff = np.full(target.shape, np.inf)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for _ in range(max_iter):
+            diff = option_price(*args, vol, is_put, div_yield) - target
+            if (np.abs(diff) < tol).all():
+                break
+            high = np.where(diff > 0, vol, high)
+            low = np.where(diff < 0, vol, low)
+            d1, _ = _d1_d2(*args, vol, div_yield)
+            vega = (
+                args[0] * np.exp(-div_yield * args[2]) * norm.pdf(d1) * np.sqrt(args[2])
+            )
+            step = vol - diff / vega
+            vol = np.where(
+                (vega > 1e-12) & (step > low) & (step < high), step, (low + high) / 2
+            )
+        diff = option_price(*args, vol, is_put, div_yield) - target
+    result[solved] = np.where(np.abs(diff) < max(tol, 1e-4), vol, np.nan)
+    return result
+
+
+def chain_greeks(
+    calls: pd.DataFrame,
+    puts: pd.DataFrame,
+    spot: float,
+    years: float,
+    rate: float,
+    div_yield: float = 0,
+) -> pd.DataFrame:
+    """Implied volatilities and greeks of a Yahoo Finance chain
+
+    Parameters
+    ----------
+    calls : pd.DataFrame
+        Calls, with strike, lastPrice, bid, ask, volume and openInterest
+    puts : pd.DataFrame
+        Puts, with the same columns
+    spot : float
+        Price of the underlying asset
+    years : float
+        Time to expiration, in years
+    rate : float
+        Continuously compounded risk-free rate
+    div_yield : float
+        Continuous dividend yield of the underlying asset
+
+    Returns
+    -------
+    pd.DataFrame
+        Options with the columns of the Tradier chains, the greeks taken at the
+        implied volatility of the middle price (last price without quotes), and rho
+    """
+    chain = pd.concat(
+        [calls.assign(option_type="call"), puts.assign(option_type="put")],
+        ignore_index=True,
+    )
+    strike = chain["strike"].to_numpy(dtype=np.float64)
+    put = (chain["option_type"] == "put").to_numpy()
+    bid = chain["bid"].to_numpy(dtype=np.float64)
+    ask = chain["ask"].to_numpy(dtype=np.float64)
+    mid = np.where(
+        (bid > 0) & (ask > 0),
+        (bid + ask) / 2,
+        chain["lastPrice"].to_numpy(dtype=np.float64),
+    )
+
+    # All the prices of all the options solved together
+    ivs = implied_volatility(
+        np.concatenate([mid, bid, ask]),
+        spot,
+        np.tile(strike, 3),
+        years,
+        rate,
+        np.tile(put, 3),
+        div_yield,
+    ).reshape(3, -1)
+    chain_greeks_df = pd.DataFrame(
+        {
+            "symbol": chain["contractSymbol"].to_numpy(),
+            "bid": bid,
+            "ask": ask,
+            "strike": strike,
+            "bidsize": np.nan,
+            "asksize": np.nan,
+            "volume": chain["volume"].to_numpy(dtype=np.float64),
+            "open_interest": chain["openInterest"].to_numpy(dtype=np.float64),
+            "option_type": chain["option_type"].to_numpy(),
+        }
+    )
+    for name, values in greeks(
+        spot, strike, years, rate, ivs[0], put, div_yield
+    ).items():
+        chain_greeks_df[name] = values
+    chain_greeks_df["ask_iv"] = ivs[2]
+    chain_greeks_df["bid_iv"] = ivs[1]
+    chain_greeks_df["mid_iv"] = ivs[0]
+    return chain_greeks_df.sort_values(["strike", "option_type"], ignore_index=True)
+
+
+def get_chain_greeks(ticker: str, expiry: str) -> pd.DataFrame:
+    """Implied volatilities and greeks of the Yahoo Finance chain of an expiration
+
+    Parameters
+    ----------
+    ticker : str
+        Ticker to get options for
+    expiry : str
+        Expiration date in the form of "YYYY-MM-DD"
+
+    Returns
+    -------
+    pd.DataFrame
+        Options with their implied volatilities and greeks, see chain_greeks
+    """
+    chain = chain_cache_model.get_option_chain(ticker, expiry)
+    spot = chain_cache_model.get_last_price(ticker)
+    div_yield = (
+        reference_data_model.get_info(ticker).get("trailingAnnualDividendYield") or 0
+    )
+    days = (datetime.strptime(expiry, "%Y-%m-%d").date() - date.today()).days
+    return chain_greeks(
+        chain.calls,
+        chain.puts,
+        spot,
+        max(days, 1) / 365,
+        np.log(1 + reference_data_model.get_rf()),
+        div_yield,
+    )
@@ -0,0 +1,96 @@
+"""Option chains and last prices of the options menu, kept for the session"""
+__docformat__ = "numpy"
+
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from gamestonk_terminal.stocks.options import (
+    reference_data_model,
+    tradier_model,
+    yfinance_model,
+)
+
+# Age, in seconds, after which a chain or a price is downloaded again
+CACHE_MAX_AGE = 5 * 60
+
+_CHAINS: Dict[Tuple[str, str, str], Tuple[float, Any]] = {}
+_PRICES: Dict[Tuple[str, str], Tuple[float, float]] = {}
+
+
+def get_option_chain(ticker: str, expiry: str, source: str = "yf") -> Any:
+    """Option chain of a ticker, downloaded once per CACHE_MAX_AGE
+
+    Parameters
+    ----------
+    ticker: str
+        Ticker to get options for
+    expiry: str
+        Expiration date in the form of "YYYY-MM-DD"
+    source: str
+        yf for Yahoo Finance or tr for Tradier
+
+    Returns
+    -------
+    Any
+        yf.ticker.Options with calls and puts for Yahoo Finance, pd.DataFrame of
+        all the options for Tradier
+    """
+    key = (ticker.upper(), expiry, source)
+    if key in _CHAINS and time.time() - _CHAINS[key][0] <= CACHE_MAX_AGE:
+        return _CHAINS[key][1]
+
+    if source == "tr":
+        chain = tradier_model.get_option_chains(ticker, expiry)
+        # Failed requests are empty, and tried again next time
+        if chain.empty:
+            return chain
+    else:
+        chain = yfinance_model.get_option_chain(ticker, expiry)
+    _CHAINS[key] = (time.time(), chain)
+    return chain
+
+
+def get_last_price(ticker: str, source: str = "yf") -> Optional[float]:
+    """Last price of a ticker
+
+    Yahoo Finance prices come from the quotes of reference_data_model, Tradier
+    prices are downloaded once per CACHE_MAX_AGE.
+
+    Parameters
+    ----------
+    ticker: str
+        Ticker to get the price of
+    source: str
+        yf for Yahoo Finance or tr for Tradier
+
+    Returns
+    -------
+    Optional[float]
+        Last price, None if Tradier could not be reached
+    """
+    if source != "tr":
+        return float(reference_data_model.get_info(ticker)["regularMarketPrice"])
+
+    key = (ticker.upper(), source)
+    if key in _PRICES and time.time() - _PRICES[key][0] <= CACHE_MAX_AGE:
+        return _PRICES[key][1]
+
+    price = tradier_model.last_price(ticker)
+    if price is None:
+        return None
+    _PRICES[key] = (time.time(), price)
+    return price
+
+
+def clear_cache(ticker: Optional[str] = None):
+    """Forget the chains and Tradier prices of a ticker, or of every ticker
+
+    Parameters
+    ----------
+    ticker: Optional[str]
+        Ticker to forget, all of them if None
+    """
+    for cache in (_CHAINS, _PRICES):
+        for key in list(cache):
+            if ticker is None or key[0] == ticker.upper():
+                del cache[key]
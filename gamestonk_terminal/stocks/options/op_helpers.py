@@ -1,9 +1,10 @@
 """Option helper functions"""
 __docformat__ = "numpy"
 
-from typing import Union
+from typing import Tuple, Union
 import numpy as np
 import pandas as pd
+from scipy.stats import norm
 
 
 def get_loss_at_strike(strike: float, chain: pd.DataFrame) -> float:
@@ -102,13 +103,118 @@ def rn_payoff(x: str, df: pd.DataFrame, put: bool, delta: int, rf: float) -> flo
     number : float
         Risk neutral value of option
     """
-    if put:
-        df["Gain"] = np.where(x > df["Price"], x - df["Price"], 0)
-    else:
-        df["Gain"] = np.where(x < df["Price"], df["Price"] - x, 0)
-    df["Vals"] = df["Chance"] * df["Gain"]
-    risk_free = (1 + rf) ** (delta / 365)
-    return sum(df["Vals"]) / risk_free
+    calls, puts = rn_payoffs([float(x)], df["Price"], df["Chance"], delta, rf)
+    return float(puts[0] if put else calls[0])
+
+
+def rn_payoffs(
+    strikes: np.ndarray,
+    prices: np.ndarray,
+    chances: np.ndarray,
+    delta: int,
+    rf: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """The risk neutral values of calls and puts for every strike at once
+
+    Parameters
+    ----------
+    strikes : np.ndarray
+        Strike prices
+    prices : np.ndarray
+        Prices of the stock at expiration
+    chances : np.ndarray
+        Probabilities of the prices
+    delta : int
+        Difference between today's date and expirations date in days
+    rf : float
+        The current risk-free rate
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Risk neutral values of the calls and of the puts, by strike
+    """
+    strikes = np.asarray(strikes, dtype=np.float64)
+    prices = np.asarray(prices, dtype=np.float64)
+    weights = np.asarray(chances, dtype=np.float64) / ((1 + rf) ** (delta / 365))
+    # Payoff of a call for each strike (rows) and price at expiration (columns)
+    gains = prices[None, :] - strikes[:, None]
+    calls = np.maximum(gains, 0) @ weights
+    # Put call parity on each scenario: max(K - S, 0) = max(S - K, 0) - (S - K)
+    puts = calls - gains @ weights
+    return calls, puts
+
+
+def lognormal_scenarios(
+    price: float, vol: float, delta: int, rf: float, n_prices: int = 1000
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Risk neutral lognormal distribution of the prices at expiration
+
+    Parameters
+    ----------
+    price : float
+        Current price of the stock
+    vol : float
+        Annualized volatility of the stock
+    delta : int
+        Difference between today's date and expirations date in days
+    rf : float
+        The current risk-free rate
+    n_prices : int
+        Number of equally likely prices the distribution is discretized into
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Prices and their probabilities
+    """
+    years = delta / 365
+    quantiles = norm.ppf((np.arange(n_prices) + 0.5) / n_prices)
+    drift = (np.log(1 + rf) - vol ** 2 / 2) * years
+    log_returns = drift + vol * np.sqrt(years) * quantiles
+    prices = price * np.exp(log_returns)
+    return _risk_neutral(prices, price, delta, rf)
+
+
+def empirical_scenarios(
+    price: float, closings: pd.Series, delta: int, rf: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Risk neutral distribution of the prices at expiration from past returns
+
+    The daily log returns, demeaned and scaled by the square root of the number
+    of trading days to expiration, keep the tails and skew of the stock.
+
+    Parameters
+    ----------
+    price : float
+        Current price of the stock
+    closings : pd.Series
+        Historical closing prices of the stock
+    delta : int
+        Difference between today's date and expirations date in days
+    rf : float
+        The current risk-free rate
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Prices and their probabilities
+    """
+    log_returns = np.diff(np.log(closings.dropna().to_numpy(dtype=np.float64)))
+    if len(log_returns) < 2:
+        raise ValueError("Not enough closing prices")
+    trading_days = max(delta * 252 / 365, 1)
+    scaled = (log_returns - log_returns.mean()) * np.sqrt(trading_days)
+    return _risk_neutral(price * np.exp(scaled), price, delta, rf)
+
+
+def _risk_neutral(
+    prices: np.ndarray, price: float, delta: int, rf: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Equally likely prices, rescaled so their mean is the forward price"""
+    forward = price * (1 + rf) ** (delta / 365)
+    prices = prices * forward / prices.mean()
+    return prices, np.full(len(prices), 1 / len(prices))
 
 
 opt_chain_cols = {
@@ -122,4 +228,9 @@ opt_chain_cols = {
     "volume": {"format": "{x:.2f}", "label": "Volume"},
     "openInterest": {"format": "", "label": "Open Interest"},
     "impliedVolatility": {"format": "{x:.2f}", "label": "Implied Volatility"},
+    "delta": {"format": "{x:.2f}", "label": "Delta"},
+    "gamma": {"format": "{x:.3f}", "label": "Gamma"},
+    "theta": {"format": "{x:.3f}", "label": "Theta"},
+    "vega": {"format": "{x:.3f}", "label": "Vega"},
+    "rho": {"format": "{x:.3f}", "label": "Rho"},
 }
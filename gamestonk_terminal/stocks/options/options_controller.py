@@ -22,6 +22,7 @@ from gamestonk_terminal.helper_funcs import (
 from gamestonk_terminal.menu import session
 from gamestonk_terminal.stocks.options import (
     barchart_view,
+    chain_cache_model,
     calculator_view,
     fdscanner_view,
     syncretism_view,
@@ -34,6 +35,8 @@ from gamestonk_terminal.stocks.options import (
     payoff_controller,
     pricing_controller,
     screener_controller,
+    surface_model,
+    surface_view,
 )
 
 # pylint: disable=R1710,C0302,R0916
@@ -48,6 +51,7 @@ class OptionsController(BaseController):
         "tr",
         "info",
         "pcr",
+        "surface",
         "load",
         "exp",
         "vol",
@@ -97,7 +101,25 @@ class OptionsController(BaseController):
     hist_source_choices = ["td", "ce"]
     voi_source_choices = ["tr", "yf"]
     oi_source_choices = ["tr", "yf"]
-    plot_vars_choices = ["ltd", "s", "lp", "b", "a", "c", "pc", "v", "oi", "iv"]
+    chains_source_choices = ["tr", "yf"]
+    surface_display_choices = ["surface", "skew", "term"]
+    plot_vars_choices = [
+        "ltd",
+        "s",
+        "lp",
+        "b",
+        "a",
+        "c",
+        "pc",
+        "v",
+        "oi",
+        "iv",
+        "delta",
+        "gamma",
+        "theta",
+        "vega",
+        "rho",
+    ]
     plot_custom_choices = ["smile"]
 
     def __init__(self, ticker: str, queue: List[str] = None):
@@ -129,6 +151,8 @@ class OptionsController(BaseController):
             choices["load"]["-s"] = {c: {} for c in self.load_source_choices}
             choices["load"]["--source"] = {c: {} for c in self.hist_source_choices}
             choices["load"]["-s"] = {c: {} for c in self.voi_source_choices}
+            choices["chains"]["-s"] = {c: {} for c in self.chains_source_choices}
+            choices["surface"]["-d"] = {c: {} for c in self.surface_display_choices}
             choices["plot"]["-x"] = {c: {} for c in self.plot_vars_choices}
             choices["plot"]["-y"] = {c: {} for c in self.plot_vars_choices}
             choices["plot"]["-c"] = {c: {} for c in self.plot_custom_choices}
@@ -170,9 +194,10 @@ class OptionsController(BaseController):
 Ticker: {self.ticker or None}
 Expiry: {self.selected_date or None}
 {"" if self.ticker else Style.DIM}
-    pcr           display put call ratio for ticker [AlphaQuery.com]{Style.DIM if not colored else ''}
+    pcr           display put call ratio for ticker [AlphaQuery.com]
+    surface       implied volatility surface, skew and term structure [Yfinance]{Style.DIM if not colored else ''}
     info          display option information (volatility, IV rank etc) [Barchart.com]
-    chains        display option chains with greeks [Tradier]
+    chains        display option chains with greeks [Tradier/YF]
     oi            plot open interest [Tradier/YF]
     vol           plot volume [Tradier/YF]
     voi           plot volume and open interest [Tradier/YF]
@@ -380,6 +405,49 @@ Expiry: {self.selected_date or None}
             else:
                 print("No ticker loaded.\n")
 
+    def call_surface(self, other_args: List[str]):
+        """Process surface command"""
+        parser = argparse.ArgumentParser(
+            add_help=False,
+            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+            prog="surface",
+            description="Display the implied volatility surface of all the expirations, "
+            "interpolated on moneyness and tenor, with its skew and term structure "
+            "[Source: Yahoo Finance]",
+        )
+        parser.add_argument(
+            "-d",
+            "--display",
+            help="Surface grid, skew of an expiration or term structure",
+            dest="display",
+            choices=self.surface_display_choices,
+            default="surface",
+        )
+        parser.add_argument(
+            "-e",
+            "--expiry",
+            help="Expiration of the skew, the selected one or the first by default",
+            dest="expiry",
+            type=str,
+            default="",
+        )
+        if other_args and "-" not in other_args[0][0]:
+            other_args.insert(0, "-d")
+        ns_parser = parse_known_args_and_warn(
+            parser, other_args, export_allowed=EXPORT_BOTH_RAW_DATA_AND_FIGURES
+        )
+        if ns_parser:
+            if self.ticker:
+                surface_view.display_surface(
+                    ticker=self.ticker,
+                    expiries=self.expiry_dates or None,
+                    display=ns_parser.display,
+                    expiry=ns_parser.expiry or self.selected_date,
+                    export=ns_parser.export,
+                )
+            else:
+                print("No ticker loaded.\n")
+
     def call_info(self, other_args: List[str]):
         """Process info command"""
         parser = argparse.ArgumentParser(
@@ -522,6 +590,9 @@ Expiry: {self.selected_date or None}
         ns_parser = parse_known_args_and_warn(parser, other_args)
         if ns_parser:
             self.ticker = ns_parser.ticker.upper()
+            # Loading a ticker again downloads its chains again
+            chain_cache_model.clear_cache(self.ticker)
+            surface_model.clear_cache(self.ticker)
             self.update_runtime_choices()
 
             if TRADIER_TOKEN == "REPLACE_ME" or ns_parser.source == "yf":
@@ -531,7 +602,7 @@ Expiry: {self.selected_date or None}
             print("")
 
             if self.ticker and self.selected_date:
-                self.chain = yfinance_model.get_option_chain(
+                self.chain = chain_cache_model.get_option_chain(
                     self.ticker, self.selected_date
                 )
 
@@ -588,7 +659,7 @@ Expiry: {self.selected_date or None}
                     self.update_runtime_choices()
 
                 if self.selected_date:
-                    self.chain = yfinance_model.get_option_chain(
+                    self.chain = chain_cache_model.get_option_chain(
                         self.ticker, self.selected_date
                     )
                     self.update_runtime_choices()
@@ -744,13 +815,22 @@ Expiry: {self.selected_date or None}
             help="columns to look at.  Columns can be:  {bid, ask, strike, bidsize, asksize, volume, open_interest, "
             "delta, gamma, theta, vega, ask_iv, bid_iv, mid_iv} ",
         )
+        parser.add_argument(
+            "-s",
+            "--source",
+            type=str,
+            default="tr",
+            choices=self.chains_source_choices,
+            dest="source",
+            help="Source to get data from, greeks are computed from the prices for yf",
+        )
         ns_parser = parse_known_args_and_warn(
             parser, other_args, EXPORT_ONLY_RAW_DATA_ALLOWED
         )
         if ns_parser:
             if self.ticker:
                 if self.selected_date:
-                    if TRADIER_TOKEN != "REPLACE_ME":
+                    if ns_parser.source == "tr" and TRADIER_TOKEN != "REPLACE_ME":
                         tradier_view.display_chains(
                             ticker=self.ticker,
                             expiry=self.selected_date,
@@ -762,7 +842,16 @@ Expiry: {self.selected_date or None}
                             export=ns_parser.export,
                         )
                     else:
-                        print("TRADIER TOKEN not supplied. \n")
+                        yfinance_view.display_chains(
+                            ticker=self.ticker,
+                            expiry=self.selected_date,
+                            to_display=ns_parser.to_display,
+                            min_sp=ns_parser.min_sp,
+                            max_sp=ns_parser.max_sp,
+                            calls_only=ns_parser.calls,
+                            puts_only=ns_parser.puts,
+                            export=ns_parser.export,
+                        )
                 else:
                     print("No expiry loaded. First use `exp {expiry date}`\n")
             else:
@@ -1023,7 +1112,8 @@ Expiry: {self.selected_date or None}
             choices=self.plot_vars_choices,
             help=(
                 "ltd- last trade date, s- strike, lp- last price, b- bid, a- ask,"
-                "c- change, pc- percent change, v- volume, oi- open interest, iv- implied volatility"
+                "c- change, pc- percent change, v- volume, oi- open interest, iv- implied volatility, "
+                "delta, gamma, theta, vega, rho- greeks computed from the prices"
             ),
         )
         parser.add_argument(
@@ -1035,7 +1125,8 @@ Expiry: {self.selected_date or None}
             choices=self.plot_vars_choices,
             help=(
                 "ltd- last trade date, s- strike, lp- last price, b- bid, a- ask,"
-                "c- change, pc- percent change, v- volume, oi- open interest, iv- implied volatility"
+                "c- change, pc- percent change, v- volume, oi- open interest, iv- implied volatility, "
+                "delta, gamma, theta, vega, rho- greeks computed from the prices"
             ),
         )
         parser.add_argument(
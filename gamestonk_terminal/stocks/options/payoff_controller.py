@@ -12,7 +12,8 @@ from gamestonk_terminal.helper_funcs import (
     parse_known_args_and_warn,
 )
 from gamestonk_terminal.menu import session
-from gamestonk_terminal.stocks.options.yfinance_model import get_option_chain, get_price
+from gamestonk_terminal.stocks.options.reference_data_model import get_price
+from gamestonk_terminal.stocks.options.chain_cache_model import get_option_chain
 from gamestonk_terminal.stocks.options.yfinance_view import plot_payoff
 
 
@@ -296,6 +297,17 @@ Underlying Asset: {text}
             prog="plot",
             description="This function plots option payoff diagrams",
         )
+        parser.add_argument(
+            "-d",
+            "--days",
+            dest="days",
+            type=check_non_negative,
+            help="also value the options with Black-Scholes this many days before "
+            "expiration, at the implied volatilities of their costs",
+            default=0,
+        )
+        if other_args and "-" not in other_args[0][0]:
+            other_args.insert(0, "-d")
         ns_parser = parse_known_args_and_warn(parser, other_args)
         if ns_parser:
             plot_payoff(
@@ -304,4 +316,5 @@ Underlying Asset: {text}
                 self.underlying,
                 self.ticker,
                 self.expiration,
+                ns_parser.days,
             )
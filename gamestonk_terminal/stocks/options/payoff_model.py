@@ -0,0 +1,236 @@
+"""Payoff of multi-leg option strategies, valued on all the prices at once"""
+__docformat__ = "numpy"
+
+from datetime import date, datetime
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from gamestonk_terminal.stocks.options import black_scholes_model, reference_data_model
+
+# Volatility of the legs whose price does not give an implied volatility
+DEFAULT_VOL = 0.3
+
+
+def get_legs(options: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """Arrays of the legs of a strategy
+
+    Parameters
+    ----------
+    options : List[Dict[str, Any]]
+        Legs, with their type (call or put), sign (1 long, -1 short), strike and cost
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        put, strike, sign and cost of the legs
+    """
+    return {
+        "put": np.array([o["type"] == "put" for o in options], dtype=bool),
+        "strike": np.array([o["strike"] for o in options], dtype=np.float64),
+        "sign": np.array([o["sign"] for o in options], dtype=np.float64),
+        "cost": np.array([o["cost"] for o in options], dtype=np.float64),
+    }
+
+
+def get_x_values(
+    current_price: float, strikes: np.ndarray, points: int = 101
+) -> np.ndarray:
+    """Prices of the underlying asset covering the current price and the strikes
+
+    Parameters
+    ----------
+    current_price : float
+        Price of the underlying asset
+    strikes : np.ndarray
+        Strikes of the legs
+    points : int
+        Number of prices
+
+    Returns
+    -------
+    np.ndarray
+        Evenly spaced prices
+    """
+    if len(strikes) == 0:
+        return np.linspace(current_price * 0.5, current_price * 1.5, points)
+    return np.linspace(
+        min(current_price, strikes.min()) * 0.8,
+        max(current_price, strikes.max()) * 1.2,
+        points,
+    )
+
+
+def expiry_payoff(
+    prices: np.ndarray, legs: Dict[str, np.ndarray], underlying: int, base: float
+) -> np.ndarray:
+    """Payoff at expiration, before premiums, of every leg on every price at once
+
+    Parameters
+    ----------
+    prices : np.ndarray
+        Prices of the underlying asset at expiration
+    legs : Dict[str, np.ndarray]
+        Legs, from get_legs
+    underlying : int
+        1 long, -1 short or 0 without the underlying asset
+    base : float
+        Price the underlying asset was bought or sold at
+
+    Returns
+    -------
+    np.ndarray
+        Payoff of the strategy on each price
+    """
+    moves = prices[:, None] - legs["strike"]
+    intrinsic = np.maximum(np.where(legs["put"], -moves, moves), 0)
+    return intrinsic @ legs["sign"] + underlying * (prices - base)
+
+
+def leg_volatilities(
+    legs: Dict[str, np.ndarray], current_price: float, years: float, rate: float
+) -> np.ndarray:
+    """Implied volatilities of the legs, from their costs
+
+    Parameters
+    ----------
+    legs : Dict[str, np.ndarray]
+        Legs, from get_legs
+    current_price : float
+        Price of the underlying asset
+    years : float
+        Time to expiration, in years
+    rate : float
+        Continuously compounded risk-free rate
+
+    Returns
+    -------
+    np.ndarray
+        Volatilities, the median of the others (or DEFAULT_VOL) for the legs whose
+        cost is outside of the no-arbitrage bounds
+    """
+    vols = black_scholes_model.implied_volatility(
+        legs["cost"], current_price, legs["strike"], years, rate, legs["put"]
+    )
+    solved = ~np.isnan(vols)
+    return np.where(
+        solved, vols, np.median(vols[solved]) if solved.any() else DEFAULT_VOL
+    )
+
+
+def value_before_expiry(
+    prices: np.ndarray,
+    legs: Dict[str, np.ndarray],
+    underlying: int,
+    base: float,
+    years: float,
+    rate: float,
+    vols: np.ndarray,
+) -> np.ndarray:
+    """Profit of the strategy before expiration, after premiums
+
+    Parameters
+    ----------
+    prices : np.ndarray
+        Prices of the underlying asset
+    legs : Dict[str, np.ndarray]
+        Legs, from get_legs
+    underlying : int
+        1 long, -1 short or 0 without the underlying asset
+    base : float
+        Price the underlying asset was bought or sold at
+    years : float
+        Time left to expiration, in years
+    rate : float
+        Continuously compounded risk-free rate
+    vols : np.ndarray
+        Volatilities of the legs
+
+    Returns
+    -------
+    np.ndarray
+        Profit of the strategy on each price
+    """
+    if years <= 0:
+        net_cost = legs["cost"] @ legs["sign"]
+        return expiry_payoff(prices, legs, underlying, base) - net_cost
+    values = black_scholes_model.option_price(
+        prices[:, None], legs["strike"], years, rate, vols, legs["put"]
+    )
+    return (values - legs["cost"]) @ legs["sign"] + underlying * (prices - base)
+
+
+def generate_data(
+    current_price: float,
+    options: List[Dict[str, Any]],
+    underlying: int,
+    points: int = 101,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Prices of the underlying asset with the payoffs before and after premiums
+
+    Parameters
+    ----------
+    current_price : float
+        Price of the underlying asset
+    options : List[Dict[str, Any]]
+        Legs, with their type (call or put), sign (1 long, -1 short), strike and cost
+    underlying : int
+        1 long, -1 short or 0 without the underlying asset
+    points : int
+        Number of prices
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, np.ndarray]
+        Prices, payoffs before premiums and payoffs after premiums (empty when the
+        premiums cancel out)
+    """
+    legs = get_legs(options)
+    prices = get_x_values(current_price, legs["strike"], points)
+    before = expiry_payoff(prices, legs, underlying, current_price)
+    # Premiums are paid for long legs and received for short ones
+    net_cost = legs["cost"] @ legs["sign"]
+    after = before - net_cost if net_cost != 0 else np.array([])
+    return prices, before, after
+
+
+def get_value_before_expiry(
+    current_price: float,
+    options: List[Dict[str, Any]],
+    underlying: int,
+    expiration: str,
+    days: int,
+    prices: np.ndarray,
+) -> np.ndarray:
+    """Profit of the strategy a number of days before expiration
+
+    The legs are valued with Black-Scholes at the implied volatilities of their
+    costs.
+
+    Parameters
+    ----------
+    current_price : float
+        Price of the underlying asset
+    options : List[Dict[str, Any]]
+        Legs, with their type (call or put), sign (1 long, -1 short), strike and cost
+    underlying : int
+        1 long, -1 short or 0 without the underlying asset
+    expiration : str
+        Expiration date of the options in the form of "YYYY-MM-DD"
+    days : int
+        Days left to expiration when the strategy is valued
+    prices : np.ndarray
+        Prices of the underlying asset
+
+    Returns
+    -------
+    np.ndarray
+        Profit of the strategy on each price
+    """
+    legs = get_legs(options)
+    days_left = (datetime.strptime(expiration, "%Y-%m-%d").date() - date.today()).days
+    rate = np.log(1 + reference_data_model.get_rf())
+    vols = leg_volatilities(legs, current_price, max(days_left, 1) / 365, rate)
+    return value_before_expiry(
+        prices, legs, underlying, current_price, days / 365, rate, vols
+    )
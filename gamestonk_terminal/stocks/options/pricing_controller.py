@@ -10,6 +10,7 @@ from prompt_toolkit.completion import NestedCompleter
 from gamestonk_terminal import feature_flags as gtff
 from gamestonk_terminal.parent_classes import BaseController
 from gamestonk_terminal.helper_funcs import (
+    check_positive_float,
     parse_known_args_and_warn,
 )
 from gamestonk_terminal.menu import session
@@ -26,6 +27,8 @@ class PricingController(BaseController):
         "rnval",
     ]
 
+    dist_choices = ["table", "lognormal", "empirical"]
+
     def __init__(
         self,
         ticker: str,
@@ -42,6 +45,7 @@ class PricingController(BaseController):
 
         if session and gtff.USE_PROMPT_TOOLKIT:
             choices: dict = {c: {} for c in self.controller_choices}
+            choices["rnval"]["-d"] = {c: {} for c in self.dist_choices}
             self.completer = NestedCompleter.from_nested_dict(choices)
 
     def print_help(self):
@@ -208,11 +212,28 @@ Expiry: {self.selected_date or None}
             dest="risk",
             help="The risk-free rate to use",
         )
+        parser.add_argument(
+            "-d",
+            "--dist",
+            choices=self.dist_choices,
+            default="table",
+            dest="dist",
+            help="Distribution of the prices at expiration: the listed expected "
+            "prices, lognormal or empirical from the past returns",
+        )
+        parser.add_argument(
+            "-v",
+            "--vol",
+            type=check_positive_float,
+            default=None,
+            dest="vol",
+            help="Annualized volatility of the lognormal distribution",
+        )
         ns_parser = parse_known_args_and_warn(parser, other_args)
         if ns_parser:
             if self.ticker:
                 if self.selected_date:
-                    if sum(self.prices["Chance"]) == 1:
+                    if ns_parser.dist != "table" or sum(self.prices["Chance"]) == 1:
                         yfinance_view.risk_neutral_vals(
                             self.ticker,
                             self.selected_date,
@@ -221,6 +242,8 @@ Expiry: {self.selected_date or None}
                             ns_parser.mini,
                             ns_parser.maxi,
                             ns_parser.risk,
+                            ns_parser.dist,
+                            ns_parser.vol,
                         )
                     else:
                         print("Total chances must equal one\n")
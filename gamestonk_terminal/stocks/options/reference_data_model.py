@@ -0,0 +1,76 @@
+"""Reference data of the options menus, cached in memory and on disk"""
+__docformat__ = "numpy"
+
+from typing import Any, Dict
+
+import pandas as pd
+
+from gamestonk_terminal import reference_data
+from gamestonk_terminal.stocks.options import yfinance_model
+
+# Maximum age, in seconds, of each kind of reference data
+DIVIDEND_MAX_AGE = 24 * 60 * 60
+QUOTE_MAX_AGE = 15 * 60
+
+# The risk-free rate is shared with the menus outside of options
+get_rf = reference_data.get_rf
+
+
+def get_dividend(ticker: str) -> pd.Series:
+    """Dividends paid by a ticker
+
+    Parameters
+    ----------
+    ticker: str
+        Ticker to get the dividends of
+
+    Returns
+    -------
+    pd.Series
+        Dividends, by date
+    """
+    return reference_data.cached(
+        f"dividend_{ticker.upper()}",
+        DIVIDEND_MAX_AGE,
+        lambda: yfinance_model.get_dividend(ticker),
+    )
+
+
+def get_price(ticker: str) -> float:
+    """Last price of a ticker
+
+    Parameters
+    ----------
+    ticker : str
+        The ticker to get the price for
+
+    Returns
+    ----------
+    price : float
+        The price of the ticker
+    """
+    return reference_data.cached(
+        f"price_{ticker.upper()}",
+        QUOTE_MAX_AGE,
+        lambda: yfinance_model.get_price(ticker),
+    )
+
+
+def get_info(ticker: str) -> Dict[str, Any]:
+    """Info of a ticker, including its current price
+
+    Parameters
+    ----------
+    ticker : str
+        The ticker to get the info for
+
+    Returns
+    ----------
+    Dict[str, Any]
+        The info for a given ticker
+    """
+    return reference_data.cached(
+        f"info_{ticker.upper()}",
+        QUOTE_MAX_AGE,
+        lambda: yfinance_model.get_info(ticker),
+    )
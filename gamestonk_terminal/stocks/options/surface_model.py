@@ -0,0 +1,235 @@
+"""Implied volatility surface of all the expirations of a ticker"""
+__docformat__ = "numpy"
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from gamestonk_terminal.stocks.options import (
+    black_scholes_model,
+    chain_cache_model,
+    reference_data_model,
+    yfinance_model,
+)
+
+# Tenors of the surface grid, in days, kept between the first and last expiries
+TENORS = [7, 14, 30, 60, 90, 120, 180, 270, 365, 545, 730, 1095]
+# Options cheaper than a tick carry no information on their volatility
+MIN_PRICE = 0.01
+
+_POINTS: Dict[Tuple[str, Optional[Tuple[str, ...]]], Tuple[float, pd.DataFrame]] = {}
+
+
+def get_surface_points(
+    ticker: str, expiries: Optional[List[str]] = None, workers: int = 8
+) -> pd.DataFrame:
+    """Implied volatilities of the out of the money options of every expiration
+
+    The chains are downloaded concurrently and the volatilities of all the
+    contracts solved at once. The points are kept for the session.
+
+    Parameters
+    ----------
+    ticker : str
+        Ticker to get options for
+    expiries : Optional[List[str]]
+        Expiration dates in the form of "YYYY-MM-DD", all of them if None
+    workers : int
+        Number of chains downloaded at the same time
+
+    Returns
+    -------
+    pd.DataFrame
+        expiry, days, strike, moneyness (strike over price) and iv of the options
+    """
+    key = (ticker.upper(), None if expiries is None else tuple(expiries))
+    if key in _POINTS and time.time() - _POINTS[key][0] <= (
+        chain_cache_model.CACHE_MAX_AGE
+    ):
+        return _POINTS[key][1]
+
+    if expiries is None:
+        expiries = yfinance_model.option_expirations(ticker)
+    today = date.today()
+    days = {
+        expiry: (datetime.strptime(expiry, "%Y-%m-%d").date() - today).days
+        for expiry in expiries
+    }
+    expiries = [expiry for expiry in expiries if days[expiry] > 0]
+
+    chains = []
+    if expiries:
+        with ThreadPoolExecutor(max_workers=min(workers, len(expiries))) as executor:
+            chains = list(
+                executor.map(
+                    lambda expiry: chain_cache_model.get_option_chain(ticker, expiry),
+                    expiries,
+                )
+            )
+
+    frames = []
+    for expiry, chain in zip(expiries, chains):
+        for options, option_type in ((chain.calls, "call"), (chain.puts, "put")):
+            if not options.empty:
+                frames.append(
+                    options[["strike", "lastPrice", "bid", "ask"]].assign(
+                        expiry=expiry, days=days[expiry], put=option_type == "put"
+                    )
+                )
+    columns = ["expiry", "days", "strike", "moneyness", "iv"]
+    if not frames:
+        return pd.DataFrame(columns=columns)
+
+    options = pd.concat(frames, ignore_index=True)
+    spot = chain_cache_model.get_last_price(ticker)
+    rate = np.log(1 + reference_data_model.get_rf())
+    div_yield = (
+        reference_data_model.get_info(ticker).get("trailingAnnualDividendYield") or 0
+    )
+    years = options["days"].to_numpy(dtype=np.float64) / 365
+    strike = options["strike"].to_numpy(dtype=np.float64)
+    put = options["put"].to_numpy()
+    bid = options["bid"].to_numpy(dtype=np.float64)
+    ask = options["ask"].to_numpy(dtype=np.float64)
+    price = np.where(
+        (bid > 0) & (ask > 0),
+        (bid + ask) / 2,
+        options["lastPrice"].to_numpy(dtype=np.float64),
+    )
+
+    # Out of the money options are the liquid ones: puts below the forward price
+    forward = spot * np.exp((rate - div_yield) * years)
+    otm = np.where(put, strike < forward, strike >= forward) & (price >= MIN_PRICE)
+    options["moneyness"] = strike / spot
+    options["iv"] = np.nan
+    options.loc[otm, "iv"] = black_scholes_model.implied_volatility(
+        price[otm], spot, strike[otm], years[otm], rate, put[otm], div_yield
+    )
+    points = (
+        options.dropna(subset=["iv"])
+        .sort_values(["days", "strike"])
+        .reset_index(drop=True)[columns]
+    )
+    _POINTS[key] = (time.time(), points)
+    return points
+
+
+def build_surface(
+    points: pd.DataFrame,
+    moneyness: Optional[np.ndarray] = None,
+    tenors: Optional[List[int]] = None,
+) -> pd.DataFrame:
+    """Implied volatilities on a moneyness by tenor grid
+
+    Each expiration is interpolated linearly along the moneyness, then the total
+    variance (iv^2 x years) linearly along the tenors. Nothing is extrapolated.
+
+    Parameters
+    ----------
+    points : pd.DataFrame
+        Implied volatilities, from get_surface_points
+    moneyness : Optional[np.ndarray]
+        Moneyness of the grid, 0.7 to 1.3 by 0.05 if None
+    tenors : Optional[List[int]]
+        Tenors of the grid in days, the TENORS within the expirations if None
+
+    Returns
+    -------
+    pd.DataFrame
+        Implied volatilities, one row per tenor (days) and one column per moneyness
+    """
+    if moneyness is None:
+        moneyness = np.round(np.arange(0.7, 1.3001, 0.05), 2)
+    moneyness = np.asarray(moneyness, dtype=np.float64)
+
+    expiry_days = []
+    rows = []
+    for days, expiry_points in points.groupby("days"):
+        if len(expiry_points) < 2:
+            continue
+        expiry_days.append(days)
+        rows.append(
+            np.interp(
+                moneyness,
+                expiry_points["moneyness"].to_numpy(dtype=np.float64),
+                expiry_points["iv"].to_numpy(dtype=np.float64),
+                left=np.nan,
+                right=np.nan,
+            )
+        )
+    if not rows:
+        return pd.DataFrame(columns=moneyness, index=pd.Index([], name="Days"))
+
+    if tenors is None:
+        tenors = [t for t in TENORS if expiry_days[0] <= t <= expiry_days[-1]]
+        tenors = tenors or expiry_days
+    tenor_years = np.asarray(tenors, dtype=np.float64) / 365
+    variance = np.square(np.array(rows)) * (np.array(expiry_days)[:, None] / 365)
+
+    surface = np.full((len(tenors), len(moneyness)), np.nan)
+    for j in range(len(moneyness)):
+        known = ~np.isnan(variance[:, j])
+        if known.sum() >= 2 or (known.sum() == 1 and len(tenors) == 1):
+            total = np.interp(
+                tenor_years,
+                np.array(expiry_days)[known] / 365,
+                variance[known, j],
+                left=np.nan,
+                right=np.nan,
+            )
+            surface[:, j] = np.sqrt(total / tenor_years)
+    return pd.DataFrame(surface, index=pd.Index(tenors, name="Days"), columns=moneyness)
+
+
+def get_term_structure(points: pd.DataFrame) -> pd.Series:
+    """At the money implied volatility of each expiration
+
+    Parameters
+    ----------
+    points : pd.DataFrame
+        Implied volatilities, from get_surface_points
+
+    Returns
+    -------
+    pd.Series
+        Implied volatility at a moneyness of 1, by days to expiration
+    """
+    return build_surface(
+        points, moneyness=[1.0], tenors=sorted(points["days"].unique())
+    )[1.0].dropna()
+
+
+def get_skew(points: pd.DataFrame, expiry: str) -> pd.Series:
+    """Implied volatilities of an expiration
+
+    Parameters
+    ----------
+    points : pd.DataFrame
+        Implied volatilities, from get_surface_points
+    expiry : str
+        Expiration date in the form of "YYYY-MM-DD"
+
+    Returns
+    -------
+    pd.Series
+        Implied volatility by moneyness
+    """
+    expiry_points = points[points["expiry"] == expiry]
+    return expiry_points.set_index("moneyness")["iv"]
+
+
+def clear_cache(ticker: Optional[str] = None):
+    """Forget the points of a ticker, or of every ticker
+
+    Parameters
+    ----------
+    ticker: Optional[str]
+        Ticker to forget, all of them if None
+    """
+    for key in list(_POINTS):
+        if ticker is None or key[0] == ticker.upper():
+            del _POINTS[key]
@@ -0,0 +1,96 @@
+"""Implied volatility surface view"""
+__docformat__ = "numpy"
+
+import os
+from typing import List, Optional
+
+import matplotlib.pyplot as plt
+from tabulate import tabulate
+
+import gamestonk_terminal.config_plot as cfp
+import gamestonk_terminal.feature_flags as gtff
+from gamestonk_terminal.helper_funcs import export_data, plot_autoscale
+from gamestonk_terminal.stocks.options import surface_model
+
+
+def display_surface(
+    ticker: str,
+    expiries: Optional[List[str]] = None,
+    display: str = "surface",
+    expiry: str = "",
+    export: str = "",
+):
+    """Display the implied volatility surface of a ticker [Source: Yahoo Finance]
+
+    Parameters
+    ----------
+    ticker : str
+        Stock ticker
+    expiries : Optional[List[str]]
+        Expiration dates to use, all of them if None
+    display : str
+        surface for the moneyness by tenor grid, skew for the volatilities of an
+        expiration or term for the at the money volatility of each expiration
+    expiry : str
+        Expiration date of the skew, the first one if empty
+    export : str
+        Format to export data
+    """
+    points = surface_model.get_surface_points(ticker, expiries)
+    if points.empty:
+        print("No implied volatilities could be computed.\n")
+        return
+
+    fig, ax = plt.subplots(figsize=plot_autoscale(), dpi=cfp.PLOT_DPI)
+    if display == "skew":
+        expiry = expiry or points["expiry"].iloc[0]
+        data = surface_model.get_skew(points, expiry).to_frame("IV")
+        data.index.name = "Moneyness"
+        ax.plot(data.index, data["IV"], "o-")
+        ax.set_xlabel("Moneyness (strike / price)")
+        ax.set_title(f"Implied volatility skew of {ticker.upper()} for {expiry}")
+    elif display == "term":
+        data = surface_model.get_term_structure(points).to_frame("ATM IV")
+        ax.plot(data.index, data["ATM IV"], "o-")
+        ax.set_xlabel("Days to expiration")
+        ax.set_title(f"At the money implied volatility of {ticker.upper()}")
+    else:
+        data = surface_model.build_surface(points)
+        for days, row in data.iterrows():
+            ax.plot(data.columns, row.to_numpy(), label=f"{days}d")
+        ax.set_xlabel("Moneyness (strike / price)")
+        ax.set_title(f"Implied volatility surface of {ticker.upper()}")
+        ax.legend(loc="best")
+    ax.set_ylabel("Implied volatility")
+    ax.grid("on")
+    fig.tight_layout()
+
+    if data.empty or data.isna().all().all():
+        plt.close(fig)
+        print("Not enough implied volatilities to interpolate.\n")
+        return
+
+    if gtff.USE_TABULATE_DF:
+        print(
+            tabulate(
+                data,
+                headers=data.columns,
+                tablefmt="fancy_grid",
+                floatfmt=".3f",
+                missingval="-",
+            ),
+            "\n",
+        )
+    else:
+        print(data.to_string(float_format="%.3f", na_rep="-"), "\n")
+
+    if gtff.USE_ION:
+        plt.ion()
+    plt.show()
+
+    export_data(
+        export,
+        os.path.dirname(os.path.abspath(__file__)),
+        f"surface_{display}",
+        data,
+    )
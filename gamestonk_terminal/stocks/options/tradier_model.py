@@ -1,8 +1,10 @@
 """Tradier options model"""
 __docformat__ = "numpy"
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 
+import numpy as np
 import pandas as pd
 import requests
 
@@ -21,6 +23,8 @@ option_columns = [
 ]
 greek_columns = ["delta", "gamma", "theta", "vega", "ask_iv", "bid_iv", "mid_iv"]
 df_columns = option_columns + greek_columns
+text_columns = ["symbol", "option_type"]
+count_columns = ["bidsize", "asksize", "volume", "open_interest"]
 
 default_columns = [
     "mid_iv",
@@ -181,30 +185,69 @@ def process_chains(response: requests.models.Response) -> pd.DataFrame:
     opt_chain: pd.DataFrame
         Dataframe with all available options
     """
-    json_response = response.json()
-    options = json_response["options"]["option"]
-
-    opt_chain = pd.DataFrame(columns=df_columns)
-    for idx, option in enumerate(options):
-        # initialize empty dictionary
-        d = {}
-        for col in df_columns:
-            d[col] = ""
-
-        # populate main dictionary values
-        for col in option_columns:
-            if col in option:
-                d[col] = option[col]
-
-        # populate greek dictionary values
-        if option["greeks"]:
-            for col in greek_columns:
-                if col in option["greeks"]:
-                    d[col] = option["greeks"][col]
-
-        opt_chain.loc[idx, :] = d
-
-    return opt_chain
+    options = (response.json().get("options") or {}).get("option") or []
+    # A chain with a single option is not wrapped in a list
+    if isinstance(options, dict):
+        options = [options]
+    greeks = [option.get("greeks") or {} for option in options]
+
+    columns = {}
+    for col in df_columns:
+        rows = greeks if col in greek_columns else options
+        values = [row.get(col) for row in rows]
+        if col in text_columns:
+            columns[col] = np.array(values, dtype=object)
+        else:
+            columns[col] = np.array(
+                [np.nan if value is None else value for value in values],
+                dtype=np.float64,
+            )
+            if col in count_columns and not np.isnan(columns[col]).any():
+                columns[col] = columns[col].astype(np.int64)
+
+    return pd.DataFrame(columns, columns=df_columns)
+
+
+def get_all_option_chains(
+    symbol: str, expiries: Optional[List[str]] = None, workers: int = 8
+) -> pd.DataFrame:
+    """Option chains of every expiration of a ticker, downloaded concurrently
+
+    Parameters
+    ----------
+    symbol : str
+        Ticker to get options for
+    expiries : Optional[List[str]]
+        Expiration dates in the form of "YYYY-MM-DD", all of them if None
+    workers : int
+        Number of chains downloaded at the same time
+
+    Returns
+    -------
+    pd.DataFrame
+        Options of all the expirations, indexed by expiry, strike and option_type
+    """
+    if expiries is None:
+        expiries = option_expirations(symbol)
+
+    chains = []
+    if expiries:
+        with ThreadPoolExecutor(max_workers=min(workers, len(expiries))) as executor:
+            chains = list(
+                executor.map(lambda expiry: get_option_chains(symbol, expiry), expiries)
+            )
+
+    # Failed requests give empty chains, without columns
+    frames = [
+        chain.assign(expiry=expiry)
+        for expiry, chain in zip(expiries, chains)
+        if not chain.empty
+    ] or [pd.DataFrame(columns=df_columns + ["expiry"])]
+    return (
+        pd.concat(frames, ignore_index=True)
+        .set_index(["expiry", "strike", "option_type"])
+        .sort_index()
+    )
 
 
 def last_price(ticker: str):
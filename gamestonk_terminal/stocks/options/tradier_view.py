@@ -21,7 +21,11 @@ from gamestonk_terminal.helper_funcs import (
     patch_pandas_text_adjustment,
     plot_autoscale,
 )
-from gamestonk_terminal.stocks.options import op_helpers, tradier_model
+from gamestonk_terminal.stocks.options import (
+    chain_cache_model,
+    op_helpers,
+    tradier_model,
+)
 
 column_map = {"mid_iv": "iv", "open_interest": "oi", "volume": "vol"}
 
@@ -112,7 +116,40 @@ def display_chains(
         Format to  export file
     """
 
-    chains_df = tradier_model.get_option_chains(ticker, expiry)
+    chains_df = chain_cache_model.get_option_chain(ticker, expiry, "tr")
+    display_chains_table(
+        chains_df, to_display, min_sp, max_sp, calls_only, puts_only, export
+    )
+
+
+def display_chains_table(
+    chains_df: pd.DataFrame,
+    to_display: List[str],
+    min_sp: float,
+    max_sp: float,
+    calls_only: bool,
+    puts_only: bool,
+    export: str = "",
+):
+    """Display an option chain with the columns of the Tradier chains
+
+    Parameters
+    ----------
+    chains_df: pd.DataFrame
+        Options, with strike, option_type and the columns to display
+    to_display: List[str]
+        List of columns to display
+    min_sp: float
+        Min strike price to display
+    max_sp: float
+        Max strike price to display
+    calls_only: bool
+        Only display calls
+    puts_only: bool
+        Only display puts
+    export: str
+        Format to  export file
+    """
     columns = to_display + ["strike", "option_type"]
     chains_df = chains_df[columns].rename(columns=column_map)
 
@@ -226,8 +263,8 @@ def plot_oi(
         Format to export file
     """
 
-    options = tradier_model.get_option_chains(ticker, expiry)
-    current_price = tradier_model.last_price(ticker)
+    options = chain_cache_model.get_option_chain(ticker, expiry, "tr")
+    current_price = chain_cache_model.get_last_price(ticker, "tr")
 
     if min_sp == -1:
         min_strike = 0.75 * current_price
@@ -330,8 +367,8 @@ def plot_vol(
         Format to export file
     """
 
-    options = tradier_model.get_option_chains(ticker, expiry)
-    current_price = tradier_model.last_price(ticker)
+    options = chain_cache_model.get_option_chain(ticker, expiry, "tr")
+    current_price = chain_cache_model.get_last_price(ticker, "tr")
 
     if min_sp == -1:
         min_strike = 0.75 * current_price
@@ -422,8 +459,8 @@ def plot_volume_open_interest(
     export: str
         Format for exporting data
     """
-    current_price = tradier_model.last_price(ticker)
-    options = tradier_model.get_option_chains(ticker, expiry)
+    current_price = chain_cache_model.get_last_price(ticker, "tr")
+    options = chain_cache_model.get_option_chain(ticker, expiry, "tr")
 
     calls = options[options.option_type == "call"][
         ["strike", "volume", "open_interest"]
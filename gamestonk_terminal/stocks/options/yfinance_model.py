@@ -1,8 +1,6 @@
 """Yfinance options model"""
 __docformat__ = "numpy"
 
-from typing import List, Dict, Tuple, Any
-
 import yfinance as yf
 import pandas as pd
 
@@ -65,58 +63,6 @@ def get_dividend(ticker: str) -> pd.Series:
     return dividend
 
 
-def get_x_values(current_price: float, options: List[Dict[str, int]]) -> List[float]:
-    """Generates different price values that need to be tested"""
-    x_list = list(range(101))
-    mini = current_price
-    maxi = current_price
-    if len(options) == 0:
-        mini *= 0.5
-        maxi *= 1.5
-    elif len(options) > 0:
-        biggest = max(options, key=lambda x: x["strike"])
-        smallest = min(options, key=lambda x: x["strike"])
-        maxi = max(maxi, biggest["strike"]) * 1.2
-        mini = min(mini, smallest["strike"]) * 0.8
-    num_range = maxi - mini
-    return [(x / 100) * num_range + mini for x in x_list]
-
-
-def get_y_values(
-    base: float,
-    price: float,
-    options: List[Dict[Any, Any]],
-    underlying: int,
-) -> float:
-    """Generates y values for corresponding x values"""
-    option_change = 0
-    change = price - base
-    for option in options:
-        if option["type"] == "call":
-            abs_change = price - option["strike"] if price > option["strike"] else 0
-            option_change += option["sign"] * abs_change
-        elif option["type"] == "put":
-            abs_change = option["strike"] - price if price < option["strike"] else 0
-            option_change += option["sign"] * abs_change
-    return (change * underlying) + option_change
-
-
-def generate_data(
-    current_price: float, options: List[Dict[str, int]], underlying: int
-) -> Tuple[List[float], List[float], List[float]]:
-    """Gets x values, and y values before and after premiums"""
-    x_vals = get_x_values(current_price, options)
-    base = current_price
-    total_cost = sum(x["cost"] for x in options)
-    before = [get_y_values(base, x, options, underlying) for x in x_vals]
-    if total_cost != 0:
-        after = [
-            get_y_values(base, x, options, underlying) - total_cost for x in x_vals
-        ]
-        return x_vals, before, after
-    return x_vals, before, []
-
-
 def get_price(ticker: str) -> float:
     """Get current price for a given ticker
 
@@ -14,20 +14,26 @@ from scipy.stats import binom
 import numpy as np
 import pandas as pd
 import seaborn as sns
-import yfinance as yf
 from tabulate import tabulate
 from openpyxl import Workbook
 
 import gamestonk_terminal.config_plot as cfp
 import gamestonk_terminal.feature_flags as gtff
 from gamestonk_terminal.helper_funcs import export_data, plot_autoscale
-from gamestonk_terminal.stocks.options import op_helpers, yfinance_model
-from gamestonk_terminal.stocks.options.yfinance_model import (
-    generate_data,
-    get_option_chain,
-    get_price,
+from gamestonk_terminal.stocks.options import (
+    black_scholes_model,
+    chain_cache_model,
+    op_helpers,
+    payoff_model,
+    reference_data_model,
+    tradier_view,
+    yfinance_model,
 )
-from gamestonk_terminal.helper_funcs import get_rf
+from gamestonk_terminal.stocks.options.reference_data_model import get_price, get_rf
+from gamestonk_terminal.stocks.options.chain_cache_model import get_option_chain
+
+
+GREEKS = ["delta", "gamma", "theta", "vega", "rho"]
 
 
 def plot_oi(
@@ -58,7 +64,7 @@ def plot_oi(
     export: str
         Format to export file
     """
-    options = yfinance_model.get_option_chain(ticker, expiry)
+    options = chain_cache_model.get_option_chain(ticker, expiry)
     export_data(
         export,
         os.path.dirname(os.path.abspath(__file__)),
@@ -67,7 +73,7 @@ def plot_oi(
     )
     calls = options.calls
     puts = options.puts
-    current_price = float(yf.Ticker(ticker).info["regularMarketPrice"])
+    current_price = chain_cache_model.get_last_price(ticker)
 
     if min_sp == -1:
         min_strike = 0.75 * current_price
@@ -161,10 +167,10 @@ def plot_vol(
     export: str
         Format to export file
     """
-    options = yfinance_model.get_option_chain(ticker, expiry)
+    options = chain_cache_model.get_option_chain(ticker, expiry)
     calls = options.calls
     puts = options.puts
-    current_price = float(yf.Ticker(ticker).info["regularMarketPrice"])
+    current_price = chain_cache_model.get_last_price(ticker)
 
     if min_sp == -1:
         min_strike = 0.75 * current_price
@@ -254,10 +260,10 @@ def plot_volume_open_interest(
         Format for exporting data
     """
 
-    options = yfinance_model.get_option_chain(ticker, expiry)
+    options = chain_cache_model.get_option_chain(ticker, expiry)
     calls = options.calls
     puts = options.puts
-    current_price = float(yf.Ticker(ticker).info["regularMarketPrice"])
+    current_price = chain_cache_model.get_last_price(ticker)
 
     # Process Calls Data
     df_calls = calls.pivot_table(
@@ -414,6 +420,44 @@ def plot_volume_open_interest(
     print("")
 
 
+def display_chains(
+    ticker: str,
+    expiry: str,
+    to_display: List[str],
+    min_sp: float,
+    max_sp: float,
+    calls_only: bool,
+    puts_only: bool,
+    export: str = "",
+):
+    """Display option chain with greeks computed from the prices [Source: Yahoo Finance]
+
+    Parameters
+    ----------
+    ticker: str
+        Stock ticker
+    expiry: str
+        Expiration date of option
+    to_display: List[str]
+        List of columns to display
+    min_sp: float
+        Min strike price to display
+    max_sp: float
+        Max strike price to display
+    calls_only: bool
+        Only display calls
+    puts_only: bool
+        Only display puts
+    export: str
+        Format to  export file
+    """
+    chains_df = black_scholes_model.get_chain_greeks(ticker, expiry)
+    print("Greeks and implied volatilities from Black-Scholes-Merton")
+    tradier_view.display_chains_table(
+        chains_df, to_display, min_sp, max_sp, calls_only, puts_only, export
+    )
+
+
 def plot_plot(
     ticker: str, expiration: str, put: bool, x: str, y: str, custom: str, export: str
 ) -> None:
@@ -449,13 +493,27 @@ def plot_plot(
         "v": "volume",
         "oi": "openInterest",
         "iv": "impliedVolatility",
+        "delta": "delta",
+        "gamma": "gamma",
+        "theta": "theta",
+        "vega": "vega",
+        "rho": "rho",
     }
 
     x = convert[x]
     y = convert[y]
     varis = op_helpers.opt_chain_cols
-    chain = yfinance_model.get_option_chain(ticker, expiration)
+    chain = chain_cache_model.get_option_chain(ticker, expiration)
     values = chain.puts if put else chain.calls
+    greek_names = [x, y] if custom is None else []
+    greek_names = [name for name in greek_names if name in GREEKS]
+    if greek_names:
+        # Yahoo Finance has no greeks, they are computed from the prices
+        greeks = black_scholes_model.get_chain_greeks(ticker, expiration)
+        greeks = greeks[greeks["option_type"] == ("put" if put else "call")]
+        values = values.merge(
+            greeks[["strike"] + GREEKS], on="strike", how="left", validate="1:1"
+        )
     _, ax = plt.subplots()
     if custom == "smile":
         x = "strike"
@@ -493,15 +551,37 @@ def plot_payoff(
     underlying: int,
     ticker: str,
     expiration: str,
+    days: int = 0,
 ) -> None:
-    """Generate a graph showing the option payoff diagram"""
-    x, yb, ya = generate_data(current_price, options, underlying)
+    """Generate a graph showing the option payoff diagram
+
+    Parameters
+    ----------
+    current_price : float
+        Price of the underlying asset
+    options : List[Dict[Any, Any]]
+        Legs, with their type (call or put), sign (1 long, -1 short), strike and cost
+    underlying : int
+        1 long, -1 short or 0 without the underlying asset
+    ticker : str
+        Stock ticker
+    expiration : str
+        Expiration date of the options
+    days : int
+        Days to expiration at which the strategy is also valued, none if 0
+    """
+    x, yb, ya = payoff_model.generate_data(current_price, options, underlying)
     _, ax = plt.subplots()
-    if ya:
+    if len(ya):
         ax.plot(x, yb, label="Payoff Before Premium")
         ax.plot(x, ya, label="Payoff After Premium")
     else:
         ax.plot(x, yb, label="Payoff")
+    if days > 0:
+        value = payoff_model.get_value_before_expiry(
+            current_price, options, underlying, expiration, days, x
+        )
+        ax.plot(x, value, "--", label=f"Profit {days} Days Before Expiration")
     ax.set_title(f"Option Payoff Diagram for {ticker} on {expiration}")
     ax.set_ylabel("Profit")
     ax.set_xlabel("Underlying Asset Price at Expiration")
@@ -538,10 +618,11 @@ def show_parity(
     """
     r_date = datetime.strptime(exp, "%Y-%m-%d").date()
     delta = (r_date - date.today()).days
-    rate = ((1 + get_rf()) ** (delta / 365)) - 1
+    rf = get_rf()
+    rate = ((1 + rf) ** (delta / 365)) - 1
     stock = get_price(ticker)
 
-    div_info = yfinance_model.get_dividend(ticker)
+    div_info = reference_data_model.get_dividend(ticker)
     div_dts = div_info.index.values.tolist()
 
     if div_dts:
@@ -558,7 +639,7 @@ def show_parity(
             day_dif = (next_div - datetime.now()).days
             dividends.append((avg_div, day_dif))
             next_div += timedelta(days=91)
-        div_pvs = [x[0] / ((1 + get_rf()) ** (x[1] / 365)) for x in dividends]
+        div_pvs = [x[0] / ((1 + rf) ** (x[1] / 365)) for x in dividends]
         pv_dividend = sum(div_pvs)
     else:
         pv_dividend = 0
@@ -632,6 +713,8 @@ def risk_neutral_vals(
     mini: float,
     maxi: float,
     risk: float,
+    dist: str = "table",
+    vol: float = None,
 ) -> None:
     """Prints current options prices and risk neutral values [Source: Yahoo Finance]
 
@@ -651,6 +734,12 @@ def risk_neutral_vals(
         Maximum strike price to show
     risk : float
         The risk-free rate for the asset
+    dist : str
+        Distribution of the prices at expiration: table for the estimated prices
+        in df, lognormal or empirical from the past returns of the stock
+    vol : float
+        Annualized volatility of the lognormal distribution, from the last year of
+        prices if not given
     """
     if put:
         chain = get_option_chain(ticker, exp).puts
@@ -659,18 +748,32 @@ def risk_neutral_vals(
 
     r_date = datetime.strptime(exp, "%Y-%m-%d").date()
     delta = (r_date - date.today()).days
-    vals = []
     if risk is None:
         risk = get_rf()
-    for _, row in chain.iterrows():
-        vals.append(
-            [
-                row["strike"],
-                row["lastPrice"],
-                op_helpers.rn_payoff(row["strike"], df, put, delta, risk),
-            ]
-        )
-    new_df = pd.DataFrame(vals, columns=["Strike", "Last Price", "Value"], dtype=float)
+
+    if dist == "table":
+        prices, chances = df["Price"].to_numpy(), df["Chance"].to_numpy()
+    else:
+        price = get_price(ticker)
+        if dist == "lognormal":
+            if vol is None:
+                closings = yfinance_model.get_closing(ticker)
+                vol = np.log(closings / closings.shift()).std() * (252 ** 0.5)
+            prices, chances = op_helpers.lognormal_scenarios(price, vol, delta, risk)
+        else:
+            prices, chances = op_helpers.empirical_scenarios(
+                price, yfinance_model.get_closing(ticker), delta, risk
+            )
+
+    strikes = chain["strike"].to_numpy(dtype=float)
+    calls, puts = op_helpers.rn_payoffs(strikes, prices, chances, delta, risk)
+    new_df = pd.DataFrame(
+        {
+            "Strike": strikes,
+            "Last Price": chain["lastPrice"].to_numpy(dtype=float),
+            "Value": puts if put else calls,
+        }
+    )
     new_df["Difference"] = new_df["Last Price"] - new_df["Value"]
 
     if mini is None:
@@ -855,7 +958,7 @@ def show_binom(
         The annualized volatility for the underlying asset
     """
     # Base variables to calculate values
-    info = yfinance_model.get_info(ticker)
+    info = reference_data_model.get_info(ticker)
     price = info["regularMarketPrice"]
     if vol is None:
         closings = yfinance_model.get_closing(ticker)
@@ -10,6 +10,8 @@ from finvizfinance.screener import (
     performance,
 )
 
+from gamestonk_terminal.stocks.screener import snapshot_model
+
 presets_path = os.path.join(os.path.abspath(os.path.dirname(__file__)), "presets/")
 
 # pylint: disable=C0302
@@ -87,6 +89,13 @@ def get_screener_data(preset_loaded: str, data_type: str, limit: int, ascend: bo
         return pd.DataFrame()
 
     if preset_loaded in d_signals:
+        # Screen the local snapshot of the universe when the signal allows it
+        df_screen = snapshot_model.get_local_screener_data(
+            {"Signal": d_signals[preset_loaded]}, {}, data_type, ascend
+        )
+        if df_screen is not None:
+            return df_screen.head(limit) if limit > 0 else df_screen
+
         screen.set_filter(signal=d_signals[preset_loaded])
 
         if limit > 0:
@@ -121,6 +130,13 @@ def get_screener_data(preset_loaded: str, data_type: str, limit: int, ascend: bo
 
         d_filters = {k: v for k, v in d_filters.items() if v}
 
+        # Screen the local snapshot of the universe when the preset allows it
+        df_screen = snapshot_model.get_local_screener_data(
+            dict(d_general), d_filters, data_type, ascend
+        )
+        if df_screen is not None:
+            return df_screen.head(limit) if limit > 0 else df_screen
+
         screen.set_filter(filters_dict=d_filters)
 
         if "Order" in d_general:
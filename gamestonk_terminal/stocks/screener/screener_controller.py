@@ -25,6 +25,8 @@ from gamestonk_terminal.stocks.screener import (
     finviz_view,
     yahoofinance_view,
     finviz_model,
+    snapshot_model,
+    snapshot_view,
 )
 
 presets_path = os.path.join(os.path.abspath(os.path.dirname(__file__)), "presets/")
@@ -38,6 +40,8 @@ class ScreenerController(BaseController):
     CHOICES_COMMANDS = [
         "view",
         "set",
+        "snapshot",
+        "batch",
         "historical",
         "overview",
         "valuation",
@@ -71,6 +75,8 @@ class ScreenerController(BaseController):
                 c: None
                 for c in self.preset_choices + list(finviz_model.d_signals.keys())
             }
+            choices["snapshot"]["-d"] = {c: None for c in snapshot_model.d_screens}
+            choices["batch"] = {c: None for c in self.preset_choices}
             choices["historical"]["-t"] = {
                 c: None for c in self.historical_candle_choices
             }
@@ -99,6 +105,8 @@ class ScreenerController(BaseController):
         help_text = f"""
     view          view available presets (defaults and customs)
     set           set one of the available presets
+    snapshot      download the universe to screen presets locally
+    batch         screen several presets at once on the local snapshot
 
 PRESET: {self.preset}
 
@@ -200,6 +208,87 @@ Last screened tickers: {', '.join(self.screen_tickers)}
             self.preset = ns_parser.preset
         print("")
 
+    def call_snapshot(self, other_args: List[str]):
+        """Process snapshot command"""
+        parser = argparse.ArgumentParser(
+            add_help=False,
+            prog="snapshot",
+            description="""Download the whole finviz universe, so that presets are
+            screened locally instead of querying finviz for each of them. Presets with
+            filters that can't be evaluated on the snapshot (e.g. crosses, patterns,
+            earnings dates) are still screened by finviz. [Source: Finviz]""",
+        )
+        parser.add_argument(
+            "-d",
+            "--data",
+            action="store",
+            dest="data_types",
+            type=lambda s: [x.strip() for x in s.split(",")],
+            default=list(snapshot_model.d_screens.keys()),
+            help="Comma separated screener views to download, all of them by default",
+        )
+        ns_parser = parse_known_args_and_warn(parser, other_args)
+        if ns_parser:
+            wrong_types = set(ns_parser.data_types) - set(snapshot_model.d_screens)
+            if wrong_types:
+                print(
+                    f"Unknown views: {', '.join(wrong_types)}. "
+                    f"Choose from: {', '.join(snapshot_model.d_screens)}\n"
+                )
+                return
+            snapshot_view.display_snapshot(ns_parser.data_types)
+
+    def call_batch(self, other_args: List[str]):
+        """Process batch command"""
+        parser = argparse.ArgumentParser(
+            add_help=False,
+            prog="batch",
+            description="""Screen several custom presets at once on the local snapshot
+            downloaded with snapshot, showing how many stocks pass each of them.""",
+        )
+        parser.add_argument(
+            "-p",
+            "--presets",
+            action="store",
+            dest="presets",
+            type=lambda s: [x.strip() for x in s.split(",")],
+            default=self.preset_choices,
+            help="Comma separated presets to screen, all custom presets by default",
+        )
+        parser.add_argument(
+            "-l",
+            "--limit",
+            action="store",
+            dest="limit",
+            type=check_positive,
+            default=10,
+            help="Limit of tickers to display per preset.",
+        )
+        parser.add_argument(
+            "-a",
+            "--ascend",
+            action="store_true",
+            default=False,
+            dest="ascend",
+            help="Set order to Ascend, the default is Descend",
+        )
+        if other_args and "-" not in other_args[0][0]:
+            other_args.insert(0, "-p")
+        ns_parser = parse_known_args_and_warn(
+            parser, other_args, EXPORT_ONLY_RAW_DATA_ALLOWED
+        )
+        if ns_parser:
+            wrong_presets = set(ns_parser.presets) - set(self.preset_choices)
+            if wrong_presets:
+                print(f"Unknown presets: {', '.join(wrong_presets)}\n")
+                return
+            self.screen_tickers = snapshot_view.display_presets(
+                ns_parser.presets,
+                ns_parser.limit,
+                ns_parser.ascend,
+                ns_parser.export,
+            )
+
     def call_historical(self, other_args: List[str]):
         """Process historical command"""
         parser = argparse.ArgumentParser(
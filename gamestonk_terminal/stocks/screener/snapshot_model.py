@@ -0,0 +1,789 @@
+"""Local screener model, evaluating presets against a snapshot of the finviz universe"""
+__docformat__ = "numpy"
+
+import configparser
+import json
+import os
+import re
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from finvizfinance.screener import (
+    technical,
+    overview,
+    valuation,
+    financial,
+    ownership,
+    performance,
+)
+
+import gamestonk_terminal.config_terminal as cfg
+
+presets_path = os.path.join(os.path.abspath(os.path.dirname(__file__)), "presets/")
+
+# Snapshots older than this are not used to screen
+SNAPSHOT_MAX_AGE = timedelta(days=1)
+
+d_screens = {
+    "overview": overview.Overview,
+    "valuation": valuation.Valuation,
+    "financial": financial.Financial,
+    "ownership": ownership.Ownership,
+    "performance": performance.Performance,
+    "technical": technical.Technical,
+}
+
+TEXT_COLUMNS = ["Ticker", "Company", "Sector", "Industry", "Country", "Earnings"]
+
+# Filters on a single numeric column of the snapshot, percentages as fractions
+d_numeric_filters = {
+    "Dividend Yield": "Dividend",
+    "Average Volume": "Avg Volume",
+    "Float Short": "Float Short",
+    "Relative Volume": "Rel Volume",
+    "Shares Outstanding": "Outstanding",
+    "Current Volume": "Volume",
+    "Float": "Float",
+    "Price": "Price",
+    "P/E": "P/E",
+    "Price/Cash": "P/C",
+    "EPS growthnext 5 years": "EPS next 5Y",
+    "Return on Equity": "ROE",
+    "Debt/Equity": "Debt/Eq",
+    "InsiderOwnership": "Insider Own",
+    "Forward P/E": "Fwd P/E",
+    "Price/Free Cash Flow": "P/FCF",
+    "Sales growthpast 5 years": "Sales past 5Y",
+    "Return on Investment": "ROI",
+    "Gross Margin": "Gross M",
+    "InsiderTransactions": "Insider Trans",
+    "PEG": "PEG",
+    "EPS growththis year": "EPS this Y",
+    "Current Ratio": "Curr R",
+    "Operating Margin": "Oper M",
+    "InstitutionalOwnership": "Inst Own",
+    "P/S": "P/S",
+    "EPS growthnext year": "EPS next Y",
+    "Quick Ratio": "Quick R",
+    "Net Profit Margin": "Profit M",
+    "InstitutionalTransactions": "Inst Trans",
+    "P/B": "P/B",
+    "EPS growthpast 5 years": "EPS past 5Y",
+    "Return on Assets": "ROA",
+    "LT Debt/Equity": "LTDebt/Eq",
+    "Beta": "Beta",
+    "Average True Range": "ATR",
+}
+
+d_text_filters = {"Sector": "Sector", "Industry": "Industry", "Country": "Country"}
+
+# Country options of finviz grouping several countries of the snapshot
+d_country_groups = {
+    "Asia": {
+        "China",
+        "Hong Kong",
+        "India",
+        "Indonesia",
+        "Israel",
+        "Japan",
+        "Jordan",
+        "Kazakhstan",
+        "Macau",
+        "Malaysia",
+        "Mongolia",
+        "Philippines",
+        "Singapore",
+        "South Korea",
+        "Taiwan",
+        "Thailand",
+        "Turkey",
+        "United Arab Emirates",
+        "Vietnam",
+    },
+    "Europe": {
+        "Austria",
+        "Belgium",
+        "Cyprus",
+        "Czech Republic",
+        "Denmark",
+        "Finland",
+        "France",
+        "Germany",
+        "Gibraltar",
+        "Greece",
+        "Guernsey",
+        "Hungary",
+        "Iceland",
+        "Ireland",
+        "Isle of Man",
+        "Italy",
+        "Jersey",
+        "Luxembourg",
+        "Malta",
+        "Monaco",
+        "Netherlands",
+        "Norway",
+        "Poland",
+        "Portugal",
+        "Russia",
+        "Spain",
+        "Sweden",
+        "Switzerland",
+        "United Kingdom",
+    },
+    "Latin America": {
+        "Argentina",
+        "Brazil",
+        "Chile",
+        "Colombia",
+        "Costa Rica",
+        "Mexico",
+        "Panama",
+        "Peru",
+        "Puerto Rico",
+        "Uruguay",
+    },
+    "BRIC": {"Brazil", "Russia", "India", "China"},
+    "BeNeLux": {"Belgium", "Netherlands", "Luxembourg"},
+    "China & Hong Kong": {"China", "Hong Kong"},
+}
+
+# Countries of the snapshot
+COUNTRIES = set().union(
+    *d_country_groups.values(),
+    {
+        "Australia",
+        "Bahamas",
+        "Bermuda",
+        "Canada",
+        "Cayman Islands",
+        "New Zealand",
+        "South Africa",
+        "USA",
+    },
+)
+
+d_market_cap = {
+    "Mega ($200bln and more)": (200e9, np.inf),
+    "Large ($10bln to $200bln)": (10e9, 200e9),
+    "Mid ($2bl to $10bln)": (2e9, 10e9),
+    "Small ($300mln to $2bln)": (300e6, 2e9),
+    "Micro ($50mln to $300mln)": (50e6, 300e6),
+    "Nano (under $50mln)": (-np.inf, 50e6),
+    "+Large (over $50mln)": (10e9, np.inf),
+    "+Mid (over $2bln)": (2e9, np.inf),
+    "+Small (over $300mln)": (300e6, np.inf),
+    "+Micro (over $50mln)": (50e6, np.inf),
+    "-Large (under $200bln)": (-np.inf, 200e9),
+    "-Mid (under $10bln)": (-np.inf, 10e9),
+    "-Small (under $2bln)": (-np.inf, 2e9),
+    "-Micro (under $300mln)": (-np.inf, 300e6),
+}
+
+d_analyst_recom = {
+    "Strong Buy (1)": (-np.inf, 1.5),
+    "Buy or better": (-np.inf, 2.5),
+    "Buy": (1.5, 2.5),
+    "Hold or better": (-np.inf, 3.5),
+    "Hold": (2.5, 3.5),
+    "Hold or worse": (2.5, np.inf),
+    "Sell": (3.5, 4.5),
+    "Sell or worse": (3.5, np.inf),
+    "Strong Sell (5)": (4.5, np.inf),
+}
+
+d_performance_columns = {
+    "Today": "Change",
+    "Week": "Perf Week",
+    "Month": "Perf Month",
+    "Quarter": "Perf Quart",
+    "Half": "Perf Half",
+    "Year": "Perf Year",
+    "YTD": "Perf YTD",
+}
+
+d_change_columns = {"Change": "Change", "Gap": "Gap", "Change from Open": "from Open"}
+
+d_sma_filters = {
+    "20-Day Simple Moving Average": "SMA20",
+    "50-Day Simple Moving Average": "SMA50",
+    "200-Day Simple Moving Average": "SMA200",
+}
+
+# Signals that only depend on snapshot fields
+d_signal_filters = {
+    "New High": ("52-Week High/Low", "New High"),
+    "New Low": ("52-Week High/Low", "New Low"),
+    "Overbought": ("RSI (14)", "Overbought (70)"),
+    "Oversold": ("RSI (14)", "Oversold (30)"),
+}
+
+d_order_columns = {
+    "Ticker": "Ticker",
+    "Company": "Company",
+    "Sector": "Sector",
+    "Industry": "Industry",
+    "Country": "Country",
+    "Market Cap.": "Market Cap",
+    "Price/Earnings": "P/E",
+    "Forward Price/Earnings": "Fwd P/E",
+    "PEG (Price/Earnings/Growth)": "PEG",
+    "Price/Sales": "P/S",
+    "Price/Book": "P/B",
+    "Price/Cash": "P/C",
+    "Price/Free Cash Flow": "P/FCF",
+    "Dividend Yield": "Dividend",
+    "EPS growth this year": "EPS this Y",
+    "EPS growth next year": "EPS next Y",
+    "EPS growth past 5 years": "EPS past 5Y",
+    "EPS growth next 5 years": "EPS next 5Y",
+    "Sales growth past 5 years": "Sales past 5Y",
+    "Shares Outstanding": "Outstanding",
+    "Shares Float": "Float",
+    "Insider Ownership": "Insider Own",
+    "Insider Transactions": "Insider Trans",
+    "Institutional Ownership": "Inst Own",
+    "Institutional Transactions": "Inst Trans",
+    "Short Interest Share": "Float Short",
+    "Short Interest Ratio": "Short Ratio",
+    "Return on Assets": "ROA",
+    "Return on Equity": "ROE",
+    "Return on Investment": "ROI",
+    "Current Ratio": "Curr R",
+    "Quick Ratio": "Quick R",
+    "LT Debt/Equity": "LTDebt/Eq",
+    "Total Debt/Equity": "Debt/Eq",
+    "Gross Margin": "Gross M",
+    "Operating Margin": "Oper M",
+    "Net Profit Margin": "Profit M",
+    "Analyst Recommendation": "Recom",
+    "Performance (Week)": "Perf Week",
+    "Performance (Month)": "Perf Month",
+    "Performance (Quarter)": "Perf Quart",
+    "Performance (Half Year)": "Perf Half",
+    "Performance (Year)": "Perf Year",
+    "Performance (Year To Date)": "Perf YTD",
+    "Beta": "Beta",
+    "Average True Range": "ATR",
+    "Volatility (Week)": "Volatility W",
+    "Volatility (Month)": "Volatility M",
+    "20-Day SMA (Relative)": "SMA20",
+    "50-Day SMA (Relative)": "SMA50",
+    "200-Day SMA (Relative)": "SMA200",
+    "52-Week High (Relative)": "52W High",
+    "52-Week Low (Relative)": "52W Low",
+    "Relative Strength Index (14)": "RSI",
+    "Average Volume (3 Month)": "Avg Volume",
+    "Relative Volume": "Rel Volume",
+    "Change": "Change",
+    "Change from Open": "from Open",
+    "Gap": "Gap",
+    "Volume": "Volume",
+    "Price": "Price",
+}
+
+# Snapshot columns a filter reads, and the function computing its boolean mask
+Mask = Tuple[List[str], Callable[[pd.DataFrame], pd.Series]]
+
+_SNAPSHOT: Dict[str, Tuple[float, pd.DataFrame, dict]] = {}
+
+
+def _snapshot_folder() -> str:
+    return os.path.join(cfg.CACHE_DIR, "screener")
+
+
+def _to_number(value) -> float:
+    """Convert a finviz cell (1.2B, 5.3%, 1,000, -) to a float, percentages as fractions"""
+    if value is None or isinstance(value, (int, float, np.number)):
+        return np.nan if value is None else float(value)
+    text = str(value).strip().replace(",", "")
+    if text in ("", "-"):
+        return np.nan
+    multiplier = {"%": 0.01, "K": 1e3, "M": 1e6, "B": 1e9, "T": 1e12}.get(text[-1])
+    try:
+        if multiplier:
+            return float(text[:-1]) * multiplier
+        return float(text)
+    except ValueError:
+        return np.nan
+
+
+def refresh_snapshot(data_types: List[str] = None) -> pd.DataFrame:
+    """Download the whole finviz universe and store it as the local screener snapshot
+
+    Parameters
+    ----------
+    data_types: List[str]
+        Screener views to download, all of them by default
+
+    Returns
+    -------
+    pd.DataFrame
+        Snapshot with one row per ticker
+    """
+    data_types = data_types or list(d_screens.keys())
+
+    df_snapshot = pd.DataFrame()
+    d_columns = {}
+    for data_type in data_types:
+        df_screen = d_screens[data_type]().ScreenerView()
+        d_columns[data_type] = list(df_screen.columns)
+        if df_snapshot.empty:
+            df_snapshot = df_screen
+        else:
+            new_columns = ["Ticker"] + [
+                col for col in df_screen.columns if col not in df_snapshot.columns
+            ]
+            df_snapshot = df_snapshot.merge(
+                df_screen[new_columns], on="Ticker", how="outer"
+            )
+
+    for col in df_snapshot.columns:
+        if col not in TEXT_COLUMNS:
+            df_snapshot[col] = df_snapshot[col].map(_to_number).astype(float)
+    df_snapshot = df_snapshot.reset_index(drop=True)
+
+    folder = _snapshot_folder()
+    os.makedirs(folder, exist_ok=True)
+    df_snapshot.to_pickle(os.path.join(folder, "snapshot.pkl"))
+    with open(os.path.join(folder, "meta.json"), "w", encoding="utf8") as f:
+        json.dump({"date": datetime.now().isoformat(), "columns": d_columns}, f)
+
+    return df_snapshot
+
+
+def load_snapshot(
+    max_age: Optional[timedelta] = SNAPSHOT_MAX_AGE,
+) -> Tuple[pd.DataFrame, dict]:
+    """Load the local screener snapshot
+
+    Parameters
+    ----------
+    max_age: Optional[timedelta]
+        Ignore snapshots older than this. None to load any snapshot
+
+    Returns
+    -------
+    Tuple[pd.DataFrame, dict]
+        Snapshot, empty when there is none recent enough, and its metadata:
+        date of download and columns of each screener view
+    """
+    folder = _snapshot_folder()
+    meta_file = os.path.join(folder, "meta.json")
+    try:
+        mtime = os.path.getmtime(meta_file)
+        if folder in _SNAPSHOT and _SNAPSHOT[folder][0] == mtime:
+            _, df_snapshot, meta = _SNAPSHOT[folder]
+        else:
+            with open(meta_file, encoding="utf8") as f:
+                meta = json.load(f)
+            df_snapshot = pd.read_pickle(os.path.join(folder, "snapshot.pkl"))
+            _SNAPSHOT[folder] = (mtime, df_snapshot, meta)
+    except (OSError, ValueError):
+        return pd.DataFrame(), {}
+
+    if max_age is not None and (
+        datetime.now() - datetime.fromisoformat(meta["date"]) > max_age
+    ):
+        return pd.DataFrame(), {}
+    return df_snapshot, meta
+
+
+def _parse_number(text: str) -> float:
+    text = text.strip().lstrip("$+%").strip()
+    if text.endswith("%"):
+        return float(text[:-1].strip()) / 100
+    multiplier = {"K": 1e3, "M": 1e6, "B": 1e9}.get(text[-1:])
+    if multiplier:
+        return float(text[:-1]) * multiplier
+    return float(text)
+
+
+def _parse_bounds(value: str) -> Optional[Tuple[float, float, bool]]:
+    """Bounds of a finviz option: Under 5, Over +10%, 1 to 2, Low (<15), Positive Low (0-10%)
+
+    Returns (low, high, inclusive) or None if the option can't be parsed.
+    """
+    bounds = _parse_range(value)
+    if bounds is None:
+        return None
+    low, high, inclusive = bounds
+    if re.match(r"(Very )?Positive", value):
+        low = max(low, 0)
+    elif re.match(r"(Very )?Negative", value):
+        # finviz writes Very Negative (<20%) for values under -20%
+        high = min(-abs(high), 0)
+    return low, high, inclusive
+
+
+def _parse_range(value: str) -> Optional[Tuple[float, float, bool]]:
+    match = re.search(r"\(([^)]*)\)", value)
+    text = (match.group(1) if match else value).strip()
+    try:
+        if text.startswith("<"):
+            return -np.inf, _parse_number(text[1:]), False
+        if text.startswith(">"):
+            return _parse_number(text[1:]), np.inf, False
+        match = re.fullmatch(r"(Under|Over)\s*(.+)", text)
+        if match:
+            number = _parse_number(match.group(2))
+            if match.group(1) == "Under":
+                return -np.inf, number, False
+            return number, np.inf, False
+        match = re.fullmatch(r"(.+?)\s*(?:to|-)\s*(.+)", text)
+        if match:
+            high = match.group(2).strip()
+            low = match.group(1).strip()
+            if high.endswith("%") and not low.endswith("%"):
+                low += "%"
+            return _parse_number(low), _parse_number(high), True
+        number = _parse_number(text)
+        return number, number, True
+    except ValueError:
+        return None
+
+
+def _between(column: str, low: float, high: float, inclusive: bool = False) -> Mask:
+    def mask(df: pd.DataFrame) -> pd.Series:
+        if inclusive:
+            return (df[column] >= low) & (df[column] <= high)
+        return (df[column] > low) & (df[column] < high)
+
+    return [column], mask
+
+
+def _compare_columns(column: str, other: str, above: bool) -> Mask:
+    def mask(df: pd.DataFrame) -> pd.Series:
+        return df[column] > df[other] if above else df[column] < df[other]
+
+    return [column, other], mask
+
+
+def _compile_sma(key: str, value: str) -> Optional[Mask]:
+    column = d_sma_filters[key]
+    match = re.fullmatch(r"Price (?:(\d+)% )?(above|below) (SMA\d+)", value)
+    if match and match.group(3) == column:
+        pct = float(match.group(1) or 0) / 100
+        if match.group(2) == "above":
+            return _between(column, pct, np.inf, inclusive=bool(pct))
+        return _between(column, -np.inf, -pct, inclusive=bool(pct))
+    match = re.fullmatch(r"(SMA\d+) (above|below) (SMA\d+)", value)
+    if match and match.group(1) == column:
+        # Relative distances r = price / SMA - 1, so SMAa > SMAb <=> rb > ra
+        other = match.group(3)
+        return _compare_columns(other, column, above=match.group(2) == "above")
+    # Crosses depend on the previous session, which the snapshot doesn't hold
+    return None
+
+
+def _compile_high_low(value: str) -> Optional[Mask]:
+    if value == "New High":
+        return _between("52W High", 0, np.inf, inclusive=True)
+    if value == "New Low":
+        return _between("52W Low", -np.inf, 0, inclusive=True)
+    match = re.fullmatch(r"(\d+)% or more (below High|above Low)", value)
+    if match:
+        pct = float(match.group(1)) / 100
+        if match.group(2) == "below High":
+            return _between("52W High", -np.inf, -pct, inclusive=True)
+        return _between("52W Low", pct, np.inf, inclusive=True)
+    match = re.fullmatch(r"0-(\d+)% (below High|above Low)", value)
+    if match:
+        pct = float(match.group(1)) / 100
+        if match.group(2) == "below High":
+            return _between("52W High", -pct, 0, inclusive=True)
+        return _between("52W Low", 0, pct, inclusive=True)
+    return None
+
+
+def _compile_move(column: str, value: str) -> Optional[Mask]:
+    """Up, Down, Up 5%, Down 10%, +20%, -15%"""
+    match = re.fullmatch(r"(Up|Down|\+|-)\s*(\d+)?%?", value)
+    if not match:
+        return None
+    pct = float(match.group(2) or 0) / 100
+    up = match.group(1) in ("Up", "+")
+    if pct == 0:
+        return _between(column, 0, np.inf) if up else _between(column, -np.inf, 0)
+    if up:
+        return _between(column, pct, np.inf, inclusive=True)
+    return _between(column, -np.inf, -pct, inclusive=True)
+
+
+def compile_filter(key: str, value: str) -> Optional[Mask]:
+    """Compile a preset filter into a vectorized mask over the snapshot
+
+    Parameters
+    ----------
+    key: str
+        Filter name, as in finviz_model.d_check_screener
+    value: str
+        Filter option
+
+    Returns
+    -------
+    Optional[Tuple[List[str], Callable[[pd.DataFrame], pd.Series]]]
+        Snapshot columns the filter reads and function returning the boolean
+        mask of the rows passing it. None if the filter can't be evaluated locally
+    """
+    if not value or value == "Any":
+        return [], lambda df: pd.Series(True, index=df.index)
+
+    if key == "Country":
+        if value == "Foreign (ex-USA)":
+            return ["Country"], lambda df: df["Country"].notna() & (
+                df["Country"] != "USA"
+            )
+        if value in d_country_groups:
+            countries = d_country_groups[value]
+        elif value in COUNTRIES:
+            countries = {value}
+        else:
+            return None
+        return ["Country"], lambda df: df["Country"].isin(countries)
+
+    if key in d_text_filters:
+        column = d_text_filters[key]
+        return [column], lambda df: df[column] == value
+
+    if key == "Market Cap.":
+        if value not in d_market_cap:
+            return None
+        return _between("Market Cap", *d_market_cap[value])
+
+    if key == "Analyst Recom.":
+        if value not in d_analyst_recom:
+            return None
+        return _between("Recom", *d_analyst_recom[value])
+
+    if key == "Dividend Yield" and value.startswith("None"):
+        return ["Dividend"], lambda df: df["Dividend"].fillna(0) == 0
+
+    if key in ("Performance", "Performance 2"):
+        match = re.fullmatch(r"(\w+) (.+)", value)
+        if not match or match.group(1) not in d_performance_columns:
+            return None
+        return _compile_move(d_performance_columns[match.group(1)], match.group(2))
+
+    if key in d_change_columns:
+        return _compile_move(d_change_columns[key], value)
+
+    if key in d_sma_filters:
+        return _compile_sma(key, value)
+
+    if key == "52-Week High/Low":
+        return _compile_high_low(value)
+
+    if key == "RSI (14)":
+        match = re.fullmatch(r"(Overbought|Oversold) \((\d+)\)", value)
+        if match:
+            level = float(match.group(2))
+            if match.group(1) == "Overbought":
+                return _between("RSI", level, np.inf, inclusive=True)
+            return _between("RSI", -np.inf, level, inclusive=True)
+        bounds = _parse_bounds(value)
+        return _between("RSI", *bounds) if bounds else None
+
+    if key == "Volatility":
+        match = re.fullmatch(r"(Week|Month)\D*?(\d+)%", value)
+        if not match:
+            return None
+        column = "Volatility W" if match.group(1) == "Week" else "Volatility M"
+        return _between(column, float(match.group(2)) / 100, np.inf)
+
+    if key in d_numeric_filters:
+        bounds = _parse_bounds(value)
+        return _between(d_numeric_filters[key], *bounds) if bounds else None
+
+    return None
+
+
+def load_preset(preset_loaded: str) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Read the general settings and the filters set in a preset file
+
+    Parameters
+    ----------
+    preset_loaded: str
+        Preset name
+
+    Returns
+    -------
+    Tuple[Dict[str, str], Dict[str, str]]
+        General settings (Order, Signal) and filters of the preset
+    """
+    preset_filter = configparser.RawConfigParser()
+    preset_filter.optionxform = str  # type: ignore
+    preset_filter.read(presets_path + preset_loaded + ".ini")
+
+    d_general = {k: v for k, v in preset_filter["General"].items() if v}
+    d_filters = {
+        **preset_filter["Descriptive"],
+        **preset_filter["Fundamental"],
+        **preset_filter["Technical"],
+    }
+    return d_general, {k: v for k, v in d_filters.items() if v}
+
+
+def compile_preset(
+    d_general: Dict[str, str], d_filters: Dict[str, str], columns: List[str]
+) -> Tuple[List[Tuple[str, str]], str, List[str]]:
+    """Check which settings of a preset can be evaluated on the snapshot
+
+    Parameters
+    ----------
+    d_general: Dict[str, str]
+        General settings of the preset: Order and Signal
+    d_filters: Dict[str, str]
+        Filters of the preset
+    columns: List[str]
+        Columns available in the snapshot
+
+    Returns
+    -------
+    Tuple[List[Tuple[str, str]], str, List[str]]
+        Filters to apply, snapshot column to order by and the settings that
+        can't be evaluated locally
+    """
+    filters = [(key, value) for key, value in d_filters.items() if value]
+    unsupported = []
+
+    signal = d_general.get("Signal") or "Any"
+    if signal in d_signal_filters:
+        filters.append(d_signal_filters[signal])
+    elif signal != "Any":
+        unsupported.append(f"Signal = {signal}")
+
+    compiled = []
+    for key, value in filters:
+        mask = compile_filter(key, value)
+        if mask is None or not set(mask[0]) <= set(columns):
+            unsupported.append(f"{key} = {value}")
+        else:
+            compiled.append((key, value))
+
+    order = d_general.get("Order") or "Ticker"
+    order_column = d_order_columns.get(order, "")
+    if order_column not in columns:
+        unsupported.append(f"Order = {order}")
+
+    return compiled, order_column, unsupported
+
+
+def screen_presets(
+    df_snapshot: pd.DataFrame,
+    presets: Dict[str, Tuple[List[Tuple[str, str]], str]],
+    ascend: bool = False,
+) -> Dict[str, pd.DataFrame]:
+    """Screen the snapshot with several presets in a single pass
+
+    Masks shared by several presets are only computed once.
+
+    Parameters
+    ----------
+    df_snapshot: pd.DataFrame
+        Snapshot, from load_snapshot
+    presets: Dict[str, Tuple[List[Tuple[str, str]], str]]
+        Filters and order column of each preset, from compile_preset
+    ascend: bool
+        Order of the stocks screened
+
+    Returns
+    -------
+    Dict[str, pd.DataFrame]
+        Rows of the snapshot passing each preset
+    """
+    d_masks: Dict[Tuple[str, str], np.ndarray] = {}
+    d_results = {}
+    for preset, (filters, order_column) in presets.items():
+        selected = np.ones(len(df_snapshot), dtype=bool)
+        for key, value in filters:
+            if (key, value) not in d_masks:
+                _, mask = compile_filter(key, value)  # type: ignore
+                d_masks[(key, value)] = mask(df_snapshot).to_numpy(dtype=bool)
+            selected &= d_masks[(key, value)]
+        d_results[preset] = df_snapshot[selected].sort_values(
+            by=order_column, ascending=ascend, na_position="last", kind="mergesort"
+        )
+    return d_results
+
+
+def get_local_screener_data(
+    d_general: Dict[str, str],
+    d_filters: Dict[str, str],
+    data_type: str = "",
+    ascend: bool = False,
+) -> Optional[pd.DataFrame]:
+    """Screen the local snapshot with a preset, when possible
+
+    Parameters
+    ----------
+    d_general: Dict[str, str]
+        General settings of the preset: Order and Signal
+    d_filters: Dict[str, str]
+        Filters of the preset
+    data_type: str
+        Screener view whose columns are returned, all columns if empty
+    ascend: bool
+        Order of the stocks screened
+
+    Returns
+    -------
+    Optional[pd.DataFrame]
+        Stocks passing the preset. None when there is no recent snapshot with
+        the view, or when the preset can't be evaluated locally
+    """
+    df_snapshot, meta = load_snapshot()
+    if df_snapshot.empty or (data_type and data_type not in meta["columns"]):
+        return None
+
+    filters, order_column, unsupported = compile_preset(
+        d_general, d_filters, list(df_snapshot.columns)
+    )
+    if unsupported:
+        return None
+
+    df_screen = screen_presets(
+        df_snapshot, {"preset": (filters, order_column)}, ascend
+    )["preset"]
+    if data_type:
+        df_screen = df_screen[meta["columns"][data_type]]
+    return df_screen.reset_index(drop=True)
+
+
+def get_local_presets_data(
+    presets: List[str], ascend: bool = False
+) -> Tuple[Dict[str, pd.DataFrame], Dict[str, List[str]]]:
+    """Screen the local snapshot with several preset files at once
+
+    Parameters
+    ----------
+    presets: List[str]
+        Preset names
+    ascend: bool
+        Order of the stocks screened
+
+    Returns
+    -------
+    Tuple[Dict[str, pd.DataFrame], Dict[str, List[str]]]
+        Stocks passing each preset that can be evaluated locally, and the
+        settings that can't be evaluated locally for the others
+    """
+    df_snapshot, _ = load_snapshot()
+    if df_snapshot.empty:
+        return {}, {preset: ["No recent snapshot"] for preset in presets}
+
+    d_compiled = {}
+    d_unsupported = {}
+    for preset in presets:
+        d_general, d_filters = load_preset(preset)
+        filters, order_column, unsupported = compile_preset(
+            d_general, d_filters, list(df_snapshot.columns)
+        )
+        if unsupported:
+            d_unsupported[preset] = unsupported
+        else:
+            d_compiled[preset] = (filters, order_column)
+
+    return screen_presets(df_snapshot, d_compiled, ascend), d_unsupported
@@ -0,0 +1,104 @@
+""" Local screener view """
+__docformat__ = "numpy"
+
+import os
+from typing import List
+
+import pandas as pd
+from tabulate import tabulate
+
+from gamestonk_terminal import feature_flags as gtff
+from gamestonk_terminal.helper_funcs import export_data
+from gamestonk_terminal.stocks.screener import snapshot_model
+
+
+def display_snapshot(data_types: List[str]):
+    """Download the finviz universe used to screen presets locally
+
+    Parameters
+    ----------
+    data_types: List[str]
+        Screener views to download: overview, valuation, financial, ownership,
+        performance, technical
+    """
+    df_snapshot = snapshot_model.refresh_snapshot(data_types)
+    print(
+        f"Snapshot of {len(df_snapshot)} tickers with {len(df_snapshot.columns)} "
+        f"fields saved. Presets are screened locally for the next "
+        f"{snapshot_model.SNAPSHOT_MAX_AGE}.\n"
+    )
+
+
+def display_presets(
+    presets: List[str], limit: int = 10, ascend: bool = False, export: str = ""
+) -> List[str]:
+    """Screen several presets at once on the local snapshot
+
+    Parameters
+    ----------
+    presets: List[str]
+        Preset names
+    limit: int
+        Number of tickers displayed per preset
+    ascend: bool
+        Order of the stocks screened
+    export: str
+        Export dataframe data to csv,json,xlsx file
+
+    Returns
+    -------
+    List[str]
+        Tickers passing at least one preset, in the order displayed
+    """
+    d_results, d_unsupported = snapshot_model.get_local_presets_data(presets, ascend)
+    if not d_results:
+        print(
+            "No preset could be screened locally, "
+            "run snapshot to download the universe first.\n"
+        )
+        return []
+
+    df_presets = pd.DataFrame(
+        [
+            [
+                preset,
+                len(df_screen),
+                ", ".join(df_screen["Ticker"].head(limit)),
+            ]
+            for preset, df_screen in d_results.items()
+        ],
+        columns=["Preset", "Matches", "Tickers"],
+    )
+
+    if gtff.USE_TABULATE_DF:
+        print(
+            tabulate(
+                df_presets,
+                headers=df_presets.columns,
+                showindex=False,
+                tablefmt="fancy_grid",
+            ),
+        )
+    else:
+        print(df_presets.to_string(index=False))
+    print("")
+
+    if d_unsupported:
+        print("Presets to screen with finviz, as they can't be evaluated locally:")
+        for preset, unsupported in d_unsupported.items():
+            print(f"   {preset}: {', '.join(unsupported)}")
+        print("")
+
+    export_data(
+        export,
+        os.path.dirname(os.path.abspath(__file__)),
+        "batch",
+        df_presets,
+    )
+
+    tickers: List[str] = []
+    for df_screen in d_results.values():
+        for ticker in df_screen["Ticker"].head(limit):
+            if ticker not in tickers:
+                tickers.append(ticker)
+    return tickers
@@ -4,7 +4,7 @@ import configparser
 import datetime
 import os
 import random
-from typing import List
+from typing import Dict, List
 import numpy as np
 import pandas as pd
 
@@ -19,7 +19,7 @@ from gamestonk_terminal.helper_funcs import (
     export_data,
     plot_autoscale,
 )
-from gamestonk_terminal.stocks.screener import finviz_model
+from gamestonk_terminal.stocks.screener import finviz_model, snapshot_model
 
 register_matplotlib_converters()
 
@@ -62,6 +62,8 @@ def historical(
     """
     screen = ticker.Ticker()
     if preset_loaded in finviz_model.d_signals:
+        d_general = {"Signal": finviz_model.d_signals[preset_loaded]}
+        d_filters: Dict[str, str] = {}
         screen.set_filter(signal=finviz_model.d_signals[preset_loaded])
 
     else:
@@ -69,7 +71,7 @@ def historical(
         preset_filter.optionxform = str  # type: ignore
         preset_filter.read(presets_path + preset_loaded + ".ini")
 
-        d_general = preset_filter["General"]
+        d_general = dict(preset_filter["General"])
         d_filters = {
             **preset_filter["Descriptive"],
             **preset_filter["Fundamental"],
@@ -83,7 +85,12 @@ def historical(
         else:
             screen.set_filter(filters_dict=d_filters)
 
-    l_stocks = screen.ScreenerView(verbose=0)
+    # Screen the local snapshot of the universe when the preset allows it
+    df_local = snapshot_model.get_local_screener_data(d_general, d_filters)
+    if df_local is not None:
+        l_stocks = list(df_local["Ticker"])
+    else:
+        l_stocks = screen.ScreenerView(verbose=0)
     limit_random_stocks = False
 
     if l_stocks:
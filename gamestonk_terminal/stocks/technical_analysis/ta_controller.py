@@ -29,6 +29,7 @@ from gamestonk_terminal.stocks.technical_analysis import (
 )
 from gamestonk_terminal.common.technical_analysis import (
     custom_indicators_view,
+    indicators_view,
     momentum_view,
     overlap_model,
     overlap_view,
@@ -70,6 +71,7 @@ class TechnicalAnalysisController(BaseController):
         "adosc",
         "obv",
         "fib",
+        "multi",
     ]
 
     def __init__(
@@ -141,6 +143,7 @@ Volume:
     obv         on balance volume
 Custom:
     fib         fibonacci retracement
+    multi       several indicators computed at once
 """
         print(help_str)
 
@@ -1392,3 +1395,48 @@ Custom:
                 end_date=ns_parser.end,
                 export=ns_parser.export,
             )
+
+    def call_multi(self, other_args: List[str]):
+        """Process multi command"""
+        parser = argparse.ArgumentParser(
+            add_help=False,
+            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+            prog="multi",
+            description="""
+                Computes several technical indicators at once, sharing intermediate
+                moving averages and ranges between them. Indicators are given as
+                name_param1_param2, e.g. ema_20,rsi_14,macd_12_26_9,bbands_20_2.
+                Omitted parameters take their default values.
+            """,
+        )
+        parser.add_argument(
+            "-i",
+            "--indicators",
+            dest="indicators",
+            type=lambda s: [str(item).lower() for item in s.split(",")],
+            default=["ema_20", "sma_50", "rsi_14", "macd_12_26_9", "bbands_20_2"],
+            help="Indicators separated by comma",
+        )
+        parser.add_argument(
+            "-n",
+            "--num",
+            dest="num",
+            type=check_positive,
+            default=5,
+            help="Number of last bars to show",
+        )
+        if other_args and "-" not in other_args[0][0]:
+            other_args.insert(0, "-i")
+
+        ns_parser = parse_known_args_and_warn(
+            parser, other_args, EXPORT_ONLY_RAW_DATA_ALLOWED
+        )
+        if ns_parser:
+            indicators_view.display_indicators(
+                s_ticker=self.ticker,
+                s_interval=self.interval,
+                df_stock=self.stock,
+                indicators=ns_parser.indicators,
+                num=ns_parser.num,
+                export=ns_parser.export,
+            )
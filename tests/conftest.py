@@ -432,3 +432,13 @@ def recorder(
         yield recorder
         recorder.persist()
         recorder.assert_equal()
+
+
+@pytest.fixture
+def cache_dir(mocker, tmp_path: pathlib.Path) -> pathlib.Path:
+    """Points the terminal cache folder to a temporary directory."""
+    mocker.patch(
+        target="gamestonk_terminal.config_terminal.CACHE_DIR",
+        new=str(tmp_path),
+    )
+    return tmp_path
@@ -0,0 +1,79 @@
+# IMPORTATION STANDARD
+import os
+
+# IMPORTATION THIRDPARTY
+import numpy as np
+import pandas as pd
+import pytest
+
+# IMPORTATION INTERNAL
+from gamestonk_terminal.alternative.covid import covid_model
+
+CSV = (
+    "Province/State,Country/Region,Lat,Long,1/1/22,1/2/22,1/3/22,1/4/22,1/5/22\n"
+    ",Albania,0,0,10,20,40,80,160\n"
+    "North,Canada,0,0,1,2,3,4,5\n"
+    "South,Canada,0,0,1,2,3,4,5\n"
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(cache_dir):
+    covid_model._TIME_SERIES.clear()
+    yield cache_dir
+
+
+def mock_response(mocker, status_code=200, content=CSV.encode()):
+    response = mocker.Mock(status_code=status_code, content=content)
+    response.headers = {"ETag": '"v1"'}
+    return response
+
+
+def test_get_time_series(mocker, cache_dir):
+    mock_get = mocker.patch.object(
+        covid_model.requests, "get", return_value=mock_response(mocker)
+    )
+
+    data = covid_model.get_time_series(covid_model.global_cases_time_series)
+    assert data.index.tolist() == ["Albania", "Canada"]
+    assert data.loc["Canada"].tolist() == [2, 4, 6, 8, 10]
+    assert isinstance(data.columns, pd.DatetimeIndex)
+    assert os.path.isfile(
+        os.path.join(cache_dir, "covid", "time_series_covid19_confirmed_global.csv")
+    )
+
+    # Recent enough not to be checked again
+    assert covid_model.get_time_series(covid_model.global_cases_time_series) is data
+    assert mock_get.call_count == 1
+
+    # Unchanged since, read from the cache
+    mock_get.return_value = mock_response(mocker, 304, b"")
+    covid_model._TIME_SERIES.clear()
+    cached = covid_model.get_time_series(
+        covid_model.global_cases_time_series, refresh=True
+    )
+    assert mock_get.call_args[1]["headers"] == {"If-None-Match": '"v1"'}
+    pd.testing.assert_frame_equal(cached, data)
+
+
+def test_get_slopes():
+    rng = np.random.default_rng(3)
+    data = pd.DataFrame(
+        np.cumsum(rng.uniform(0, 100, (4, 60)), axis=1),
+        index=["A", "B", "C", "D"],
+    )
+
+    slopes = covid_model.get_slopes(data, [7, 30, 60])
+    for window in [7, 30, 60]:
+        for country, values in data.iterrows():
+            expected = np.polyfit(np.arange(window), values.iloc[-window:], 1)[0]
+            assert slopes.loc[country, window] == pytest.approx(expected)
+
+    # Increase over the window below the threshold
+    data.loc["B"] = 5.0
+    slopes = covid_model.get_slopes(data, [7, 30], threshold=0)
+    assert slopes.loc["B"].isna().all()
+    assert slopes.drop("B").notna().all().all()
+
+    with pytest.raises(ValueError):
+        covid_model.get_slopes(data, [61])
@@ -0,0 +1,20 @@
+# IMPORTATION THIRDPARTY
+import pandas as pd
+import pytest
+
+# IMPORTATION INTERNAL
+from gamestonk_terminal.alternative.covid import covid_view
+
+
+@pytest.mark.parametrize("days_back", [1, 6, [3, 6]])
+def test_display_country_slopes_invalid_days(mocker, days_back):
+    mocker.patch.object(
+        covid_view.covid_model,
+        "get_time_series",
+        return_value=pd.DataFrame([[1, 2, 3, 4, 5]], index=["Albania"]),
+    )
+    mock_print = mocker.patch.object(covid_view.t_console, "print")
+
+    covid_view.display_country_slopes(days_back=days_back)
+
+    mock_print.assert_called_once_with("Windows must be between 2 and 5 days\n")
@@ -0,0 +1,95 @@
+# IMPORTATION STANDARD
+
+# IMPORTATION THIRDPARTY
+import numpy as np
+import pandas as pd
+import pytest
+
+# IMPORTATION INTERNAL
+from gamestonk_terminal.common.quantitative_analysis import rolling_model
+
+
+@pytest.fixture
+def df_prices():
+    rng = np.random.default_rng(5)
+    df = pd.DataFrame(
+        {
+            "AAA": 300 + np.cumsum(rng.normal(0, 0.05, 700)),
+            "BBB": 10 * np.exp(np.cumsum(rng.normal(0, 0.01, 700))),
+        },
+        index=pd.date_range("2021-01-01", periods=700, freq="T"),
+    )
+    df.iloc[100:110, 1] = np.nan
+    df.iloc[300, 0] = np.nan
+    return df
+
+
+@pytest.mark.parametrize(
+    "center, min_periods",
+    [(False, None), (True, 1), (False, 3)],
+)
+def test_get_rolling_statistics(df_prices, center, min_periods):
+    df_stats = rolling_model.get_rolling_statistics(
+        df_prices,
+        [5, 14, 60],
+        rolling_model.ROLLING_STATISTICS,
+        center=center,
+        min_periods=min_periods,
+    )
+
+    assert df_stats.shape == (700, 6 * 3 * 2)
+    for length in [5, 14, 60]:
+        rolling = df_prices.rolling(length, center=center, min_periods=min_periods)
+        for statistic in rolling_model.ROLLING_STATISTICS:
+            if statistic == "count":
+                expected = (
+                    df_prices.notna()
+                    .rolling(length, center=center, min_periods=0)
+                    .sum()
+                )
+            else:
+                expected = getattr(rolling, statistic)()
+            pd.testing.assert_frame_equal(
+                df_stats[statistic][length],
+                expected,
+                check_names=False,
+                # pandas adds and removes each value from running sums, its
+                # higher moments of short windows are off by about 1e-4
+                rtol=1e-3 if statistic in ("skew", "kurt") else 1e-6,
+                atol=1e-10,
+            )
+
+
+def test_get_rolling_statistics_flat():
+    data = pd.Series([5.0] * 10 + [6.0, 4.0, 7.0, 5.0, 3.0], name="flat")
+
+    df_stats = rolling_model.get_rolling_statistics(
+        data, 5, ["mean", "std", "skew", "kurt"]
+    )
+
+    assert list(df_stats.columns) == [
+        ("mean", 5, "flat"),
+        ("std", 5, "flat"),
+        ("skew", 5, "flat"),
+        ("kurt", 5, "flat"),
+    ]
+    assert (df_stats["std"][5]["flat"][4:10] == 0).all()
+    assert df_stats["skew"][5]["flat"][4:10].isna().all()
+    assert df_stats["kurt"][5]["flat"][4:10].isna().all()
+    assert df_stats["kurt"][5]["flat"].iloc[-1] == pytest.approx(data.iloc[-5:].kurt())
+
+
+def test_get_rolling_statistics_invalid():
+    with pytest.raises(ValueError):
+        rolling_model.get_rolling_statistics(pd.Series([1.0, 2.0]), 0)
+    with pytest.raises(ValueError):
+        rolling_model.get_rolling_statistics(pd.Series([1.0, 2.0]), 2, ["median"])
+
+
+def test_get_spread(df_prices):
+    df_sd, df_var = rolling_model.get_spread(df_prices["AAA"], 14)
+
+    assert list(df_sd.columns) == ["STDEV_14"]
+    assert list(df_var.columns) == ["VAR_14"]
+    expected = df_prices["AAA"].rolling(14).std().dropna()
+    np.testing.assert_allclose(df_sd["STDEV_14"], expected, rtol=1e-6)
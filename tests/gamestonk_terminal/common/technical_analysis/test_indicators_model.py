@@ -0,0 +1,190 @@
+# IMPORTATION STANDARD
+
+# IMPORTATION THIRDPARTY
+import numpy as np
+import pandas as pd
+import pytest
+
+# IMPORTATION INTERNAL
+from gamestonk_terminal.common.technical_analysis import indicators_model
+
+
+def get_mock_stock(size: int = 300) -> pd.DataFrame:
+    close = 100 + np.cumsum(np.sin(np.arange(size) / 7))
+    return pd.DataFrame(
+        {
+            "Open": close - 0.5,
+            "High": close + 1,
+            "Low": close - 1.5,
+            "Close": close,
+            "Adj Close": close,
+            "Volume": 1e6 + 1e5 * np.cos(np.arange(size)),
+        },
+        index=pd.date_range("2021-01-01", periods=size),
+    )
+
+
+def get_mock_intraday(size: int = 400) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    close = 100 + np.cumsum(rng.normal(0, 1, size))
+    open_ = close + rng.normal(0, 0.5, size)
+    # Some bars without a range or a price change
+    open_[::50] = close[::50]
+    close[1::60] = close[::60][: len(close[1::60])]
+    high = np.maximum(open_, close) + rng.uniform(0, 1, size)
+    low = np.minimum(open_, close) - rng.uniform(0, 1, size)
+    high[::50] = low[::50] = close[::50]
+    return pd.DataFrame(
+        {
+            "Open": open_,
+            "High": high,
+            "Low": low,
+            "Close": close,
+            "Volume": rng.integers(1_000, 10_000, size).astype(float),
+        },
+        index=pd.date_range("2021-01-04 09:30", periods=size, freq="60min"),
+    )
+
+
+def reference_indicator(ta, name: str, df: pd.DataFrame) -> pd.DataFrame:
+    """The indicator as pandas_ta computes it, with the engine defaults"""
+    params = dict(indicators_model.INDICATORS[name])
+    high, low, close, volume = df["High"], df["Low"], df["Close"], df["Volume"]
+    if name in ("sma", "ema", "wma", "hma", "zlma", "macd", "rsi", "bbands", "cg"):
+        df_ta = getattr(ta, name)(close, **params)
+    elif name == "vwap":
+        df_ta = ta.vwap(high, low, close, volume)
+    elif name == "cci":
+        df_ta = ta.cci(high, low, close, length=params["length"], c=params["scalar"])
+    elif name in ("fisher", "aroon", "donchian"):
+        df_ta = getattr(ta, name)(high, low, **params)
+    elif name in ("ad", "adosc"):
+        use_open = params.pop("use_open")
+        df_ta = getattr(ta, name)(
+            high, low, close, volume, open_=df["Open"] if use_open else None, **params
+        )
+    elif name == "obv":
+        df_ta = ta.obv(close, volume)
+    else:
+        df_ta = getattr(ta, name)(high, low, close, **params)
+    if isinstance(df_ta, pd.Series):
+        df_ta = df_ta.to_frame()
+    # pandas_ta leaves out the rows before the first stochastic, the engine keeps
+    # every row of the loaded data
+    return df_ta.reindex(df.index)
+
+
+@pytest.mark.parametrize("name", list(indicators_model.INDICATORS))
+def test_pandas_ta_parity(name):
+    ta = pytest.importorskip("pandas_ta")
+    df_stock = get_mock_intraday()
+    engine = indicators_model.IndicatorEngine(df_stock, "60min")
+
+    pd.testing.assert_frame_equal(
+        engine.compute(name), reference_indicator(ta, name, df_stock), check_freq=False
+    )
+
+
+@pytest.mark.parametrize(
+    "name, params",
+    [
+        ("ema", {"length": 5}),
+        ("macd", {"fast": 5, "slow": 35, "signal": 5}),
+        ("rsi", {"length": 5, "scalar": 100.0, "drift": 2}),
+        ("bbands", {"length": 10, "std": 1.5, "mamode": "ema"}),
+        ("kc", {"length": 10, "scalar": 1.5, "mamode": "sma"}),
+        ("stoch", {"k": 5, "d": 2, "smooth_k": 4}),
+        ("ad", {"use_open": True}),
+        ("adosc", {"fast": 5, "slow": 20, "use_open": True}),
+    ],
+)
+def test_pandas_ta_parity_params(mocker, name, params):
+    ta = pytest.importorskip("pandas_ta")
+    mocker.patch.dict(indicators_model.INDICATORS, {name: params})
+    df_stock = get_mock_intraday()
+    engine = indicators_model.IndicatorEngine(df_stock, "60min")
+
+    pd.testing.assert_frame_equal(
+        engine.compute(name), reference_indicator(ta, name, df_stock), check_freq=False
+    )
+
+
+@pytest.mark.parametrize(
+    "spec, expected",
+    [
+        ("ema", ("ema", {"length": 20})),
+        ("macd_5_10", ("macd", {"fast": 5, "slow": 10, "signal": 9})),
+        ("bbands_20_2", ("bbands", {"length": 20, "std": 2.0, "mamode": "sma"})),
+        ("ad_1", ("ad", {"use_open": True})),
+    ],
+)
+def test_parse_spec(spec, expected):
+    assert indicators_model.parse_spec(spec) == expected
+
+
+@pytest.mark.parametrize("spec", ["foo_1", "ema_1_2"])
+def test_parse_spec_invalid(spec):
+    with pytest.raises(ValueError):
+        indicators_model.parse_spec(spec)
+
+
+def test_get_indicators():
+    df_stock = get_mock_stock()
+    df_ta = indicators_model.get_indicators(
+        df_stock,
+        "1440min",
+        [
+            "sma_10",
+            "ema_10",
+            "rsi_14",
+            "macd_12_26_9",
+            "stoch",
+            "bbands_20_2",
+            "donchian",
+            "kc_20_2",
+            "cci_14",
+            "ad",
+            "adosc",
+            "obv",
+        ],
+    )
+
+    assert df_ta.index.equals(df_stock.index)
+    assert list(df_ta.columns[:4]) == [
+        "SMA_10",
+        "EMA_10",
+        "RSI_14",
+        "MACD_12_26_9",
+    ]
+    assert "BBM_20_2.0" in df_ta.columns
+    assert "KCBe_20_2.0" in df_ta.columns
+    np.testing.assert_allclose(
+        df_ta["SMA_10"].dropna(),
+        df_stock["Adj Close"].rolling(10).mean().dropna(),
+    )
+    assert df_ta["RSI_14"].dropna().between(0, 100).all()
+
+
+def test_get_engine_memoized():
+    df_stock = get_mock_stock()
+    engine = indicators_model.get_engine(df_stock, "1440min")
+
+    assert indicators_model.get_engine(df_stock, "1440min") is engine
+    first = engine.compute("ema", length=20)
+    assert engine.compute("ema", length=20) is first
+    # The keltner channel basis reuses the EMA of the close
+    np.testing.assert_array_equal(
+        engine.ema("close", 20).values, engine.compute("kc")["KCBe_20_2.0"].values
+    )
+    assert ("ema", "close", 20) in engine.cache
+
+
+def test_volume_indicators():
+    engine = indicators_model.IndicatorEngine(get_mock_stock().drop(columns="Volume"))
+
+    for name in indicators_model.INDICATORS:
+        if name in indicators_model.VOLUME_INDICATORS:
+            with pytest.raises(KeyError):
+                engine.compute(name)
+        else:
+            assert not engine.compute(name).empty
@@ -0,0 +1,109 @@
+# IMPORTATION STANDARD
+
+# IMPORTATION THIRDPARTY
+import numpy as np
+import pandas as pd
+import pytest
+
+# IMPORTATION INTERNAL
+from gamestonk_terminal.common.technical_analysis import (
+    indicators_model,
+    streaming_model,
+)
+
+
+def get_mock_intraday(size: int = 900) -> pd.DataFrame:
+    close = 100 + np.cumsum(np.sin(np.arange(size) / 5) / 10)
+    return pd.DataFrame(
+        {
+            "Open": close - 0.02,
+            "High": close + 0.05 + np.abs(np.cos(np.arange(size))) / 10,
+            "Low": close - 0.05 - np.abs(np.sin(np.arange(size))) / 10,
+            "Close": close,
+            "Volume": 1e4 + 1e3 * np.cos(np.arange(size) / 3),
+        },
+        index=pd.date_range("2022-01-03 09:30", periods=size, freq="1min"),
+    )
+
+
+SPECS = [
+    "sma_20",
+    "ema_20",
+    "rsi_14",
+    "macd_12_26_9",
+    "bbands_20_2",
+    "atr_14",
+    "kc_20_2",
+    "obv",
+    "ad",
+    "ad_1",
+    "vwap",
+]
+
+
+def test_streaming_matches_batch():
+    df_stock = get_mock_intraday()
+    expected = indicators_model.get_indicators(df_stock, "1min", SPECS)
+
+    streaming = streaming_model.StreamingIndicators(SPECS, "1min")
+    # Refreshed frames keep growing, only the new bars and the last one are processed
+    result = pd.concat(
+        [
+            streaming.update_frame(df_stock.iloc[:300]),
+            streaming.update_frame(df_stock.iloc[:600]),
+            streaming.update_frame(df_stock),
+        ]
+    )
+    assert result.index.duplicated().sum() == 2
+    result = result[~result.index.duplicated(keep="last")]
+
+    assert result.index.equals(df_stock.index)
+    assert list(result.columns) == list(expected.columns)
+    np.testing.assert_allclose(result.values, expected.values, rtol=1e-7, atol=1e-6)
+
+
+def test_streaming_update():
+    df_stock = get_mock_intraday(size=50)
+    streaming = streaming_model.StreamingIndicators(["ema_10", "obv"])
+    streaming.update_frame(df_stock.iloc[:-1])
+
+    last = df_stock.iloc[-1]
+    values = streaming.update(
+        {
+            "open": last["Open"],
+            "high": last["High"],
+            "low": last["Low"],
+            "close": last["Close"],
+            "volume": last["Volume"],
+            "date": df_stock.index[-1],
+        }
+    )
+
+    assert streaming.last_date == df_stock.index[-1]
+    assert values["EMA_10"] == pytest.approx(
+        indicators_model.get_indicators(df_stock, "1min", ["ema_10"])["EMA_10"].iloc[-1]
+    )
+
+
+def test_streaming_forming_bar():
+    df_stock = get_mock_intraday(size=120)
+    streaming = streaming_model.StreamingIndicators(SPECS, "1min")
+
+    # The last bar is still forming when first fed
+    forming = df_stock.iloc[:100].copy()
+    forming.iloc[-1, forming.columns.get_loc("Close")] += 0.3
+    streaming.update_frame(forming)
+    streaming.update_frame(df_stock.iloc[:100])
+    result = streaming.update_frame(df_stock)
+
+    expected = indicators_model.get_indicators(df_stock, "1min", SPECS)
+    assert result.index.equals(df_stock.index[99:])
+    np.testing.assert_allclose(
+        result.values, expected.values[99:], rtol=1e-7, atol=1e-6
+    )
+
+
+@pytest.mark.parametrize("spec", ["wma_10", "bbands_20_2_ema"])
+def test_streaming_unsupported(spec):
+    with pytest.raises(ValueError):
+        streaming_model.StreamingIndicators([spec])
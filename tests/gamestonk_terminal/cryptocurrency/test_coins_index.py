@@ -0,0 +1,91 @@
+# IMPORTATION STANDARD
+import difflib
+import os
+
+# IMPORTATION THIRDPARTY
+import numpy as np
+import pytest
+
+# IMPORTATION INTERNAL
+from gamestonk_terminal.cryptocurrency import coins_index
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(cache_dir):
+    coins_index.clear_cache()
+    yield cache_dir
+    coins_index.clear_cache()
+
+
+def test_index_is_persisted_and_memory_mapped(cache_dir):
+    expected = coins_index.build_all_coins_df()
+    assert os.path.isfile(os.path.join(cache_dir, "coins_index", "meta.json")) is False
+
+    df = coins_index.get_all_coins_df()
+    assert os.path.isfile(os.path.join(cache_dir, "coins_index", "meta.json"))
+    assert list(df.columns) == coins_index.INDEX_COLUMNS
+    assert df.equals(expected)
+
+    coins_index.clear_cache()
+    index = coins_index.load_index()
+    assert isinstance(index["CoinGecko"], np.memmap)
+    assert coins_index.get_all_coins_df().equals(expected)
+
+
+def test_index_is_rebuilt_on_new_version(mocker, cache_dir):
+    coins_index.load_index()
+    coins_index.clear_cache()
+
+    mock_build = mocker.patch(
+        target="gamestonk_terminal.cryptocurrency.coins_index.build_index",
+        wraps=coins_index.build_index,
+    )
+    coins_index.load_index()
+    mock_build.assert_not_called()
+
+    coins_index.clear_cache()
+    mocker.patch(
+        target="gamestonk_terminal.cryptocurrency.coins_index.INDEX_VERSION",
+        new=coins_index.INDEX_VERSION + 1,
+    )
+    coins_index.load_index()
+    mock_build.assert_called_once()
+
+
+def test_index_without_writable_cache(mocker):
+    mocker.patch(
+        target="gamestonk_terminal.cryptocurrency.coins_index._write_index",
+        side_effect=PermissionError,
+    )
+    df = coins_index.get_all_coins_df()
+    assert df.set_index("Symbol").loc["btc"]["CoinGecko"] == "bitcoin"
+
+
+@pytest.mark.parametrize(
+    "word, column, n",
+    [
+        ("bitcoin", "CoinGecko", 10),
+        ("bitcon", "CoinGecko", 10),
+        ("bitcon", "CoinGecko", 3),
+        ("uniswap", "CoinGecko", 10),
+        ("uniswp", "CoinGecko", 10),
+        ("eth", "Symbol", 10),
+        ("btc", "Symbol", 1),
+        ("Polkadot", "Name", 10),
+        ("polkadot", "Name", 5),
+    ],
+)
+def test_get_close_matches(word, column, n):
+    matches = coins_index.get_close_matches(word, column, n=n, cutoff=0.6)
+    vocabulary = coins_index.get_all_coins_df()[column].dropna().unique().tolist()
+
+    assert matches
+    # Same matches, in the same order, as a linear difflib scan
+    assert matches == difflib.get_close_matches(word, vocabulary, n, 0.6)
+
+
+def test_get_close_matches_cutoff():
+    assert coins_index.get_close_matches("zzzzzzzzzzzzzz", "CoinGecko") == []
+    assert coins_index.get_close_matches("é", "Name", cutoff=1) == []
+    with pytest.raises(ValueError):
+        coins_index.get_close_matches("bitcoin", "CoinGecko", n=0)
@@ -1,8 +1,17 @@
+import json
+import os
+
+import pandas as pd
 import pytest
 import requests
 from gamestonk_terminal.economy.fred import fred_model
 
 
+@pytest.fixture(autouse=True)
+def series_folder(cache_dir):
+    return os.path.join(cache_dir, "fred")
+
+
 @pytest.fixture(scope="module")
 def vcr_config():
     return {
@@ -70,3 +79,85 @@ def test_load_data(func, kwargs_dict, recorder):
 
     assert not result_df.empty
     recorder.capture(result_df)
+
+
+def observations(values, start):
+    return pd.Series(values, index=pd.date_range(start, periods=len(values)))
+
+
+def test_get_series_data_store(mocker, series_folder):
+    get_series = mocker.patch.object(
+        fred_model.Fred,
+        "get_series",
+        return_value=observations([1.0, float("nan"), 3.0], "2020-01-01"),
+    )
+
+    first = fred_model.get_series_data("DGS10", "2020-01-01")
+    pd.testing.assert_series_equal(
+        fred_model.get_series_data("DGS10", "2020-01-02"),
+        first.iloc[1:],
+        check_freq=False,
+    )
+    assert get_series.call_count == 1
+
+    def expire():
+        with open(os.path.join(series_folder, "DGS10.json"), encoding="utf8") as f:
+            meta = json.load(f)
+        meta["updated"] -= fred_model.SERIES_MAX_AGE + 1
+        with open(os.path.join(series_folder, "DGS10.json"), "w", encoding="utf8") as f:
+            json.dump(meta, f)
+
+    def stored_dates():
+        return pd.read_csv(os.path.join(series_folder, "DGS10.csv"), index_col=0).index
+
+    # Only the observations since the last stored one are pulled once stale
+    expire()
+    get_series.return_value = observations([3.5, 4.0], "2020-01-03")
+
+    expected = observations([1.0, float("nan"), 3.5, 4.0], "2020-01-01")
+    data = fred_model.get_series_data("DGS10", "2020-01-01")
+    assert get_series.call_args.args == ("DGS10", pd.Timestamp("2020-01-03"))
+    pd.testing.assert_series_equal(data, expected, check_freq=False)
+
+    _, stored = fred_model._load_series("DGS10")
+    pd.testing.assert_series_equal(stored, expected, check_freq=False)
+    assert stored_dates().is_unique
+
+    # An unrevised last observation is not stored again
+    expire()
+    get_series.return_value = observations([4.0, 5.0], "2020-01-04")
+    fred_model.get_series_data("DGS10", "2020-01-01")
+    expire()
+    get_series.return_value = observations([5.0], "2020-01-05")
+    fred_model.get_series_data("DGS10", "2020-01-01")
+    assert len(stored_dates()) == 5
+    assert stored_dates().is_unique
+
+    # Earlier observations need the whole series again
+    get_series.return_value = observations([0.5] * 6, "2019-12-30")
+    fred_model.get_series_data("DGS10", "2019-12-30")
+    assert get_series.call_args.args == ("DGS10", pd.Timestamp("2019-12-30"))
+    assert get_series.call_count == 5
+
+
+def test_get_aggregated_series_data(mocker):
+    mocker.patch.object(
+        fred_model.Fred,
+        "get_series",
+        side_effect=lambda s_id, _: observations([len(s_id)] * 2, "2021-01-01"),
+    )
+
+    data = fred_model.get_aggregated_series_data(["GDP", "DGS10", "GDP"], "2021-01-01")
+    assert list(data.columns) == ["GDP", "DGS10"]
+    assert list(data["DGS10"]) == [5, 5]
+
+
+def test_check_series_ids(mocker):
+    mocker.patch.object(
+        fred_model,
+        "check_series_id",
+        side_effect=lambda s_id: (s_id != "BAD", {}),
+    )
+
+    checks = fred_model.check_series_ids(["GDP", "BAD"])
+    assert checks == {"GDP": (True, {}), "BAD": (False, {})}
@@ -0,0 +1,117 @@
+# IMPORTATION THIRDPARTY
+import pandas as pd
+import pytest
+
+# IMPORTATION INTERNAL
+from gamestonk_terminal.etf import stockanalysis_model
+
+HOLDINGS = """
+<html><body><table>
+<thead><tr><th>No.</th><th>Symbol</th><th>Name</th><th>Weight</th><th>Shares</th></tr></thead>
+<tbody>
+<tr><td>1</td><td>AAPL</td><td>Apple Inc.</td><td>6.9%</td><td>167,000,000</td></tr>
+<tr><td>2</td><td>MSFT</td><td>Microsoft Corp.</td><td>6.2%</td><td>82,000,000</td></tr>
+</tbody>
+</table></body></html>
+"""
+
+
+def overview_page(symbol):
+    cells = "".join(f"<tr><td>{symbol} {i}</td></tr>" for i in range(34))
+    return f"<html><body><table>{cells}</table></body></html>"
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(cache_dir):
+    yield cache_dir
+
+
+def test_get_etf_holdings(mocker):
+    get = mocker.patch.object(
+        stockanalysis_model.requests,
+        "get",
+        return_value=mocker.Mock(status_code=200, text=HOLDINGS),
+    )
+
+    df = stockanalysis_model.get_etf_holdings("spy")
+    assert list(df.index) == ["AAPL", "MSFT"]
+    assert list(df["% Of Etf"]) == ["6.9%", "6.2%"]
+    assert list(df["Shares"]) == ["167,000,000", "82,000,000"]
+    assert get.call_args.args[0] == "https://stockanalysis.com/etf/spy/holdings/"
+
+    # Parsed pages are kept for the day
+    pd.testing.assert_frame_equal(stockanalysis_model.get_etf_holdings("SPY"), df)
+    assert get.call_count == 1
+
+
+def test_get_etf_tables_cache(mocker, cache_dir):
+    folder = cache_dir / "etf" / "stockanalysis"
+    folder.mkdir(parents=True)
+    (folder / "SPY_holdings_2021-01-04.json").write_text("[]")
+    (folder / "SPY_overview_2021-01-04.json").write_text("[]")
+    get = mocker.patch.object(
+        stockanalysis_model.requests,
+        "get",
+        return_value=mocker.Mock(status_code=200, text="<html></html>"),
+    )
+
+    # Pages without tables are not kept
+    assert stockanalysis_model.get_etf_tables("spy", "holdings") == []
+    assert stockanalysis_model.get_etf_tables("spy", "holdings") == []
+    assert get.call_count == 2
+
+    get.return_value.text = HOLDINGS
+    assert stockanalysis_model.get_etf_tables("spy", "holdings")
+    assert sorted(path.name for path in folder.iterdir()) == [
+        f"SPY_holdings_{stockanalysis_model.date.today()}.json",
+        "SPY_overview_2021-01-04.json",
+    ]
+
+
+def test_get_etf_holdings_not_found(mocker):
+    mocker.patch.object(
+        stockanalysis_model.requests,
+        "get",
+        return_value=mocker.Mock(status_code=404, text=""),
+    )
+
+    assert stockanalysis_model.get_etf_holdings("none").empty
+    assert stockanalysis_model.get_etfs_holdings(["none"])["none"].empty
+
+
+def test_get_look_through_holdings(mocker):
+    holdings = {
+        "spy": pd.DataFrame(
+            {"% Of Etf": ["6.9%", "6.2%"], "Shares": ["1", "2"]},
+            index=["AAPL", "MSFT"],
+        ),
+        "qqq": pd.DataFrame(
+            {"% Of Etf": ["12.1%", "n/a"], "Shares": ["3", "4"]},
+            index=["AAPL", "NVDA"],
+        ),
+        "none": pd.DataFrame(),
+    }
+    mocker.patch.object(
+        stockanalysis_model, "get_etf_holdings", side_effect=holdings.get
+    )
+
+    df = stockanalysis_model.get_look_through_holdings(["spy", "qqq", "none"])
+    assert list(df.index) == ["AAPL", "MSFT", "NVDA"]
+    assert list(df["Weight"]) == [9.5, 3.1, 0]
+    assert list(df["Etfs"]) == ["SPY, QQQ", "SPY", "QQQ"]
+    assert stockanalysis_model.get_look_through_holdings(["none"]).empty
+
+
+def test_compare_etfs(mocker):
+    def get(url, **_):
+        symbol = url.rsplit("/", 1)[-1]
+        if symbol == "bad":
+            return mocker.Mock(status_code=200, text="<html><table></table></html>")
+        return mocker.Mock(status_code=200, text=overview_page(symbol))
+
+    mocker.patch.object(stockanalysis_model.requests, "get", side_effect=get)
+
+    df = stockanalysis_model.compare_etfs(["xlk", "bad", "xle"])
+    assert list(df.columns) == ["XLK", "XLE"]
+    assert df.loc["xlk 0", "XLK"] == "xlk 1"
+    assert stockanalysis_model.compare_etfs(["bad"]).empty
@@ -0,0 +1,92 @@
+# IMPORTATION STANDARD
+import os
+
+# IMPORTATION THIRDPARTY
+import numpy as np
+import pandas as pd
+import pytest
+
+# IMPORTATION INTERNAL
+from gamestonk_terminal.etf import universe_model
+from gamestonk_terminal.etf.screener import screener_model
+
+NAMES = [
+    "SPDR S&P 500 ETF Trust",
+    "iShares Core S&P 500 ETF",
+    "Invesco QQQ Trust",
+    None,
+    "Vanguard Total Bond Market ETF",
+    "ARK Innovation ETF",
+    "iShares MSCI Emerging Markets ETF",
+]
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(mocker, cache_dir):
+    mocker.patch.dict(universe_model._SNAPSHOTS, clear=True)
+    mocker.patch.dict(universe_model._INDEXES, clear=True)
+    yield cache_dir
+
+
+@pytest.mark.parametrize(
+    "query",
+    ["s&p 500", "ETF", "trust", "shares core", "bond market", "nova", "", "xyz"],
+)
+def test_search(query):
+    expected = [
+        i
+        for i, name in enumerate(NAMES)
+        if name is not None and query.lower() in name.lower()
+    ]
+    assert universe_model.search("names", "name", NAMES, query) == expected
+
+
+def test_get_snapshot(mocker):
+    fetch = mocker.Mock(return_value=["SPY", "QQQ"])
+
+    assert universe_model.get_snapshot("list", fetch) == ["SPY", "QQQ"]
+    universe_model._SNAPSHOTS.clear()
+    # Read back from disk
+    assert universe_model.get_snapshot("list", fetch) == ["SPY", "QQQ"]
+    assert fetch.call_count == 1
+
+    fetch.side_effect = ValueError
+    # The stale snapshot is kept when it cannot be downloaded again
+    assert universe_model.get_snapshot("list", fetch, max_age=-1) == ["SPY", "QQQ"]
+    with pytest.raises(ValueError):
+        universe_model.get_snapshot("other", fetch)
+
+
+def test_get_overviews(mocker, cache_dir):
+    response = mocker.Mock(
+        status_code=200, content=b",Price,Assets\nSPY,450,400\n", headers={"ETag": "a"}
+    )
+    get = mocker.patch.object(universe_model.requests, "get", return_value=response)
+
+    df = universe_model.get_overviews()
+    assert list(df.index) == ["SPY"]
+    assert "If-None-Match" not in get.call_args.kwargs["headers"]
+
+    path = os.path.join(cache_dir, "etf", "overviews.pkl")
+    os.utime(path, (0, 0))
+    universe_model._SNAPSHOTS.clear()
+    get.return_value = mocker.Mock(status_code=304)
+    pd.testing.assert_frame_equal(universe_model.get_overviews(), df)
+    assert get.call_args.kwargs["headers"] == {"If-None-Match": "a"}
+    # The unchanged snapshot counts as new again
+    assert os.path.getmtime(path) > 0
+    universe_model.get_overviews()
+    assert get.call_count == 2
+
+
+def test_screen():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        rng.normal(0, 1, (200, 3)), columns=["Price", "Assets", "Expense"]
+    )
+    df.iloc[::7, 1] = np.nan
+    bounds = {"Price": (-0.5, np.inf), "Assets": (-1.0, 1.0)}
+
+    expected = df.query("Price > -0.5").query("Assets > -1.0").query("Assets < 1.0")
+    pd.testing.assert_frame_equal(screener_model.screen(df, bounds), expected)
+    pd.testing.assert_frame_equal(screener_model.screen(df, {}), df)
@@ -0,0 +1,110 @@
+# IMPORTATION STANDARD
+import os
+from datetime import date, datetime
+
+# IMPORTATION THIRDPARTY
+import nbformat
+import pytest
+
+# IMPORTATION INTERNAL
+from gamestonk_terminal.jupyter.reports import reports_model
+
+
+@pytest.fixture(autouse=True)
+def isolated_folders(mocker, cache_dir):
+    mocker.patch(
+        target="gamestonk_terminal.jupyter.reports.reports_model.STORED_FOLDER",
+        new=str(cache_dir / "stored"),
+    )
+    yield cache_dir
+
+
+def mock_execute_notebook(input_path, output_path, parameters, **_):
+    notebook = nbformat.read(input_path, as_version=4)
+    notebook.cells.append(
+        nbformat.v4.new_code_cell(
+            source="print(ticker)",
+            outputs=[
+                nbformat.v4.new_output(
+                    "stream", name="stdout", text=parameters["ticker"]
+                )
+            ],
+        )
+    )
+    nbformat.write(notebook, output_path)
+    return notebook
+
+
+def test_load_report_template():
+    notebook = reports_model.load_report_template("dark_pool")
+
+    assert notebook.cells
+    assert not any(
+        reports_model.EXPORT_CELL_PREFIX in cell.source for cell in notebook.cells
+    )
+
+
+def test_get_report_key():
+    notebook = reports_model.load_report_template("dark_pool")
+    key = reports_model.get_report_key(
+        "dark_pool", notebook, {"ticker": "AMC"}, date(2022, 1, 3)
+    )
+
+    assert key == reports_model.get_report_key(
+        "dark_pool", notebook, {"ticker": "AMC"}, date(2022, 1, 3)
+    )
+    assert key != reports_model.get_report_key(
+        "dark_pool", notebook, {"ticker": "GME"}, date(2022, 1, 3)
+    )
+    assert key != reports_model.get_report_key(
+        "dark_pool", notebook, {"ticker": "AMC"}, date(2022, 1, 4)
+    )
+
+
+def test_get_report_output_name():
+    when = datetime(2021, 7, 25, 19, 35, 17)
+
+    assert (
+        reports_model.get_report_output_name("dark_pool", ["AMC"], when)
+        == "20210725_193517_dark_pool_AMC"
+    )
+    assert (
+        reports_model.get_report_output_name("econ_data", [], when)
+        == "20210725_193517_econ_data"
+    )
+
+
+def test_execute_report_cache(mocker):
+    mock_execute = mocker.patch(
+        target="gamestonk_terminal.jupyter.reports.reports_model.pm.execute_notebook",
+        side_effect=mock_execute_notebook,
+    )
+
+    path, from_cache = reports_model.execute_report("dark_pool", {"ticker": "AMC"})
+    assert not from_cache
+    assert os.path.isfile(path)
+    assert os.path.isfile(path.replace(".html", ".ipynb"))
+    with open(path, encoding="utf-8") as f:
+        assert "AMC" in f.read()
+
+    path, from_cache = reports_model.execute_report("dark_pool", {"ticker": "AMC"})
+    assert from_cache
+    assert os.path.isfile(path)
+    mock_execute.assert_called_once()
+
+    reports_model.execute_report("dark_pool", {"ticker": "AMC"}, use_cache=False)
+    assert mock_execute.call_count == 2
+
+
+def test_clear_old_reports_cache(cache_dir):
+    cache = cache_dir / "reports"
+    cache.mkdir(parents=True)
+    old, new = cache / "old.ipynb", cache / "new.ipynb"
+    old.write_text("{}")
+    new.write_text("{}")
+    os.utime(old, (0, 0))
+
+    reports_model.clear_old_reports_cache()
+
+    assert not old.exists()
+    assert new.exists()
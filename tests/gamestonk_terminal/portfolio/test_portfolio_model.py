@@ -0,0 +1,129 @@
+# IMPORTATION STANDARD
+from datetime import datetime, timedelta
+
+# IMPORTATION THIRDPARTY
+import numpy as np
+import pandas as pd
+import pytest
+
+# IMPORTATION INTERNAL
+from gamestonk_terminal.portfolio import portfolio_model
+
+WINDOW = 30
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(0)
+    index = pd.date_range("2021-01-01", periods=300)
+    market = 100 + np.cumsum(rng.normal(0, 1, 300))
+    assets = pd.DataFrame(
+        {
+            "aapl": 2 * market + rng.normal(0, 1, 300),
+            "msft": -0.5 * market + rng.normal(0, 2, 300),
+        },
+        index=index,
+    )
+    assets.iloc[:40, 1] = np.nan
+    return assets, pd.DataFrame({"Close": market}, index=index)
+
+
+def test_get_rolling_regression(prices):
+    assets, market = prices
+    params = portfolio_model.get_rolling_regression(assets, market, WINDOW)
+
+    assert list(params.columns.levels[0]) == ["Close", "const"]
+    assert params[("Close", "aapl")].iloc[: WINDOW - 1].isna().all()
+    # Windows without observations are left empty, partial ones are fitted
+    assert np.isnan(params[("Close", "msft")].iloc[WINDOW - 1])
+    for col in assets.columns:
+        for end in [45, 60, 300]:
+            y = assets[col].iloc[end - WINDOW : end]
+            x = market["Close"].iloc[end - WINDOW : end][y.notna()]
+            slope, const = np.polyfit(x, y.dropna(), 1)
+            assert params[("Close", col)].iloc[end - 1] == pytest.approx(slope)
+            assert params[("const", col)].iloc[end - 1] == pytest.approx(const)
+
+
+def test_get_rolling_regression_factors(prices):
+    assets, market = prices
+    factors = market.assign(trend=np.arange(len(market)))
+    params = portfolio_model.get_rolling_regression(assets, factors, WINDOW)
+
+    x = np.column_stack([np.ones(WINDOW), factors.iloc[-WINDOW:].to_numpy()])
+    coefs = np.linalg.lstsq(x, assets["aapl"].iloc[-WINDOW:], rcond=None)[0]
+    np.testing.assert_allclose(
+        params.xs("aapl", axis=1, level=1)[["const", "Close", "trend"]].iloc[-1],
+        coefs,
+    )
+
+
+def test_get_rolling_beta(prices):
+    assets, market = prices
+    index = pd.date_range(datetime.now() - timedelta(days=299), periods=300).normalize()
+    assets.index = market.index = index
+    holdings = pd.concat({"Holding": pd.DataFrame(1.0, index, assets.columns)}, axis=1)
+
+    betas = portfolio_model.get_rolling_beta(
+        holdings,
+        pd.concat({"Close": assets}, axis=1),
+        pd.concat({"Market": market}, axis=1),
+        30,
+    )
+
+    assert list(betas.columns) == [
+        "prod_aapl",
+        "prod_msft",
+        "total",
+        "beta_aapl",
+        "beta_msft",
+    ]
+    np.testing.assert_allclose(
+        betas["total"], (betas["beta_aapl"] + betas["beta_msft"]) / 2
+    )
+
+
+def test_convert_df(mocker):
+    days = pd.date_range(end=datetime.now() - timedelta(days=1), periods=6).normalize()
+    portfolio = pd.DataFrame(
+        {
+            "Name": ["cash", "aapl", "msft", "aapl", "amc"],
+            "Type": ["cash", "stock", "stock", "stock", "stock"],
+            "Quantity": [1.0, 10.0, 2.0, 5.0, 4.0],
+            "Date": [days[0], days[1], days[2], days[3], days[3]],
+            "Price": [2000.0, 100.0, 50.0, 120.0, 10.0],
+            "Fees": [np.nan, 1.0, np.nan, 0.0, 0.0],
+            "Side": ["deposit", "Buy", "Buy", "Sell", "Buy"],
+        }
+    )
+    closes = {"aapl": 110.0, "amc": 12.0, "msft": 55.0}
+    mocker.patch.object(
+        portfolio_model.yfinance_model,
+        "get_stocks",
+        return_value=pd.DataFrame(
+            {("Close", ticker): close for ticker, close in closes.items()},
+            index=days,
+        ),
+    )
+    mocker.patch.object(
+        portfolio_model.yfinance_model,
+        "get_dividends",
+        return_value=pd.DataFrame(
+            {("Dividend", ticker): [float(ticker == "aapl")] for ticker in closes},
+            index=days[4:5],
+        ),
+    )
+
+    comb, _ = portfolio_model.convert_df(portfolio)
+
+    last = comb.iloc[-1]
+    assert last[("Quantity", "aapl")] == 5
+    # Half of the position is sold at its average cost
+    assert last[("Cost Basis", "aapl")] == pytest.approx(500.5)
+    assert last[("Profit", "aapl")] == pytest.approx(99.5)
+    assert last[("Cost Basis", "msft")] == pytest.approx(100)
+    # Deposit, purchases, sale and the dividend of the remaining shares
+    assert last[("Cash", "Cash")] == pytest.approx(2000 - 1001 - 100 + 600 - 40 + 5)
+    assert comb["holdings"].iloc[-1] == pytest.approx(5 * 110 + 2 * 55 + 4 * 12)
+    assert comb["total_cost"].iloc[-1] == pytest.approx(500.5 + 100 + 40)
+    assert comb["Holding"].loc[days[1], "aapl"] == pytest.approx(1100)
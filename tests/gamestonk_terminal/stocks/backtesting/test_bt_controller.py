@@ -1,5 +1,6 @@
 # IMPORTATION STANDARD
 import os
+from datetime import datetime
 
 # IMPORTATION THIRDPARTY
 import pandas as pd
@@ -279,6 +280,42 @@ def test_call_func_expect_queue(expected_queue, queue, func):
                 export="csv",
             ),
         ),
+        (
+            "call_basket",
+            "bt_view.display_portfolio_backtest",
+            [
+                "AAPL,MSFT",
+                "--strategy=ema_cross",
+                "--rebalance=weekly",
+                "--start=2021-01-04",
+                "--ema=10",
+                "--short=5",
+                "--long=15",
+                "--periods=2",
+                "--high=80",
+                "--low=20",
+                "--spy",
+                "--no_bench",
+                "--no_short",
+                "--export=csv",
+            ],
+            dict(
+                tickers=["AAPL", "MSFT"],
+                start_date=datetime(2021, 1, 4),
+                strategy="ema_cross",
+                rebalance="weekly",
+                ema_length=10,
+                short_length=5,
+                long_length=15,
+                periods=2,
+                low_rsi=20,
+                high_rsi=80,
+                shortable=False,
+                spy_bt=True,
+                no_bench=True,
+                export="csv",
+            ),
+        ),
     ],
 )
 def test_call_func(tested_func, mocked_func, other_args, called_with, mocker):
@@ -309,6 +346,7 @@ def test_call_func(tested_func, mocked_func, other_args, called_with, mocker):
         "call_ema",
         "call_ema_cross",
         "call_rsi",
+        "call_basket",
     ],
 )
 def test_call_func_no_parser(func, mocker):
@@ -2,6 +2,8 @@
 from datetime import datetime
 
 # IMPORTATION THIRDPARTY
+import numpy as np
+import pandas as pd
 import pytest
 
 # IMPORTATION INTERNAL
@@ -120,3 +122,75 @@ def test_rsi_strategy(mocker):
         shortable=True,
     )
     assert isinstance(back_test_instance, bt.backtest.Result)
+
+
+def get_mock_prices():
+    index = pd.bdate_range("2021-01-04", periods=60)
+    prices = pd.DataFrame(
+        {
+            "aaa": np.linspace(10, 20, 60),
+            "bbb": np.linspace(20, 10, 60),
+            "ccc": 10 + np.sin(np.arange(60) / 3),
+        },
+        index=index,
+    )
+    prices.iloc[:10, 2] = np.nan
+    return prices
+
+
+@pytest.mark.parametrize(
+    "strategy",
+    bt_model.PORTFOLIO_STRATEGIES,
+)
+def test_get_portfolio_signals(strategy):
+    prices = get_mock_prices()
+    signals = bt_model.get_portfolio_signals(
+        prices=prices,
+        strategy=strategy,
+        ema_length=5,
+        short_length=3,
+        long_length=8,
+        periods=5,
+    )
+
+    assert signals.shape == prices.shape
+    assert signals.isin([-1.0, 0.0, 1.0]).all().all()
+    assert (signals["ccc"].iloc[:10] == 0).all()
+
+
+def test_portfolio_backtest_hold():
+    prices = get_mock_prices()[["aaa", "bbb"]]
+    weights = bt_model.get_portfolio_weights(
+        bt_model.get_portfolio_signals(prices, "hold"), "hold"
+    )
+    equity = bt_model.portfolio_backtest(prices, weights, rebalance="yearly")
+
+    # Held from the first close without rebalancing, the value only drifts
+    expected = 100 * (
+        0.5 * prices["aaa"] / prices["aaa"].iloc[0]
+        + 0.5 * prices["bbb"] / prices["bbb"].iloc[0]
+    )
+    np.testing.assert_allclose(equity.values[1:], expected.values[1:])
+
+
+@pytest.mark.parametrize(
+    "rebalance",
+    list(bt_model.REBALANCE_FREQUENCIES.keys()),
+)
+def test_portfolio_backtest(rebalance):
+    prices = get_mock_prices()
+    weights = bt_model.get_portfolio_weights(
+        bt_model.get_portfolio_signals(prices, "ema", ema_length=5), "ema"
+    )
+    equity = bt_model.portfolio_backtest(prices, weights, rebalance=rebalance)
+    stats = bt_model.get_portfolio_stats(equity.to_frame())
+
+    assert equity.iloc[0] == 100
+    assert not equity.isnull().any()
+    assert list(stats.index) == [
+        "Total Return",
+        "CAGR",
+        "Volatility",
+        "Sharpe",
+        "Max Drawdown",
+    ]
@@ -258,6 +258,33 @@ def test_call_func_expect_queue(expected_queue, queue, func):
                 candle_type="h",
             ),
         ),
+        (
+            "call_tcorr",
+            "correlation_view.display_top_correlations",
+            [
+                "--type=c",
+                "--start=2020-12-01",
+                "--limit=5",
+                "--least",
+                "--ticker=mock_similar_1",
+                "--lw",
+                "--window=20",
+                "--workers=4",
+                "--export=csv",
+            ],
+            dict(
+                similar_tickers=["MOCK_SIMILAR_1", "MOCK_SIMILAR_2"],
+                start="2020-12-01",
+                candle_type="c",
+                num=5,
+                least=True,
+                ticker="MOCK_SIMILAR_1",
+                shrinkage=None,
+                window=20,
+                workers=4,
+                export="csv",
+            ),
+        ),
         (
             "call_volume",
             "yahoo_finance_view.display_volume",
@@ -451,6 +478,7 @@ def test_call_func(tested_func, mocked_func, other_args, called_with, mocker):
         "call_rmv",
         "call_historical",
         "call_hcorr",
+        "call_tcorr",
         "call_volume",
         "call_income",
         "call_balance",
@@ -565,3 +593,21 @@ def test_call_tsne(mocker):
         no_plot=True,
         num_tickers=5,
     )
+
+
+@pytest.mark.vcr(record_mode="none")
+def test_call_set_file(tmp_path):
+    text_file = tmp_path / "tickers.txt"
+    text_file.write_text("aapl, msft\nTSLA\n\n")
+    csv_file = tmp_path / "tickers.csv"
+    csv_file.write_text("Symbol,Name\nAAPL,Apple\nGME,GameStop\n")
+
+    controller = ca_controller.ComparisonAnalysisController()
+    controller.call_set(other_args=["--similar=AMC,AAPL", f"--file={text_file}"])
+    assert controller.similar == ["AMC", "AAPL", "MSFT", "TSLA"]
+
+    controller.call_set(other_args=[f"--file={csv_file}"])
+    assert controller.similar == ["AAPL", "GME"]
+
+    controller.call_set(other_args=[f"--file={tmp_path / 'missing.txt'}"])
+    assert controller.similar == ["AAPL", "GME"]
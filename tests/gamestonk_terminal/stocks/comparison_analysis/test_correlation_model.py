@@ -0,0 +1,134 @@
+# IMPORTATION STANDARD
+
+# IMPORTATION THIRDPARTY
+import numpy as np
+import pandas as pd
+import pytest
+
+# IMPORTATION INTERNAL
+from gamestonk_terminal.stocks.comparison_analysis import correlation_model
+
+
+@pytest.fixture
+def returns():
+    rng = np.random.default_rng(3)
+    values = rng.normal(0, 0.01, (120, 12))
+    values[:, 1] += values[:, 0]
+    values[:, 2] -= values[:, 0]
+    return pd.DataFrame(
+        values.astype(np.float32),
+        index=pd.date_range("2021-01-01", periods=120),
+        columns=[f"T{i}" for i in range(12)],
+    )
+
+
+def test_get_panel(mocker):
+    dates = pd.date_range("2021-01-01", periods=3)
+    df_multi = pd.concat(
+        {
+            "Adj Close": pd.DataFrame(
+                {"AAA": [1.0, 2.0, 3.0], "BBB": [np.nan] * 3}, index=dates
+            ),
+        },
+        axis=1,
+    )
+    df_single = pd.DataFrame({"Adj Close": [4.0, 5.0, 6.0]}, index=dates)
+    mocker.patch.object(correlation_model, "CHUNK_SIZE", 2)
+    mock_download = mocker.patch.object(
+        correlation_model.yf, "download", side_effect=[df_multi, df_single]
+    )
+
+    df_panel = correlation_model.get_panel(["AAA", "BBB", "CCC"], "2021-01-01")
+
+    assert list(df_panel.columns) == ["AAA", "CCC"]
+    assert (df_panel.dtypes == np.float32).all()
+    assert mock_download.call_args_list[0].kwargs["threads"] == 2
+    assert mock_download.call_args_list[1].args[0] == ["CCC"]
+
+
+def test_get_returns():
+    df_panel = pd.DataFrame(
+        {
+            "AAA": [1.0, 2.0, np.nan, 4.0, 5.0],
+            "BBB": [np.nan, np.nan, np.nan, 1.0, 2.0],
+            "CCC": [3.0, 3.0, 3.0, 3.0, 3.0],
+        }
+    )
+
+    df_returns = correlation_model.get_returns(df_panel, min_ratio=0.5)
+
+    assert list(df_returns.columns) == ["AAA"]
+    np.testing.assert_allclose(df_returns["AAA"], [1, 0.625, 0.625, 0.25])
+
+
+def test_correlation_matrix(returns):
+    corr, shrinkage = correlation_model.correlation_matrix(returns.to_numpy())
+
+    assert corr.dtype == np.float32
+    assert shrinkage == 0
+    np.testing.assert_allclose(corr, returns.corr(), atol=1e-5)
+
+    cov, shrinkage = correlation_model.covariance_matrix(returns.to_numpy(), None)
+    assert 0 < shrinkage < 1
+    sample_cov = returns.cov().to_numpy()
+    mu = np.trace(sample_cov) / len(sample_cov)
+    np.testing.assert_allclose(
+        cov,
+        (1 - shrinkage) * sample_cov + shrinkage * mu * np.eye(len(sample_cov)),
+        rtol=1e-4,
+        atol=1e-9,
+    )
+
+
+def test_top_correlated_pairs(returns):
+    corr = returns.corr().to_numpy()
+    tickers = list(returns.columns)
+    pairs = [
+        (corr[i, j], tickers[i], tickers[j])
+        for i in range(len(tickers))
+        for j in range(i + 1, len(tickers))
+    ]
+
+    df_most = correlation_model.top_correlated_pairs(corr, tickers, 4, block_size=5)
+    df_least = correlation_model.top_correlated_pairs(
+        corr, tickers, 4, least=True, block_size=3
+    )
+
+    expected = sorted(pairs, reverse=True)[:4]
+    assert list(zip(df_most["Ticker 1"], df_most["Ticker 2"])) == [
+        (t1, t2) for _, t1, t2 in expected
+    ]
+    np.testing.assert_allclose(df_most["Correlation"], [c for c, _, _ in expected])
+    expected = sorted(pairs)[:4]
+    assert list(zip(df_least["Ticker 1"], df_least["Ticker 2"])) == [
+        (t1, t2) for _, t1, t2 in expected
+    ]
+    assert df_least["Ticker 1"].iloc[0] == "T0"
+    assert df_least["Ticker 2"].iloc[0] == "T2"
+
+
+def test_top_correlated(returns):
+    corr = returns.corr().to_numpy()
+    tickers = list(returns.columns)
+
+    df_corr = correlation_model.top_correlated(corr, tickers, "T0", 2)
+    assert list(df_corr["Ticker"]) == list(
+        returns.corr()["T0"].drop("T0").nlargest(2).index
+    )
+    df_corr = correlation_model.top_correlated(corr, tickers, "T0", 1, least=True)
+    assert list(df_corr["Ticker"]) == ["T2"]
+
+    with pytest.raises(ValueError):
+        correlation_model.top_correlated(corr, tickers, "OTHER")
+
+
+def test_rolling_correlation(returns):
+    df_rolling = correlation_model.rolling_correlation(returns, "T0", ["T1", "T5"], 30)
+
+    assert len(df_rolling) == len(returns) - 29
+    for other in ["T1", "T5"]:
+        expected = returns["T0"].rolling(30).corr(returns[other]).dropna()
+        np.testing.assert_allclose(df_rolling[other], expected, atol=1e-6)
+
+    with pytest.raises(ValueError):
+        correlation_model.rolling_correlation(returns, "T0", ["T1"], 500)
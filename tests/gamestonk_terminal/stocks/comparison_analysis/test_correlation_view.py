@@ -0,0 +1,35 @@
+# IMPORTATION STANDARD
+
+# IMPORTATION THIRDPARTY
+import numpy as np
+import pandas as pd
+import pytest
+
+# IMPORTATION INTERNAL
+from gamestonk_terminal.stocks.comparison_analysis import correlation_view
+
+
+@pytest.mark.parametrize("window", [1, 31])
+def test_display_top_correlations_invalid_window(capsys, mocker, window):
+    rng = np.random.default_rng(0)
+    returns = pd.DataFrame(
+        rng.normal(0, 0.01, (30, 3)),
+        index=pd.date_range("2021-01-01", periods=30),
+        columns=["AAA", "BBB", "CCC"],
+    )
+    mocker.patch.object(correlation_view.correlation_model, "get_panel")
+    mocker.patch.object(
+        correlation_view.correlation_model, "get_returns", return_value=returns
+    )
+    mock_rolling = mocker.patch.object(
+        correlation_view.correlation_model, "rolling_correlation"
+    )
+
+    correlation_view.display_top_correlations(
+        ["AAA", "BBB", "CCC"], ticker="AAA", window=window
+    )
+
+    assert (
+        "The rolling window must be between 2 and 30 days." in capsys.readouterr().out
+    )
+    mock_rolling.assert_not_called()
@@ -0,0 +1,102 @@
+# IMPORTATION STANDARD
+import os
+from datetime import date
+
+# IMPORTATION THIRDPARTY
+import numpy as np
+import pandas as pd
+import pytest
+
+# IMPORTATION INTERNAL
+from gamestonk_terminal.stocks.comparison_analysis import similarity_index_model
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(cache_dir):
+    similarity_index_model._INDEX.clear()
+    yield cache_dir
+
+
+@pytest.fixture
+def prices():
+    dates = pd.date_range("2021-01-01", periods=80).strftime("%Y-%m-%d")
+    rng = np.random.default_rng(7)
+    factors = rng.normal(0, 0.01, (80, 3))
+    return pd.DataFrame(
+        {
+            f"{name}{i}": 100
+            * np.cumprod(1 + factors[:, j] + rng.normal(0, 2e-3, 80) * (i + 1))
+            for j, name in enumerate(["A", "B", "C"])
+            for i in range(4)
+        },
+        index=dates,
+    )
+
+
+def test_build_similarity_index(prices):
+    index = similarity_index_model.build_similarity_index(prices, n_components=5)
+
+    assert index["tickers"].tolist() == list(prices.columns)
+    assert index["embeddings"].shape == (12, 5)
+    assert index["embeddings"].dtype == np.float32
+    assert index["components"].shape == (5, 79)
+
+    # Stocks moving with the same factor are the nearest, least noisy first
+    assert similarity_index_model.query_similarity_index(
+        index, index["embeddings"][0], 3, exclude="A0"
+    ) == ["A1", "A2", "A3"]
+    assert similarity_index_model.query_similarity_index(
+        index, index["embeddings"][4], 20
+    )[:4] == ["B0", "B1", "B2", "B3"]
+
+
+def test_embed_prices(prices):
+    index = similarity_index_model.build_similarity_index(prices, n_components=5)
+    close = prices["C2"].copy()
+    close.index = pd.to_datetime(close.index)
+
+    np.testing.assert_allclose(
+        similarity_index_model.embed_prices(index, close),
+        index["embeddings"][10],
+        atol=1e-5,
+    )
+
+
+def test_load_similarity_index(mocker, prices, cache_dir):
+    mock_prices = mocker.patch.object(
+        similarity_index_model, "get_1y_sp500", return_value=prices
+    )
+
+    index = similarity_index_model.load_similarity_index()
+    assert os.path.isfile(os.path.join(cache_dir, "similarity", "sp500.npz"))
+
+    # Built once a day
+    similarity_index_model._INDEX.clear()
+    loaded = similarity_index_model.load_similarity_index()
+    assert mock_prices.call_count == 1
+    assert loaded["tickers"].tolist() == index["tickers"].tolist()
+    np.testing.assert_array_equal(loaded["embeddings"], index["embeddings"])
+
+    similarity_index_model._INDEX[next(iter(similarity_index_model._INDEX))][1][
+        "built"
+    ] = np.array(date(2021, 1, 1).isoformat())
+    similarity_index_model.load_similarity_index()
+    assert mock_prices.call_count == 2
+
+
+def test_get_similar_tickers(mocker, prices):
+    mocker.patch.object(similarity_index_model, "get_1y_sp500", return_value=prices)
+    mock_download = mocker.patch.object(
+        similarity_index_model.yf,
+        "download",
+        return_value=pd.DataFrame(
+            {"Adj Close": prices["B1"].to_numpy()},
+            index=pd.to_datetime(prices.index),
+        ),
+    )
+
+    assert similarity_index_model.get_similar_tickers("C0", 2) == ["C1", "C2"]
+    mock_download.assert_not_called()
+
+    assert similarity_index_model.get_similar_tickers("OTHER", 1) == ["B1"]
+    mock_download.assert_called_once()
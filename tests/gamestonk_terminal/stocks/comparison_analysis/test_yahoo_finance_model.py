@@ -1,6 +1,5 @@
 # IMPORTATION STANDARD
 from datetime import datetime
-from io import BytesIO
 
 # IMPORTATION THIRDPARTY
 import numpy as np
@@ -42,47 +41,41 @@ def test_get_historical(mocker, recorder):
     recorder.capture(result_df)
 
 
-def filter_reduce_csv(response):
-    """To reduce cassette size."""
-
-    headers = response["headers"]
-    if (
-        "Expect-CT" in headers
-        and isinstance(headers["Expect-CT"], list)
-        and len(headers["Expect-CT"]) > 0
-        and "yahoo" in headers["Expect-CT"][0]
-    ):
-        return response
-
-    content = response["body"]["string"]
-    df = pd.read_csv(filepath_or_buffer=BytesIO(content), index_col=0)
-    if len(df) > 10:
-        response["body"]["string"] = df.head(10).to_csv().encode()
-    return response
-
-
-@pytest.mark.vcr(before_record_response=filter_reduce_csv)
-def test_get_sp500_comps_tsne(mocker, recorder):
-    # FORCE SINGLE THREADING
-    yf_download = yahoo_finance_model.yf.download
-
-    def mock_yf_download(*args, **kwargs):
-        kwargs["threads"] = False
-        return yf_download(*args, **kwargs)
-
-    mocker.patch("yfinance.download", side_effect=mock_yf_download)
-
+def test_get_sp500_comps_tsne(mocker, cache_dir):
+    dates = pd.date_range("2021-01-01", periods=60).strftime("%Y-%m-%d")
+    rng = np.random.default_rng(42)
+    factors = rng.normal(0, 0.01, (60, 2))
+    prices = {
+        f"{name}{i}": 100 * np.cumprod(1 + factors[:, j] + rng.normal(0, 1e-3, 60))
+        for j, name in enumerate(["A", "B"])
+        for i in range(5)
+    }
     mocker.patch(
-        "gamestonk_terminal.stocks.comparison_analysis.yahoo_finance_model.normalize",
-        side_effect=lambda x: x,
+        target="gamestonk_terminal.stocks.comparison_analysis.similarity_index_model.get_1y_sp500",
+        return_value=pd.DataFrame(prices, index=dates),
     )
-    mocker.patch("matplotlib.pyplot.show")
     mocker.patch(
-        "sklearn.manifold.TSNE.fit_transform",
-        side_effect=lambda x: np.full((len(x), 2), 1),
+        target="gamestonk_terminal.stocks.comparison_analysis.similarity_index_model.yf.download",
+        return_value=pd.DataFrame(
+            {"Adj Close": 50 * np.cumprod(1 + factors[:, 1])},
+            index=pd.to_datetime(dates),
+        ),
     )
-    result_df = yahoo_finance_model.get_sp500_comps_tsne(
-        ticker="TOT.TO",
+    mock_show = mocker.patch("matplotlib.pyplot.show")
+    mock_tsne = mocker.patch(
+        "gamestonk_terminal.stocks.comparison_analysis.yahoo_finance_model.TSNE"
     )
+    mock_tsne.return_value.fit_transform.side_effect = lambda x: np.ones((len(x), 2))
 
-    recorder.capture(result_df)
+    similar = yahoo_finance_model.get_sp500_comps_tsne(ticker="A0", num_tickers=4)
+    assert sorted(similar) == ["A1", "A2", "A3", "A4"]
+    # TSNE only runs to plot the stocks
+    mock_tsne.assert_called_once_with(learning_rate=200)
+    mock_show.assert_called_once()
+    assert (cache_dir / "similarity" / "sp500.npz").is_file()
+
+    similar = yahoo_finance_model.get_sp500_comps_tsne(
+        ticker="TOT.TO", no_plot=True, num_tickers=5
+    )
+    assert sorted(similar) == ["B0", "B1", "B2", "B3", "B4"]
+    mock_tsne.assert_called_once()
@@ -0,0 +1,172 @@
+# IMPORTATION STANDARD
+
+# IMPORTATION THIRDPARTY
+import numpy as np
+import pytest
+
+# IMPORTATION INTERNAL
+from gamestonk_terminal.stocks.fundamental_analysis import dcf_batch_model
+
+
+def get_pages(revenue, rounding=1_000_000):
+    years = ["Year", "2021", "2020", "2019", "2018"]
+    bs_rows = [
+        ["Cash & Equivalents", "40", "30", "20", "10"],
+        ["Cash & Cash Equivalents", "40", "30", "20", "10"],
+        ["Receivables", "20", "15", "10", "5"],
+        ["Total Current Assets", "60", "45", "30", "15"],
+        ["Property, Plant & Equipment", "100", "90", "80", "70"],
+        ["Total Long-Term Assets", "100", "90", "80", "70"],
+        ["Total Assets", "160", "135", "110", "85"],
+        ["Accounts Payable", "10", "8", "6", "4"],
+        ["Total Current Liabilities", "10", "8", "6", "4"],
+        ["Long-Term Debt", "50", "50", "50", "50"],
+        ["Total Long-Term Liabilities", "50", "50", "50", "50"],
+        ["Total Liabilities", "60", "58", "56", "54"],
+        ["Cash Growth", "33.33%", "50.00%", "100.00%", "-"],
+    ]
+    is_rows = [
+        ["Revenue", *revenue],
+        ["Cost of Revenue", "200", "150", "100", "50"],
+        ["Operating Income", "200", "150", "100", "50"],
+        ["Income Tax", "40", "30", "20", "10"],
+        ["Net Income", "160", "120", "80", "40"],
+        ["Revenue Growth", "25.00%", "33.33%", "50.00%", "-"],
+    ]
+    return {
+        "BS": {"years": years, "rows": bs_rows, "rounding": rounding},
+        "IS": {"years": years, "rows": is_rows, "rounding": rounding},
+        "CF": {"years": years, "rows": [], "rounding": rounding},
+    }
+
+
+PAGES = get_pages(["400", "300", "200", "100"])
+
+
+def test_get_statement_items():
+    years, values, fit_values = dcf_batch_model.get_statement_items(
+        get_pages(["400", "300", "-", "-100"])
+    )
+
+    np.testing.assert_array_equal(years, [2018, 2019, 2020, 2021])
+    np.testing.assert_array_equal(values["Revenue"], [-100, 0, 300, 400])
+    # The workbook fits its lines on the values read with string_float
+    np.testing.assert_array_equal(fit_values["Revenue"], [100, 0, 300, 400])
+    np.testing.assert_array_equal(values["Inventory"], [0, 0, 0, 0])
+    assert "Cash Growth" not in values
+
+
+def test_get_statement_items_missing_revenue():
+    pages = get_pages(["400", "300", "200", "100"])
+    pages["IS"]["rows"] = pages["IS"]["rows"][1:]
+
+    with pytest.raises(ValueError):
+        dcf_batch_model.get_statement_items(pages)
+
+
+def test_linear_fit():
+    x = np.array([1.0, 2.0, 4.0, 7.0])
+    y = np.column_stack([3 * x + 1, np.array([2.0, 1.0, 5.0, 3.0])])
+
+    slopes, intercepts = dcf_batch_model.linear_fit(x, y)
+
+    for i in range(2):
+        slope, intercept = np.polyfit(x, y[:, i], 1)
+        assert slopes[i] == pytest.approx(slope)
+        assert intercepts[i] == pytest.approx(intercept)
+
+    slopes, intercepts = dcf_batch_model.linear_fit(np.ones(4), y)
+    np.testing.assert_array_equal(slopes, [0, 0])
+    np.testing.assert_allclose(intercepts, y.mean(axis=0))
+
+
+def test_project_financials():
+    years, values, fit_values = dcf_batch_model.get_statement_items(PAGES)
+    projected = dcf_batch_model.project_financials(years, fit_values, n_years=3)
+
+    np.testing.assert_allclose(projected["Revenue"], [500, 600, 700])
+    np.testing.assert_allclose(projected["Cost of Revenue"], [250, 300, 350])
+    np.testing.assert_allclose(projected["Operating Income"], [250, 300, 350])
+    np.testing.assert_allclose(projected["Income Tax"], [50, 60, 70])
+    np.testing.assert_allclose(projected["Net Income"], [200, 240, 280])
+    np.testing.assert_allclose(projected["Total Current Assets"], [75, 90, 105])
+
+    free_cash_flows = dcf_batch_model.get_free_cash_flows(values, projected)
+    # Net income - (change in current assets - change in current liabilities)
+    # - change in long-term assets
+    np.testing.assert_allclose(
+        free_cash_flows,
+        [200 - (15 - 2) - 10, 240 - (15 - 2) - 10, 280 - (15 - 2) - 10],
+    )
+
+
+def test_get_firm_value():
+    _, values, _ = dcf_batch_model.get_statement_items(PAGES)
+
+    value = dcf_batch_model.get_firm_value(values, np.array([100.0, 100.0]), 0.1, 0)
+    expected = 100 / 1.1 + 100 / 1.1 ** 2 + 1000 / 1.1 ** 3 + 40 - 50
+    assert value == pytest.approx(expected)
+
+    # Never below the book value
+    value = dcf_batch_model.get_firm_value(values, np.array([-100.0]), 0.1, 0)
+    assert value == 160 - 60
+
+
+def test_get_discount_rate(mocker):
+    assert dcf_batch_model.get_discount_rate("AAA", 1.5, 0.02) == (
+        "CAPM",
+        pytest.approx(0.11),
+    )
+    assert dcf_batch_model.get_discount_rate("AAA", None, 0.02)[1] == pytest.approx(
+        0.08
+    )
+    assert dcf_batch_model.get_discount_rate("AAA", -3, 0.02)[1] == 0.005
+
+    mocker.patch.object(
+        dcf_batch_model.dcf_model, "get_fama_coe", return_value=np.float64(0.09)
+    )
+    assert dcf_batch_model.get_discount_rate("AAA", 1.5, 0.02, mocker.Mock()) == (
+        "Fama French",
+        0.09,
+    )
+
+
+def test_value_company():
+    info = {"sharesOutstanding": 1e6, "regularMarketPrice": 50.0}
+    result = dcf_batch_model.value_company(PAGES, info, 0.1)
+
+    assert result["Long Term Growth"] == 0.04
+    assert result["Discount Rate"] == 0.1
+    assert result["Value"] > 0
+    assert result["Upside"] == pytest.approx(result["Value"] / 50 - 1)
+    assert result["Revenue Growth"] == pytest.approx((1400 / 400) ** 0.1 - 1)
+
+    with pytest.raises(ValueError):
+        dcf_batch_model.value_company(get_pages(["1", "1", "1", "1"], 0), info, 0.1)
+
+
+def test_get_batch_dcf(mocker):
+    mocker.patch.object(dcf_batch_model, "get_rf", return_value=0.02)
+    mocker.patch.object(
+        dcf_batch_model.dcf_model,
+        "get_statement_pages",
+        side_effect=lambda tickers: {}
+        if tickers == ["BBB"]
+        else {(tickers[0], statement): page for statement, page in PAGES.items()},
+    )
+    mock_ticker = mocker.patch.object(dcf_batch_model.yf, "Ticker")
+    mock_ticker.return_value.info = {
+        "sharesOutstanding": 1e6,
+        "regularMarketPrice": 50.0,
+        "beta": 1.0,
+    }
+
+    df_summary, d_errors = dcf_batch_model.get_batch_dcf(
+        ["AAA", "BBB", "CCC"], workers=1, capm=True
+    )
+
+    assert list(df_summary.columns) == dcf_batch_model.SUMMARY_COLUMNS
+    assert list(df_summary["Ticker"]) == ["AAA", "CCC"]
+    assert list(df_summary["Model"]) == ["CAPM", "CAPM"]
+    assert df_summary["Discount Rate"].iloc[0] == pytest.approx(0.08)
+    assert list(d_errors) == ["BBB"]
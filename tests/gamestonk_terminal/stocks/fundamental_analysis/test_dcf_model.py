@@ -1,4 +1,5 @@
 # IMPORTATION STANDARD
+from datetime import datetime
 
 # IMPORTATION THIRDPARTY
 import openpyxl
@@ -114,3 +115,52 @@ def test_others_in_sector():
         ticker="PM", sector="Consumer Defensive", industry="Tobacco"
     )
     assert len(data) > 0
+
+
+STATEMENT_PAGE = """<html><body>
+<div class="text-sm pb-1 text-gray-600">Financials in millions USD.</div>
+<table class="FinancialTable_table_financial__1RhLY other">
+<thead><tr><th>Year</th><th>2021</th><th>2020</th></tr></thead>
+<tbody><tr><td>Revenue</td><td>1,200.5</td><td>-</td></tr>
+<tr><td>Net Income</td><td> 50 </td><td>40</td></tr></tbody>
+</table></body></html>"""
+
+
+def test_parse_statement_page():
+    page = dcf_model.parse_statement_page(STATEMENT_PAGE)
+
+    assert page["years"] == ["Year", "2021", "2020"]
+    assert page["rows"] == [["Revenue", "1,200.5", "-"], ["Net Income", "50", "40"]]
+    assert page["rounding"] == 1_000_000
+
+
+def test_parse_statement_page_not_found():
+    with pytest.raises(ValueError):
+        dcf_model.parse_statement_page("<h1>404 - Page Not Found</h1>")
+
+
+def test_get_fiscal_period():
+    assert dcf_model.get_fiscal_period(datetime(2021, 11, 3)) == "2021Q4"
+    assert dcf_model.get_fiscal_period(datetime(2022, 3, 31)) == "2022Q1"
+
+
+def test_get_statement_pages(mocker, cache_dir):
+    def get(url, **_):
+        if "/BBB/" in url:
+            return mocker.Mock(text="404 - Page Not Found")
+        return mocker.Mock(text=STATEMENT_PAGE)
+
+    mock_get = mocker.patch(
+        target="gamestonk_terminal.stocks.fundamental_analysis.dcf_model.requests.get",
+        side_effect=get,
+    )
+
+    pages = dcf_model.get_statement_pages(["AAA", "BBB"])
+    assert mock_get.call_count == 6
+    assert sorted(pages) == [("AAA", "BS"), ("AAA", "CF"), ("AAA", "IS")]
+    assert pages[("AAA", "IS")]["rounding"] == 1_000_000
+    assert len(list(cache_dir.glob("dcf/AAA_*.json"))) == 3
+
+    # Statements parsed this quarter are read from the cache
+    assert dcf_model.get_statement_pages(["AAA"]) == pages
+    assert mock_get.call_count == 6
@@ -18,6 +18,11 @@ def vcr_config():
     }
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache(cache_dir):
+    yield cache_dir
+
+
 @pytest.mark.vcr
 def test_create_xls():
     for ticker in ["AEIS"]:
@@ -330,6 +330,19 @@ def test_call_func_expect_queue(expected_queue, queue, func):
             ["--audit"],
             {"TSLA", True},
         ),
+        (
+            "call_dcf",
+            "dcf_batch_view.display_batch_dcf",
+            ["--tickers=aapl,msft,aapl", "--excel=msft", "--workers=2", "--capm"],
+            {
+                "tickers": ["AAPL", "MSFT"],
+                "excel": ["MSFT"],
+                "workers": 2,
+                "capm": True,
+                "audit": False,
+                "export": "",
+            },
+        ),
         (
             "call_warnings",
             "market_watch_view.display_sean_seah_warnings",
@@ -360,6 +373,27 @@ def test_call_func(tested_func, mocked_func, other_args, called_with, mocker):
         mock.assert_called_once()
 
 
+@pytest.mark.vcr(record_mode="none")
+def test_call_dcf_excel_without_tickers(capsys, mocker):
+    mock_excel = mocker.patch(
+        "gamestonk_terminal.stocks.fundamental_analysis.dcf_view.CreateExcelFA"
+    )
+    mock_batch = mocker.patch(
+        "gamestonk_terminal.stocks.fundamental_analysis.dcf_batch_view.display_batch_dcf"
+    )
+    fa = fa_controller.FundamentalAnalysisController(
+        ticker="TSLA",
+        start="10/25/2021",
+        interval="1440min",
+        suffix="",
+    )
+    fa.call_dcf(other_args=["--excel=msft"])
+
+    mock_excel.assert_not_called()
+    mock_batch.assert_not_called()
+    assert "--tickers or --file" in capsys.readouterr().out
+
+
 @pytest.mark.vcr(record_mode="none")
 @pytest.mark.parametrize(
     "func",
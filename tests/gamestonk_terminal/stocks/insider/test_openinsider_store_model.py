@@ -0,0 +1,187 @@
+# IMPORTATION STANDARD
+from datetime import datetime, timedelta
+
+# IMPORTATION THIRDPARTY
+import pytest
+
+# IMPORTATION INTERNAL
+from gamestonk_terminal.stocks.insider import openinsider_store_model
+
+HEADERS = [
+    "X",
+    "Filing\xa0Date",
+    "Trade\xa0Date",
+    "Ticker",
+    "Company\xa0Name",
+    "Insider\xa0Name",
+    "Title",
+    "Trade\xa0Type",
+    "Price",
+    "Qty",
+    "Owned",
+    "ΔOwn",
+    "Value",
+    "1d",
+    "1w",
+    "1m",
+    "6m",
+]
+
+
+def get_page(trades):
+    rows = "".join(
+        f"""<tr><td>{x}</td><td><a href="http://www.sec.gov/{ticker}{filing}">{filing}</a></td>
+        <td>2021-12-01</td><td><a href="/{ticker}">{ticker}</a></td><td>{ticker} Inc</td>
+        <td><a href="/insider/{insider}">{insider}</a></td><td>{title}</td><td>{trade_type}</td>
+        <td>$10.00</td><td>+1,000</td><td>5,000</td><td>+25%</td><td>{value}</td>
+        <td></td><td></td><td></td><td></td></tr>"""
+        for x, filing, ticker, insider, title, trade_type, value in trades
+    )
+    return f"""<html><body><table class="tinytable"><thead><tr>
+        {"".join(f"<th>{header}</th>" for header in HEADERS)}</tr></thead>
+        <tbody>{rows}</tbody></table></body></html>"""
+
+
+FIRST_PAGE = [
+    ("", "2021-12-10 18:00:00", "AAA", "Smith John", "CEO", "P - Purchase", "+$30,000"),
+    ("", "2021-12-10 17:00:00", "BBB", "Doe Jane", "Dir", "S - Sale", "-$150,000"),
+    ("M", "2021-12-08 16:00:00", "CCC", "Roe Rick", "VP", "P - Purchase", "+$90,000"),
+    ("", "2021-11-01 10:00:00", "DDD", "Poe Paul", "CFO", "S - Sale+OE", "-$5,000"),
+]
+
+SECOND_PAGE = [
+    (
+        "",
+        "2021-12-13 09:00:00",
+        "EEE",
+        "Moe Mary",
+        "Pres, CEO",
+        "P - Purchase",
+        "+$1,000",
+    ),
+    (
+        "A",
+        "2021-12-10 18:00:00",
+        "AAA",
+        "Smith John",
+        "CEO",
+        "P - Purchase",
+        "+$30,000",
+    ),
+]
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(cache_dir):
+    openinsider_store_model._STORE.clear()
+    yield cache_dir
+
+
+@pytest.fixture
+def mock_get(mocker):
+    def get(pages):
+        return mocker.patch(
+            target="gamestonk_terminal.stocks.insider.openinsider_store_model.requests.get",
+            side_effect=[mocker.Mock(text=get_page(page)) for page in pages],
+        )
+
+    return get
+
+
+def test_update_insider_store(mocker, mock_get):
+    mocker.patch.object(
+        openinsider_store_model,
+        "datetime",
+        mocker.Mock(
+            now=lambda: datetime(2021, 12, 11),
+            fromisoformat=datetime.fromisoformat,
+        ),
+    )
+    mocker.patch.object(openinsider_store_model, "RESULTS_PER_PAGE", 2)
+
+    mock_requests = mock_get([FIRST_PAGE[:2], FIRST_PAGE[2:], []])
+    df_store = openinsider_store_model.update_insider_store()
+    assert mock_requests.call_count == 3
+    assert "fd=30&" in mock_requests.call_args_list[0].args[0]
+    assert "page=2" in mock_requests.call_args_list[1].args[0]
+    # Filings older than STORE_DAYS from the latest one are dropped
+    assert list(df_store["Ticker"]) == ["AAA", "BBB", "CCC"]
+    assert (
+        df_store["Filing Link"].iloc[0] == "http://www.sec.gov/AAA2021-12-10 18:00:00"
+    )
+
+    # Recent enough, read from disk without requests
+    openinsider_store_model._STORE.clear()
+    assert openinsider_store_model.update_insider_store().equals(df_store)
+    assert mock_requests.call_count == 3
+
+    openinsider_store_model.datetime.now = lambda: datetime(2021, 12, 13, 10)
+    mock_requests = mock_get([SECOND_PAGE])
+    df_store = openinsider_store_model.update_insider_store()
+    # Only the filings since the latest one stored are requested
+    assert "fd=3&" in mock_requests.call_args_list[0].args[0]
+    assert mock_requests.call_count == 1
+    assert list(df_store["Ticker"]) == ["EEE", "AAA", "BBB", "CCC"]
+    assert df_store["X"].iloc[1] == "A"
+
+
+def test_update_insider_store_offline(mocker):
+    mocker.patch(
+        target="gamestonk_terminal.stocks.insider.openinsider_store_model.requests.get",
+        side_effect=openinsider_store_model.requests.exceptions.ConnectionError,
+    )
+    assert openinsider_store_model.update_insider_store().empty
+
+
+@pytest.mark.parametrize(
+    "type_insider, expected",
+    [
+        ("lip", ["AAA", "CCC"]),
+        ("blip", ["AAA", "CCC"]),
+        ("blop", ["AAA", "CCC"]),
+        ("blcp", ["AAA"]),
+        ("lis", ["BBB", "DDD"]),
+        ("blis", ["BBB"]),
+        ("blos", []),
+        ("tipt", ["AAA"]),
+        ("tippw", ["CCC", "AAA"]),
+        ("tispm", ["BBB"]),
+    ],
+)
+def test_query_insider_store(type_insider, expected):
+    df_store = openinsider_store_model.parse_open_insider_table(get_page(FIRST_PAGE))[
+        0
+    ].rename(columns={"ΔOwn": "Diff Own"})
+    df_store["Filing Link"] = ""
+
+    df_screen = openinsider_store_model.query_insider_store(
+        df_store, **openinsider_store_model.d_store_screens[type_insider]
+    )
+
+    assert list(df_screen["Ticker"]) == expected
+    assert "Filing Link" not in df_screen
+
+
+def test_get_insider_data_from_page(mocker):
+    mock_update = mocker.patch.object(openinsider_store_model, "update_insider_store")
+    mock_get_page = mocker.patch.object(
+        openinsider_store_model, "get_open_insider_page"
+    )
+
+    openinsider_store_model.get_insider_data("lcb")
+
+    mock_update.assert_not_called()
+    mock_get_page.assert_called_once_with("lcb")
+
+
+def test_store_is_fresh_for_a_while(mocker):
+    mocker.patch.object(
+        openinsider_store_model,
+        "load_insider_store",
+        return_value=(mocker.Mock(), datetime.now() - timedelta(minutes=1)),
+    )
+    mock_trades = mocker.patch.object(openinsider_store_model, "get_latest_trades")
+
+    openinsider_store_model.update_insider_store()
+
+    mock_trades.assert_not_called()
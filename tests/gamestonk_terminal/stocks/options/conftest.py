@@ -0,0 +1,12 @@
+# IMPORTATION STANDARD
+
+# IMPORTATION THIRDPARTY
+import pytest
+
+# IMPORTATION INTERNAL
+from gamestonk_terminal.stocks.options import chain_cache_model
+
+
+@pytest.fixture(autouse=True)
+def clear_chain_cache():
+    chain_cache_model.clear_cache()
@@ -0,0 +1,116 @@
+# IMPORTATION STANDARD
+
+# IMPORTATION THIRDPARTY
+import numpy as np
+import pandas as pd
+import pytest
+
+# IMPORTATION INTERNAL
+from gamestonk_terminal.stocks.options import black_scholes_model
+
+
+def test_option_price():
+    # Hull, Options, Futures and Other Derivatives, example 15.6
+    prices = black_scholes_model.option_price(
+        42, 40, 0.5, 0.1, 0.2, np.array([False, True])
+    )
+    np.testing.assert_allclose(prices, [4.76, 0.81], atol=5e-3)
+
+    # Put call parity with dividends
+    call, put = black_scholes_model.option_price(
+        100, 90, 1.5, 0.03, 0.4, np.array([False, True]), div_yield=0.02
+    )
+    assert call - put == pytest.approx(
+        100 * np.exp(-0.02 * 1.5) - 90 * np.exp(-0.03 * 1.5)
+    )
+
+
+@pytest.mark.parametrize("put", [False, True])
+def test_greeks(put):
+    args = dict(spot=100.0, strike=np.array([80.0, 100.0, 130.0]), years=0.4, rate=0.03)
+    vol = np.array([0.3, 0.25, 0.4])
+    greeks = black_scholes_model.greeks(**args, vol=vol, put=put, div_yield=0.01)
+
+    def price(**changes):
+        kwargs = dict(args, vol=vol, put=put, div_yield=0.01)
+        kwargs.update(changes)
+        return black_scholes_model.option_price(**kwargs)
+
+    h = 1e-4
+    np.testing.assert_allclose(
+        greeks["delta"], (price(spot=100 + h) - price(spot=100 - h)) / (2 * h)
+    )
+    np.testing.assert_allclose(
+        greeks["gamma"],
+        (price(spot=100 + 1e-2) - 2 * price() + price(spot=100 - 1e-2)) / 1e-4,
+        rtol=1e-4,
+    )
+    np.testing.assert_allclose(
+        greeks["vega"], (price(vol=vol + h) - price(vol=vol - h)) / (2 * h) / 100
+    )
+    np.testing.assert_allclose(
+        greeks["rho"], (price(rate=0.03 + h) - price(rate=0.03 - h)) / (2 * h) / 100
+    )
+    np.testing.assert_allclose(
+        greeks["theta"],
+        -(price(years=0.4 + h) - price(years=0.4 - h)) / (2 * h) / 365,
+    )
+
+
+def test_implied_volatility():
+    rng = np.random.default_rng(0)
+    strikes = rng.uniform(60, 140, 5000)
+    years = rng.uniform(5 / 365, 2, 5000)
+    put = rng.random(5000) < 0.5
+    vol = rng.uniform(0.1, 1.2, 5000)
+    prices = black_scholes_model.option_price(100, strikes, years, 0.03, vol, put)
+
+    implied = black_scholes_model.implied_volatility(
+        prices, 100, strikes, years, 0.03, put
+    )
+
+    # Deep in the money options with a vanishing vega carry no volatility
+    vega = black_scholes_model.greeks(100, strikes, years, 0.03, vol, put)["vega"]
+    solvable = vega > 1e-3
+    np.testing.assert_allclose(implied[solvable], vol[solvable], atol=1e-6)
+
+    # Below the intrinsic value or above the price of the asset
+    assert np.isnan(
+        black_scholes_model.implied_volatility(
+            [0.5, 120, np.nan], 100, [90, 90, 90], 0.5, 0.03, False
+        )
+    ).all()
+
+
+def test_chain_greeks():
+    strikes = np.array([90.0, 100.0, 110.0])
+    prices = {
+        put: black_scholes_model.option_price(100, strikes, 0.25, 0.02, 0.3, put)
+        for put in [False, True]
+    }
+
+    def chain(put):
+        return pd.DataFrame(
+            {
+                "contractSymbol": [
+                    f"X{strike:.0f}{'P' if put else 'C'}" for strike in strikes
+                ],
+                "strike": strikes,
+                "lastPrice": prices[put],
+                "bid": [prices[put][0] - 0.05, 0.0, prices[put][2] - 0.05],
+                "ask": [prices[put][0] + 0.05, 0.0, prices[put][2] + 0.05],
+                "volume": [1, 2, 3],
+                "openInterest": [4, 5, 6],
+            }
+        )
+
+    result = black_scholes_model.chain_greeks(
+        chain(False), chain(True), 100, 0.25, 0.02
+    )
+
+    assert len(result) == 6
+    assert result["option_type"].tolist() == ["call", "put"] * 3
+    np.testing.assert_allclose(result["mid_iv"], 0.3, atol=1e-6)
+    assert (result["bid_iv"].dropna() < 0.3).all()
+    assert (result["ask_iv"].dropna() > 0.3).all()
+    assert result.loc[result["option_type"] == "call", "delta"].is_monotonic_decreasing
@@ -0,0 +1,74 @@
+# IMPORTATION STANDARD
+
+# IMPORTATION THIRDPARTY
+import pandas as pd
+
+# IMPORTATION INTERNAL
+from gamestonk_terminal.stocks.options import chain_cache_model
+
+
+def test_get_option_chain(mocker):
+    mock_yf = mocker.patch.object(
+        chain_cache_model.yfinance_model, "get_option_chain", return_value="YF_CHAIN"
+    )
+    mock_tr = mocker.patch.object(
+        chain_cache_model.tradier_model,
+        "get_option_chains",
+        return_value=pd.DataFrame({"strike": [1.0]}),
+    )
+
+    for _ in range(3):
+        assert chain_cache_model.get_option_chain("pm", "2022-01-07") == "YF_CHAIN"
+        chain_cache_model.get_option_chain("PM", "2022-01-07", "tr")
+    chain_cache_model.get_option_chain("PM", "2022-01-14")
+    assert mock_yf.call_count == 2
+    assert mock_tr.call_count == 1
+
+    # Stale chains are downloaded again
+    mocker.patch.object(chain_cache_model, "CACHE_MAX_AGE", -1)
+    chain_cache_model.get_option_chain("PM", "2022-01-07")
+    assert mock_yf.call_count == 3
+
+
+def test_failed_requests_not_cached(mocker):
+    mock_tr = mocker.patch.object(
+        chain_cache_model.tradier_model,
+        "get_option_chains",
+        return_value=pd.DataFrame(),
+    )
+    mock_price = mocker.patch.object(
+        chain_cache_model.tradier_model, "last_price", return_value=None
+    )
+
+    for _ in range(2):
+        assert chain_cache_model.get_option_chain("PM", "2022-01-07", "tr").empty
+        assert chain_cache_model.get_last_price("PM", "tr") is None
+    assert mock_tr.call_count == 2
+    assert mock_price.call_count == 2
+
+
+def test_get_last_price_and_clear_cache(mocker):
+    mock_info = mocker.patch.object(
+        chain_cache_model.reference_data_model,
+        "get_info",
+        return_value={"regularMarketPrice": 85},
+    )
+    mock_price = mocker.patch.object(
+        chain_cache_model.tradier_model, "last_price", return_value=84.5
+    )
+
+    # Yahoo Finance prices share the reference quotes
+    assert chain_cache_model.get_last_price("PM") == 85.0
+    mock_info.assert_called_once_with("PM")
+
+    assert chain_cache_model.get_last_price("PM", "tr") == 84.5
+    assert chain_cache_model.get_last_price("PM", "tr") == 84.5
+    assert mock_price.call_count == 1
+
+    chain_cache_model.clear_cache("OTHER")
+    chain_cache_model.get_last_price("PM", "tr")
+    assert mock_price.call_count == 1
+
+    chain_cache_model.clear_cache("pm")
+    chain_cache_model.get_last_price("PM", "tr")
+    assert mock_price.call_count == 2
@@ -0,0 +1,50 @@
+# IMPORTATION STANDARD
+
+# IMPORTATION THIRDPARTY
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.stats import norm
+
+# IMPORTATION INTERNAL
+from gamestonk_terminal.stocks.options import op_helpers
+
+
+def test_rn_payoffs():
+    df = pd.DataFrame({"Price": [100.0, 200.0], "Chance": [0.5, 0.5]})
+    strikes = np.array([50.0, 150.0, 250.0])
+
+    calls, puts = op_helpers.rn_payoffs(
+        strikes, df["Price"], df["Chance"], delta=365, rf=0.02
+    )
+    np.testing.assert_allclose(calls, [100 / 1.02, 25 / 1.02, 0])
+    np.testing.assert_allclose(puts, [0, 25 / 1.02, 100 / 1.02])
+
+    for strike, call, put in zip(strikes, calls, puts):
+        assert op_helpers.rn_payoff(strike, df, False, 365, 0.02) == pytest.approx(call)
+        assert op_helpers.rn_payoff(strike, df, True, 365, 0.02) == pytest.approx(put)
+
+
+def test_lognormal_scenarios():
+    prices, chances = op_helpers.lognormal_scenarios(100, 0.3, 365, 0.02, 20000)
+    assert chances.sum() == pytest.approx(1)
+    assert prices @ chances == pytest.approx(102)
+
+    # Close to Black-Scholes with the continuously compounded rate
+    rate = np.log(1.02)
+    d1 = (np.log(100 / 110) + rate + 0.3 ** 2 / 2) / 0.3
+    black_scholes = 100 * norm.cdf(d1) - 110 * np.exp(-rate) * norm.cdf(d1 - 0.3)
+    calls, _ = op_helpers.rn_payoffs([110], prices, chances, 365, 0.02)
+    assert calls[0] == pytest.approx(black_scholes, rel=1e-3)
+
+
+def test_empirical_scenarios():
+    rng = np.random.default_rng(5)
+    closings = pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.01, 251))))
+
+    prices, chances = op_helpers.empirical_scenarios(50, closings, 30, 0.02)
+    assert len(prices) == 250
+    assert prices @ chances == pytest.approx(50 * 1.02 ** (30 / 365))
+
+    with pytest.raises(ValueError):
+        op_helpers.empirical_scenarios(50, closings.iloc[:2], 30, 0.02)
@@ -14,6 +14,7 @@ from gamestonk_terminal.stocks.options import options_controller
 # pylint: disable=E1111
 # pylint: disable=C0302
 
+
 EXPIRY_DATES = [
     "2022-01-07",
     "2022-01-14",
@@ -460,6 +461,19 @@ def test_call_func_expect_queue(expected_queue, func, mocker, queue):
                 export="csv",
             ),
         ),
+        (
+            "call_surface",
+            ["skew", "--expiry=2022-01-14", "--export=csv"],
+            "surface_view.display_surface",
+            [],
+            dict(
+                ticker="MOCK_TICKER",
+                expiries=EXPIRY_DATES,
+                display="skew",
+                expiry="2022-01-14",
+                export="csv",
+            ),
+        ),
         (
             "call_info",
             ["--export=csv"],
@@ -631,6 +645,26 @@ def test_call_func_expect_queue(expected_queue, func, mocker, queue):
                 export="csv",
             ),
         ),
+        (
+            # SOURCE: YFINANCE
+            "call_chains",
+            [
+                "--display=delta,mid_iv",
+                "--source=yf",
+            ],
+            "yfinance_view.display_chains",
+            [],
+            dict(
+                ticker="MOCK_TICKER",
+                expiry="2022-01-07",
+                to_display=["delta", "mid_iv"],
+                min_sp=-1,
+                max_sp=-1,
+                calls_only=False,
+                puts_only=False,
+                export="",
+            ),
+        ),
         (
             # SOURCE: YFINANCE
             "call_vol",
@@ -911,6 +945,7 @@ def test_call_func_test(
     [
         "call_info",
         "call_pcr",
+        "call_surface",
         "call_exp",
         "call_vol",
         "call_voi",
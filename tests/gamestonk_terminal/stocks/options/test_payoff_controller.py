@@ -488,6 +488,20 @@ def test_call_func_expect_queue(expected_queue, func, mocker, queue):
             [],
             dict(),
         ),
+        (
+            "call_plot",
+            ["10"],
+            "plot_payoff",
+            [
+                95.0,
+                [{"type": "put", "sign": -1, "strike": 200.0, "cost": 0.01}],
+                0,
+                "MOCK_TICKER",
+                "2022-01-07",
+                10,
+            ],
+            dict(),
+        ),
         (
             "call_sop",
             [],
@@ -0,0 +1,118 @@
+# IMPORTATION STANDARD
+from datetime import date, timedelta
+
+# IMPORTATION THIRDPARTY
+import numpy as np
+import pytest
+
+# IMPORTATION INTERNAL
+from gamestonk_terminal.stocks.options import black_scholes_model, payoff_model
+
+IRON_CONDOR = [
+    {"type": "put", "sign": 1, "strike": 80.0, "cost": 0.5},
+    {"type": "put", "sign": -1, "strike": 90.0, "cost": 1.5},
+    {"type": "call", "sign": -1, "strike": 110.0, "cost": 1.6},
+    {"type": "call", "sign": 1, "strike": 120.0, "cost": 0.4},
+]
+
+
+def loop_payoff(price, options, underlying, base):
+    payoff = underlying * (price - base)
+    for option in options:
+        if option["type"] == "call":
+            payoff += option["sign"] * max(price - option["strike"], 0)
+        else:
+            payoff += option["sign"] * max(option["strike"] - price, 0)
+    return payoff
+
+
+@pytest.mark.parametrize("underlying", [-1, 0, 1])
+def test_generate_data(underlying):
+    prices, before, after = payoff_model.generate_data(
+        100.0, IRON_CONDOR, underlying, points=1001
+    )
+
+    assert prices[0] == pytest.approx(64.0)
+    assert prices[-1] == pytest.approx(144.0)
+    np.testing.assert_allclose(
+        before, [loop_payoff(p, IRON_CONDOR, underlying, 100.0) for p in prices]
+    )
+    # The condor is opened for a credit of 2.2
+    np.testing.assert_allclose(after, before + 2.2)
+
+
+def test_generate_data_no_options():
+    prices, before, after = payoff_model.generate_data(100.0, [], 0)
+
+    assert prices[0] == pytest.approx(50.0)
+    assert prices[-1] == pytest.approx(150.0)
+    assert not before.any()
+    assert after.size == 0
+
+
+def test_value_before_expiry():
+    legs = payoff_model.get_legs(IRON_CONDOR)
+    prices = np.linspace(60, 140, 81)
+    vols = np.array([0.3, 0.25, 0.22, 0.24])
+
+    value = payoff_model.value_before_expiry(prices, legs, 1, 100.0, 0.1, 0.02, vols)
+    expected = [
+        (p - 100.0)
+        + sum(
+            option["sign"]
+            * (
+                black_scholes_model.option_price(
+                    p, option["strike"], 0.1, 0.02, vol, option["type"] == "put"
+                )
+                - option["cost"]
+            )
+            for option, vol in zip(IRON_CONDOR, vols)
+        )
+        for p in prices
+    ]
+    np.testing.assert_allclose(value, expected)
+
+    # At expiration the value is the payoff after premiums
+    _, _, after = payoff_model.generate_data(100.0, IRON_CONDOR, 0)
+    np.testing.assert_allclose(
+        payoff_model.value_before_expiry(
+            payoff_model.get_x_values(100.0, legs["strike"]),
+            legs,
+            0,
+            100.0,
+            0,
+            0.02,
+            vols,
+        ),
+        after,
+    )
+
+
+def test_get_value_before_expiry(mocker):
+    mocker.patch.object(payoff_model.reference_data_model, "get_rf", return_value=0.02)
+    expiration = (date.today() + timedelta(days=30)).isoformat()
+    rate = np.log(1.02)
+    options = [
+        {
+            "type": "call",
+            "sign": 1,
+            "strike": 100.0,
+            "cost": float(
+                black_scholes_model.option_price(100, 100, 30 / 365, rate, 0.4, False)
+            ),
+        },
+        # Below its intrinsic value, so valued at the volatility of the other leg
+        {"type": "put", "sign": -1, "strike": 120.0, "cost": 1.0},
+    ]
+
+    # Valued today, the call is worth its cost
+    value = payoff_model.get_value_before_expiry(
+        100.0, options[:1], 0, expiration, 30, np.array([100.0])
+    )
+    assert value[0] == pytest.approx(0, abs=1e-4)
+
+    value = payoff_model.get_value_before_expiry(
+        100.0, options, 0, expiration, 30, np.array([100.0])
+    )
+    put = black_scholes_model.option_price(100, 120, 30 / 365, rate, 0.4, True)
+    assert value[0] == pytest.approx(-(put - 1.0), abs=1e-3)
@@ -319,6 +319,8 @@ def test_call_func_expect_queue(expected_queue, func, queue):
                 1.0,
                 2.0,
                 3.0,
+                "table",
+                None,
             ],
             dict(),
         ),
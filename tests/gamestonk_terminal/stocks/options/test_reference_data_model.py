@@ -0,0 +1,58 @@
+# IMPORTATION STANDARD
+import os
+import time
+
+# IMPORTATION THIRDPARTY
+import pandas as pd
+import pytest
+
+# IMPORTATION INTERNAL
+from gamestonk_terminal import reference_data
+from gamestonk_terminal.stocks.options import reference_data_model
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(cache_dir):
+    reference_data._CACHE.clear()
+    yield cache_dir
+
+
+def test_get_dividend_and_quotes(mocker):
+    dividends = pd.Series(
+        [0.5, 0.6], index=pd.to_datetime(["2021-01-01", "2021-04-01"])
+    )
+    mock_dividend = mocker.patch.object(
+        reference_data_model.yfinance_model, "get_dividend", return_value=dividends
+    )
+    mock_price = mocker.patch.object(
+        reference_data_model.yfinance_model, "get_price", return_value=10.0
+    )
+    mock_info = mocker.patch.object(
+        reference_data_model.yfinance_model,
+        "get_info",
+        return_value={"regularMarketPrice": 10.0},
+    )
+
+    for _ in range(2):
+        pd.testing.assert_series_equal(
+            reference_data_model.get_dividend("pm"), dividends
+        )
+        assert reference_data_model.get_price("PM") == 10.0
+        assert reference_data_model.get_info("PM") == {"regularMarketPrice": 10.0}
+    assert mock_dividend.call_count == 1
+    assert mock_price.call_count == 1
+    assert mock_info.call_count == 1
+
+    # Quotes expire sooner than dividends
+    for name in list(reference_data._CACHE):
+        mtime, value = reference_data._CACHE[name]
+        reference_data._CACHE[name] = (mtime - 3600, value)
+    for path in os.listdir(os.path.join(reference_data._reference_folder())):
+        os.utime(
+            os.path.join(reference_data._reference_folder(), path),
+            (time.time() - 3600, time.time() - 3600),
+        )
+    reference_data_model.get_dividend("PM")
+    reference_data_model.get_price("PM")
+    assert mock_dividend.call_count == 1
+    assert mock_price.call_count == 2
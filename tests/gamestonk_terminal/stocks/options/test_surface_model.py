@@ -0,0 +1,128 @@
+# IMPORTATION STANDARD
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+# IMPORTATION THIRDPARTY
+import numpy as np
+import pandas as pd
+import pytest
+
+# IMPORTATION INTERNAL
+from gamestonk_terminal.stocks.options import black_scholes_model, surface_model
+
+DAYS = [20, 50, 120, 400]
+EXPIRIES = [(date.today() + timedelta(days=days)).isoformat() for days in DAYS]
+STRIKES = np.arange(60.0, 145.0, 5.0)
+
+
+def smile(strike, days):
+    return 0.25 + 0.3 * (strike / 100 - 1) ** 2 + 0.02 * days / 365
+
+
+def make_chain(_, expiry):
+    days = DAYS[EXPIRIES.index(expiry)]
+    vol = smile(STRIKES, days)
+    options = []
+    for put in (False, True):
+        price = black_scholes_model.option_price(
+            100, STRIKES, days / 365, np.log(1.02), vol, put
+        )
+        options.append(
+            pd.DataFrame(
+                {
+                    "strike": STRIKES,
+                    "lastPrice": price,
+                    "bid": price - 0.01,
+                    "ask": price + 0.01,
+                }
+            )
+        )
+    return SimpleNamespace(calls=options[0], puts=options[1])
+
+
+@pytest.fixture(autouse=True)
+def mock_market(mocker):
+    surface_model.clear_cache()
+    mocker.patch.object(
+        surface_model.chain_cache_model, "get_option_chain", side_effect=make_chain
+    )
+    mocker.patch.object(
+        surface_model.chain_cache_model, "get_last_price", return_value=100.0
+    )
+    mocker.patch.object(surface_model.reference_data_model, "get_rf", return_value=0.02)
+    mocker.patch.object(surface_model.reference_data_model, "get_info", return_value={})
+    mocker.patch.object(
+        surface_model.yfinance_model, "option_expirations", return_value=EXPIRIES
+    )
+
+
+def test_get_surface_points():
+    points = surface_model.get_surface_points("PM")
+
+    assert list(points.columns) == ["expiry", "days", "strike", "moneyness", "iv"]
+    assert sorted(points["days"].unique()) == DAYS
+    np.testing.assert_allclose(
+        points["iv"], smile(points["strike"], points["days"]), atol=1e-3
+    )
+
+    # Every chain is downloaded once per session
+    surface_model.get_surface_points("pm")
+    assert surface_model.chain_cache_model.get_option_chain.call_count == len(DAYS)
+
+
+def test_build_surface():
+    points = surface_model.get_surface_points("PM")
+    surface = surface_model.build_surface(points, moneyness=[0.9, 1.0, 1.1])
+
+    assert list(surface.index) == [30, 60, 90, 120, 180, 270, 365]
+    assert not surface.isna().any().any()
+    # Variance is linear in time between the expirations
+    expected = np.sqrt(
+        np.interp(
+            surface.index,
+            DAYS,
+            [smile(100.0, days) ** 2 * days for days in DAYS],
+        )
+        / surface.index
+    )
+    np.testing.assert_allclose(surface[1.0], expected, atol=1e-3)
+
+    # Nothing is extrapolated outside of the strikes
+    assert surface_model.build_surface(points, moneyness=[2.0])[2.0].isna().all()
+
+
+def test_points_cache():
+    points = surface_model.get_surface_points("PM", EXPIRIES[:2])
+    assert sorted(points["days"].unique()) == DAYS[:2]
+
+    # Other expirations of the same ticker are not served from the cache
+    points = surface_model.get_surface_points("PM", EXPIRIES[2:])
+    assert sorted(points["days"].unique()) == DAYS[2:]
+    surface_model.get_surface_points("PM", EXPIRIES[2:])
+    assert surface_model.chain_cache_model.get_option_chain.call_count == len(DAYS)
+
+    surface_model.get_surface_points("AAA", EXPIRIES[:1])
+    surface_model.clear_cache("pm")
+    surface_model.get_surface_points("PM", EXPIRIES[2:])
+    surface_model.get_surface_points("AAA", EXPIRIES[:1])
+    assert surface_model.chain_cache_model.get_option_chain.call_count == len(DAYS) + 3
+
+
+def test_slices():
+    points = surface_model.get_surface_points("PM")
+
+    term = surface_model.get_term_structure(points)
+    assert list(term.index) == DAYS
+    np.testing.assert_allclose(term, [smile(100.0, days) for days in DAYS], atol=1e-3)
+
+    skew = surface_model.get_skew(points, EXPIRIES[0])
+    assert skew.index.is_monotonic_increasing
+    assert skew.idxmin() == pytest.approx(1.0)
+
+
+def test_no_expirations(mocker):
+    mocker.patch.object(
+        surface_model.yfinance_model, "option_expirations", return_value=[]
+    )
+    assert surface_model.get_surface_points("PM").empty
+    assert surface_model.build_surface(surface_model.get_surface_points("PM")).empty
@@ -1,6 +1,7 @@
 # IMPORTATION STANDARD
 
 # IMPORTATION THIRDPARTY
+import pandas as pd
 import pytest
 import requests
 
@@ -116,6 +117,73 @@ def test_get_option_chains_invalid_status(mocker):
     assert result_df.empty
 
 
+@pytest.mark.vcr(record_mode="none")
+def test_process_chains(mocker):
+    option = {
+        "symbol": "PM220107C00050000",
+        "bid": 45.55,
+        "ask": 47.3,
+        "strike": 50.0,
+        "bidsize": 82,
+        "asksize": 80,
+        "volume": 0,
+        "open_interest": 0,
+        "option_type": "call",
+        "greeks": {"delta": 1.0, "mid_iv": 2.7},
+    }
+    mock_response = mocker.Mock()
+    mock_response.json.return_value = {
+        "options": {"option": [option, dict(option, bidsize=None, greeks=None)]}
+    }
+
+    result_df = tradier_model.process_chains(mock_response)
+
+    assert result_df.columns.tolist() == tradier_model.df_columns
+    assert result_df["asksize"].dtype == "int64"
+    assert result_df["bidsize"].isna().tolist() == [False, True]
+    assert result_df["delta"].tolist()[0] == 1.0
+    assert result_df[tradier_model.greek_columns].iloc[1].isna().all()
+
+    # A single option is not in a list
+    mock_response.json.return_value = {"options": {"option": option}}
+    assert len(tradier_model.process_chains(mock_response)) == 1
+    mock_response.json.return_value = {"options": None}
+    assert tradier_model.process_chains(mock_response).empty
+
+
+@pytest.mark.vcr(record_mode="none")
+def test_get_all_option_chains(mocker):
+    def get_option_chains(symbol, expiry):
+        if expiry == "2022-01-21":
+            return pd.DataFrame()
+        return pd.DataFrame(
+            {
+                "symbol": [f"{symbol}{expiry}P", f"{symbol}{expiry}C"],
+                "strike": [50.0, 50.0],
+                "option_type": ["put", "call"],
+                "bid": [1.0, 2.0],
+            }
+        )
+
+    mocker.patch.object(
+        tradier_model, "get_option_chains", side_effect=get_option_chains
+    )
+
+    result_df = tradier_model.get_all_option_chains(
+        "PM", ["2022-01-14", "2022-01-07", "2022-01-21"]
+    )
+
+    assert result_df.index.names == ["expiry", "strike", "option_type"]
+    assert result_df.index.tolist() == [
+        ("2022-01-07", 50.0, "call"),
+        ("2022-01-07", 50.0, "put"),
+        ("2022-01-14", 50.0, "call"),
+        ("2022-01-14", 50.0, "put"),
+    ]
+    assert result_df.loc[("2022-01-14", 50.0, "call"), "bid"] == 2.0
+    assert tradier_model.get_all_option_chains("PM", []).empty
+
+
 @pytest.mark.vcr
 def test_last_price(recorder):
     result = tradier_model.last_price(ticker="PM")
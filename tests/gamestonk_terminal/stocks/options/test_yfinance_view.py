@@ -5,7 +5,15 @@ import pandas as pd
 import pytest
 
 # IMPORTATION INTERNAL
-from gamestonk_terminal.stocks.options import yfinance_view
+from gamestonk_terminal import reference_data
+from gamestonk_terminal.stocks.options import chain_cache_model, yfinance_view
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(cache_dir):
+    reference_data._CACHE.clear()
+    chain_cache_model.clear_cache()
+    yield cache_dir
 
 
 @pytest.fixture(scope="module")
@@ -241,6 +241,34 @@ def test_call_func_expect_queue(expected_queue, func, queue):
             [],
             dict(),
         ),
+        (
+            "call_snapshot",
+            [
+                "--data=overview,technical",
+            ],
+            "snapshot_view.display_snapshot",
+            [
+                ["overview", "technical"],
+            ],
+            dict(),
+        ),
+        (
+            "call_batch",
+            [
+                "cheap_dividend,oversold",
+                "--limit=5",
+                "--ascend",
+                "--export=csv",
+            ],
+            "snapshot_view.display_presets",
+            [
+                ["cheap_dividend", "oversold"],
+                5,
+                True,
+                "csv",
+            ],
+            dict(),
+        ),
         (
             "call_historical",
             [
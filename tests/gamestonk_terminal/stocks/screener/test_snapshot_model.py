@@ -0,0 +1,218 @@
+# IMPORTATION STANDARD
+import json
+import os
+from datetime import datetime, timedelta
+
+# IMPORTATION THIRDPARTY
+import numpy as np
+import pandas as pd
+import pytest
+
+# IMPORTATION INTERNAL
+from gamestonk_terminal.stocks.screener import snapshot_model
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(cache_dir):
+    snapshot_model._SNAPSHOT.clear()
+    yield cache_dir
+
+
+def get_screen(columns):
+    class MockScreen:
+        def ScreenerView(self):
+            df = pd.DataFrame(
+                {
+                    "Ticker": ["AAA", "BBB", "CCC", "DDD"],
+                    "Company": ["A Inc", "B Inc", "C Inc", "D Inc"],
+                    "Sector": ["Technology", "Energy", "Energy", "Utilities"],
+                    "Market Cap": ["250B", "15B", "500M", "-"],
+                    "P/E": [30.5, 12.0, 8.0, np.nan],
+                    "P/B": [9.0, 0.8, 0.5, 2.0],
+                    "Dividend": ["0.5%", "3%", "5.2%", "-"],
+                    "RSI": [75.0, 25.0, 28.0, 50.0],
+                    "SMA50": ["5%", "-3%", "-12%", "1%"],
+                    "SMA200": ["10%", "-6%", "-2%", "-1%"],
+                    "Change": ["2.1%", "-1%", "-6%", "0%"],
+                    "Price": [100.0, 20.0, 4.0, 10.0],
+                }
+            )
+            return df[columns]
+
+    return MockScreen
+
+
+@pytest.fixture
+def snapshot(mocker):
+    mocker.patch.object(
+        snapshot_model,
+        "d_screens",
+        {
+            "overview": get_screen(
+                ["Ticker", "Company", "Sector", "Market Cap", "P/E", "Price", "Change"]
+            ),
+            "valuation": get_screen(["Ticker", "Market Cap", "P/E", "P/B", "Price"]),
+            "financial": get_screen(["Ticker", "Market Cap", "Dividend", "Price"]),
+            "technical": get_screen(
+                ["Ticker", "SMA50", "SMA200", "RSI", "Price", "Change"]
+            ),
+        },
+    )
+    return snapshot_model.refresh_snapshot()
+
+
+def test_refresh_snapshot(snapshot, cache_dir):
+    assert list(snapshot["Ticker"]) == ["AAA", "BBB", "CCC", "DDD"]
+    assert snapshot["Market Cap"].tolist()[:3] == [250e9, 15e9, 500e6]
+    assert np.isnan(snapshot["Market Cap"].iloc[3])
+    assert snapshot["Dividend"].iloc[2] == pytest.approx(0.052)
+
+    df_snapshot, meta = snapshot_model.load_snapshot()
+    pd.testing.assert_frame_equal(df_snapshot, snapshot)
+    assert meta["columns"]["valuation"] == [
+        "Ticker",
+        "Market Cap",
+        "P/E",
+        "P/B",
+        "Price",
+    ]
+    assert os.path.isfile(os.path.join(cache_dir, "screener", "snapshot.pkl"))
+
+
+def test_old_snapshot_is_ignored(snapshot, cache_dir):
+    meta_file = os.path.join(cache_dir, "screener", "meta.json")
+    with open(meta_file, encoding="utf8") as f:
+        meta = json.load(f)
+    meta["date"] = (datetime.now() - timedelta(days=2)).isoformat()
+    with open(meta_file, "w", encoding="utf8") as f:
+        json.dump(meta, f)
+
+    assert snapshot_model.load_snapshot()[0].empty
+    assert not snapshot_model.load_snapshot(max_age=None)[0].empty
+    assert snapshot_model.get_local_screener_data({}, {"P/E": "Under 15"}) is None
+
+
+@pytest.mark.parametrize(
+    "key, value, expected",
+    [
+        ("Market Cap.", "+Mid (over $2bln)", ["AAA", "BBB"]),
+        ("P/E", "Under 15", ["BBB", "CCC"]),
+        ("P/B", "0.5 to 1", ["BBB", "CCC"]),
+        ("Dividend Yield", "Over 4%", ["CCC"]),
+        ("Dividend Yield", "None (0%)", ["DDD"]),
+        ("Sector", "Energy", ["BBB", "CCC"]),
+        ("RSI (14)", "Oversold (30)", ["BBB", "CCC"]),
+        ("50-Day Simple Moving Average", "Price 10% below SMA50", ["CCC"]),
+        ("50-Day Simple Moving Average", "SMA50 above SMA200", ["AAA", "CCC"]),
+        ("Change", "Up", ["AAA"]),
+        ("Change", "Down 5%", ["CCC"]),
+    ],
+)
+def test_compile_filter(snapshot, key, value, expected):
+    columns, mask = snapshot_model.compile_filter(key, value)
+    assert set(columns) <= set(snapshot.columns)
+    assert list(snapshot[mask(snapshot)]["Ticker"]) == expected
+
+
+@pytest.mark.parametrize(
+    "key, value",
+    [
+        ("50-Day Simple Moving Average", "SMA50 crossed SMA200 above"),
+        ("Pattern", "Channel Up"),
+        ("Earnings Date", "Today"),
+        ("Market Cap.", "Giant"),
+        ("Country", "Atlantis"),
+    ],
+)
+def test_compile_filter_unsupported(key, value):
+    assert snapshot_model.compile_filter(key, value) is None
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("Under 5", (-np.inf, 5, False)),
+        ("Over 10%", (0.1, np.inf, False)),
+        ("0.5 to 1", (0.5, 1, True)),
+        ("Low (<15)", (-np.inf, 15, False)),
+        ("Positive (>0%)", (0, np.inf, False)),
+        ("Positive Low (<10%)", (0, 0.1, False)),
+        ("Positive Low (0-10%)", (0, 0.1, True)),
+        ("Very Positive (>25%)", (0.25, np.inf, False)),
+        ("Negative (<0%)", (-np.inf, 0, False)),
+        ("Very Negative (<-15%)", (-np.inf, -0.15, False)),
+        ("Very Negative (<20%)", (-np.inf, -0.2, False)),
+    ],
+)
+def test_parse_bounds(value, expected):
+    assert snapshot_model._parse_bounds(value) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("USA", ["AAA"]),
+        ("Japan", ["DDD"]),
+        ("Asia", ["CCC", "DDD"]),
+        ("Europe", ["BBB"]),
+        ("BRIC", ["CCC"]),
+        ("China & Hong Kong", ["CCC"]),
+        ("Latin America", []),
+        ("Foreign (ex-USA)", ["BBB", "CCC", "DDD"]),
+    ],
+)
+def test_compile_filter_country(value, expected):
+    df = pd.DataFrame(
+        {
+            "Ticker": ["AAA", "BBB", "CCC", "DDD", "EEE"],
+            "Country": ["USA", "Germany", "China", "Japan", np.nan],
+        }
+    )
+    columns, mask = snapshot_model.compile_filter("Country", value)
+    assert columns == ["Country"]
+    assert list(df[mask(df)]["Ticker"]) == expected
+
+
+def test_get_local_screener_data(snapshot):
+    df_screen = snapshot_model.get_local_screener_data(
+        {"Signal": "Oversold", "Order": "Price"},
+        {"P/B": "Under 1"},
+        "valuation",
+        ascend=True,
+    )
+    assert list(df_screen.columns) == ["Ticker", "Market Cap", "P/E", "P/B", "Price"]
+    assert list(df_screen["Ticker"]) == ["CCC", "BBB"]
+
+    # Views missing from the snapshot and unsupported filters go to finviz
+    assert (
+        snapshot_model.get_local_screener_data({}, {"P/B": "Under 1"}, "ownership")
+        is None
+    )
+    assert snapshot_model.get_local_screener_data({"Signal": "Top Gainers"}, {}) is None
+
+
+def test_get_local_presets_data(snapshot):
+    d_results, d_unsupported = snapshot_model.get_local_presets_data(
+        ["cheap_dividend", "golden_cross"]
+    )
+
+    assert list(d_results) == ["cheap_dividend"]
+    assert list(d_results["cheap_dividend"]["Ticker"]) == ["CCC", "BBB"]
+    assert d_unsupported["golden_cross"] == [
+        "50-Day Simple Moving Average = SMA50 crossed SMA200 above"
+    ]
+
+
+def test_screen_presets_shares_masks(mocker, snapshot):
+    spy = mocker.spy(snapshot_model, "compile_filter")
+    d_results = snapshot_model.screen_presets(
+        snapshot,
+        {
+            "cheap": ([("P/E", "Under 15"), ("P/B", "Under 1")], "Price"),
+            "cheap_energy": ([("P/E", "Under 15"), ("Sector", "Energy")], "Price"),
+        },
+    )
+
+    assert spy.call_count == 3
+    assert list(d_results["cheap"]["Ticker"]) == ["BBB", "CCC"]
+    assert list(d_results["cheap_energy"]["Ticker"]) == ["BBB", "CCC"]
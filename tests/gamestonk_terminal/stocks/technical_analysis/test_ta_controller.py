@@ -720,6 +720,24 @@ def test_call_func_expect_queue(expected_queue, func, queue):
                 export="csv",
             ),
         ),
+        (
+            "call_multi",
+            [
+                "ema_20,rsi_14,macd_12_26_9",
+                "--num=2",
+                "--export=csv",
+            ],
+            "indicators_view.display_indicators",
+            [],
+            dict(
+                s_ticker="MOCK_TICKER",
+                s_interval="MOCK_INTERVAL",
+                df_stock=EMPTY_DF,
+                indicators=["ema_20", "rsi_14", "macd_12_26_9"],
+                num=2,
+                export="csv",
+            ),
+        ),
     ],
 )
 def test_call_func(
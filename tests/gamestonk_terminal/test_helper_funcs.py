@@ -0,0 +1,43 @@
+# IMPORTATION STANDARD
+
+# IMPORTATION THIRDPARTY
+import pytest
+
+# IMPORTATION INTERNAL
+from gamestonk_terminal import helper_funcs
+
+
+@pytest.mark.parametrize(
+    "name, content, expected",
+    [
+        ("tickers.csv", "Symbol,Name\nAAPL,Apple\nmsft,Microsoft\n", ["AAPL", "MSFT"]),
+        ("tickers.csv", "AAPL,Apple\n\nMSFT,Microsoft\n", ["AAPL", "MSFT"]),
+        ("tickers.txt", "aapl\nMSFT\ntsla\n", ["AAPL", "MSFT", "TSLA"]),
+        (
+            "tickers.txt",
+            "aapl, msft\n\n\nTSLA gme\n\n",
+            ["AAPL", "MSFT", "TSLA", "GME"],
+        ),
+        ("tickers.txt", "\n\n", []),
+    ],
+)
+def test_load_tickers_file(tmp_path, name, content, expected):
+    path = tmp_path / name
+    path.write_text(content)
+
+    assert helper_funcs.load_tickers_file(str(path)) == expected
+
+
+def test_load_tickers_file_missing(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        helper_funcs.load_tickers_file(str(tmp_path / "missing.txt"))
+
+
+def test_get_rf(mocker):
+    mock_rf = mocker.patch(
+        target="gamestonk_terminal.reference_data.get_rf",
+        return_value=0.04,
+    )
+
+    assert helper_funcs.get_rf() == 0.04
+    mock_rf.assert_called_once()
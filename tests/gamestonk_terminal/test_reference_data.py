@@ -0,0 +1,45 @@
+# IMPORTATION STANDARD
+import os
+import time
+
+# IMPORTATION THIRDPARTY
+import pytest
+
+# IMPORTATION INTERNAL
+from gamestonk_terminal import reference_data
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(cache_dir):
+    reference_data._CACHE.clear()
+    yield cache_dir
+
+
+def test_get_rf(mocker, cache_dir):
+    response = mocker.Mock()
+    response.json.return_value = {"data": [{"avg_interest_rate_amt": "0.051"}]}
+    mock_get = mocker.patch.object(
+        reference_data.requests, "get", return_value=response
+    )
+
+    assert reference_data.get_rf() == 0.00051
+    assert reference_data.get_rf() == 0.00051
+    assert mock_get.call_count == 1
+
+    # Read back from the disk by another session
+    reference_data._CACHE.clear()
+    assert reference_data.get_rf() == 0.00051
+    assert mock_get.call_count == 1
+
+    # Expired, but the stale rate is kept while the API is down
+    path = os.path.join(cache_dir, "reference", "rf.pkl")
+    old = time.time() - reference_data.RF_MAX_AGE - 60
+    os.utime(path, (old, old))
+    reference_data._CACHE.clear()
+    mock_get.side_effect = reference_data.requests.exceptions.ConnectionError
+    assert reference_data.get_rf() == 0.00051
+    assert mock_get.call_count == 2
+
+    os.remove(path)
+    reference_data._CACHE.clear()
+    assert reference_data.get_rf() == reference_data.DEFAULT_RF